@@ -25,6 +25,7 @@ class StrategyModule:
     handle_data: Optional[Callable] = None
     analyze: Optional[Callable] = None
     before_trading_start: Optional[Callable] = None
+    vectorized_signals: Optional[Callable] = None
 
 
 def _load_strategy_module(strategy_name: str, asset_class: Optional[str] = None) -> StrategyModule:
@@ -79,7 +80,8 @@ def _load_strategy_module(strategy_name: str, asset_class: Optional[str] = None)
         initialize=initialize_func,
         handle_data=getattr(strategy_module, 'handle_data', None),
         analyze=getattr(strategy_module, 'analyze', None),
-        before_trading_start=getattr(strategy_module, 'before_trading_start', None)
+        before_trading_start=getattr(strategy_module, 'before_trading_start', None),
+        vectorized_signals=getattr(strategy_module, 'vectorized_signals', None)
     )
 
 
@@ -0,0 +1,37 @@
+"""
+Vectorized screening backtester.
+
+Approximates a strategy's equity curve over a bundle's daily OHLCV arrays
+in numpy, for pre-screening large parameter sweeps before running the
+survivors through Zipline:
+- engine: next-bar execution, costs and position sizing
+- data: Bundle OHLCV loading
+- screen: Strategy screening and prescreen() for grid/random search
+- parity: Tracking error against run_backtest()
+
+Main exports:
+- run_vectorized: Simulate target positions over OHLCV bars
+- screen_strategy: Screen one strategy/parameter set
+- prescreen: Rank parameter sets and keep the best
+- compare_with_zipline: Parity harness against Zipline
+"""
+
+from .engine import CostModel, VectorizedResult, run_vectorized, position_sizes
+from .data import load_bundle_ohlcv
+from .screen import rebalance_bars, screen_signals, screen_strategy, load_signal_function, prescreen
+from .parity import tracking_error, compare_with_zipline
+
+__all__ = [
+    'CostModel',
+    'VectorizedResult',
+    'run_vectorized',
+    'position_sizes',
+    'load_bundle_ohlcv',
+    'rebalance_bars',
+    'screen_signals',
+    'screen_strategy',
+    'load_signal_function',
+    'prescreen',
+    'tracking_error',
+    'compare_with_zipline',
+]
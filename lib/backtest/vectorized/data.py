@@ -0,0 +1,78 @@
+"""
+Bundle OHLCV loading for the vectorized engine.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+OHLCV_FIELDS = ['open', 'high', 'low', 'close', 'volume']
+
+
+def load_bundle_ohlcv(
+    bundle: str,
+    symbol: str,
+    start_date: str,
+    end_date: str,
+    lookback_bars: int = 0
+) -> pd.DataFrame:
+    """
+    Daily OHLCV bars of one symbol from a Zipline bundle's daily bar reader.
+
+    Minute bundles ingested by this repo also write daily bars, so this
+    works for both.
+
+    Args:
+        bundle: Bundle name
+        symbol: Asset symbol
+        start_date: First session (YYYY-MM-DD)
+        end_date: Last session (YYYY-MM-DD)
+        lookback_bars: Extra sessions to load before start_date for
+            indicator history (as data.history() would see them)
+
+    Returns:
+        DataFrame indexed by tz-naive session with OHLCV columns; sessions
+        without a close are dropped
+
+    Raises:
+        ValueError: If the symbol is not in the bundle or no sessions are in range
+    """
+    from ...bundles import load_bundle
+
+    bundle_data = load_bundle(bundle)
+    reader = bundle_data.equity_daily_bar_reader
+    sessions = reader.sessions
+    if sessions.tz is not None:
+        sessions = sessions.tz_localize(None)
+
+    first = int(sessions.searchsorted(_naive(start_date)))
+    last = int(sessions.searchsorted(_naive(end_date), side='right')) - 1
+    if last < first:
+        raise ValueError(f"No sessions of bundle '{bundle}' between {start_date} and {end_date}")
+    first = max(0, first - lookback_bars)
+
+    try:
+        asset = bundle_data.asset_finder.lookup_symbol(symbol, as_of_date=None)
+    except Exception as e:
+        raise ValueError(f"Symbol '{symbol}' not found in bundle '{bundle}': {e}") from e
+
+    arrays = reader.load_raw_arrays(OHLCV_FIELDS, sessions[first], sessions[last], [asset.sid])
+    frame = pd.DataFrame(
+        {name: values[:, 0] for name, values in zip(OHLCV_FIELDS, arrays)},
+        index=sessions[first:last + 1],
+    )
+    return frame[np.isfinite(frame['close'].to_numpy())]
+
+
+def _naive(date) -> pd.Timestamp:
+    """Timestamp without timezone, normalized to the session date."""
+    ts = pd.Timestamp(date)
+    if ts.tz is not None:
+        ts = ts.tz_convert('UTC').tz_localize(None)
+    return ts.normalize()
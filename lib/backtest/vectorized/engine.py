@@ -0,0 +1,225 @@
+"""
+Vectorized screening engine.
+
+Evaluates a strategy's target positions over whole OHLCV arrays instead of
+running Zipline bar by bar. Execution is modelled after the Zipline setup
+used by the strategies in this repo:
+
+- Orders are sized at the signal bar (order_target_percent of the current
+  portfolio value at the current close) and filled on the next bar, at its
+  close by default (Zipline's daily fill) or its open
+- Fills pay VolumeShareSlippage price impact,
+  price_impact * min(shares / bar_volume, volume_limit) ** 2, and
+  PerShare commission, max(per_share * shares, min_cost)
+- Orders fill completely on the next bar (Zipline may spread large
+  orders over several bars when they exceed volume_limit)
+
+Only bars where the target changes are processed one by one; positions,
+cash and equity between them are filled in with numpy.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from ...indicators import Volatility
+
+logger = logging.getLogger(__name__)
+
+FILL_PRICES = ('close', 'open')
+
+# Trading days per year by asset class (as in lib.position_sizing)
+TRADING_DAYS_BY_ASSET_CLASS = {'equities': 252, 'forex': 260, 'crypto': 365}
+
+
+@dataclass
+class CostModel:
+    """Commission and slippage settings, as configured in parameters.yaml costs."""
+    per_share: float = 0.005
+    min_cost: float = 1.0
+    volume_limit: float = 0.025
+    price_impact: float = 0.1
+
+    @classmethod
+    def from_params(cls, params: Dict[str, Any]) -> 'CostModel':
+        """Build from a strategy's parameters (same defaults as the strategy template)."""
+        costs = params.get('costs', {})
+        commission = costs.get('commission', {})
+        slippage = costs.get('slippage', {})
+        return cls(
+            per_share=commission.get('per_share', cls.per_share),
+            min_cost=commission.get('min_cost', cls.min_cost),
+            volume_limit=slippage.get('volume_limit', cls.volume_limit),
+            price_impact=slippage.get('price_impact', cls.price_impact),
+        )
+
+
+@dataclass
+class VectorizedResult:
+    """Equity curve and fills of one vectorized run."""
+    equity: pd.Series
+    returns: pd.Series
+    positions: pd.Series
+    trades: pd.DataFrame = field(default_factory=pd.DataFrame)
+
+    @property
+    def total_commission(self) -> float:
+        return float(self.trades['commission'].sum()) if len(self.trades) else 0.0
+
+    def metrics(self, trading_days_per_year: int = 252, risk_free_rate: float = 0.04) -> Dict[str, float]:
+        """Performance metrics of the returns (see lib.metrics.calculate_metrics)."""
+        from ...metrics import calculate_metrics
+
+        returns = self.returns
+        if getattr(returns.index, 'tz', None) is not None:
+            returns = returns.tz_localize(None)
+        return calculate_metrics(
+            returns,
+            risk_free_rate=risk_free_rate,
+            trading_days_per_year=trading_days_per_year,
+        )
+
+
+def run_vectorized(
+    ohlcv: pd.DataFrame,
+    signals: Union[np.ndarray, pd.Series],
+    sizes: Union[float, np.ndarray] = 1.0,
+    capital_base: float = 100000.0,
+    costs: Optional[CostModel] = None,
+    fill_price: str = 'close',
+    start: Optional[Union[str, pd.Timestamp]] = None
+) -> VectorizedResult:
+    """
+    Simulate next-bar execution of target positions over OHLCV bars.
+
+    Args:
+        ohlcv: Bars with 'open', 'close' and 'volume' columns
+        signals: Target direction per bar, decided at that bar's close:
+            1 long, -1 short, 0 flat, NaN keeps the previous target
+        sizes: Fraction of portfolio value to allocate when a target is
+            entered (scalar or one value per bar)
+        capital_base: Starting cash
+        costs: Commission and slippage (None = no costs)
+        fill_price: 'close' or 'open' of the bar after the signal
+        start: First bar that may trade; earlier bars only feed indicators
+            and are dropped from the result
+
+    Returns:
+        VectorizedResult from `start` onwards
+    """
+    if fill_price not in FILL_PRICES:
+        raise ValueError(f"fill_price must be one of {list(FILL_PRICES)}. Got: {fill_price!r}")
+    costs = costs or CostModel(per_share=0.0, min_cost=0.0, price_impact=0.0)
+
+    n = len(ohlcv)
+    signals = np.asarray(signals, dtype=float)
+    if len(signals) != n:
+        raise ValueError(f"Got {len(signals)} signals for {n} bars")
+    sizes = np.broadcast_to(np.asarray(sizes, dtype=float), (n,))
+
+    first = 0 if start is None else int(ohlcv.index.searchsorted(pd.Timestamp(start)))
+    signals = signals.copy()
+    signals[:first] = np.nan
+    target = pd.Series(signals).ffill().fillna(0.0).to_numpy()
+
+    close = ohlcv['close'].to_numpy(dtype=float)
+    fills = ohlcv[fill_price].to_numpy(dtype=float)
+    volume = ohlcv['volume'].to_numpy(dtype=float)
+
+    # Bars whose target differs from the previous bar's, with a next bar to fill on
+    previous = np.concatenate(([0.0], target[:-1]))
+    events = np.flatnonzero(target != previous)
+    events = events[events < n - 1]
+
+    shares_path = np.full(n, np.nan)
+    cash_path = np.full(n, np.nan)
+    shares_path[0], cash_path[0] = 0.0, capital_base
+    shares, cash = 0.0, float(capital_base)
+    trades = []
+
+    for t in events:
+        equity = cash + shares * close[t]
+        desired = target[t] * sizes[t] * equity / close[t] if target[t] else 0.0
+        delta = desired - shares
+        fill = fills[t + 1]
+        if delta == 0 or not np.isfinite(delta) or not np.isfinite(fill):
+            continue
+
+        volume_share = min(abs(delta) / volume[t + 1], costs.volume_limit) if volume[t + 1] > 0 else 0.0
+        price = fill * (1.0 + np.sign(delta) * costs.price_impact * volume_share ** 2)
+        commission = max(costs.per_share * abs(delta), costs.min_cost)
+
+        cash -= delta * price + commission
+        shares = desired
+        shares_path[t + 1], cash_path[t + 1] = shares, cash
+        trades.append({
+            'signal_bar': ohlcv.index[t],
+            'fill_bar': ohlcv.index[t + 1],
+            'shares': delta,
+            'price': price,
+            'commission': commission,
+            'slippage': abs(delta) * abs(price - fill),
+        })
+
+    shares_path = pd.Series(shares_path, index=ohlcv.index).ffill()
+    cash_path = pd.Series(cash_path, index=ohlcv.index).ffill()
+    equity = (cash_path + shares_path * pd.Series(close, index=ohlcv.index)).ffill()
+
+    equity = equity.iloc[first:]
+    returns = equity.pct_change().fillna(0.0)
+    return VectorizedResult(
+        equity=equity,
+        returns=returns,
+        positions=shares_path.iloc[first:],
+        trades=pd.DataFrame(trades),
+    )
+
+
+def position_sizes(ohlcv: pd.DataFrame, params: Dict[str, Any]) -> np.ndarray:
+    """
+    Per-bar position size, as lib.position_sizing.compute_position_size()
+    would return it at each bar's close.
+
+    Args:
+        ohlcv: Bars with a 'close' column
+        params: Strategy parameters
+
+    Returns:
+        Float array with one size per bar
+    """
+    from ...position_sizing import compute_position_size
+
+    pos_config = params.get('position_sizing', {})
+    method = pos_config.get('method', 'fixed')
+    n = len(ohlcv)
+
+    if method != 'volatility_scaled':
+        # 'fixed' and 'kelly' do not read market data
+        size = compute_position_size(SimpleNamespace(params=params), None, params)
+        return np.full(n, size)
+
+    max_position = pos_config.get('max_position_pct', 0.95)
+    min_position = pos_config.get('min_position_pct', 0.10)
+    vol_lookback = pos_config.get('volatility_lookback', 20)
+    vol_target = pos_config.get('volatility_target', 0.15)
+    if vol_lookback < 1:
+        vol_lookback = 20
+    if vol_target <= 0:
+        vol_target = 0.15
+    if vol_lookback < 2:
+        return np.full(n, float(max_position))
+
+    asset_class = params.get('strategy', {}).get('asset_class', 'equities')
+    trading_days = TRADING_DAYS_BY_ASSET_CLASS.get(asset_class, 252)
+    vol = Volatility.compute(ohlcv['close'], period=vol_lookback, annualization=trading_days)
+
+    sizes = np.full(n, float(max_position))
+    scaled = np.isfinite(vol) & (vol > 0)
+    sizes[scaled] = np.clip(vol_target / vol[scaled], min_position, max_position)
+    return sizes
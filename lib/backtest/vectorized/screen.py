@@ -0,0 +1,230 @@
+"""
+Strategy screening with the vectorized engine.
+
+A strategy opts in by defining, next to compute_signals(), a
+vectorized_signals(ohlcv, params) function returning its target direction
+for every bar at once (1 long, -1 short, 0 flat, NaN hold). The screen
+applies the strategy's rebalance schedule, warmup, position sizing and
+costs from its parameters, mirroring the strategy template.
+
+prescreen() ranks many parameter sets this way so grid and random search
+only run the most promising ones through Zipline.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ...config import load_strategy_params, get_warmup_days
+from ..config import _prepare_backtest_config
+from ..strategy import _load_strategy_module
+from .data import load_bundle_ohlcv
+from .engine import (
+    CostModel,
+    VectorizedResult,
+    TRADING_DAYS_BY_ASSET_CLASS,
+    position_sizes,
+    run_vectorized,
+)
+
+logger = logging.getLogger(__name__)
+
+# Sessions loaded before the start date for indicator history
+DEFAULT_LOOKBACK_BARS = 252
+
+REBALANCE_FREQUENCIES = ('daily', 'weekly', 'monthly')
+
+
+def rebalance_bars(index: pd.DatetimeIndex, frequency: str = 'daily') -> np.ndarray:
+    """
+    Mask of the sessions a strategy rebalances on.
+
+    Matches date_rules.every_day(), week_start() and month_start(): every
+    session, or the first session of each week or month in the index.
+    """
+    if frequency not in REBALANCE_FREQUENCIES:
+        logger.warning(f"Invalid rebalance_frequency '{frequency}'. Defaulting to 'daily'.")
+        frequency = 'daily'
+    if frequency == 'daily' or len(index) == 0:
+        return np.ones(len(index), dtype=bool)
+    period = index.to_period('W' if frequency == 'weekly' else 'M')
+    return np.concatenate(([True], period[1:] != period[:-1]))
+
+
+def screen_signals(
+    ohlcv: pd.DataFrame,
+    params: Dict[str, Any],
+    signal_fn: Callable[[pd.DataFrame, Dict[str, Any]], Any],
+    start_date: str,
+    capital_base: float
+) -> VectorizedResult:
+    """
+    Run a signal function through the vectorized engine like the template's rebalance().
+
+    Signals are only acted on at rebalance sessions on or after start_date,
+    skipping the first warmup_days of them, as rebalance() does.
+
+    Args:
+        ohlcv: Daily bars, including history before start_date
+        params: Strategy parameters
+        signal_fn: vectorized_signals(ohlcv, params) of the strategy
+        start_date: First session that may trade
+        capital_base: Starting cash
+
+    Returns:
+        VectorizedResult from start_date onwards
+    """
+    signals = np.asarray(signal_fn(ohlcv, params), dtype=float).copy()
+
+    first = int(ohlcv.index.searchsorted(pd.Timestamp(start_date)))
+    frequency = params.get('strategy', {}).get('rebalance_frequency', 'daily')
+    rebalancing = np.zeros(len(ohlcv), dtype=bool)
+    rebalancing[first:] = rebalance_bars(ohlcv.index[first:], frequency)
+    # rebalance() returns early during the first warmup_days calls
+    rebalance_positions = np.flatnonzero(rebalancing)
+    rebalancing[rebalance_positions[:get_warmup_days(params)]] = False
+    signals[~rebalancing] = np.nan
+
+    return run_vectorized(
+        ohlcv,
+        signals,
+        sizes=position_sizes(ohlcv, params),
+        capital_base=capital_base,
+        costs=CostModel.from_params(params),
+        fill_price='close',
+        start=ohlcv.index[first] if first < len(ohlcv) else None,
+    )
+
+
+def screen_strategy(
+    strategy_name: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    params: Optional[Dict[str, Any]] = None,
+    capital_base: Optional[float] = None,
+    bundle: Optional[str] = None,
+    asset_class: Optional[str] = None,
+    ohlcv: Optional[pd.DataFrame] = None,
+    lookback_bars: int = DEFAULT_LOOKBACK_BARS
+) -> VectorizedResult:
+    """
+    Screen a strategy with the vectorized engine over its bundle's daily bars.
+
+    Args:
+        strategy_name: Strategy defining vectorized_signals()
+        start_date: Start date (default: from config, as run_backtest())
+        end_date: End date (default: today)
+        params: Full parameters (default: the strategy's parameters.yaml)
+        capital_base: Starting capital (default: from config)
+        bundle: Bundle name (default: auto-detect, as run_backtest())
+        asset_class: Asset class hint
+        ohlcv: Preloaded bars (skips bundle loading)
+        lookback_bars: Sessions loaded before start_date for indicators
+
+    Returns:
+        VectorizedResult
+
+    Raises:
+        ValueError: If the strategy has no vectorized_signals() function
+    """
+    signal_fn = load_signal_function(strategy_name, asset_class)
+    if params is None:
+        params = load_strategy_params(strategy_name, asset_class)
+    config = _prepare_backtest_config(
+        strategy_name, start_date, end_date, capital_base, bundle, 'daily', asset_class
+    )
+    if ohlcv is None:
+        symbol = params.get('strategy', {}).get('asset_symbol')
+        ohlcv = load_bundle_ohlcv(config.bundle, symbol, config.start_date, config.end_date, lookback_bars)
+    else:
+        ohlcv = ohlcv.loc[:pd.Timestamp(config.end_date)]
+    return screen_signals(ohlcv, params, signal_fn, config.start_date, config.capital_base)
+
+
+def load_signal_function(strategy_name: str, asset_class: Optional[str] = None) -> Callable:
+    """Return the strategy's vectorized_signals() function."""
+    module = _load_strategy_module(strategy_name, asset_class)
+    if module.vectorized_signals is None:
+        raise ValueError(
+            f"Strategy '{strategy_name}' has no vectorized_signals(ohlcv, params) function. "
+            "See strategies/_template/strategy.py."
+        )
+    return module.vectorized_signals
+
+
+def prescreen(
+    strategy_name: str,
+    param_sets: List[Dict[str, Any]],
+    start_date: str,
+    end_date: str,
+    objective: str = 'sharpe',
+    keep: float = 0.2,
+    capital_base: Optional[float] = None,
+    bundle: Optional[str] = None,
+    asset_class: Optional[str] = None,
+    lookback_bars: int = DEFAULT_LOOKBACK_BARS
+) -> Tuple[List[int], Dict[int, float]]:
+    """
+    Rank parameter sets by their vectorized objective and keep the best.
+
+    Bars are loaded once per asset symbol, before screening, and shared by
+    all parameter sets. Load errors (unknown bundle or symbol) propagate.
+
+    Args:
+        strategy_name: Strategy defining vectorized_signals()
+        param_sets: Full parameter dicts to screen
+        start_date: Screening start date
+        end_date: Screening end date
+        objective: Metric to rank by (a lib.metrics.calculate_metrics key)
+        keep: Fraction (0-1] of parameter sets to keep, or a count if > 1
+        capital_base: Starting capital (default: from config)
+        bundle: Bundle name (default: auto-detect)
+        asset_class: Asset class hint
+        lookback_bars: Sessions loaded before start_date for indicators
+
+    Returns:
+        (kept, scores): indices of the kept parameter sets in their original
+        order, and the objective score of every screened set (-inf where
+        screening failed). All indices are kept when no set could be scored.
+
+    Raises:
+        ValueError: If the strategy has no vectorized_signals(), or a symbol
+            or date range is not in the bundle
+    """
+    if keep <= 0:
+        raise ValueError(f"keep must be > 0. Got: {keep}")
+    signal_fn = load_signal_function(strategy_name, asset_class)
+    config = _prepare_backtest_config(
+        strategy_name, start_date, end_date, capital_base, bundle, 'daily', asset_class
+    )
+
+    symbols = [params.get('strategy', {}).get('asset_symbol') for params in param_sets]
+    bars: Dict[str, pd.DataFrame] = {
+        symbol: load_bundle_ohlcv(config.bundle, symbol, config.start_date, config.end_date, lookback_bars)
+        for symbol in dict.fromkeys(symbols)
+    }
+
+    scores: Dict[int, float] = {}
+    for i, params in enumerate(param_sets):
+        try:
+            result = screen_signals(bars[symbols[i]], params, signal_fn, config.start_date, config.capital_base)
+            asset_class_name = params.get('strategy', {}).get('asset_class', 'equities')
+            trading_days = params.get('backtest', {}).get(
+                'trading_days_per_year', TRADING_DAYS_BY_ASSET_CLASS.get(asset_class_name, 252)
+            )
+            scores[i] = float(result.metrics(trading_days_per_year=trading_days).get(objective, 0.0))
+        except Exception as e:
+            logger.warning(f"Vectorized screen failed for parameter set {i}: {e}")
+            scores[i] = -np.inf
+
+    if not any(np.isfinite(score) for score in scores.values()):
+        logger.warning("No parameter set could be screened; keeping all of them")
+        return list(range(len(param_sets))), scores
+
+    n_keep = int(keep) if keep > 1 else max(1, int(np.ceil(keep * len(param_sets))))
+    ranked = sorted(scores, key=lambda i: scores[i], reverse=True)
+    return sorted(ranked[:n_keep]), scores
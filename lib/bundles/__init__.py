@@ -27,6 +27,7 @@ from .registry import (
     get_bundle_registry_path,
     load_bundle_registry,
     save_bundle_registry,
+    locked_bundle_registry,
     register_bundle_metadata,
     get_bundle_path,
     list_bundles,
@@ -34,6 +35,19 @@ from .registry import (
     get_registered_bundles,
     add_registered_bundle,
     discard_registered_bundle,
+    update_bundle_coverage,
+)
+
+# Incremental (append-only) ingestion
+from .incremental import (
+    PreviousIngestion,
+    load_previous_ingestion,
+)
+
+# Bundles aggregated from an existing minute bundle
+from .derived import (
+    register_derived_bundle,
+    derived_bundle_name,
 )
 
 # Bundle utilities
@@ -56,16 +70,11 @@ from .yahoo import (
     auto_register_yahoo_bundle_if_exists,
 )
 
-# Caching utilities (optional - module may not exist)
-try:
-    from .cache import (
-        cache_api_data,
-        clear_cache,
-    )
-except ImportError:
-    # Cache module not available
-    cache_api_data = None
-    clear_cache = None
+# API response cache
+from .cache import (
+    cache_api_data,
+    clear_cache,
+)
 
 # Main bundle API
 from .api import (
@@ -93,6 +102,7 @@ __all__ = [
     'get_bundle_registry_path',
     'load_bundle_registry',
     'save_bundle_registry',
+    'locked_bundle_registry',
     'register_bundle_metadata',
     'get_bundle_path',
     'list_bundles',
@@ -100,6 +110,13 @@ __all__ = [
     'get_registered_bundles',
     'add_registered_bundle',
     'discard_registered_bundle',
+    'update_bundle_coverage',
+    # Incremental ingestion
+    'PreviousIngestion',
+    'load_previous_ingestion',
+    # Derived bundles
+    'register_derived_bundle',
+    'derived_bundle_name',
     # Utils
     'aggregate_to_4h',
     'is_valid_date_string',
@@ -112,8 +129,8 @@ __all__ = [
     'register_yahoo_bundle',
     'auto_register_yahoo_bundle_if_exists',
     # Cache (optional)
-    # 'cache_api_data',  # Optional - module may not exist
-    # 'clear_cache',  # Optional - module may not exist
+    'cache_api_data',
+    'clear_cache',
     # Main API
     'ingest_bundle',
     'load_bundle',
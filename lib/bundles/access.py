@@ -12,6 +12,7 @@ from typing import Any, List
 from .registry import load_bundle_registry, add_registered_bundle
 from .utils import extract_symbols_from_bundle
 from .yahoo import register_yahoo_bundle
+from .derived import register_derived_bundle
 from ..calendars import register_custom_calendars
 
 logger = logging.getLogger(__name__)
@@ -57,15 +58,25 @@ def load_bundle(bundle_name: str) -> Any:
                 register_custom_calendars(calendars=[calendar_name])
 
             # Re-register the bundle
-            register_yahoo_bundle(
-                bundle_name=bundle_name,
-                symbols=symbols,
-                calendar_name=calendar_name,
-                start_date=start_date,
-                end_date=end_date,
-                data_frequency=data_frequency,
-                timeframe=timeframe
-            )
+            if bundle_meta.get('source_bundle'):
+                register_derived_bundle(
+                    bundle_name=bundle_name,
+                    source_bundle=bundle_meta['source_bundle'],
+                    timeframe=timeframe,
+                    symbols=symbols,
+                    start_date=start_date,
+                    end_date=end_date
+                )
+            else:
+                register_yahoo_bundle(
+                    bundle_name=bundle_name,
+                    symbols=symbols,
+                    calendar_name=calendar_name,
+                    start_date=start_date,
+                    end_date=end_date,
+                    data_frequency=data_frequency,
+                    timeframe=timeframe
+                )
         elif bundle_name.startswith('yahoo_'):
             # Fallback: Check if bundle data exists on disk
             bundle_data_path = Path.home() / '.zipline' / 'data' / bundle_name
@@ -0,0 +1,165 @@
+"""
+On-disk cache for raw API responses used by bundle ingestion.
+
+Re-ingesting a bundle refetches the same history for every symbol. Responses
+are stored as Parquet under data/cache/api/{source}/, one file per
+(symbol, interval, start, end) request, and reused until they are older than
+the configured TTL (settings.yaml: data.cache.ttl_hours).
+"""
+
+import hashlib
+import logging
+import os
+import re
+import time
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from ..paths import get_project_root
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_HOURS = 24
+
+
+def get_api_cache_dir(source: str) -> Path:
+    """Get the directory holding cached responses for a data source."""
+    return get_project_root() / 'data' / 'cache' / 'api' / source
+
+
+def get_cache_settings() -> dict:
+    """
+    Read cache settings from settings.yaml (data.cache).
+
+    Returns:
+        Dict with 'enabled' (bool) and 'ttl_hours' (float)
+    """
+    try:
+        from ..config import load_settings
+        cache_cfg = (load_settings().get('data') or {}).get('cache') or {}
+    except Exception as e:
+        logger.debug(f"Using default API cache settings: {e}")
+        cache_cfg = {}
+    return {
+        'enabled': bool(cache_cfg.get('enabled', True)),
+        'ttl_hours': float(cache_cfg.get('ttl_hours', DEFAULT_TTL_HOURS)),
+    }
+
+
+def get_cache_path(
+    source: str,
+    symbol: str,
+    interval: str,
+    start_date: Optional[str],
+    end_date: Optional[str]
+) -> Path:
+    """
+    Get the cache file for one request.
+
+    The file name starts with a filesystem-safe symbol so entries can be
+    cleared per symbol; the request itself is identified by a hash.
+    """
+    request = f"{symbol}|{interval}|{start_date or ''}|{end_date or ''}"
+    digest = hashlib.sha256(request.encode()).hexdigest()[:16]
+    safe_symbol = re.sub(r'[^A-Za-z0-9._-]', '_', symbol)
+    return get_api_cache_dir(source) / f"{safe_symbol}_{interval}_{digest}.parquet"
+
+
+def load_cached_api_data(
+    source: str,
+    symbol: str,
+    interval: str,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    ttl_hours: Optional[float] = None
+) -> Optional[pd.DataFrame]:
+    """
+    Load a cached response if present and younger than the TTL.
+
+    Args:
+        source: Data source name (e.g. 'yahoo')
+        symbol: Requested symbol
+        interval: Requested interval
+        start_date: Requested start date
+        end_date: Requested end date
+        ttl_hours: Maximum age in hours (None = settings.yaml value)
+
+    Returns:
+        Cached DataFrame, or None if missing, expired or unreadable
+    """
+    cache_path = get_cache_path(source, symbol, interval, start_date, end_date)
+    if not cache_path.exists():
+        return None
+    if ttl_hours is None:
+        ttl_hours = get_cache_settings()['ttl_hours']
+    age_hours = (time.time() - cache_path.stat().st_mtime) / 3600
+    if age_hours >= ttl_hours:
+        return None
+    try:
+        return pd.read_parquet(cache_path)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable API cache file {cache_path}: {e}")
+        return None
+
+
+def cache_api_data(
+    df: pd.DataFrame,
+    source: str,
+    symbol: str,
+    interval: str,
+    start_date: Optional[str],
+    end_date: Optional[str]
+) -> Path:
+    """
+    Store a response in the cache atomically.
+
+    Returns:
+        Path of the cache file
+    """
+    cache_path = get_cache_path(source, symbol, interval, start_date, end_date)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        df.to_parquet(tmp_path)
+        os.replace(tmp_path, cache_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return cache_path
+
+
+def clear_cache(
+    source: Optional[str] = None,
+    symbol: Optional[str] = None,
+    expired_only: bool = False,
+    ttl_hours: Optional[float] = None
+) -> int:
+    """
+    Delete cached API responses.
+
+    Args:
+        source: Only this data source (None = all sources)
+        symbol: Only this symbol (None = all symbols)
+        expired_only: Only delete entries older than the TTL
+        ttl_hours: TTL used with expired_only (None = settings.yaml value)
+
+    Returns:
+        Number of files deleted
+    """
+    root = get_api_cache_dir(source) if source else get_api_cache_dir('_').parent
+    if not root.exists():
+        return 0
+    if ttl_hours is None:
+        ttl_hours = get_cache_settings()['ttl_hours']
+
+    prefix = re.sub(r'[^A-Za-z0-9._-]', '_', symbol) + '_' if symbol else ''
+    removed = 0
+    now = time.time()
+    for path in root.rglob(f"{prefix}*.parquet"):
+        if expired_only and (now - path.stat().st_mtime) / 3600 < ttl_hours:
+            continue
+        path.unlink()
+        removed += 1
+    return removed
@@ -8,16 +8,31 @@ Main entry point: register_csv_bundle()
 """
 
 from .registration import register_csv_bundle
-from .parser import normalize_csv_columns, parse_csv_filename
-from .ingestion import load_and_process_csv, create_asset_metadata
+from .parser import normalize_csv_columns, parse_csv_filename, read_ohlcv_csv, CSV_ENGINES
+from .ingestion import (
+    load_and_process_csv,
+    iter_symbol_csvs,
+    load_symbol_csvs,
+    create_asset_metadata,
+    asset_metadata_from_spans,
+)
+from .cache import CsvCacheStats, clear_csv_cache, get_csv_cache_dir
 from .writer import write_minute_and_daily_bars, write_daily_bars
 
 __all__ = [
     'register_csv_bundle',
     'normalize_csv_columns',
     'parse_csv_filename',
+    'read_ohlcv_csv',
+    'CSV_ENGINES',
     'load_and_process_csv',
+    'iter_symbol_csvs',
+    'load_symbol_csvs',
     'create_asset_metadata',
+    'asset_metadata_from_spans',
+    'CsvCacheStats',
+    'clear_csv_cache',
+    'get_csv_cache_dir',
     'write_minute_and_daily_bars',
     'write_daily_bars',
 ]
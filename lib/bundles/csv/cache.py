@@ -0,0 +1,230 @@
+"""
+Columnar cache for processed CSV data.
+
+load_and_process_csv() parses, validates and session-filters each CSV on
+every ingest. When neither the file nor anything that affects processing has
+changed, the cleaned output is identical, so it is stored as Parquet under
+data/cache/csv/ and reused on the next ingest.
+
+Cache keys cover:
+- the source file (resolved path, size, mtime)
+- timeframe, asset class and effective date bounds
+- the calendar name and a fingerprint of its session schedule
+- CSV_CACHE_VERSION, bumped whenever processing logic changes
+
+A key is a scope digest (the file and processing parameters) followed by a
+state digest (size, mtime, calendar fingerprint, version). Writing a new key
+evicts older entries of the same scope only, so bundles that process one
+file with other date bounds or calendars keep their own entries.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from ...paths import get_project_root
+
+logger = logging.getLogger(__name__)
+
+# Bump when parsing, validation or session filtering changes output,
+# so stale entries are never served after a code change.
+# 2: vectorized FOREX pre-session filter and Sunday consolidation
+CSV_CACHE_VERSION = 2
+
+# Cache keys are a 12-hex-digit scope digest followed by a 12-hex-digit state digest
+_DIGEST_LEN = 12
+_KEY_PATTERN = re.compile(r'[0-9a-f]{24}')
+_ENTRY_SUFFIX = re.compile(r'[^_]+_[0-9a-f]{24}')
+
+# Per-process calendar fingerprints (the schedule is hashed once per calendar)
+_calendar_fingerprints: Dict[str, str] = {}
+
+
+@dataclass
+class CsvCacheStats:
+    """Hit/miss counters for the processed-CSV cache."""
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    errors: int = 0
+
+    def merge(self, other: 'CsvCacheStats') -> None:
+        """Add another stats object's counters to this one."""
+        self.hits += other.hits
+        self.misses += other.misses
+        self.writes += other.writes
+        self.errors += other.errors
+
+    def summary(self) -> str:
+        """One-line summary for ingest logs."""
+        return (
+            f"CSV cache: {self.hits} hit(s), {self.misses} miss(es), "
+            f"{self.writes} write(s), {self.errors} error(s)"
+        )
+
+
+def get_csv_cache_dir() -> Path:
+    """Get the directory holding processed-CSV cache files."""
+    return get_project_root() / 'data' / 'cache' / 'csv'
+
+
+def calendar_fingerprint(calendar: Any, calendar_name: str) -> str:
+    """
+    Hash a calendar's session schedule so calendar edits invalidate the cache.
+
+    Args:
+        calendar: exchange_calendars calendar object
+        calendar_name: Calendar name (used as the memo key)
+
+    Returns:
+        Short hex digest of the schedule
+    """
+    fingerprint = _calendar_fingerprints.get(calendar_name)
+    if fingerprint is None:
+        schedule_hash = pd.util.hash_pandas_object(calendar.schedule, index=True)
+        fingerprint = hashlib.sha256(schedule_hash.values.tobytes()).hexdigest()[:16]
+        _calendar_fingerprints[calendar_name] = fingerprint
+    return fingerprint
+
+
+def csv_cache_key(
+    csv_file: Path,
+    timeframe: str,
+    asset_class: str,
+    calendar_name: str,
+    calendar_hash: str,
+    start_date: Optional[pd.Timestamp],
+    end_date: Optional[pd.Timestamp],
+) -> str:
+    """
+    Build the cache key for a processed CSV.
+
+    Returns:
+        Hex digest identifying the processed output: the scope digest
+        (file path and processing parameters) followed by the state digest
+        (file size/mtime, calendar fingerprint, cache version)
+    """
+    stat = csv_file.stat()
+    scope_fields = {
+        'path': str(csv_file.resolve()),
+        'timeframe': timeframe,
+        'asset_class': asset_class.lower(),
+        'calendar': calendar_name,
+        'start': start_date.isoformat() if start_date is not None else None,
+        'end': end_date.isoformat() if end_date is not None else None,
+    }
+    state_fields = {
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'calendar_hash': calendar_hash,
+        'version': CSV_CACHE_VERSION,
+    }
+    return _digest(scope_fields) + _digest(state_fields)
+
+
+def _digest(fields: Dict[str, Any]) -> str:
+    """Short hex digest of a JSON-serializable dict."""
+    encoded = json.dumps(fields, sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()[:_DIGEST_LEN]
+
+
+def get_cache_path(symbol: str, timeframe: str, key: str) -> Path:
+    """Get the cache file path for a symbol/timeframe/key."""
+    return get_csv_cache_dir() / f"{symbol}_{timeframe}_{key}.parquet"
+
+
+def load_cached_csv(cache_path: Path) -> Optional[pd.DataFrame]:
+    """
+    Load a processed DataFrame from the cache.
+
+    Returns:
+        Cached DataFrame, or None if missing or unreadable
+    """
+    if not cache_path.exists():
+        return None
+    try:
+        df = pd.read_parquet(cache_path)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable CSV cache file {cache_path}: {e}")
+        return None
+    # Parquet restores a pytz UTC index; match the tz of freshly processed frames
+    if isinstance(df.index, pd.DatetimeIndex):
+        df.index = pd.to_datetime(df.index, utc=True).tz_convert('UTC')
+    return df
+
+
+def save_cached_csv(df: pd.DataFrame, cache_path: Path) -> None:
+    """
+    Write a processed DataFrame to the cache atomically.
+
+    The file is written under a temporary name and moved into place so
+    concurrent ingests never read a partially written cache file. Entries
+    it supersedes are then evicted.
+    """
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        df.to_parquet(tmp_path)
+        os.replace(tmp_path, cache_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    _evict_superseded(cache_path)
+
+
+def _evict_superseded(cache_path: Path) -> int:
+    """
+    Delete entries with the same scope as cache_path but an older state.
+
+    The state changes whenever the source file is edited, so without
+    eviction every edit would leave an orphaned Parquet file behind.
+
+    Returns:
+        Number of files deleted
+    """
+    prefix, key = cache_path.stem.rsplit('_', 1)
+    removed = 0
+    for path in cache_path.parent.glob(f"{prefix}_{key[:_DIGEST_LEN]}*.parquet"):
+        other = path.stem[len(prefix) + 1:]
+        # The exact match keeps e.g. EUR_daily from evicting EUR_USD_daily entries
+        if path == cache_path or not _KEY_PATTERN.fullmatch(other):
+            continue
+        try:
+            path.unlink()
+            removed += 1
+        except FileNotFoundError:
+            # A concurrent ingest already evicted it
+            pass
+    return removed
+
+
+def clear_csv_cache(symbol: Optional[str] = None) -> int:
+    """
+    Delete processed-CSV cache files.
+
+    Args:
+        symbol: Only delete entries for this symbol (None = all)
+
+    Returns:
+        Number of files deleted
+    """
+    cache_dir = get_csv_cache_dir()
+    if not cache_dir.exists():
+        return 0
+    pattern = f"{symbol}_*.parquet" if symbol else "*.parquet"
+    removed = 0
+    for path in cache_dir.glob(pattern):
+        # {timeframe}_{key} must follow the symbol exactly, so clearing EUR keeps EUR_USD
+        if symbol and not _ENTRY_SUFFIX.fullmatch(path.stem[len(symbol) + 1:]):
+            continue
+        path.unlink()
+        removed += 1
+    return removed
@@ -7,8 +7,11 @@ bundle ingestion and backtest execution.
 """
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
-from typing import List, Optional, Iterator, Tuple
+from typing import Dict, List, Optional, Iterator, Tuple
 
 import pandas as pd
 from zipline.utils.calendar_utils import get_calendar
@@ -19,7 +22,16 @@ from ...data.aggregation import aggregate_ohlcv
 from ...validation import DataValidator, ValidationConfig
 from ..timeframes import get_timeframe_info, get_minutes_per_day
 from ..registry import register_bundle_metadata, add_registered_bundle, unregister_bundle
-from .parser import normalize_csv_columns, parse_csv_filename
+from ..pipeline import Stage, run_pipeline
+from .cache import (
+    CsvCacheStats,
+    calendar_fingerprint,
+    csv_cache_key,
+    get_cache_path,
+    load_cached_csv,
+    save_cached_csv,
+)
+from .parser import DEFAULT_CSV_CHUNKSIZE, parse_csv_filename, read_ohlcv_csv
 
 logger = logging.getLogger(__name__)
 
@@ -32,11 +44,25 @@ def load_and_process_csv(
     session_mgr: SessionManager,
     user_start_date: Optional[pd.Timestamp],
     user_end_date: Optional[pd.Timestamp],
-    show_progress: bool = False
+    show_progress: bool = False,
+    engine: str = 'pandas',
+    chunksize: int = DEFAULT_CSV_CHUNKSIZE,
+    use_cache: bool = True,
+    rebuild_cache: bool = False,
+    cache_stats: Optional[CsvCacheStats] = None,
+    process_from: Optional[pd.Timestamp] = None
 ) -> pd.DataFrame:
     """
     Load CSV file and apply session filters using SessionManager.
 
+    The processed result is cached under data/cache/csv/ (see cache.py) and
+    reused while the file, calendar, date bounds and processing version
+    are unchanged.
+
+    With process_from (incremental ingestion), rows before it are dropped
+    right after parsing, so only new rows are validated and filtered. A
+    cached full result is sliced instead; partial results are not cached.
+
     Args:
         csv_file: Path to CSV file
         symbol: Asset symbol
@@ -46,6 +72,12 @@ def load_and_process_csv(
         user_start_date: User-specified start date (overrides filename)
         user_end_date: User-specified end date (overrides filename)
         show_progress: Whether to print progress messages
+        engine: CSV parse engine ('pandas', 'pyarrow', 'chunked'), see read_ohlcv_csv
+        chunksize: Rows per chunk for the 'chunked' engine
+        use_cache: Whether to read/write the processed-CSV and validation-result caches
+        rebuild_cache: If True, ignore existing cache entries and overwrite them
+        cache_stats: Optional counters updated with cache hits/misses/writes
+        process_from: Only process rows at or after this UTC timestamp
 
     Returns:
         Processed DataFrame with calendar-aligned sessions
@@ -58,18 +90,47 @@ def load_and_process_csv(
     file_start_date, file_end_date = parse_csv_filename(
         csv_file.name, symbol, timeframe
     )
+    effective_start = user_start_date or file_start_date
+    effective_end = user_end_date or file_end_date
 
-    # Read CSV
-    df = pd.read_csv(csv_file, parse_dates=[0], index_col=0)
+    if cache_stats is None:
+        cache_stats = CsvCacheStats()
+
+    # Processed-CSV cache lookup
+    cache_path = None
+    if use_cache:
+        cache_key = csv_cache_key(
+            csv_file, timeframe, asset_class,
+            session_mgr.calendar_name,
+            calendar_fingerprint(session_mgr.calendar, session_mgr.calendar_name),
+            effective_start, effective_end
+        )
+        cache_path = get_cache_path(symbol, timeframe, cache_key)
+        if not rebuild_cache:
+            cached_df = load_cached_csv(cache_path)
+            if cached_df is not None:
+                cache_stats.hits += 1
+                if show_progress:
+                    print(f"  ✓ Loaded processed {symbol} from cache ({len(cached_df)} bars)")
+                if process_from is not None:
+                    cached_df = cached_df[cached_df.index >= process_from]
+                return cached_df
+        cache_stats.misses += 1
+
+    # Read CSV (normalized OHLCV columns, float64, UTC index)
+    df = read_ohlcv_csv(csv_file, engine=engine, chunksize=chunksize)
 
     if df.empty:
         raise ValueError(f"Empty data for {symbol} from {csv_file}")
 
-    # Normalize column names
-    df = normalize_csv_columns(df)
-
-    # Convert index to UTC
-    df.index = pd.to_datetime(df.index, utc=True)
+    if process_from is not None:
+        df = df[df.index >= process_from]
+        # The output no longer covers the whole file, so it must not be cached
+        cache_path = None
+        if df.empty:
+            if show_progress:
+                print(f"  No new rows for {symbol} since {process_from}")
+            return df
 
     # Data validation
     asset_type_map = {
@@ -84,7 +145,8 @@ def load_and_process_csv(
     config = ValidationConfig(
         timeframe=timeframe,
         asset_type=asset_type,
-        calendar_name=session_mgr.calendar_name
+        calendar_name=session_mgr.calendar_name,
+        cache_results=use_cache and not rebuild_cache
     )
     validator = DataValidator(config=config)
 
@@ -107,9 +169,6 @@ def load_and_process_csv(
         print(f"  ✓ Data validation passed for {symbol}")
 
     # Date filtering
-    effective_start = user_start_date or file_start_date
-    effective_end = user_end_date or file_end_date
-
     if effective_start:
         df = df[df.index >= effective_start]
     if effective_end:
@@ -131,37 +190,283 @@ def load_and_process_csv(
         symbol=symbol
     )
 
+    if cache_path is not None:
+        try:
+            save_cached_csv(df, cache_path)
+            cache_stats.writes += 1
+        except Exception as e:
+            cache_stats.errors += 1
+            logger.warning(f"Failed to write CSV cache for {symbol}: {e}")
+
     return df
 
 
-def create_asset_metadata(
+# Per-process SessionManager cache so pool workers build each calendar once
+_worker_session_managers: Dict[str, SessionManager] = {}
+
+
+def _get_worker_session_manager(asset_class: str) -> SessionManager:
+    """Return a SessionManager for asset_class, cached for the current process."""
+    session_mgr = _worker_session_managers.get(asset_class)
+    if session_mgr is None:
+        session_mgr = SessionManager.for_asset_class(asset_class)
+        _worker_session_managers[asset_class] = session_mgr
+    return session_mgr
+
+
+def resolve_worker_count(workers: Optional[int], n_tasks: int) -> int:
+    """
+    Resolve the number of worker processes to use for n_tasks.
+
+    Args:
+        workers: Requested worker count. None or 1 runs sequentially,
+            0 or negative uses all available CPUs.
+        n_tasks: Number of independent tasks
+
+    Returns:
+        Worker count, never more than n_tasks and at least 1
+    """
+    if workers is None:
+        workers = 1
+    elif workers <= 0:
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, n_tasks))
+
+
+def _load_symbol_task(
+    sid: int,
+    symbol: str,
+    csv_file: Path,
+    timeframe: str,
+    asset_class: str,
+    user_start_date: Optional[pd.Timestamp],
+    user_end_date: Optional[pd.Timestamp],
+    show_progress: bool,
+    engine: str,
+    use_cache: bool,
+    rebuild_cache: bool,
+    process_from: Optional[pd.Timestamp] = None,
+) -> Tuple[int, str, Optional[pd.DataFrame], Optional[str], CsvCacheStats]:
+    """
+    Load and process a single symbol's CSV (process pool entry point).
+
+    Errors are returned rather than raised so one bad file does not abort
+    the whole pool.
+
+    Returns:
+        Tuple of (sid, symbol, DataFrame or None, error message or None, cache stats)
+    """
+    cache_stats = CsvCacheStats()
+    try:
+        df = load_and_process_csv(
+            csv_file=csv_file,
+            symbol=symbol,
+            timeframe=timeframe,
+            asset_class=asset_class,
+            session_mgr=_get_worker_session_manager(asset_class),
+            user_start_date=user_start_date,
+            user_end_date=user_end_date,
+            show_progress=show_progress,
+            engine=engine,
+            use_cache=use_cache,
+            rebuild_cache=rebuild_cache,
+            cache_stats=cache_stats,
+            process_from=process_from
+        )
+        return sid, symbol, df, None, cache_stats
+    except Exception as e:
+        logger.exception(f"Error processing CSV for {symbol}: {e}")
+        return sid, symbol, None, str(e), cache_stats
+
+
+def iter_symbol_csvs(
     symbols: List[str],
-    data_dict: dict,
+    data_path: Path,
+    timeframe: str,
+    asset_class: str,
+    user_start_date: Optional[pd.Timestamp],
+    user_end_date: Optional[pd.Timestamp],
+    workers: Optional[int] = 1,
+    show_progress: bool = False,
+    engine: str = 'pandas',
+    use_cache: bool = True,
+    rebuild_cache: bool = False,
+    cache_stats: Optional[CsvCacheStats] = None,
+    resume_from: Optional[Dict[int, pd.Timestamp]] = None,
+    max_in_flight: Optional[int] = None
+) -> Iterator[Tuple[int, pd.DataFrame]]:
+    """
+    Stream loaded, validated and filtered CSV data for all symbols.
+
+    Symbols go through a bounded pipeline (see lib/bundles/pipeline.py):
+    while the caller writes one symbol, the next ones are parsed, validated
+    and session-filtered (in a process pool when workers > 1). At most
+    max_in_flight symbols are held in memory at once. Results are yielded
+    in sid order, making output identical to a sequential run.
+
+    Args:
+        symbols: List of symbols; list position is the sid
+        data_path: Directory containing {symbol}_{timeframe}_*.csv files
+        timeframe: Data timeframe (1m, 1h, daily, etc.)
+        asset_class: Asset class (forex, crypto, equity)
+        user_start_date: User-specified start date (overrides filename)
+        user_end_date: User-specified end date (overrides filename)
+        workers: Worker processes (1 = sequential, 0 = all CPUs)
+        show_progress: Whether to print progress messages
+        engine: CSV parse engine ('pandas', 'pyarrow', 'chunked')
+        use_cache: Whether to read/write the processed-CSV and validation-result caches
+        rebuild_cache: If True, ignore existing cache entries and overwrite them
+        cache_stats: Optional counters accumulated across all symbols
+        resume_from: Optional per-sid timestamp from which to process rows
+            (incremental ingestion); sids not in the dict are processed fully
+        max_in_flight: Symbols loaded ahead of the consumer (None = workers + 1)
+
+    Yields:
+        (sid, DataFrame) tuples in sid order, skipping symbols with no
+        file, no data after filtering, or processing errors
+    """
+    resume_from = resume_from or {}
+    tasks = []
+    for sid, symbol in enumerate(symbols):
+        file_pattern = f"{symbol}_{timeframe}_*.csv"
+        matching_files = sorted(data_path.glob(file_pattern))
+        if not matching_files:
+            logger.warning(f"No CSV file found for {symbol} with pattern '{file_pattern}'")
+            continue
+        tasks.append((
+            sid, symbol, matching_files[0], timeframe, asset_class,
+            user_start_date, user_end_date, show_progress, engine,
+            use_cache, rebuild_cache, resume_from.get(sid)
+        ))
+
+    if cache_stats is None:
+        cache_stats = CsvCacheStats()
+
+    n_workers = resolve_worker_count(workers, len(tasks))
+    if max_in_flight is None:
+        max_in_flight = n_workers + 1
+
+    with ExitStack() as stack:
+        executor = None
+        if n_workers > 1:
+            if show_progress:
+                print(f"  Processing {len(tasks)} CSV file(s) with {n_workers} worker processes...")
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=n_workers))
+
+        def load(task):
+            if executor is not None:
+                return executor.submit(_load_symbol_task, *task).result()
+            return _load_symbol_task(*task)
+
+        results = run_pipeline(tasks, [Stage(load, workers=n_workers, name='csv')], max_in_flight)
+        for sid, symbol, df, error, task_stats in results:
+            cache_stats.merge(task_stats)
+            if error is not None:
+                if show_progress:
+                    print(f"  Error: {symbol}: {error}")
+                continue
+            if df.empty:
+                if sid in resume_from:
+                    logger.info(f"No new data for {symbol}")
+                else:
+                    logger.warning(f"No data for {symbol} after filtering")
+                continue
+            yield sid, df
+
+    if use_cache:
+        logger.info(cache_stats.summary())
+        if show_progress:
+            print(f"  {cache_stats.summary()}")
+
+
+def load_symbol_csvs(
+    symbols: List[str],
+    data_path: Path,
+    timeframe: str,
+    asset_class: str,
+    user_start_date: Optional[pd.Timestamp],
+    user_end_date: Optional[pd.Timestamp],
+    workers: Optional[int] = 1,
+    show_progress: bool = False,
+    engine: str = 'pandas',
+    use_cache: bool = True,
+    rebuild_cache: bool = False,
+    cache_stats: Optional[CsvCacheStats] = None,
+    resume_from: Optional[Dict[int, pd.Timestamp]] = None
+) -> List[Tuple[int, pd.DataFrame]]:
+    """
+    Load, validate and filter CSV files for all symbols into memory.
+
+    Same as iter_symbol_csvs(), collected into a list. Prefer the iterator
+    when the result feeds a bar writer.
+
+    Returns:
+        List of (sid, DataFrame) tuples sorted by sid
+    """
+    return list(iter_symbol_csvs(
+        symbols=symbols,
+        data_path=data_path,
+        timeframe=timeframe,
+        asset_class=asset_class,
+        user_start_date=user_start_date,
+        user_end_date=user_end_date,
+        workers=workers,
+        show_progress=show_progress,
+        engine=engine,
+        use_cache=use_cache,
+        rebuild_cache=rebuild_cache,
+        cache_stats=cache_stats,
+        resume_from=resume_from
+    ))
+
+
+def asset_metadata_from_spans(
+    symbols: List[str],
+    spans: Dict[int, Tuple[pd.Timestamp, pd.Timestamp]],
     calendar_name: str
 ) -> pd.DataFrame:
     """
-    Create asset metadata DataFrame from symbol data.
+    Create asset metadata from each sid's first and last bar.
 
     Args:
         symbols: List of symbols
-        data_dict: Dict mapping sid -> DataFrame
+        spans: Dict mapping sid -> (first bar, last bar)
         calendar_name: Calendar name
 
     Returns:
         Assets DataFrame with metadata
     """
     asset_data_list = []
-    for sid, df in data_dict.items():
+    for sid, (first_bar, last_bar) in spans.items():
         symbol = symbols[sid]
-        first_trade = df.index.min().normalize()
-        last_trade = df.index.max().normalize()
         asset_data_list.append({
             'sid': sid,
             'symbol': symbol,
             'asset_name': symbol,
-            'start_date': first_trade,
-            'end_date': last_trade,
+            'start_date': first_bar.normalize(),
+            'end_date': last_bar.normalize(),
             'exchange': calendar_name,
             'country_code': 'XX',
         })
-    return pd.DataFrame(asset_data_list).set_index('sid')
+    columns = ['sid', 'symbol', 'asset_name', 'start_date', 'end_date', 'exchange', 'country_code']
+    return pd.DataFrame(asset_data_list, columns=columns).set_index('sid')
+
+
+def create_asset_metadata(
+    symbols: List[str],
+    data_dict: dict,
+    calendar_name: str
+) -> pd.DataFrame:
+    """
+    Create asset metadata DataFrame from symbol data.
+
+    Args:
+        symbols: List of symbols
+        data_dict: Dict mapping sid -> DataFrame
+        calendar_name: Calendar name
+
+    Returns:
+        Assets DataFrame with metadata
+    """
+    spans = {sid: (df.index.min(), df.index.max()) for sid, df in data_dict.items()}
+    return asset_metadata_from_spans(symbols, spans, calendar_name)
@@ -5,31 +5,38 @@ Handles CSV file reading, column normalization, and filename parsing
 for date range extraction.
 """
 
+import csv
 import logging
 import re
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Sequence
 
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Standard OHLCV column order used throughout ingestion
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
 
-def normalize_csv_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Normalize CSV column names to lowercase standard format.
+# Supported CSV parse engines for read_ohlcv_csv()
+CSV_ENGINES = ('pandas', 'pyarrow', 'chunked')
 
-    Handles various column naming conventions:
-    - Title case: Open, High, Low, Close, Volume
-    - Uppercase: OPEN, HIGH, LOW, CLOSE, VOLUME
-    - Mixed case: open, HIGH, Close, etc.
-    - With prefixes: Adj Close, Adj_Close, adjusted_close
+# Default rows per chunk for the 'chunked' engine
+DEFAULT_CSV_CHUNKSIZE = 1_000_000
+
+# Trailing UTC offset on an ISO-8601 timestamp (e.g. '+00:00', '-0500', 'Z')
+_UTC_OFFSET_PATTERN = re.compile(r'(?:[+-]\d{2}:?\d{2}|Z)$')
+
+
+def match_ohlcv_columns(columns: Sequence) -> Dict[str, str]:
+    """
+    Map source column names to standard lowercase OHLCV names.
 
     Args:
-        df: DataFrame with potentially non-standard column names
+        columns: Column names as found in the CSV header
 
     Returns:
-        DataFrame with normalized lowercase column names
+        Dict mapping original column name -> standard name
 
     Raises:
         ValueError: If required OHLCV columns cannot be identified
@@ -48,7 +55,7 @@ def normalize_csv_columns(df: pd.DataFrame) -> pd.DataFrame:
     found_columns = {}
 
     for target_name, patterns in column_patterns.items():
-        for col in df.columns:
+        for col in columns:
             col_lower = str(col).lower().strip()
             for pattern in patterns:
                 if re.match(pattern, col_lower):
@@ -60,23 +67,158 @@ def normalize_csv_columns(df: pd.DataFrame) -> pd.DataFrame:
                 break
 
     # Check for missing required columns
-    required = {'open', 'high', 'low', 'close', 'volume'}
+    required = set(OHLCV_COLUMNS)
     missing = required - set(found_columns.keys())
 
     if missing:
         raise ValueError(
             f"CSV missing required columns: {missing}. "
-            f"Found columns: {list(df.columns)}. "
+            f"Found columns: {list(columns)}. "
             f"Expected: open, high, low, close, volume (case-insensitive)"
         )
 
+    return column_mapping
+
+
+def normalize_csv_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Normalize CSV column names to lowercase standard format.
+
+    Handles various column naming conventions:
+    - Title case: Open, High, Low, Close, Volume
+    - Uppercase: OPEN, HIGH, LOW, CLOSE, VOLUME
+    - Mixed case: open, HIGH, Close, etc.
+    - With prefixes: Adj Close, Adj_Close, adjusted_close
+
+    Args:
+        df: DataFrame with potentially non-standard column names
+
+    Returns:
+        DataFrame with normalized lowercase column names
+
+    Raises:
+        ValueError: If required OHLCV columns cannot be identified
+    """
+    column_mapping = match_ohlcv_columns(df.columns)
+
     # Rename and keep only required columns
     df = df.rename(columns=column_mapping)
-    df = df[['open', 'high', 'low', 'close', 'volume']]
+    df = df[OHLCV_COLUMNS]
 
     return df
 
 
+def _read_csv_header(csv_file: Path) -> Tuple[List[str], List[str]]:
+    """Return the header row and first data row (empty if none) of a CSV file."""
+    with open(csv_file, 'r', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        first_row = next(reader, [])
+    if not header:
+        raise ValueError(f"CSV file has no header: {csv_file}")
+    return header, first_row
+
+
+def _read_csv_pandas(csv_file: Path) -> pd.DataFrame:
+    """Read with pandas' default parser and date inference."""
+    df = pd.read_csv(csv_file, parse_dates=[0], index_col=0)
+    return normalize_csv_columns(df)
+
+
+def _read_csv_pyarrow(csv_file: Path) -> pd.DataFrame:
+    """Read with the multithreaded pyarrow CSV reader and an explicit schema."""
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+
+    header, first_row = _read_csv_header(csv_file)
+    index_col = header[0]
+    column_mapping = match_ohlcv_columns(header[1:])
+
+    # pyarrow requires the timestamp type to state whether values carry an offset
+    has_offset = bool(first_row) and bool(_UTC_OFFSET_PATTERN.search(first_row[0].strip()))
+    column_types = {index_col: pa.timestamp('ns', tz='UTC' if has_offset else None)}
+    column_types.update({col: pa.float64() for col in column_mapping})
+
+    table = pa_csv.read_csv(
+        str(csv_file),
+        convert_options=pa_csv.ConvertOptions(
+            column_types=column_types,
+            include_columns=[index_col, *column_mapping],
+        ),
+    )
+    df = table.to_pandas().set_index(index_col)
+    df = df.rename(columns=column_mapping)
+    return df[OHLCV_COLUMNS]
+
+
+def _read_csv_chunked(csv_file: Path, chunksize: int) -> pd.DataFrame:
+    """Stream the file in bounded-size chunks, normalizing each as it is read."""
+    header, _ = _read_csv_header(csv_file)
+    index_col = header[0]
+    column_mapping = match_ohlcv_columns(header[1:])
+
+    reader = pd.read_csv(
+        csv_file,
+        index_col=index_col,
+        usecols=[index_col, *column_mapping],
+        dtype={col: 'float64' for col in column_mapping},
+        chunksize=chunksize,
+    )
+    chunks = []
+    for chunk in reader:
+        chunk = chunk.rename(columns=column_mapping)[OHLCV_COLUMNS]
+        chunk.index = pd.to_datetime(chunk.index, utc=True)
+        chunks.append(chunk)
+
+    if not chunks:
+        return pd.DataFrame(columns=OHLCV_COLUMNS, dtype='float64',
+                            index=pd.DatetimeIndex([], tz='UTC', name=index_col))
+    return pd.concat(chunks, copy=False)
+
+
+def read_ohlcv_csv(
+    csv_file: Path,
+    engine: str = 'pandas',
+    chunksize: int = DEFAULT_CSV_CHUNKSIZE
+) -> pd.DataFrame:
+    """
+    Read an OHLCV CSV into a normalized DataFrame.
+
+    The first column is the timestamp index; OHLCV columns are identified
+    case-insensitively (see normalize_csv_columns). All engines return the
+    same frame: float64 OHLCV columns and a UTC DatetimeIndex.
+
+    Engines:
+    - 'pandas': pd.read_csv with date inference (handles any date format)
+    - 'pyarrow': pyarrow CSV reader with explicit float64/timestamp schema.
+      Fastest; requires ISO-8601 timestamps.
+    - 'chunked': pandas reader streaming `chunksize` rows at a time with
+      explicit float64 dtypes, keeping parse memory bounded for huge files.
+
+    Args:
+        csv_file: Path to CSV file
+        engine: Parse engine ('pandas', 'pyarrow', 'chunked')
+        chunksize: Rows per chunk for the 'chunked' engine
+
+    Returns:
+        DataFrame with open, high, low, close, volume columns
+
+    Raises:
+        ValueError: If engine is unknown or required columns are missing
+    """
+    if engine == 'pandas':
+        df = _read_csv_pandas(csv_file)
+    elif engine == 'pyarrow':
+        df = _read_csv_pyarrow(csv_file)
+    elif engine == 'chunked':
+        df = _read_csv_chunked(csv_file, chunksize)
+    else:
+        raise ValueError(f"Unknown CSV engine: {engine}. Valid options: {list(CSV_ENGINES)}")
+
+    df.index = pd.to_datetime(df.index, utc=True)
+    return df.astype('float64', copy=False)
+
+
 def parse_csv_filename(
     filename: str,
     symbol: str,
@@ -7,7 +7,7 @@ Coordinates CSV loading, session management, and Zipline writer operations.
 
 import logging
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 import pandas as pd
 from zipline.utils.calendar_utils import get_calendar
@@ -15,13 +15,32 @@ from zipline.utils.calendar_utils import get_calendar
 from ...calendars.sessions import SessionManager
 from ...utils import get_project_root
 from ..timeframes import get_timeframe_info, get_minutes_per_day
-from ..registry import register_bundle_metadata, add_registered_bundle, unregister_bundle
-from .ingestion import load_and_process_csv
+from ..incremental import load_previous_ingestion
+from ..registry import (
+    register_bundle_metadata,
+    add_registered_bundle,
+    unregister_bundle,
+    update_bundle_coverage,
+)
+from .ingestion import iter_symbol_csvs
 from .writer import write_minute_and_daily_bars, write_daily_bars
 
 logger = logging.getLogger(__name__)
 
 
+def _require_data(
+    data: Iterable[Tuple[int, pd.DataFrame]],
+    message: str
+) -> Iterator[Tuple[int, pd.DataFrame]]:
+    """Pass a bar stream through, raising RuntimeError(message) if it turns out empty."""
+    empty = True
+    for item in data:
+        empty = False
+        yield item
+    if empty:
+        raise RuntimeError(message)
+
+
 def register_csv_bundle(
     bundle_name: str,
     symbols: List[str],
@@ -30,7 +49,12 @@ def register_csv_bundle(
     asset_class: str,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
-    force: bool = False
+    force: bool = False,
+    workers: Optional[int] = 1,
+    csv_engine: str = 'pandas',
+    use_cache: bool = True,
+    rebuild_cache: bool = False,
+    incremental: bool = False
 ):
     """
     Register a local CSV data bundle for ingestion using SessionManager.
@@ -51,6 +75,16 @@ def register_csv_bundle(
         start_date: Optional start date (overrides filename dates)
         end_date: Optional end date (overrides filename dates)
         force: If True, re-ingest even if bundle exists
+        workers: Worker processes for per-symbol CSV parsing, validation and
+            filtering (1 = sequential, 0 = all CPUs). Bars are still written
+            by a single writer in sid order, so output is deterministic.
+        csv_engine: CSV parse engine ('pandas', 'pyarrow', 'chunked')
+        use_cache: Reuse processed CSVs from data/cache/csv/ when unchanged
+        rebuild_cache: Reprocess every CSV and overwrite its cache entry
+        incremental: Append only rows newer than the bundle's most recent
+            ingestion, reusing its bars (see lib/bundles/incremental.py).
+            Falls back to a full ingest when there is no compatible
+            previous ingestion.
 
     Raises:
         FileNotFoundError: If CSV directory or files not found
@@ -71,6 +105,11 @@ def register_csv_bundle(
     closure_timeframe = timeframe
     closure_calendar_name = calendar_name
     closure_asset_class = asset_class
+    closure_workers = workers
+    closure_csv_engine = csv_engine
+    closure_use_cache = use_cache
+    closure_rebuild_cache = rebuild_cache
+    closure_incremental = incremental
 
     def make_csv_ingest(symbols_list):
         mpd = get_minutes_per_day(closure_calendar_name)
@@ -102,49 +141,46 @@ def register_csv_bundle(
             tf_info = get_timeframe_info(closure_timeframe)
             data_frequency = tf_info['data_frequency']
 
+            # Previous version to append to (incremental mode)
+            previous = None
+            if closure_incremental:
+                previous = load_previous_ingestion(
+                    bundle_name,
+                    symbols_list,
+                    data_frequency,
+                    start_session=start_session,
+                    minutes_per_day=mpd,
+                    exclude=timestamp
+                )
+                if show_progress:
+                    if previous is None:
+                        print("  No compatible previous ingestion, running a full ingest")
+                    else:
+                        print(f"  Appending to ingestion {previous.timestr}")
+
             # Load all CSV data
             local_data_path = get_project_root() / 'data' / 'processed' / closure_timeframe
             if not local_data_path.is_dir():
                 raise FileNotFoundError(f"CSV data directory not found: {local_data_path}")
 
-            all_data = []
-            for sid, symbol in enumerate(symbols_list):
-                try:
-                    # Find CSV file
-                    file_pattern = f"{symbol}_{closure_timeframe}_*.csv"
-                    matching_files = list(local_data_path.glob(file_pattern))
-
-                    if not matching_files:
-                        logger.warning(f"No CSV file found for {symbol} with pattern '{file_pattern}'")
-                        continue
-
-                    csv_file = matching_files[0]
-
-                    # Load and process CSV with SessionManager
-                    df = load_and_process_csv(
-                        csv_file=csv_file,
-                        symbol=symbol,
-                        timeframe=closure_timeframe,
-                        asset_class=closure_asset_class,
-                        session_mgr=session_mgr,
-                        user_start_date=user_start,
-                        user_end_date=user_end,
-                        show_progress=show_progress
-                    )
-
-                    if not df.empty:
-                        all_data.append((sid, df))
-                    else:
-                        logger.warning(f"No data for {symbol} after filtering")
-
-                except Exception as e:
-                    logger.exception(f"Error processing CSV for {symbol}: {e}")
-                    if show_progress:
-                        print(f"  Error: {symbol}: {e}")
-                    continue
-
-            if not all_data:
-                raise RuntimeError(
+            # Stream symbols from the load pipeline straight into the bar writers
+            all_data = iter_symbol_csvs(
+                symbols=symbols_list,
+                data_path=local_data_path,
+                timeframe=closure_timeframe,
+                asset_class=closure_asset_class,
+                user_start_date=user_start,
+                user_end_date=user_end,
+                workers=closure_workers,
+                show_progress=show_progress,
+                engine=closure_csv_engine,
+                use_cache=closure_use_cache,
+                rebuild_cache=closure_rebuild_cache,
+                resume_from=previous.resume_dates() if previous is not None else None
+            )
+            if previous is None:
+                all_data = _require_data(
+                    all_data,
                     f"No CSV data was successfully loaded. "
                     f"Symbols attempted: {symbols_list}. "
                     f"Check data/processed/{closure_timeframe}/"
@@ -152,7 +188,7 @@ def register_csv_bundle(
 
             # Write data to Zipline bundle
             if data_frequency == 'minute':
-                write_minute_and_daily_bars(
+                coverage = write_minute_and_daily_bars(
                     minute_data=all_data,
                     symbols=symbols_list,
                     session_mgr=session_mgr,
@@ -160,19 +196,28 @@ def register_csv_bundle(
                     minute_bar_writer=minute_bar_writer,
                     daily_bar_writer=daily_bar_writer,
                     adjustment_writer=adjustment_writer,
-                    show_progress=show_progress
+                    show_progress=show_progress,
+                    previous=previous
                 )
             else:
-                write_daily_bars(
+                coverage = write_daily_bars(
                     daily_data=all_data,
                     symbols=symbols_list,
                     calendar_name=closure_calendar_name,
                     asset_db_writer=asset_db_writer,
                     daily_bar_writer=daily_bar_writer,
                     adjustment_writer=adjustment_writer,
-                    show_progress=show_progress
+                    show_progress=show_progress,
+                    previous=previous,
+                    calendar=calendar
                 )
 
+            update_bundle_coverage(
+                bundle_name,
+                {symbols_list[sid]: span for sid, span in coverage.items()},
+                incremental=previous is not None
+            )
+
         return csv_ingest
 
     make_csv_ingest(symbols)
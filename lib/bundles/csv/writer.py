@@ -2,39 +2,112 @@
 Zipline writer interface for CSV bundles.
 
 Handles writing minute and daily bars to Zipline bundle storage,
-including aggregation from minute to daily data.
+including aggregation from minute to daily data. Bars are consumed as a
+stream, so a symbol can be written while the next ones are still loading.
 """
 
 import logging
-from typing import Iterator, Tuple, List
+from typing import Dict, Iterable, Iterator, Tuple, List, Optional
 
 import pandas as pd
 
 from ...calendars.sessions import SessionManager
 from ...data.aggregation import aggregate_ohlcv
 from ...data.filters import consolidate_forex_sunday_to_friday, filter_to_calendar_sessions, apply_gap_filling
+from ..incremental import Coverage, PreviousIngestion, track_coverage
 
 logger = logging.getLogger(__name__)
 
 
+def _track_spans(
+    data: Iterable[Tuple[int, pd.DataFrame]],
+    spans: Dict[int, Tuple[pd.Timestamp, pd.Timestamp]]
+) -> Iterator[Tuple[int, pd.DataFrame]]:
+    """Pass bars through while recording each sid's first and last bar for asset metadata."""
+    for sid, df in data:
+        spans[sid] = (df.index.min(), df.index.max())
+        yield sid, df
+
+
+def _minute_to_daily(
+    sid: int,
+    minute_df: pd.DataFrame,
+    session_mgr: SessionManager,
+    show_progress: bool = False
+) -> Optional[pd.DataFrame]:
+    """
+    Aggregate one symbol's minute bars to daily bars.
+
+    Applies FOREX-specific filters (Sunday consolidation, session filtering).
+
+    Returns:
+        Daily bars, or None if nothing is left or aggregation failed
+    """
+    try:
+        daily_df = aggregate_ohlcv(minute_df, 'daily')
+        if daily_df.empty:
+            logger.warning(f"No daily data after aggregating minute data for SID {sid}")
+            return None
+
+        # Ensure UTC timezone and normalize
+        if daily_df.index.tz is not None:
+            daily_df.index = daily_df.index.tz_convert('UTC').normalize()
+        else:
+            daily_df.index = daily_df.index.tz_localize('UTC').normalize()
+
+        # Apply FOREX-specific filters to aggregated daily data
+        if 'FOREX' in session_mgr.calendar_name.upper():
+            daily_df = consolidate_forex_sunday_to_friday(
+                daily_df, session_mgr.calendar, show_progress, sid
+            )
+            if daily_df.empty:
+                return None
+
+            daily_df = filter_to_calendar_sessions(
+                daily_df, session_mgr.calendar, show_progress, sid
+            )
+            if daily_df.empty:
+                return None
+
+        # Skip gap filling for CSV sources - data is assumed complete
+        # Gap filling is only needed for API sources (Yahoo) where data may be incomplete
+        # CSV files are pre-validated and complete, so gap filling causes false warnings
+        # with intraday-to-daily aggregated data
+
+        return daily_df
+    except Exception as e:
+        logger.exception(f"Failed to aggregate daily data for SID {sid}: {e}")
+        return None
+
+
 def write_minute_and_daily_bars(
-    minute_data: List[Tuple[int, pd.DataFrame]],
+    minute_data: Iterable[Tuple[int, pd.DataFrame]],
     symbols: List[str],
     session_mgr: SessionManager,
     asset_db_writer,
     minute_bar_writer,
     daily_bar_writer,
     adjustment_writer,
-    show_progress: bool = False
-):
+    show_progress: bool = False,
+    previous: Optional[PreviousIngestion] = None
+) -> Coverage:
     """
     Write both minute and daily bars to Zipline bundle.
 
+    minute_data may be a stream (see iter_symbol_csvs()). Each symbol's
+    minute bars go straight to the minute writer and are aggregated to
+    daily bars as they pass, so only the much smaller daily frames are
+    kept until the daily writer runs. Asset metadata is written last, from
+    the first and last bar seen per sid.
+
     For minute data, aggregates to daily and applies FOREX-specific
     filters (Sunday consolidation, gap filling) to daily bars.
 
+    With a previous ingestion, minute_data holds only new bars: previous
+    minute ctables are copied and appended to, and daily bars are merged.
+
     Args:
-        minute_data: List of (sid, DataFrame) tuples with minute bars
+        minute_data: Iterable of (sid, DataFrame) tuples with minute bars, in sid order
         symbols: List of symbols
         session_mgr: SessionManager for calendar operations
         asset_db_writer: Zipline asset database writer
@@ -42,107 +115,105 @@ def write_minute_and_daily_bars(
         daily_bar_writer: Zipline daily bar writer
         adjustment_writer: Zipline adjustment writer
         show_progress: Whether to print progress messages
+        previous: Previous ingestion to append to (incremental mode)
+
+    Returns:
+        Covered (first, last) session per sid
     """
-    from .ingestion import create_asset_metadata
+    from .ingestion import asset_metadata_from_spans
 
-    # Write asset metadata
-    asset_metadata = create_asset_metadata(
-        symbols,
-        {sid: df for sid, df in minute_data},
-        session_mgr.calendar_name
-    )
-    asset_db_writer.write(equities=asset_metadata)
+    if previous is not None:
+        previous.copy_minute_bars(minute_bar_writer, show_progress=show_progress)
+
+    spans: Dict[int, Tuple[pd.Timestamp, pd.Timestamp]] = {}
+    daily_bars: List[Tuple[int, pd.DataFrame]] = []
+
+    def minute_stream():
+        """Yield minute bars to the writer, aggregating each symbol to daily on the way."""
+        for sid, minute_df in _track_spans(minute_data, spans):
+            daily_df = _minute_to_daily(sid, minute_df, session_mgr, show_progress)
+            if daily_df is not None:
+                daily_bars.append((sid, daily_df))
+            yield sid, minute_df
 
     # Write minute bars
     if show_progress:
-        print(f"  Writing {len(minute_data)} symbol(s) to minute bar writer...")
-    minute_bar_writer.write(iter(minute_data), show_progress=show_progress)
+        print("  Streaming minute bars to minute bar writer (aggregating to daily)...")
+    minute_bar_writer.write(minute_stream(), show_progress=show_progress)
 
-    # Aggregate to daily and write
-    if show_progress:
-        print("  Aggregating minute data to daily bars...")
-
-    def daily_data_gen():
-        """Generate aggregated daily data from minute data."""
-        for sid, minute_df in minute_data:
-            try:
-                daily_df = aggregate_ohlcv(minute_df, 'daily')
-                if daily_df.empty:
-                    logger.warning(f"No daily data after aggregating minute data for SID {sid}")
-                    continue
-
-                # Ensure UTC timezone and normalize
-                if daily_df.index.tz is not None:
-                    daily_df.index = daily_df.index.tz_convert('UTC').normalize()
-                else:
-                    daily_df.index = daily_df.index.tz_localize('UTC').normalize()
-
-                # Apply FOREX-specific filters to aggregated daily data
-                if 'FOREX' in session_mgr.calendar_name.upper():
-                    daily_df = consolidate_forex_sunday_to_friday(
-                        daily_df, session_mgr.calendar, show_progress, sid
-                    )
-                    if daily_df.empty:
-                        continue
-
-                    daily_df = filter_to_calendar_sessions(
-                        daily_df, session_mgr.calendar, show_progress, sid
-                    )
-                    if daily_df.empty:
-                        continue
-
-                # Skip gap filling for CSV sources - data is assumed complete
-                # Gap filling is only needed for API sources (Yahoo) where data may be incomplete
-                # CSV files are pre-validated and complete, so gap filling causes false warnings
-                # with intraday-to-daily aggregated data
-
-                yield sid, daily_df
-            except Exception as e:
-                logger.exception(f"Failed to aggregate daily data for SID {sid}: {e}")
-                continue
-
-    daily_bar_writer.write(daily_data_gen(), show_progress=show_progress)
+    # Write aggregated daily bars
+    daily_data = iter(daily_bars)
+    if previous is not None:
+        daily_data = previous.merge_daily_bars(daily_data, session_mgr.calendar)
+    coverage: Coverage = {}
+    daily_bar_writer.write(track_coverage(daily_data, coverage), show_progress=show_progress)
+
+    # Write asset metadata
+    asset_metadata = asset_metadata_from_spans(symbols, spans, session_mgr.calendar_name)
+    if previous is not None:
+        asset_metadata = previous.merge_asset_metadata(asset_metadata)
+    asset_db_writer.write(equities=asset_metadata)
 
     # Write adjustments (empty for CSV data)
     adjustment_writer.write(splits=None, dividends=None, mergers=None)
 
     if show_progress:
         print("  ✓ Both minute and daily bars written successfully")
+    return coverage
 
 
 def write_daily_bars(
-    daily_data: List[Tuple[int, pd.DataFrame]],
+    daily_data: Iterable[Tuple[int, pd.DataFrame]],
     symbols: List[str],
     calendar_name: str,
     asset_db_writer,
     daily_bar_writer,
     adjustment_writer,
-    show_progress: bool = False
-):
+    show_progress: bool = False,
+    previous: Optional[PreviousIngestion] = None,
+    calendar=None
+) -> Coverage:
     """
     Write daily bars to Zipline bundle.
 
+    daily_data may be a stream (see iter_symbol_csvs()); it is consumed
+    directly by the daily bar writer. Asset metadata is written afterwards,
+    from the first and last bar seen per sid.
+
+    With a previous ingestion, daily_data holds only new bars and is merged
+    with the previous version's daily bars.
+
     Args:
-        daily_data: List of (sid, DataFrame) tuples with daily bars
+        daily_data: Iterable of (sid, DataFrame) tuples with daily bars, in sid order
         symbols: List of symbols
         calendar_name: Calendar name
         asset_db_writer: Zipline asset database writer
         daily_bar_writer: Zipline daily bar writer
         adjustment_writer: Zipline adjustment writer
         show_progress: Whether to print progress messages
+        previous: Previous ingestion to append to (incremental mode)
+        calendar: Trading calendar (required with previous)
+
+    Returns:
+        Covered (first, last) session per sid
     """
-    from .ingestion import create_asset_metadata
+    from .ingestion import asset_metadata_from_spans
 
-    # Write asset metadata
-    asset_metadata = create_asset_metadata(
-        symbols,
-        {sid: df for sid, df in daily_data},
-        calendar_name
-    )
-    asset_db_writer.write(equities=asset_metadata)
+    spans: Dict[int, Tuple[pd.Timestamp, pd.Timestamp]] = {}
+    bars = _track_spans(daily_data, spans)
+    if previous is not None:
+        bars = previous.merge_daily_bars(bars, calendar)
 
     # Write daily bars
-    daily_bar_writer.write(iter(daily_data), show_progress=show_progress)
+    coverage: Coverage = {}
+    daily_bar_writer.write(track_coverage(bars, coverage), show_progress=show_progress)
+
+    # Write asset metadata
+    asset_metadata = asset_metadata_from_spans(symbols, spans, calendar_name)
+    if previous is not None:
+        asset_metadata = previous.merge_asset_metadata(asset_metadata)
+    asset_db_writer.write(equities=asset_metadata)
 
     # Write adjustments (empty for CSV data)
     adjustment_writer.write(splits=None, dividends=None, mergers=None)
+    return coverage
@@ -0,0 +1,296 @@
+"""
+Derived-timeframe bundles built from an existing minute bundle.
+
+Building 5m, 15m, 1h and daily bundles by re-running CSV ingestion for each
+timeframe re-parses and re-validates the same raw files every time. A
+derived bundle instead reads the source bundle's bcolz minute bars and
+aggregates them per session (aggregate_ohlcv_by_session() in
+lib/data/aggregation.py), skipping parsing and validation entirely. One 1m
+ingest then feeds every coarser timeframe.
+
+The source's most recent ingestion is used. Its symbols, calendar and asset
+attributes carry over; sids follow the order of the derived bundle's symbols.
+"""
+
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..data.aggregation import TIMEFRAME_MINUTES, aggregate_ohlcv_by_session
+from .incremental import OHLCV_FIELDS, Coverage, find_previous_ingestion, track_coverage
+from .pipeline import Stage, run_pipeline
+from .registry import (
+    add_registered_bundle,
+    load_bundle_registry,
+    register_bundle_metadata,
+    unregister_bundle,
+    update_bundle_coverage,
+)
+from .timeframes import get_minutes_per_day, get_timeframe_info
+
+logger = logging.getLogger(__name__)
+
+# Aggregation threads when the caller does not choose (see register_derived_bundle())
+DEFAULT_DERIVED_WORKERS = 4
+
+
+def derived_bundle_name(source_bundle: str, timeframe: str) -> str:
+    """
+    Default name for a bundle derived from source_bundle: the source name
+    with its timeframe suffix replaced (csv_crypto_1m -> csv_crypto_5m).
+    """
+    tf_normalized = {'1d': 'daily'}.get(timeframe, timeframe)
+    prefix, sep, _ = source_bundle.rpartition('_')
+    return f"{prefix}_{tf_normalized}" if sep else f"{source_bundle}_{tf_normalized}"
+
+
+def validate_derivation(source_meta: Dict[str, Any], timeframe: str) -> None:
+    """
+    Check that timeframe can be aggregated from the source bundle.
+
+    Args:
+        source_meta: Registry metadata of the source bundle
+        timeframe: Target timeframe
+
+    Raises:
+        ValueError: If the source is not a minute bundle or the target is
+            not a whole multiple of the source timeframe
+    """
+    if source_meta.get('data_frequency') != 'minute':
+        raise ValueError(
+            f"Derived bundles need a minute source bundle, got data_frequency="
+            f"{source_meta.get('data_frequency')!r}"
+        )
+    source_tf = source_meta.get('timeframe', '1m')
+    source_mins = TIMEFRAME_MINUTES.get(source_tf)
+    target_mins = TIMEFRAME_MINUTES.get(timeframe)
+    if source_mins is None or target_mins is None:
+        raise ValueError(f"Cannot derive {timeframe} from {source_tf}: unknown timeframe")
+    if target_mins <= source_mins or target_mins % source_mins:
+        raise ValueError(
+            f"Cannot derive {timeframe} from {source_tf}: target must be a larger "
+            f"whole multiple of the source timeframe"
+        )
+
+
+def read_minute_bars(
+    minute_reader,
+    sid: int,
+    start: pd.Timestamp,
+    end: pd.Timestamp
+) -> pd.DataFrame:
+    """
+    Read one sid's minute bars between two sessions, dropping empty minutes.
+
+    Args:
+        minute_reader: BcolzMinuteBarReader of the source bundle
+        sid: Source sid
+        start: First session to read
+        end: Last session to read
+
+    Returns:
+        DataFrame with OHLCV columns and a UTC minute index
+    """
+    calendar = minute_reader.trading_calendar
+    start_minute = calendar.session_first_minute(start.tz_localize(None) if start.tz else start)
+    end_minute = min(
+        calendar.session_last_minute(end.tz_localize(None) if end.tz else end),
+        minute_reader.last_available_dt
+    )
+    if end_minute < start_minute:
+        return pd.DataFrame(columns=OHLCV_FIELDS, dtype='float64')
+
+    minutes = calendar.minutes_in_range(start_minute, end_minute)
+    arrays = minute_reader.load_raw_arrays(OHLCV_FIELDS, start_minute, end_minute, [sid])
+    traded = ~np.isnan(arrays[OHLCV_FIELDS.index('close')][:, 0])
+    return pd.DataFrame(
+        {field: values[traded, 0] for field, values in zip(OHLCV_FIELDS, arrays)},
+        index=minutes[traded]
+    )
+
+
+def _complete_sessions(daily_df: pd.DataFrame, calendar) -> pd.DataFrame:
+    """Reindex daily bars to every session in their range, writing gaps as zeros like the other writers."""
+    sessions = calendar.sessions_in_range(
+        daily_df.index[0].tz_localize(None), daily_df.index[-1].tz_localize(None)
+    )
+    sessions = sessions.tz_localize('UTC') if sessions.tz is None else sessions
+    return daily_df.reindex(sessions).fillna(0.0)
+
+
+def _source_assets(asset_db_path: str, sids: List[int]) -> Dict[int, Any]:
+    """Source Equity objects by sid."""
+    from zipline.assets import AssetFinder
+    finder = AssetFinder(asset_db_path)
+    return {asset.sid: asset for asset in finder.retrieve_all(sids)}
+
+
+def register_derived_bundle(
+    bundle_name: str,
+    source_bundle: str,
+    timeframe: str,
+    symbols: Optional[List[str]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    force: bool = False,
+    workers: Optional[int] = None
+) -> None:
+    """
+    Register a bundle aggregated from an existing minute bundle.
+
+    Args:
+        bundle_name: Name of the derived bundle
+        source_bundle: Registered minute bundle to aggregate from
+        timeframe: Target timeframe ('5m', '15m', '1h', '4h', 'daily', ...)
+        symbols: Subset of the source symbols (None = all, in source order)
+        start_date: Start date (YYYY-MM-DD), None = source start
+        end_date: End date (YYYY-MM-DD), None = source end
+        force: If True, unregister and re-register the bundle
+        workers: Threads reading and aggregating symbols ahead of the writer
+            (None = DEFAULT_DERIVED_WORKERS, 0 or negative = all CPUs)
+
+    Raises:
+        ValueError: If the source is unknown, not a minute bundle, lacks
+            requested symbols, or cannot be aggregated to timeframe
+    """
+    from zipline.data.bundles import bundles, register
+
+    if workers is None:
+        workers = DEFAULT_DERIVED_WORKERS
+    elif workers <= 0:
+        workers = os.cpu_count() or 1
+
+    registry = load_bundle_registry()
+    if source_bundle not in registry:
+        raise ValueError(f"Source bundle '{source_bundle}' is not in the bundle registry")
+    source_meta = registry[source_bundle]
+    timeframe = timeframe.lower()
+    validate_derivation(source_meta, timeframe)
+
+    source_symbols = list(source_meta.get('symbols') or [])
+    symbols_list = list(symbols) if symbols else source_symbols
+    unknown = [s for s in symbols_list if s not in source_symbols]
+    if unknown:
+        raise ValueError(f"Symbols not in source bundle '{source_bundle}': {unknown}")
+
+    calendar_name = source_meta['calendar_name']
+    data_frequency = get_timeframe_info(timeframe)['data_frequency']
+
+    if bundle_name in bundles:
+        if force:
+            unregister_bundle(bundle_name)
+        else:
+            return
+
+    mpd = get_minutes_per_day(calendar_name)
+    user_start = pd.Timestamp(start_date, tz='UTC') if start_date else None
+    user_end = pd.Timestamp(end_date, tz='UTC') if end_date else None
+
+    @register(bundle_name, calendar_name=calendar_name, minutes_per_day=mpd)
+    def derived_ingest(environ, asset_db_writer, minute_bar_writer,
+                       daily_bar_writer, adjustment_writer, calendar,
+                       start_session, end_session, cache, show_progress, timestamp):
+        """Aggregate the source bundle's minute bars into this bundle's timeframe."""
+        from zipline.data.bcolz_minute_bars import BcolzMinuteBarReader
+        from zipline.data.bundles.core import asset_db_path, minute_equity_path
+
+        timestr = find_previous_ingestion(source_bundle)
+        if timestr is None:
+            raise RuntimeError(f"Source bundle '{source_bundle}' has not been ingested")
+        if show_progress:
+            print(f"Aggregating {source_bundle} ({timestr}) to {timeframe} for {len(symbols_list)} symbols...")
+
+        minute_reader = BcolzMinuteBarReader(minute_equity_path(source_bundle, timestr, environ))
+        source_sids = [source_symbols.index(symbol) for symbol in symbols_list]
+        assets = _source_assets(asset_db_path(source_bundle, timestr, environ), source_sids)
+
+        def aggregate(sid: int) -> Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame]]:
+            """Read one symbol's minute bars and aggregate to (target bars, daily bars)."""
+            asset = assets.get(source_sids[sid])
+            if asset is None:
+                return None, None
+            start = max(pd.Timestamp(asset.start_date).tz_localize(None), user_start.tz_localize(None)) \
+                if user_start is not None else pd.Timestamp(asset.start_date).tz_localize(None)
+            end = min(pd.Timestamp(asset.end_date).tz_localize(None), user_end.tz_localize(None)) \
+                if user_end is not None else pd.Timestamp(asset.end_date).tz_localize(None)
+            sessions = calendar.sessions_in_range(start, end)
+            if len(sessions) == 0:
+                return None, None
+            minute_df = read_minute_bars(minute_reader, source_sids[sid], sessions[0], sessions[-1])
+            if minute_df.empty:
+                return None, None
+            daily_df = aggregate_ohlcv_by_session(minute_df, 'daily', calendar)
+            daily_df = _complete_sessions(daily_df, calendar)
+            if data_frequency == 'daily':
+                return None, daily_df
+            return aggregate_ohlcv_by_session(minute_df, timeframe, calendar), daily_df
+
+        sids = list(range(len(symbols_list)))
+        results = run_pipeline(sids, [Stage(aggregate, workers=workers, name='aggregate')], workers + 1)
+
+        spans: Dict[int, Tuple[pd.Timestamp, pd.Timestamp]] = {}
+        daily_bars: List[Tuple[int, pd.DataFrame]] = []
+
+        def bar_stream():
+            """Yield target bars in sid order, keeping daily bars for the daily writer."""
+            for sid, result in zip(sids, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to aggregate {symbols_list[sid]} from {source_bundle}: {result}")
+                    continue
+                bars_df, daily_df = result
+                if daily_df is None:
+                    logger.warning(f"No data for {symbols_list[sid]} in {source_bundle}")
+                    continue
+                spans[sid] = (daily_df.index[0], daily_df.index[-1])
+                if bars_df is None:
+                    yield sid, daily_df
+                else:
+                    daily_bars.append((sid, daily_df))
+                    yield sid, bars_df
+
+        coverage: Coverage = {}
+        if data_frequency == 'minute':
+            minute_bar_writer.write(bar_stream(), show_progress=show_progress)
+            daily_bar_writer.write(track_coverage(iter(daily_bars), coverage), show_progress=show_progress)
+        else:
+            daily_bar_writer.write(track_coverage(bar_stream(), coverage), show_progress=show_progress)
+
+        if not spans:
+            raise RuntimeError(f"No data aggregated from source bundle '{source_bundle}'")
+
+        rows = []
+        for sid, (first, last) in spans.items():
+            asset = assets[source_sids[sid]]
+            rows.append({
+                'sid': sid,
+                'symbol': symbols_list[sid],
+                'asset_name': asset.asset_name,
+                'start_date': first,
+                'end_date': last,
+                'exchange': asset.exchange,
+                'country_code': asset.exchange_info.country_code,
+            })
+        asset_db_writer.write(equities=pd.DataFrame(rows).set_index('sid'))
+        adjustment_writer.write(splits=None, dividends=None, mergers=None)
+
+        update_bundle_coverage(
+            bundle_name,
+            {symbols_list[sid]: span for sid, span in coverage.items()},
+            incremental=False
+        )
+
+    add_registered_bundle(bundle_name)
+    register_bundle_metadata(
+        bundle_name=bundle_name,
+        symbols=symbols_list,
+        calendar_name=calendar_name,
+        start_date=start_date or source_meta.get('start_date'),
+        end_date=end_date or source_meta.get('end_date'),
+        data_frequency=data_frequency,
+        timeframe=timeframe,
+        source_bundle=source_bundle
+    )
+    logger.info(f"Derived bundle {bundle_name} registered from {source_bundle} ({timeframe})")
@@ -0,0 +1,386 @@
+"""
+Incremental (append-only) bundle ingestion.
+
+A full ingest rebuilds every bar from scratch. In incremental mode the most
+recent ingestion of the bundle is opened with Zipline's readers, the last
+ingested bar is found per sid, and only newer rows are processed. The new
+bundle version reuses the unchanged data:
+
+- Minute bars: each sid's bcolz ctable is copied from the previous version
+  and new minutes are appended to the copy, so the previous version is never
+  modified and stays usable (and removable with ``zipline clean``).
+- Daily bars: the daily ctable stores all sids in one table, so previous
+  daily bars are read back and merged with the new ones before writing.
+- Asset metadata keeps each sid's original start date.
+
+Incremental mode requires the previous version to have been written with the
+same symbol order (sids), calendar start session and minutes per day;
+otherwise load_previous_ingestion() returns None and a full ingest is run.
+"""
+
+import logging
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+OHLCV_FIELDS = ['open', 'high', 'low', 'close', 'volume']
+
+# Covered (first, last) session per sid
+Coverage = Dict[int, Tuple[pd.Timestamp, pd.Timestamp]]
+
+
+def _to_utc(ts: pd.Timestamp) -> pd.Timestamp:
+    """Return ts as a UTC-aware Timestamp."""
+    ts = pd.Timestamp(ts)
+    return ts.tz_localize('UTC') if ts.tz is None else ts.tz_convert('UTC')
+
+
+@dataclass
+class PreviousIngestion:
+    """
+    Data from the most recent ingestion of a bundle, used to append to it.
+
+    Attributes:
+        bundle_name: Bundle name
+        timestr: Ingestion directory name (Zipline timestamp string)
+        data_frequency: 'daily' or 'minute'
+        assets: Asset metadata indexed by sid (symbol, asset_name, start_date,
+            end_date, exchange, country_code)
+        daily_bars: Previous daily bars per sid, UTC session index
+        last_bar: Last ingested bar per sid (session label for daily bundles,
+            last written minute for minute bundles)
+        minute_path: Previous minute bar directory (minute bundles only)
+    """
+
+    bundle_name: str
+    timestr: str
+    data_frequency: str
+    assets: pd.DataFrame
+    daily_bars: Dict[int, pd.DataFrame] = field(default_factory=dict)
+    last_bar: Dict[int, pd.Timestamp] = field(default_factory=dict)
+    minute_path: Optional[str] = None
+
+    def resume_from(self, sid: int) -> Optional[pd.Timestamp]:
+        """
+        First timestamp that still needs to be ingested for a sid.
+
+        Returns:
+            UTC Timestamp, or None if the sid is not in the previous version
+        """
+        last = self.last_bar.get(sid)
+        if last is None:
+            return None
+        step = pd.Timedelta(minutes=1) if self.data_frequency == 'minute' else pd.Timedelta(days=1)
+        return last + step
+
+    def resume_dates(self) -> Dict[int, pd.Timestamp]:
+        """resume_from() for every sid of the previous version."""
+        return {sid: self.resume_from(sid) for sid in self.last_bar}
+
+    def trim_new_data(self, sid: int, df: pd.DataFrame) -> pd.DataFrame:
+        """Drop rows of df that are already in the previous version."""
+        resume = self.resume_from(sid)
+        if resume is None or df.empty:
+            return df
+        return df[df.index >= resume]
+
+    def copy_minute_bars(self, minute_bar_writer, show_progress: bool = False) -> int:
+        """
+        Copy previous minute ctables into the new version's minute directory.
+
+        New minutes written afterwards through minute_bar_writer are appended
+        to the copies (BcolzMinuteBarWriter reopens existing ctables in append
+        mode), leaving the previous version untouched.
+
+        Returns:
+            Number of sids copied
+        """
+        if self.minute_path is None:
+            return 0
+        from zipline.data.bcolz_minute_bars import BcolzMinuteBarWriter
+
+        previous_writer = BcolzMinuteBarWriter.open(self.minute_path)
+        copied = 0
+        for sid in sorted(self.last_bar):
+            src = Path(previous_writer.sidpath(sid))
+            if not src.exists():
+                continue
+            dst = Path(minute_bar_writer.sidpath(sid))
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copytree(src, dst)
+            copied += 1
+        if show_progress:
+            print(f"  Reused minute bars for {copied} symbol(s) from ingestion {self.timestr}")
+        return copied
+
+    def merge_daily_bars(
+        self,
+        new_daily: Iterable[Tuple[int, pd.DataFrame]],
+        calendar
+    ) -> Iterator[Tuple[int, pd.DataFrame]]:
+        """
+        Merge previous daily bars with newly ingested ones.
+
+        A session present in both (a partially ingested last session of a
+        minute bundle) is combined as one bar. The result is reindexed to
+        every calendar session in range; sessions without data are written
+        as zeros, which Zipline reads back as missing, exactly as before.
+
+        new_daily is consumed lazily and must be in sid order (as produced by
+        the ingestion pipelines); previous-only sids are interleaved.
+
+        Args:
+            new_daily: Iterable of (sid, DataFrame) with new daily bars, in sid order
+            calendar: Bundle trading calendar
+
+        Yields:
+            (sid, DataFrame) for every sid in the previous or new data
+        """
+        previous_sids = iter(sorted(self.daily_bars))
+        next_previous = next(previous_sids, None)
+        for sid, new_df in new_daily:
+            while next_previous is not None and next_previous < sid:
+                merged = self._merge_sid(next_previous, None, calendar)
+                if merged is not None:
+                    yield next_previous, merged
+                next_previous = next(previous_sids, None)
+            if next_previous == sid:
+                next_previous = next(previous_sids, None)
+            merged = self._merge_sid(sid, new_df, calendar)
+            if merged is not None:
+                yield sid, merged
+        while next_previous is not None:
+            merged = self._merge_sid(next_previous, None, calendar)
+            if merged is not None:
+                yield next_previous, merged
+            next_previous = next(previous_sids, None)
+
+    def _merge_sid(self, sid: int, new_df: Optional[pd.DataFrame], calendar) -> Optional[pd.DataFrame]:
+        """Merge one sid's previous and new daily bars onto its calendar sessions."""
+        frames = [
+            df[OHLCV_FIELDS] for df in (self.daily_bars.get(sid), new_df)
+            if df is not None and not df.empty
+        ]
+        if not frames:
+            return None
+        combined = pd.concat(frames)
+        combined.index = pd.DatetimeIndex([_to_utc(ts) for ts in combined.index])
+        merged = combined.groupby(level=0).agg({
+            'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum',
+        })
+        sessions = calendar.sessions_in_range(
+            merged.index[0].tz_localize(None), merged.index[-1].tz_localize(None)
+        )
+        sessions = sessions.tz_localize('UTC') if sessions.tz is None else sessions
+        return merged.reindex(sessions).fillna(0.0)
+
+    def merge_asset_metadata(self, new_assets: pd.DataFrame) -> pd.DataFrame:
+        """
+        Combine previous and new asset metadata.
+
+        Sids without new data keep their previous row; sids in both keep the
+        earliest start_date and latest end_date.
+        """
+        rows = {}
+        for sid in sorted(set(self.assets.index) | set(new_assets.index)):
+            old = self.assets.loc[sid] if sid in self.assets.index else None
+            new = new_assets.loc[sid] if sid in new_assets.index else None
+            row = (new if new is not None else old).copy()
+            if old is not None and new is not None:
+                row['start_date'] = min(_to_utc(old['start_date']), _to_utc(new['start_date']))
+                row['end_date'] = max(_to_utc(old['end_date']), _to_utc(new['end_date']))
+            rows[sid] = row
+        merged = pd.DataFrame.from_dict(rows, orient='index')
+        merged.index.name = 'sid'
+        return merged
+
+
+def find_previous_ingestion(bundle_name: str, exclude: Optional[str] = None) -> Optional[str]:
+    """
+    Find the most recent complete ingestion of a bundle.
+
+    Args:
+        bundle_name: Bundle name
+        exclude: Ingestion path to skip (the ingestion currently being written)
+
+    Returns:
+        Ingestion directory name (timestr), or None if there is none
+    """
+    from zipline.data.bundles.core import (
+        daily_equity_path,
+        ingestions_for_bundle,
+        to_bundle_ingest_dirname,
+    )
+    from zipline.utils.paths import data_path
+
+    try:
+        ingestions = ingestions_for_bundle(bundle_name)
+    except OSError:
+        return None
+
+    for ingestion_ts in ingestions:
+        timestr = to_bundle_ingest_dirname(ingestion_ts)
+        if exclude is not None and Path(data_path([bundle_name, timestr])) == Path(exclude):
+            continue
+        if Path(daily_equity_path(bundle_name, timestr)).exists():
+            return timestr
+    return None
+
+
+def _read_daily_bars(daily_path: str, sids: List[int]) -> Dict[int, pd.DataFrame]:
+    """Read every daily bar of the given sids, trimmed to each sid's data range."""
+    from zipline.data.bcolz_daily_bars import BcolzDailyBarReader
+
+    reader = BcolzDailyBarReader(daily_path)
+    sessions = reader.sessions
+    if len(sessions) == 0 or not sids:
+        return {}
+    arrays = reader.load_raw_arrays(OHLCV_FIELDS, sessions[0], sessions[-1], sids)
+    index = sessions.tz_localize('UTC') if sessions.tz is None else sessions
+
+    daily_bars = {}
+    for col, sid in enumerate(sids):
+        df = pd.DataFrame(
+            {name: values[:, col] for name, values in zip(OHLCV_FIELDS, arrays)},
+            index=index
+        )
+        valid = np.flatnonzero(df['close'].notna().to_numpy())
+        if valid.size:
+            daily_bars[sid] = df.iloc[valid[0]:valid[-1] + 1]
+    return daily_bars
+
+
+def _last_written_minutes(minute_path: str, sids: List[int]) -> Dict[int, pd.Timestamp]:
+    """Last written minute per sid, derived from each ctable's length."""
+    from zipline.data.bcolz_minute_bars import BcolzMinuteBarMetadata, BcolzMinuteBarReader
+    from zipline.data.bar_reader import NoDataForSid
+
+    metadata = BcolzMinuteBarMetadata.read(minute_path)
+    reader = BcolzMinuteBarReader(minute_path)
+    first_minutes = metadata.calendar.first_minutes
+    start_session = pd.Timestamp(metadata.start_session)
+    if start_session.tz is not None and first_minutes.index.tz is None:
+        start_session = start_session.tz_convert('UTC').tz_localize(None)
+    start_loc = first_minutes.index.get_loc(start_session)
+
+    last_minutes = {}
+    for sid in sids:
+        try:
+            n_minutes = reader.table_len(sid)
+        except NoDataForSid:
+            continue
+        if n_minutes == 0:
+            continue
+        # Ctables hold minutes_per_day slots per session starting at the open
+        session_offset, minute_offset = divmod(n_minutes - 1, metadata.minutes_per_day)
+        session_open = first_minutes.iloc[start_loc + session_offset]
+        last_minutes[sid] = _to_utc(session_open) + pd.Timedelta(minutes=minute_offset)
+    return last_minutes
+
+
+def load_previous_ingestion(
+    bundle_name: str,
+    symbols: List[str],
+    data_frequency: str,
+    start_session: Optional[pd.Timestamp] = None,
+    minutes_per_day: Optional[int] = None,
+    exclude: Optional[str] = None
+) -> Optional[PreviousIngestion]:
+    """
+    Open the most recent ingestion of a bundle for incremental ingestion.
+
+    Args:
+        bundle_name: Bundle name
+        symbols: Symbols being ingested; list position is the sid
+        data_frequency: 'daily' or 'minute'
+        start_session: Start session of the new minute bar writer
+        minutes_per_day: Minutes per day of the new minute bar writer
+        exclude: Path of the ingestion currently being written
+
+    Returns:
+        PreviousIngestion, or None if there is no compatible previous
+        ingestion (a full ingest is needed)
+    """
+    from zipline.assets import AssetFinder
+    from zipline.data.bcolz_minute_bars import BcolzMinuteBarMetadata
+    from zipline.data.bundles.core import asset_db_path, daily_equity_path, minute_equity_path
+
+    timestr = find_previous_ingestion(bundle_name, exclude=exclude)
+    if timestr is None:
+        logger.info(f"No previous ingestion of {bundle_name} found")
+        return None
+
+    finder = AssetFinder(asset_db_path(bundle_name, timestr))
+    equities = finder.retrieve_all(finder.sids)
+    for asset in equities:
+        if asset.sid >= len(symbols) or symbols[asset.sid] != asset.symbol:
+            logger.warning(
+                f"Symbol order of {bundle_name} changed since ingestion {timestr} "
+                f"(sid {asset.sid} was {asset.symbol}); running a full ingest"
+            )
+            return None
+
+    assets = pd.DataFrame([
+        {
+            'sid': asset.sid,
+            'symbol': asset.symbol,
+            'asset_name': asset.asset_name,
+            'start_date': _to_utc(asset.start_date),
+            'end_date': _to_utc(asset.end_date),
+            'exchange': asset.exchange,
+            'country_code': asset.country_code,
+        }
+        for asset in equities
+    ]).set_index('sid') if equities else pd.DataFrame()
+    sids = sorted(assets.index)
+
+    previous = PreviousIngestion(
+        bundle_name=bundle_name,
+        timestr=timestr,
+        data_frequency=data_frequency,
+        assets=assets,
+        daily_bars=_read_daily_bars(daily_equity_path(bundle_name, timestr), sids),
+    )
+
+    if data_frequency == 'minute':
+        minute_path = minute_equity_path(bundle_name, timestr)
+        metadata = BcolzMinuteBarMetadata.read(minute_path)
+        if (start_session is not None and _to_utc(metadata.start_session) != _to_utc(start_session)) or \
+                (minutes_per_day is not None and metadata.minutes_per_day != minutes_per_day):
+            logger.warning(
+                f"Minute bar layout of {bundle_name} ingestion {timestr} differs from the "
+                f"current calendar; running a full ingest"
+            )
+            return None
+        previous.minute_path = minute_path
+        previous.last_bar = _last_written_minutes(minute_path, sids)
+    else:
+        previous.last_bar = {sid: df.index[-1] for sid, df in previous.daily_bars.items()}
+
+    logger.info(
+        f"Appending to {bundle_name} ingestion {timestr} "
+        f"({len(previous.last_bar)} symbol(s) with existing data)"
+    )
+    return previous
+
+
+def track_coverage(
+    daily_data: Iterable[Tuple[int, pd.DataFrame]],
+    coverage: Coverage
+) -> Iterator[Tuple[int, pd.DataFrame]]:
+    """
+    Pass daily bars through while recording each sid's first and last session.
+
+    Sessions written as zeros (no data) are not counted as covered.
+    """
+    for sid, df in daily_data:
+        valid = df.index[df['close'].fillna(0).to_numpy() > 0]
+        if len(valid):
+            coverage[sid] = (valid[0], valid[-1])
+        yield sid, df
@@ -11,7 +11,8 @@ from typing import List, Optional
 
 from ..config import get_data_source
 from .timeframes import get_timeframe_info
-from .registry import add_registered_bundle
+from .registry import add_registered_bundle, load_bundle_registry
+from .derived import derived_bundle_name, register_derived_bundle
 from .yahoo import register_yahoo_bundle
 from .csv import register_csv_bundle
 from ..calendars import register_custom_calendars
@@ -30,6 +31,11 @@ def ingest_bundle(
     calendar_name: Optional[str] = None,
     timeframe: str = 'daily',
     force: bool = False,
+    workers: Optional[int] = None,
+    csv_engine: str = 'pandas',
+    rebuild_cache: bool = False,
+    incremental: bool = False,
+    source_bundle: Optional[str] = None,
     **kwargs
 ) -> str:
     """
@@ -49,6 +55,21 @@ def ingest_bundle(
         calendar_name: Trading calendar ('XNYS', 'CRYPTO', 'FOREX'). Auto-detected from asset class
         timeframe: Data timeframe ('1m', '5m', '15m', '1h', '4h', 'daily', etc.)
         force: If True, unregister and re-register the bundle even if already registered
+        workers: Parallelism, 0 = all CPUs. For the csv source, worker processes
+            for per-symbol CSV processing (None or 1 = sequential). With
+            source_bundle, threads aggregating symbols for the derived bundle
+            (None = DEFAULT_DERIVED_WORKERS in lib/bundles/derived.py).
+        csv_engine: CSV parse engine ('pandas', 'pyarrow', 'chunked'; csv source only)
+        rebuild_cache: Ignore cached inputs: reprocess every CSV instead of reusing
+            data/cache/csv/ (csv source), or refetch instead of reusing
+            data/cache/api/yahoo/ (yahoo source)
+        incremental: Append only data newer than the bundle's most recent ingestion,
+            reusing its existing bars (csv and yahoo sources). Implies force, since
+            the bundle must be re-registered in append mode.
+        source_bundle: Build the bundle by aggregating this registered minute
+            bundle's bars to `timeframe` instead of reading from `source`.
+            Symbols default to the source bundle's, and the bundle name to the
+            source name with its timeframe replaced (csv_crypto_1m -> csv_crypto_5m).
 
     Returns:
         Bundle name string
@@ -57,7 +78,7 @@ def ingest_bundle(
         ValueError: If symbols empty, source not supported, or timeframe invalid
         RuntimeError: If ingestion fails
     """
-    if symbols is None or len(symbols) == 0:
+    if source_bundle is None and (symbols is None or len(symbols) == 0):
         raise ValueError("symbols parameter is required and cannot be empty")
 
     # Validate timeframe
@@ -74,6 +95,11 @@ def ingest_bundle(
             f"For weekly/monthly data, ingest daily data and use aggregation functions."
         )
 
+    if source_bundle is not None:
+        return _ingest_derived_bundle(
+            source_bundle, timeframe, bundle_name, symbols, start_date, end_date, force, workers
+        )
+
     # Validate source
     if source != 'csv':
         try:
@@ -145,6 +171,9 @@ def ingest_bundle(
             f"to {tf_info['aggregation_target']}"
         )
 
+    if incremental:
+        force = True
+
     # Register and ingest based on source
     if source == 'yahoo':
         try:
@@ -156,7 +185,9 @@ def ingest_bundle(
                 end_date=end_date,
                 data_frequency=data_frequency,
                 timeframe=timeframe,
-                force=force
+                force=force,
+                incremental=incremental,
+                refresh_cache=rebuild_cache
             )
 
             from zipline.data.bundles import ingest
@@ -184,7 +215,11 @@ def ingest_bundle(
                 asset_class=asset_class,
                 start_date=start_date,
                 end_date=end_date,
-                force=force
+                force=force,
+                workers=workers,
+                csv_engine=csv_engine,
+                rebuild_cache=rebuild_cache,
+                incremental=incremental
             )
             from zipline.data.bundles import ingest
             ingest(bundle_name, show_progress=True)
@@ -198,3 +233,43 @@ def ingest_bundle(
             f"Unsupported data source: {source}. "
             f"Supported sources: yahoo, binance, oanda, csv"
         )
+
+
+def _ingest_derived_bundle(
+    source_bundle: str,
+    timeframe: str,
+    bundle_name: Optional[str],
+    symbols: Optional[List[str]],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    force: bool,
+    workers: Optional[int]
+) -> str:
+    """Register and ingest a bundle aggregated from a minute bundle (see ingest_bundle())."""
+    if bundle_name is None:
+        bundle_name = derived_bundle_name(source_bundle, timeframe)
+    if bundle_name == source_bundle:
+        raise ValueError(f"Derived bundle name must differ from its source bundle '{source_bundle}'")
+
+    source_meta = load_bundle_registry().get(source_bundle, {})
+    if source_meta.get('calendar_name') in ['CRYPTO', 'FOREX']:
+        register_custom_calendars(calendars=[source_meta['calendar_name']])
+
+    logger.info(f"Ingesting derived bundle: {bundle_name} (from {source_bundle}, timeframe={timeframe})")
+    try:
+        register_derived_bundle(
+            bundle_name=bundle_name,
+            source_bundle=source_bundle,
+            timeframe=timeframe,
+            symbols=symbols,
+            start_date=start_date,
+            end_date=end_date,
+            force=force,
+            workers=workers
+        )
+        from zipline.data.bundles import ingest
+        ingest(bundle_name, show_progress=True)
+        return bundle_name
+    except Exception as e:
+        logger.exception(f"Failed to ingest derived bundle: {bundle_name}")
+        raise RuntimeError(f"Failed to ingest derived bundle: {e}") from e
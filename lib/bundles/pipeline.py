@@ -0,0 +1,141 @@
+"""
+Streaming stage pipeline for bundle ingestion.
+
+Ingestion handles each symbol independently: fetch or parse, then
+validate/filter, then hand the bars to a Zipline writer. Running those
+steps as phases (fetch everything, process everything, write everything)
+holds the whole universe in memory and leaves the CPU idle while waiting on
+the network.
+
+run_pipeline() connects the stages with worker threads and queues and
+yields results in input order, so a writer's `(sid, df)` generator can
+consume directly from it. A semaphore caps the number of items between the
+source and the consumer: once max_in_flight items are fetched, processed or
+waiting to be written, the source blocks until the writer takes one.
+"""
+
+import logging
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, List, Sequence
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+@dataclass
+class Stage:
+    """
+    One step of a pipeline.
+
+    Attributes:
+        func: Function applied to each item; its return value is passed on
+        workers: Threads running func concurrently
+        name: Label used in log messages
+    """
+    func: Callable[[Any], Any]
+    workers: int = 1
+    name: str = ''
+
+
+def run_pipeline(
+    items: Iterable[Any],
+    stages: Sequence[Stage],
+    max_in_flight: int = 4
+) -> Iterator[Any]:
+    """
+    Run items through stages concurrently, yielding results in input order.
+
+    An exception raised by a stage becomes that item's result: later stages
+    skip it and it is yielded in place of a value, so one failing symbol
+    does not stop the others. An exception raised while iterating `items`
+    is re-raised to the consumer after the items before it.
+
+    Args:
+        items: Inputs, consumed lazily
+        stages: Stages applied in order
+        max_in_flight: Maximum items admitted but not yet consumed
+
+    Yields:
+        Final stage result (or exception) per item, in input order
+    """
+    stages = list(stages)
+    max_in_flight = max(1, int(max_in_flight))
+    slots = threading.Semaphore(max_in_flight)
+    stop = threading.Event()
+    # queues[i] feeds stage i; the last queue feeds the consumer
+    queues: List[queue.Queue] = [queue.Queue() for _ in range(len(stages) + 1)]
+    readers = [max(1, stage.workers) for stage in stages] + [1]
+    remaining = list(readers)
+    remaining_lock = threading.Lock()
+    source_error: List[BaseException] = []
+
+    def close(i: int) -> None:
+        """Tell the readers of queues[i] that no more items will come."""
+        for _ in range(readers[i]):
+            queues[i].put(_DONE)
+
+    def feed() -> None:
+        try:
+            for index, item in enumerate(items):
+                while not slots.acquire(timeout=0.1):
+                    if stop.is_set():
+                        return
+                if stop.is_set():
+                    return
+                queues[0].put((index, item))
+        except BaseException as e:
+            source_error.append(e)
+        finally:
+            close(0)
+
+    def work(i: int) -> None:
+        stage = stages[i]
+        inbox, outbox = queues[i], queues[i + 1]
+        while True:
+            entry = inbox.get()
+            if entry is _DONE:
+                with remaining_lock:
+                    remaining[i] -= 1
+                    last = remaining[i] == 0
+                if last:
+                    close(i + 1)
+                return
+            index, value = entry
+            if not isinstance(value, Exception) and not stop.is_set():
+                try:
+                    value = stage.func(value)
+                except Exception as e:
+                    logger.debug(f"Pipeline stage {stage.name or i} failed on item {index}: {e}")
+                    value = e
+            outbox.put((index, value))
+
+    threads = [threading.Thread(target=feed, name='pipeline-source', daemon=True)]
+    for i, stage in enumerate(stages):
+        threads.extend(
+            threading.Thread(target=work, args=(i,), name=f"pipeline-{stage.name or i}-{n}", daemon=True)
+            for n in range(readers[i])
+        )
+    for thread in threads:
+        thread.start()
+
+    pending = {}
+    next_index = 0
+    try:
+        while True:
+            entry = queues[-1].get()
+            if entry is _DONE:
+                break
+            index, value = entry
+            pending[index] = value
+            while next_index in pending:
+                value = pending.pop(next_index)
+                next_index += 1
+                yield value
+                slots.release()
+        if source_error:
+            raise source_error[0]
+    finally:
+        stop.set()
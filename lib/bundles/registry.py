@@ -6,9 +6,19 @@ Handles persistence and retrieval of bundle metadata.
 
 import json
 import logging
+import os
+import secrets
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: registry updates are not locked
+    fcntl = None
+
+import pandas as pd
 
 from ..utils import get_project_root
 from .utils import is_valid_date_string
@@ -46,17 +56,66 @@ def load_bundle_registry() -> dict:
         try:
             with open(registry_path, 'r') as f:
                 return json.load(f)
-        except (json.JSONDecodeError, IOError):
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Could not read bundle registry {registry_path}: {e}")
             return {}
     return {}
 
 
 def save_bundle_registry(registry: dict) -> None:
-    """Save the bundle registry to disk."""
+    """
+    Save the bundle registry to disk.
+
+    Written to a temporary file and moved into place with os.replace, so
+    readers always see either the old or the new registry.
+    """
+    registry_path = get_bundle_registry_path()
+    registry_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = registry_path.with_name(f".{registry_path.name}.{os.getpid()}-{secrets.token_hex(4)}.tmp")
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(registry, f, indent=2)
+        os.replace(tmp_path, registry_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+@contextmanager
+def locked_bundle_registry() -> Iterator[dict]:
+    """
+    Load the registry for a read-modify-write update and save it on exit.
+
+    Holds an exclusive lock on a sidecar lock file for the whole update, so
+    concurrent ingests (e.g. reingest_all.py --jobs) in other processes do
+    not overwrite each other's entries. Nothing is saved if the block raises.
+
+    Yields:
+        The registry dict to modify in place
+    """
     registry_path = get_bundle_registry_path()
     registry_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(registry_path, 'w') as f:
-        json.dump(registry, f, indent=2)
+    lock_path = registry_path.with_name(registry_path.name + '.lock')
+    with open(lock_path, 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            try:
+                with open(registry_path, 'r') as f:
+                    registry = json.load(f)
+            except FileNotFoundError:
+                registry = {}
+            except (json.JSONDecodeError, IOError) as e:
+                # Keep the unreadable file rather than overwriting it with one entry
+                backup = registry_path.with_name(f"{registry_path.name}.corrupt-{datetime.now():%Y%m%d_%H%M%S}")
+                os.replace(registry_path, backup)
+                logger.warning(f"Bundle registry {registry_path} was unreadable ({e}); moved to {backup}")
+                registry = {}
+            yield registry
+            save_bundle_registry(registry)
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
 
 
 def register_bundle_metadata(
@@ -66,11 +125,17 @@ def register_bundle_metadata(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     data_frequency: str = 'daily',
-    timeframe: str = 'daily'
+    timeframe: str = 'daily',
+    source_bundle: Optional[str] = None,
+    memory_gb: Optional[float] = None
 ) -> None:
     """
     Persist bundle metadata to registry file.
 
+    Updates the bundle's existing entry: registry-maintained fields, such as
+    the `memory_gb` scheduler hint and the `coverage` recorded by
+    update_bundle_coverage(), are kept across re-ingests.
+
     Args:
         bundle_name: Name of the bundle
         symbols: List of symbols in the bundle
@@ -79,13 +144,15 @@ def register_bundle_metadata(
         end_date: End date for data (YYYY-MM-DD format, validated)
         data_frequency: Zipline data frequency ('daily' or 'minute')
         timeframe: Actual data timeframe ('1m', '5m', '1h', 'daily', etc.)
+        source_bundle: Minute bundle this bundle is derived from (derived bundles
+            only; None marks the bundle as not derived)
+        memory_gb: Peak ingestion memory hint for the scheduler (None keeps
+            the registered one)
     
     Note:
         Dates are validated before storage to prevent registry corruption.
         Invalid dates are stored as None rather than corrupted values.
     """
-    registry = load_bundle_registry()
-    
     # Validate dates before storing to prevent registry corruption
     validated_start_date = start_date if is_valid_date_string(start_date) else None
     validated_end_date = end_date if is_valid_date_string(end_date) else None
@@ -96,16 +163,62 @@ def register_bundle_metadata(
     if end_date and not validated_end_date:
         logger.warning(f"Invalid end_date '{end_date}' for bundle {bundle_name}, storing as None")
     
-    registry[bundle_name] = {
-        'symbols': symbols,
-        'calendar_name': calendar_name,
-        'start_date': validated_start_date,
-        'end_date': validated_end_date,
-        'data_frequency': data_frequency,
-        'timeframe': timeframe,
-        'registered_at': datetime.now().isoformat()
+    with locked_bundle_registry() as registry:
+        entry = registry.setdefault(bundle_name, {})
+        entry.update({
+            'symbols': symbols,
+            'calendar_name': calendar_name,
+            'start_date': validated_start_date,
+            'end_date': validated_end_date,
+            'data_frequency': data_frequency,
+            'timeframe': timeframe,
+            'registered_at': datetime.now().isoformat()
+        })
+        if source_bundle:
+            entry['source_bundle'] = source_bundle
+        else:
+            # A bundle re-registered from CSV/Yahoo is no longer derived
+            entry.pop('source_bundle', None)
+        if memory_gb is not None:
+            entry['memory_gb'] = memory_gb
+
+
+def update_bundle_coverage(
+    bundle_name: str,
+    coverage: Dict[str, Tuple[Any, Any]],
+    incremental: bool = False
+) -> None:
+    """
+    Record the date range actually ingested for each symbol of a bundle.
+
+    Stored under the bundle's registry entry as ``coverage`` (per symbol),
+    ``covered_start``/``covered_end`` (across all symbols) and
+    ``last_ingest`` (timestamp and whether it was incremental).
+
+    Args:
+        bundle_name: Name of the bundle
+        coverage: Dict mapping symbol -> (first session, last session)
+        incremental: Whether the ingestion appended to a previous version
+    """
+    def to_date(ts) -> str:
+        return pd.Timestamp(ts).strftime('%Y-%m-%d')
+
+    symbol_coverage = {
+        symbol: {'start': to_date(start), 'end': to_date(end)}
+        for symbol, (start, end) in sorted(coverage.items())
     }
-    save_bundle_registry(registry)
+    with locked_bundle_registry() as registry:
+        entry = registry.setdefault(bundle_name, {})
+        entry['coverage'] = symbol_coverage
+        if coverage:
+            entry['covered_start'] = min(c['start'] for c in symbol_coverage.values())
+            entry['covered_end'] = max(c['end'] for c in symbol_coverage.values())
+        else:
+            entry['covered_start'] = entry['covered_end'] = None
+        entry['last_ingest'] = {
+            'at': datetime.now().isoformat(),
+            'incremental': incremental,
+        }
 
 
 def get_bundle_path(bundle_name: str) -> Path:
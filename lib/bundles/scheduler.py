@@ -0,0 +1,327 @@
+"""
+Dependency-aware parallel scheduler for bundle (re-)ingestion.
+
+Rebuilding every registered bundle one after another takes hours. The
+scheduler runs independent bundles concurrently, bounded by:
+
+- a job count (each bundle runs in its own worker process, so Zipline's
+  global bundle registry and calendars are never shared between ingests)
+- a memory budget: each bundle carries a memory hint (registry `memory_gb`
+  or an estimate from symbols, timeframe and date range) and a bundle only
+  starts if the hints of running bundles leave room for it
+
+Bundles derived from another bundle (registry `source_bundle`) start after
+their source has been rebuilt, and are skipped if it failed. A failed
+bundle never stops the others.
+"""
+
+import json
+import logging
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from .timeframes import get_minutes_per_day, get_timeframe_info
+
+logger = logging.getLogger(__name__)
+
+# Fixed per-process overhead of an ingest (Python, pandas, Zipline, calendars)
+BASE_MEMORY_GB = 0.5
+
+# Bytes held per bar while a symbol is parsed, validated and written
+# (5 float64 columns, copied several times along the way)
+BYTES_PER_BAR = 5 * 8 * 8
+
+# Symbols held in memory at once by the streaming ingestion pipeline
+SYMBOLS_IN_FLIGHT = 4
+
+STATUS_SUCCESS = 'success'
+STATUS_FAILED = 'failed'
+STATUS_SKIPPED = 'skipped'
+
+
+@dataclass
+class BundleJob:
+    """
+    One bundle to ingest.
+
+    Attributes:
+        name: Bundle name
+        meta: Registry metadata for the bundle
+        depends_on: Bundles that must be ingested first
+        memory_gb: Memory hint used against the scheduler's budget
+    """
+    name: str
+    meta: Dict[str, Any]
+    depends_on: List[str] = field(default_factory=list)
+    memory_gb: float = BASE_MEMORY_GB
+
+
+@dataclass
+class JobResult:
+    """Outcome of one scheduled bundle."""
+    name: str
+    status: str
+    seconds: float = 0.0
+    error: Optional[str] = None
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+
+
+def estimate_memory_gb(meta: Dict[str, Any]) -> float:
+    """
+    Estimate peak memory of ingesting a bundle.
+
+    Uses the registry's `memory_gb` hint if present. Otherwise scales with
+    the bars per symbol (date range x bars per session) times the symbols
+    in flight in the ingestion pipeline.
+
+    Args:
+        meta: Bundle registry metadata
+
+    Returns:
+        Estimated peak memory in GB
+    """
+    if meta.get('memory_gb') is not None:
+        return float(meta['memory_gb'])
+
+    start = pd.Timestamp(meta.get('start_date') or pd.Timestamp.now() - pd.Timedelta(days=365))
+    end = meta.get('end_date')
+    try:
+        end = pd.Timestamp(end) if end else pd.Timestamp.now()
+    except (TypeError, ValueError):
+        end = pd.Timestamp.now()
+    days = max(1, (end - start).days)
+
+    timeframe = meta.get('timeframe', 'daily')
+    try:
+        intraday = get_timeframe_info(timeframe)['data_frequency'] == 'minute'
+    except ValueError:
+        intraday = False
+    # Zipline minute bundles store every calendar minute regardless of the bar size
+    bars_per_day = get_minutes_per_day(meta.get('calendar_name') or 'XNYS') if intraday else 1
+
+    symbols_in_flight = min(len(meta.get('symbols') or []) or 1, SYMBOLS_IN_FLIGHT)
+    pipeline_gb = days * bars_per_day * BYTES_PER_BAR * symbols_in_flight / 1e9
+    return round(BASE_MEMORY_GB + pipeline_gb, 2)
+
+
+def plan_jobs(bundles: Dict[str, Dict[str, Any]]) -> List[BundleJob]:
+    """
+    Build jobs for bundles in dependency order.
+
+    A bundle depends on its `source_bundle` when that bundle is also being
+    ingested; sources outside the selection are assumed to be up to date.
+
+    Args:
+        bundles: Bundle name -> registry metadata
+
+    Returns:
+        Jobs with every source before the bundles derived from it, otherwise by name
+
+    Raises:
+        ValueError: If source_bundle references form a cycle
+    """
+    jobs = {}
+    for name, meta in bundles.items():
+        source = meta.get('source_bundle')
+        depends_on = [source] if source and source in bundles and source != name else []
+        jobs[name] = BundleJob(name, meta, depends_on, estimate_memory_gb(meta))
+
+    ordered: List[BundleJob] = []
+    state: Dict[str, str] = {}
+
+    def visit(name: str, path: Tuple[str, ...]) -> None:
+        if state.get(name) == 'done':
+            return
+        if state.get(name) == 'visiting':
+            raise ValueError(f"Bundle dependency cycle: {' -> '.join(path + (name,))}")
+        state[name] = 'visiting'
+        for dependency in jobs[name].depends_on:
+            visit(dependency, path + (name,))
+        state[name] = 'done'
+        ordered.append(jobs[name])
+
+    for name in sorted(jobs):
+        visit(name, ())
+    return ordered
+
+
+def _timed_call(job_func: Callable[[str, Dict[str, Any]], Any], name: str, meta: Dict[str, Any]) -> Tuple[float, Optional[str]]:
+    """Run job_func in a worker, returning (seconds, error message or None)."""
+    start = time.perf_counter()
+    try:
+        job_func(name, meta)
+        return time.perf_counter() - start, None
+    except Exception as e:
+        logger.exception(f"Bundle job {name} failed")
+        return time.perf_counter() - start, f"{type(e).__name__}: {e}"
+
+
+class _InlineExecutor(Executor):
+    """Runs submitted calls immediately in the calling process (jobs=1)."""
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+def run_jobs(
+    jobs: List[BundleJob],
+    job_func: Callable[[str, Dict[str, Any]], Any],
+    max_jobs: int = 1,
+    memory_budget_gb: Optional[float] = None,
+    executor: Optional[Executor] = None,
+    on_event: Optional[Callable[[str, BundleJob, Optional[JobResult]], None]] = None
+) -> List[JobResult]:
+    """
+    Run bundle jobs with bounded parallelism, memory budget and dependencies.
+
+    A job starts when its dependencies succeeded, fewer than max_jobs are
+    running, and its memory hint fits next to the running jobs' hints. A
+    job larger than the whole budget still runs, alone. Smaller jobs may
+    start ahead of a large one that is waiting for memory.
+
+    Args:
+        jobs: Jobs in dependency order (see plan_jobs())
+        job_func: Called as job_func(name, meta); raises on failure. Must be
+            picklable (module-level) when jobs run in worker processes
+        max_jobs: Bundles ingested concurrently
+        memory_budget_gb: Total memory hint allowed at once (None = unlimited)
+        executor: Executor to run jobs in (None = one fresh process per
+            bundle, or inline when max_jobs == 1)
+        on_event: Optional callback(event, job, result) for 'start',
+            'finish' and 'skip' events
+
+    Returns:
+        One JobResult per job, in the order given
+    """
+    max_jobs = max(1, int(max_jobs))
+    notify = on_event or (lambda event, job, result: None)
+    owns_executor = executor is None
+    if executor is None:
+        if max_jobs == 1:
+            executor = _InlineExecutor()
+        else:
+            # A fresh process per bundle returns its memory to the OS and
+            # keeps Zipline's global registries separate
+            executor = ProcessPoolExecutor(
+                max_workers=max_jobs,
+                mp_context=multiprocessing.get_context('spawn'),
+                max_tasks_per_child=1
+            )
+
+    results: Dict[str, JobResult] = {}
+    pending = list(jobs)
+    running: Dict[Future, Tuple[BundleJob, str]] = {}
+
+    try:
+        while pending or running:
+            # Skip jobs whose dependencies failed
+            for job in list(pending):
+                failed = [d for d in job.depends_on if d in results and results[d].status != STATUS_SUCCESS]
+                if failed:
+                    pending.remove(job)
+                    results[job.name] = JobResult(
+                        job.name, STATUS_SKIPPED, error=f"dependency failed: {', '.join(failed)}"
+                    )
+                    notify('skip', job, results[job.name])
+
+            # Start every job that is ready and fits
+            for job in list(pending):
+                if len(running) >= max_jobs:
+                    break
+                if any(d not in results for d in job.depends_on):
+                    continue
+                in_use = sum(j.memory_gb for j, _ in running.values())
+                if running and memory_budget_gb is not None and in_use + job.memory_gb > memory_budget_gb:
+                    continue
+                pending.remove(job)
+                started_at = datetime.now().isoformat(timespec='seconds')
+                notify('start', job, None)
+                running[executor.submit(_timed_call, job_func, job.name, job.meta)] = (job, started_at)
+
+            if not running:
+                # Only reachable with unresolvable dependencies; fail them rather than hang
+                for job in pending:
+                    results[job.name] = JobResult(job.name, STATUS_SKIPPED, error='dependencies never completed')
+                    notify('skip', job, results[job.name])
+                break
+
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                job, started_at = running.pop(future)
+                try:
+                    seconds, error = future.result()
+                except Exception as e:
+                    # The worker itself died (e.g. killed for running out of memory)
+                    seconds, error = 0.0, f"{type(e).__name__}: {e}"
+                results[job.name] = JobResult(
+                    job.name,
+                    STATUS_FAILED if error else STATUS_SUCCESS,
+                    seconds=round(seconds, 3),
+                    error=error,
+                    started_at=started_at,
+                    finished_at=datetime.now().isoformat(timespec='seconds'),
+                )
+                notify('finish', job, results[job.name])
+    finally:
+        if owns_executor:
+            executor.shutdown(wait=True)
+
+    return [results[job.name] for job in jobs]
+
+
+def write_run_summary(
+    results: List[JobResult],
+    path: Path,
+    jobs: Optional[List[BundleJob]] = None,
+    **context: Any
+) -> Path:
+    """
+    Write a per-bundle status and timing summary as JSON.
+
+    Args:
+        results: Job results
+        path: Output file
+        jobs: Jobs, to include each bundle's memory hint and dependencies
+        **context: Extra top-level fields (e.g. jobs, memory budget)
+
+    Returns:
+        Path written
+    """
+    job_info = {job.name: job for job in jobs or []}
+    bundles = []
+    for result in results:
+        entry = asdict(result)
+        job = job_info.get(result.name)
+        if job is not None:
+            entry['memory_gb'] = job.memory_gb
+            entry['depends_on'] = job.depends_on
+        bundles.append(entry)
+
+    summary = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        **context,
+        'total_seconds': round(sum(r.seconds for r in results), 3),
+        'counts': {
+            status: sum(1 for r in results if r.status == status)
+            for status in (STATUS_SUCCESS, STATUS_FAILED, STATUS_SKIPPED)
+        },
+        'bundles': bundles,
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(summary, f, indent=2)
+    return path
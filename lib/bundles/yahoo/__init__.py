@@ -6,7 +6,15 @@ Refactored in v1.0.11 from monolithic yahoo_bundle.py into modular structure.
 """
 
 from .registration import register_yahoo_bundle, auto_register_yahoo_bundle_if_exists
-from .fetcher import fetch_yahoo_data, fetch_multiple_symbols
+from .fetcher import fetch_yahoo_data, fetch_multiple_symbols, fetch_symbols, TokenBucket
+from .transport import (
+    YahooTransport,
+    YFinanceTransport,
+    ChartApiTransport,
+    FixtureTransport,
+    TransientFetchError,
+    set_default_transport,
+)
 from .processor import process_yahoo_data, aggregate_to_daily
 
 __all__ = [
@@ -14,6 +22,14 @@ __all__ = [
     'auto_register_yahoo_bundle_if_exists',
     'fetch_yahoo_data',
     'fetch_multiple_symbols',
+    'fetch_symbols',
+    'TokenBucket',
+    'YahooTransport',
+    'YFinanceTransport',
+    'ChartApiTransport',
+    'FixtureTransport',
+    'TransientFetchError',
+    'set_default_transport',
     'process_yahoo_data',
     'aggregate_to_daily',
 ]
@@ -3,23 +3,125 @@ Yahoo Finance data fetcher for The Researcher's Cockpit.
 
 Handles yfinance API calls, retry logic, and symbol resolution.
 Extracted from yahoo_bundle.py as part of v1.0.11 refactoring.
+
+Requests go through a pluggable transport (see transport.py), are throttled
+by a shared token-bucket rate limiter, retried with exponential backoff on
+transient errors, and cached on disk per (symbol, interval, range) (see
+lib/bundles/cache.py). fetch_symbols() runs many requests with bounded
+concurrency.
 """
 
 import logging
-from typing import List, Optional
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
 
 import pandas as pd
-import yfinance as yf
+
+from ..cache import cache_api_data, get_cache_settings, load_cached_api_data
+from .transport import TransientFetchError, YahooTransport, get_default_transport
 
 logger = logging.getLogger(__name__)
 
+CACHE_SOURCE = 'yahoo'
+
+# Defaults when config/data_sources.yaml has no yahoo.fetch / rate_limits entries
+DEFAULT_FETCH_SETTINGS = {
+    'max_concurrency': 8,
+    'requests_per_second': 2.0,
+    'burst': 4,
+    'retries': 3,
+    'backoff_seconds': 1.0,
+}
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
+
+    Tokens refill continuously at `rate` per second up to `capacity`; each
+    request takes one token and waits while the bucket is empty.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens, sleeping until they are available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+def get_fetch_settings() -> dict:
+    """
+    Read fetcher settings from config/data_sources.yaml (yahoo.fetch and yahoo.rate_limits).
+
+    Returns:
+        Dict with max_concurrency, requests_per_second, burst, retries, backoff_seconds
+    """
+    settings = dict(DEFAULT_FETCH_SETTINGS)
+    try:
+        from ...config import get_data_source
+        yahoo_cfg = get_data_source('yahoo')
+    except Exception as e:
+        logger.debug(f"Using default Yahoo fetch settings: {e}")
+        return settings
+    for section in ('rate_limits', 'fetch'):
+        for key, value in (yahoo_cfg.get(section) or {}).items():
+            if key in settings and value is not None:
+                settings[key] = value
+    return settings
+
+
+_rate_limiter: Optional[TokenBucket] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> TokenBucket:
+    """Process-wide rate limiter shared by all Yahoo requests."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            settings = get_fetch_settings()
+            _rate_limiter = TokenBucket(settings['requests_per_second'], settings['burst'])
+        return _rate_limiter
+
 
 def fetch_yahoo_data(
     symbol: str,
     start_date: Optional[str],
     end_date: Optional[str],
     interval: str,
-    show_progress: bool = False
+    show_progress: bool = False,
+    transport: Optional[YahooTransport] = None,
+    rate_limiter: Optional[TokenBucket] = None,
+    use_cache: Optional[bool] = None,
+    refresh_cache: bool = False,
+    retries: Optional[int] = None,
+    backoff_seconds: Optional[float] = None
 ) -> pd.DataFrame:
     """
     Fetch data from Yahoo Finance for a single symbol.
@@ -30,6 +132,12 @@ def fetch_yahoo_data(
         end_date: End date (YYYY-MM-DD)
         interval: yfinance interval ('1m', '5m', '1h', '1d', etc.)
         show_progress: Whether to print progress messages
+        transport: History transport (None = default, yfinance)
+        rate_limiter: Rate limiter (None = shared process-wide limiter)
+        use_cache: Read/write the on-disk response cache (None = settings.yaml)
+        refresh_cache: Ignore cached responses but store the new one
+        retries: Retries on transient errors (None = config)
+        backoff_seconds: Initial retry delay, doubled each attempt (None = config)
 
     Returns:
         DataFrame with OHLCV data and DatetimeIndex
@@ -37,15 +145,37 @@ def fetch_yahoo_data(
     Raises:
         ValueError: If no data returned for symbol
     """
-    try:
-        ticker = yf.Ticker(symbol)
+    if use_cache is None:
+        use_cache = get_cache_settings()['enabled']
 
-        # Convert date strings to datetime if provided
-        yf_start = pd.Timestamp(start_date).to_pydatetime() if start_date else None
-        yf_end = pd.Timestamp(end_date).to_pydatetime() if end_date else None
+    if use_cache and not refresh_cache:
+        cached = load_cached_api_data(CACHE_SOURCE, symbol, interval, start_date, end_date)
+        if cached is not None and not cached.empty:
+            if show_progress:
+                print(f"  {symbol}: Loaded {len(cached)} bars from cache")
+            return cached
+
+    settings = get_fetch_settings()
+    retries = settings['retries'] if retries is None else retries
+    backoff_seconds = settings['backoff_seconds'] if backoff_seconds is None else backoff_seconds
+    transport = transport or get_default_transport()
+    rate_limiter = rate_limiter or get_rate_limiter()
 
-        # Fetch data from yfinance
-        hist = ticker.history(start=yf_start, end=yf_end, interval=interval)
+    try:
+        for attempt in range(retries + 1):
+            rate_limiter.acquire()
+            try:
+                hist = transport.history(symbol, start_date, end_date, interval)
+                break
+            except TransientFetchError as e:
+                if attempt >= retries:
+                    raise
+                delay = backoff_seconds * (2 ** attempt) * (1 + random.random() * 0.25)
+                logger.warning(
+                    f"Transient error fetching {symbol} (attempt {attempt + 1}/{retries + 1}), "
+                    f"retrying in {delay:.1f}s: {e}"
+                )
+                time.sleep(delay)
 
         if hist.empty:
             raise ValueError(f"No data returned for {symbol} at {interval} timeframe")
@@ -53,19 +183,69 @@ def fetch_yahoo_data(
         if show_progress:
             print(f"  {symbol}: Fetched {len(hist)} bars ({hist.index[0]} to {hist.index[-1]})")
 
-        return hist
-
     except Exception as e:
         logger.exception(f"Error fetching data for {symbol}")
         raise ValueError(f"Failed to fetch data for {symbol}: {e}") from e
 
+    if use_cache:
+        try:
+            cache_api_data(hist, CACHE_SOURCE, symbol, interval, start_date, end_date)
+        except Exception as e:
+            logger.warning(f"Failed to cache Yahoo response for {symbol}: {e}")
+
+    return hist
+
+
+def fetch_symbols(
+    requests: List[Tuple[str, Optional[str], Optional[str]]],
+    interval: str,
+    max_workers: Optional[int] = None,
+    show_progress: bool = False,
+    **fetch_kwargs
+) -> Dict[str, Union[pd.DataFrame, Exception]]:
+    """
+    Fetch several symbols concurrently.
+
+    Requests share one rate limiter, so concurrency only hides network
+    latency; the request rate stays within the configured limit.
+
+    Args:
+        requests: List of (symbol, start_date, end_date)
+        interval: yfinance interval
+        max_workers: Concurrent requests (None = config max_concurrency)
+        show_progress: Whether to print progress messages
+        **fetch_kwargs: Passed to fetch_yahoo_data (transport, use_cache, ...)
+
+    Returns:
+        Dict mapping symbol -> DataFrame, or the exception raised for it
+    """
+    if max_workers is None:
+        max_workers = get_fetch_settings()['max_concurrency']
+    max_workers = max(1, min(int(max_workers), len(requests) or 1))
+
+    def fetch_one(request):
+        symbol, start_date, end_date = request
+        try:
+            return symbol, fetch_yahoo_data(
+                symbol, start_date, end_date, interval, show_progress, **fetch_kwargs
+            )
+        except Exception as e:
+            return symbol, e
+
+    if max_workers == 1:
+        return dict(fetch_one(request) for request in requests)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(executor.map(fetch_one, requests))
+
 
 def fetch_multiple_symbols(
     symbols: List[str],
     start_date: Optional[str],
     end_date: Optional[str],
     interval: str,
-    show_progress: bool = False
+    show_progress: bool = False,
+    max_workers: Optional[int] = None,
+    **fetch_kwargs
 ) -> dict:
     """
     Fetch data for multiple symbols from Yahoo Finance.
@@ -76,6 +256,8 @@ def fetch_multiple_symbols(
         end_date: End date (YYYY-MM-DD)
         interval: yfinance interval
         show_progress: Whether to print progress
+        max_workers: Concurrent requests (None = config max_concurrency)
+        **fetch_kwargs: Passed to fetch_yahoo_data (transport, use_cache, ...)
 
     Returns:
         Dictionary mapping symbol -> DataFrame
@@ -83,17 +265,24 @@ def fetch_multiple_symbols(
     Raises:
         RuntimeError: If no symbols could be fetched
     """
+    fetched = fetch_symbols(
+        [(symbol, start_date, end_date) for symbol in symbols],
+        interval,
+        max_workers=max_workers,
+        show_progress=show_progress,
+        **fetch_kwargs
+    )
+
     results = {}
     failed = []
-
     for symbol in symbols:
-        try:
-            data = fetch_yahoo_data(symbol, start_date, end_date, interval, show_progress)
-            results[symbol] = data
-        except Exception as e:
+        data = fetched[symbol]
+        if isinstance(data, Exception):
             failed.append(symbol)
             if show_progress:
-                print(f"  Warning: Skipping {symbol} - {e}")
+                print(f"  Warning: Skipping {symbol} - {data}")
+        else:
+            results[symbol] = data
 
     if not results:
         raise RuntimeError(
@@ -13,8 +13,15 @@ import pandas as pd
 from zipline.utils.calendar_utils import get_calendar
 
 from ..timeframes import get_timeframe_info, get_minutes_per_day, validate_timeframe_date_range
-from ..registry import unregister_bundle, register_bundle_metadata, add_registered_bundle
-from .fetcher import fetch_yahoo_data
+from ..incremental import Coverage, load_previous_ingestion, track_coverage
+from ..pipeline import Stage, run_pipeline
+from ..registry import (
+    unregister_bundle,
+    register_bundle_metadata,
+    add_registered_bundle,
+    update_bundle_coverage,
+)
+from .fetcher import fetch_yahoo_data, get_fetch_settings
 from .processor import process_yahoo_data, aggregate_to_daily
 from ...data.filters import (
     consolidate_forex_sunday_to_friday,
@@ -33,7 +40,10 @@ def register_yahoo_bundle(
     end_date: Optional[str] = None,
     data_frequency: str = 'daily',
     timeframe: str = 'daily',
-    force: bool = False
+    force: bool = False,
+    incremental: bool = False,
+    max_workers: Optional[int] = None,
+    refresh_cache: bool = False
 ):
     """
     Register a Yahoo Finance bundle with multi-timeframe support.
@@ -47,6 +57,14 @@ def register_yahoo_bundle(
         data_frequency: Zipline data frequency ('daily' or 'minute')
         timeframe: Actual timeframe for yfinance ('1m', '5m', '15m', '1h', '4h', 'daily', etc.')
         force: If True, unregister and re-register even if already registered
+        incremental: Fetch only bars newer than the bundle's most recent
+            ingestion and reuse its data (see lib/bundles/incremental.py).
+            Falls back to a full ingest when there is no compatible
+            previous ingestion.
+        max_workers: Concurrent Yahoo requests (None = data_sources.yaml
+            yahoo.fetch.max_concurrency). Requests share one rate limiter.
+        refresh_cache: Refetch instead of using cached responses in
+            data/cache/api/yahoo/ (the new responses are still cached)
 
     Note:
         For 4h timeframe, this fetches 1h data from yfinance and aggregates to 4h,
@@ -84,6 +102,9 @@ def register_yahoo_bundle(
     closure_calendar_name = calendar_name
     closure_requires_aggregation = requires_aggregation
     closure_aggregation_target = aggregation_target
+    closure_incremental = incremental
+    closure_max_workers = max_workers
+    closure_refresh_cache = refresh_cache
 
     def make_yahoo_ingest(symbols_list):
         mpd = get_minutes_per_day(closure_calendar_name)
@@ -106,6 +127,23 @@ def register_yahoo_bundle(
             start_date_utc = to_utc_midnight(start_session)
             end_date_utc = to_utc_midnight(end_session)
 
+            # Previous version to append to (incremental mode)
+            previous = None
+            if closure_incremental:
+                previous = load_previous_ingestion(
+                    bundle_name,
+                    symbols_list,
+                    closure_data_frequency,
+                    start_session=start_session,
+                    minutes_per_day=mpd,
+                    exclude=timestamp
+                )
+                if show_progress:
+                    if previous is None:
+                        print("  No compatible previous ingestion, running a full ingest")
+                    else:
+                        print(f"  Appending to ingestion {previous.timestr}")
+
             # Create asset metadata
             n_symbols = len(symbols_list)
             equities_data = {
@@ -117,6 +155,8 @@ def register_yahoo_bundle(
                 'country_code': ['US'] * n_symbols,
             }
             equities_df = pd.DataFrame(equities_data, index=pd.Index(range(n_symbols), name='sid'))
+            if previous is not None:
+                equities_df = previous.merge_asset_metadata(equities_df)
             asset_db_writer.write(equities=equities_df)
 
             if show_progress:
@@ -126,118 +166,160 @@ def register_yahoo_bundle(
                 if closure_requires_aggregation:
                     print(f"  Note: Will aggregate {closure_yf_interval} data to {closure_aggregation_target}")
 
-            # Data generator
+            # Incremental: only fetch from the first missing bar onwards
+            fetch_starts = {}
+            for sid, symbol in enumerate(symbols_list):
+                fetch_start = closure_start_date
+                resume = previous.resume_from(sid) if previous is not None else None
+                if resume is not None:
+                    fetch_start = resume.strftime('%Y-%m-%d')
+                    if closure_end_date and fetch_start > closure_end_date:
+                        continue
+                fetch_starts[sid] = fetch_start
+
+            def fetch(sid):
+                """Pipeline stage 1: fetch raw history (network-bound, rate-limited, cached)."""
+                return fetch_yahoo_data(
+                    symbols_list[sid],
+                    fetch_starts[sid],
+                    closure_end_date,
+                    closure_yf_interval,
+                    show_progress,
+                    refresh_cache=closure_refresh_cache
+                ), sid
+
+            def process(fetched):
+                """Pipeline stage 2: clean, session-filter and aggregate one symbol."""
+                hist, sid = fetched
+                bars_df = process_yahoo_data(
+                    hist,
+                    closure_data_frequency,
+                    calendar_obj,
+                    closure_calendar_name,
+                    fetch_starts[sid],
+                    closure_end_date,
+                    closure_requires_aggregation,
+                    closure_aggregation_target,
+                    symbols_list[sid],
+                    show_progress
+                )
+                if previous is not None:
+                    bars_df = previous.trim_new_data(sid, bars_df)
+                return bars_df
+
+            n_fetchers = closure_max_workers or get_fetch_settings()['max_concurrency']
+            n_fetchers = max(1, min(int(n_fetchers), len(fetch_starts) or 1))
+
+            # Data generator: fetch -> process stream into the bar writer with
+            # at most a few symbols in memory (fetching, processing, or waiting to be written)
             def data_gen():
                 successful_fetches = 0
+                sids = list(fetch_starts)
+                results = run_pipeline(
+                    sids,
+                    [Stage(fetch, workers=n_fetchers, name='fetch'), Stage(process, name='process')],
+                    max_in_flight=n_fetchers + 2
+                )
 
-                for sid, symbol in enumerate(symbols_list):
-                    try:
-                        # Fetch data
-                        hist = fetch_yahoo_data(
-                            symbol,
-                            closure_start_date,
-                            closure_end_date,
-                            closure_yf_interval,
-                            show_progress
-                        )
-
-                        # Process data
-                        bars_df = process_yahoo_data(
-                            hist,
-                            closure_data_frequency,
-                            calendar_obj,
-                            closure_calendar_name,
-                            closure_start_date,
-                            closure_end_date,
-                            closure_requires_aggregation,
-                            closure_aggregation_target,
-                            symbol,
-                            show_progress
-                        )
-
-                        successful_fetches += 1
-                        yield sid, bars_df
-
-                    except Exception as e:
-                        print(f"Error fetching {closure_timeframe} data for {symbol}: {e}")
-                        logger.exception(f"Error fetching {closure_timeframe} data for {symbol}")
+                for sid, bars_df in zip(sids, results):
+                    symbol = symbols_list[sid]
+                    if isinstance(bars_df, Exception):
+                        print(f"Error fetching {closure_timeframe} data for {symbol}: {bars_df}")
+                        logger.error(f"Error fetching {closure_timeframe} data for {symbol}: {bars_df}")
+                        continue
+                    if bars_df.empty:
                         continue
 
-                if successful_fetches == 0:
+                    successful_fetches += 1
+                    yield sid, bars_df
+
+                if successful_fetches == 0 and previous is None:
                     raise RuntimeError(
                         f"No data was successfully fetched for any symbol. "
                         f"Symbols attempted: {symbols_list}. "
                         f"Check that symbols are valid and date range has data."
                     )
 
+            def minute_to_daily(sid, minute_df):
+                """Aggregate one symbol's minute bars to session-aligned daily bars."""
+                try:
+                    daily_df = aggregate_to_daily(minute_df)
+
+                    if daily_df.empty:
+                        print(f"  Warning: No daily data after aggregating minute data for SID {sid}")
+                        return None
+
+                    # Ensure UTC and normalize
+                    if daily_df.index.tz is None:
+                        daily_df.index = daily_df.index.tz_localize('UTC')
+                    elif str(daily_df.index.tz) != 'UTC':
+                        daily_df.index = daily_df.index.tz_convert('UTC')
+                    daily_df.index = daily_df.index.normalize()
+
+                    # FOREX Sunday consolidation
+                    if 'FOREX' in closure_calendar_name.upper():
+                        daily_df = consolidate_forex_sunday_to_friday(daily_df, calendar_obj, show_progress, sid)
+                        if daily_df.empty:
+                            return None
+
+                    # Calendar session filtering
+                    if 'FOREX' in closure_calendar_name.upper():
+                        daily_df = filter_to_calendar_sessions(daily_df, calendar_obj, show_progress, sid)
+                        if daily_df.empty:
+                            return None
+
+                    # Gap filling
+                    if 'FOREX' in closure_calendar_name.upper() or 'CRYPTO' in closure_calendar_name.upper():
+                        daily_df = apply_gap_filling(daily_df, calendar_obj, closure_calendar_name, show_progress, sid)
+                        if daily_df.empty:
+                            return None
+
+                    return daily_df
+                except Exception as agg_err:
+                    print(f"  Warning: Failed to aggregate daily data for SID {sid}: {agg_err}")
+                    logger.exception(f"Failed to aggregate daily data for SID {sid}")
+                    return None
+
             if closure_data_frequency == 'minute':
-                # Collect minute data
-                if show_progress:
-                    print("  Collecting minute data for aggregation...")
-                all_minute_data = list(data_gen())
+                # Write minute bars (appended to copies of the previous ctables)
+                if previous is not None:
+                    previous.copy_minute_bars(minute_bar_writer, show_progress=show_progress)
 
-                if not all_minute_data:
-                    raise RuntimeError("No minute data was collected. Check symbol validity and date range.")
+                # Stream minute bars into the writer, keeping only the daily aggregates
+                all_daily_data = []
 
-                # Write minute bars
-                if show_progress:
-                    print(f"  Writing {len(all_minute_data)} symbol(s) to minute bar writer...")
-                minute_bar_writer.write(iter(all_minute_data), show_progress=show_progress)
+                def minute_stream():
+                    for sid, minute_df in data_gen():
+                        daily_df = minute_to_daily(sid, minute_df)
+                        if daily_df is not None:
+                            all_daily_data.append((sid, daily_df))
+                        yield sid, minute_df
 
-                # Aggregate to daily
                 if show_progress:
-                    print("  Aggregating minute data to daily bars...")
-
-                def daily_data_gen():
-                    for sid, minute_df in all_minute_data:
-                        try:
-                            daily_df = aggregate_to_daily(minute_df)
-
-                            if daily_df.empty:
-                                print(f"  Warning: No daily data after aggregating minute data for SID {sid}")
-                                continue
-
-                            # Ensure UTC and normalize
-                            if daily_df.index.tz is None:
-                                daily_df.index = daily_df.index.tz_localize('UTC')
-                            elif str(daily_df.index.tz) != 'UTC':
-                                daily_df.index = daily_df.index.tz_convert('UTC')
-                            daily_df.index = daily_df.index.normalize()
-
-                            # FOREX Sunday consolidation
-                            if 'FOREX' in closure_calendar_name.upper():
-                                daily_df = consolidate_forex_sunday_to_friday(daily_df, calendar_obj, show_progress, sid)
-                                if daily_df.empty:
-                                    continue
-
-                            # Calendar session filtering
-                            if 'FOREX' in closure_calendar_name.upper():
-                                daily_df = filter_to_calendar_sessions(daily_df, calendar_obj, show_progress, sid)
-                                if daily_df.empty:
-                                    continue
-
-                            # Gap filling
-                            if 'FOREX' in closure_calendar_name.upper() or 'CRYPTO' in closure_calendar_name.upper():
-                                daily_df = apply_gap_filling(daily_df, calendar_obj, closure_calendar_name, show_progress, sid)
-                                if daily_df.empty:
-                                    continue
-
-                            yield sid, daily_df
-                        except Exception as agg_err:
-                            print(f"  Warning: Failed to aggregate daily data for SID {sid}: {agg_err}")
-                            logger.exception(f"Failed to aggregate daily data for SID {sid}")
-                            continue
-
-                daily_bar_writer.write(daily_data_gen(), show_progress=show_progress)
+                    print("  Streaming minute bars to minute bar writer (aggregating to daily)...")
+                minute_bar_writer.write(minute_stream(), show_progress=show_progress)
 
-                if show_progress:
-                    print("  ✓ Both minute and daily bars written successfully")
+                daily_data = iter(all_daily_data)
             else:
-                daily_bar_writer.write(data_gen(), show_progress=show_progress)
+                daily_data = data_gen()
+
+            if previous is not None:
+                daily_data = previous.merge_daily_bars(daily_data, calendar_obj)
+            coverage: Coverage = {}
+            daily_bar_writer.write(track_coverage(daily_data, coverage), show_progress=show_progress)
+
+            if show_progress and closure_data_frequency == 'minute':
+                print("  ✓ Both minute and daily bars written successfully")
 
             # Write empty adjustments
             adjustment_writer.write(splits=None, dividends=None, mergers=None)
 
+            update_bundle_coverage(
+                bundle_name,
+                {symbols_list[sid]: span for sid, span in coverage.items()},
+                incremental=previous is not None
+            )
+
         return yahoo_ingest
 
     make_yahoo_ingest(symbols)
@@ -0,0 +1,211 @@
+"""
+Pluggable transports for Yahoo Finance history requests.
+
+fetch_yahoo_data() does not talk to Yahoo directly; it asks a transport for
+raw history. Swapping the transport lets tests and offline runs work with
+no network access:
+
+- YFinanceTransport: yfinance (default)
+- ChartApiTransport: Yahoo's v8 chart JSON API at a configurable base URL,
+  e.g. a local fake server in tests
+- FixtureTransport: CSV files in a fixture directory
+
+All transports return yfinance-shaped frames (Open/High/Low/Close/Volume
+columns, tz-aware DatetimeIndex) and raise TransientFetchError for errors
+worth retrying (rate limiting, server errors, network failures).
+"""
+
+import json
+import logging
+import urllib.error
+import urllib.parse
+import urllib.request
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional, Union
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class TransientFetchError(Exception):
+    """A fetch failure that may succeed on retry (429, 5xx, network errors)."""
+
+
+def _to_timestamp(value: Optional[str], tz: str = 'UTC') -> Optional[pd.Timestamp]:
+    """Parse a date string into a tz-aware Timestamp (naive values are taken as tz)."""
+    if value is None:
+        return None
+    ts = pd.Timestamp(value)
+    return ts.tz_localize(tz) if ts.tz is None else ts
+
+
+class YahooTransport(ABC):
+    """Base class for Yahoo history transports."""
+
+    name = 'base'
+
+    @abstractmethod
+    def history(
+        self,
+        symbol: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        interval: str
+    ) -> pd.DataFrame:
+        """
+        Fetch raw OHLCV history for one symbol.
+
+        Args:
+            symbol: Yahoo symbol (e.g. 'SPY', 'BTC-USD', 'EURUSD=X')
+            start_date: Inclusive start (YYYY-MM-DD or ISO timestamp), None = earliest
+            end_date: Exclusive end (YYYY-MM-DD or ISO timestamp), None = now
+            interval: yfinance interval ('1m', '1h', '1d', ...)
+
+        Returns:
+            DataFrame with Open/High/Low/Close/Volume columns (empty if no data)
+
+        Raises:
+            TransientFetchError: For failures worth retrying
+        """
+        pass
+
+
+class YFinanceTransport(YahooTransport):
+    """Fetch history through yfinance."""
+
+    name = 'yfinance'
+
+    def history(self, symbol, start_date, end_date, interval):
+        import yfinance as yf
+
+        yf_start = pd.Timestamp(start_date).to_pydatetime() if start_date else None
+        yf_end = pd.Timestamp(end_date).to_pydatetime() if end_date else None
+        try:
+            return yf.Ticker(symbol).history(start=yf_start, end=yf_end, interval=interval)
+        except Exception as e:
+            if _is_transient(e):
+                raise TransientFetchError(f"{symbol}: {e}") from e
+            raise
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether an exception raised by yfinance/requests looks retryable."""
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    name = type(error).__name__
+    return any(marker in name for marker in ('RateLimit', 'Timeout', 'ConnectionError', 'HTTPError'))
+
+
+class ChartApiTransport(YahooTransport):
+    """
+    Fetch history from Yahoo's v8 chart API.
+
+    Uses only the standard library. Point base_url at a local fake server to
+    exercise the full HTTP path in tests.
+    """
+
+    name = 'chart_api'
+
+    def __init__(self, base_url: str = 'https://query1.finance.yahoo.com', timeout: float = 30.0):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+
+    def _url(self, symbol: str, start_date: Optional[str], end_date: Optional[str], interval: str) -> str:
+        start = _to_timestamp(start_date)
+        end = _to_timestamp(end_date) or pd.Timestamp.now(tz='UTC')
+        params = {
+            'period1': int(start.timestamp()) if start is not None else 0,
+            'period2': int(end.timestamp()),
+            'interval': interval,
+            'includePrePost': 'false',
+        }
+        quoted = urllib.parse.quote(symbol, safe='')
+        return f"{self.base_url}/v8/finance/chart/{quoted}?{urllib.parse.urlencode(params)}"
+
+    def history(self, symbol, start_date, end_date, interval):
+        url = self._url(symbol, start_date, end_date, interval)
+        request = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                payload = json.load(response)
+        except urllib.error.HTTPError as e:
+            if e.code == 429 or e.code >= 500:
+                raise TransientFetchError(f"{symbol}: HTTP {e.code}") from e
+            if e.code == 404:
+                return pd.DataFrame()
+            raise ValueError(f"{symbol}: HTTP {e.code}") from e
+        except (urllib.error.URLError, TimeoutError, ConnectionError) as e:
+            raise TransientFetchError(f"{symbol}: {e}") from e
+
+        return self.parse_chart(payload)
+
+    @staticmethod
+    def parse_chart(payload: dict) -> pd.DataFrame:
+        """Convert a v8 chart JSON payload into a yfinance-shaped DataFrame."""
+        chart = payload.get('chart') or {}
+        if chart.get('error'):
+            raise ValueError(f"Chart API error: {chart['error']}")
+        results = chart.get('result') or []
+        if not results or not results[0].get('timestamp'):
+            return pd.DataFrame()
+
+        result = results[0]
+        quote = result['indicators']['quote'][0]
+        tz = (result.get('meta') or {}).get('exchangeTimezoneName') or 'UTC'
+        index = pd.to_datetime(result['timestamp'], unit='s', utc=True).tz_convert(tz)
+        df = pd.DataFrame({
+            'Open': quote.get('open'),
+            'High': quote.get('high'),
+            'Low': quote.get('low'),
+            'Close': quote.get('close'),
+            'Volume': quote.get('volume'),
+        }, index=pd.DatetimeIndex(index, name='Date'), dtype='float64')
+        return df.dropna(subset=['Open', 'High', 'Low', 'Close'], how='all')
+
+
+class FixtureTransport(YahooTransport):
+    """
+    Serve history from CSV fixtures: {directory}/{symbol}_{interval}.csv.
+
+    The first column is the timestamp; naive timestamps are taken as UTC.
+    Missing fixtures return an empty frame, like Yahoo for unknown symbols.
+    """
+
+    name = 'fixture'
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+
+    def history(self, symbol, start_date, end_date, interval):
+        path = self.directory / f"{symbol}_{interval}.csv"
+        if not path.exists():
+            return pd.DataFrame()
+        df = pd.read_csv(path, index_col=0)
+        df.index = pd.to_datetime(df.index, utc=True)
+
+        start = _to_timestamp(start_date)
+        end = _to_timestamp(end_date)
+        if start is not None:
+            df = df[df.index >= start]
+        if end is not None:
+            df = df[df.index < end]
+        return df
+
+
+_default_transport: Optional[YahooTransport] = None
+
+
+def get_default_transport() -> YahooTransport:
+    """Transport used when none is passed explicitly (YFinanceTransport unless overridden)."""
+    global _default_transport
+    if _default_transport is None:
+        _default_transport = YFinanceTransport()
+    return _default_transport
+
+
+def set_default_transport(transport: Optional[YahooTransport]) -> None:
+    """Override the default transport (None restores yfinance)."""
+    global _default_transport
+    _default_transport = transport
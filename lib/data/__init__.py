@@ -8,6 +8,7 @@ filtering, and FOREX-specific processing.
 # Aggregation utilities
 from .aggregation import (
     aggregate_ohlcv,
+    aggregate_ohlcv_by_session,
     resample_to_timeframe,
     create_multi_timeframe_data,
     get_timeframe_multiplier,
@@ -16,6 +17,7 @@ from .aggregation import (
 # Normalization utilities
 from .normalization import (
     normalize_to_utc,
+    utc_ns,
     fill_data_gaps,
 )
 
@@ -36,11 +38,13 @@ from .filters import (
 __all__ = [
     # Aggregation
     'aggregate_ohlcv',
+    'aggregate_ohlcv_by_session',
     'resample_to_timeframe',
     'create_multi_timeframe_data',
     'get_timeframe_multiplier',
     # Normalization
     'normalize_to_utc',
+    'utc_ns',
     'fill_data_gaps',
     # FOREX
     'consolidate_sunday_to_friday',
@@ -5,8 +5,11 @@ Provides functions for resampling and aggregating time-series data
 to different timeframes.
 """
 
+import numpy as np
 import pandas as pd
-from typing import Dict, List
+from typing import Dict, List, Tuple
+
+from .normalization import utc_ns
 
 
 # Timeframe to pandas offset alias mapping
@@ -24,6 +27,15 @@ TIMEFRAME_MAP = {
     'W': '1W', '1w': '1W', 'weekly': '1W',
 }
 
+# OHLCV aggregation rules
+OHLCV_AGG_RULES = {
+    'open': 'first',
+    'high': 'max',
+    'low': 'min',
+    'close': 'last',
+    'volume': 'sum'
+}
+
 # Timeframe hierarchy in minutes
 TIMEFRAME_MINUTES = {
     '1m': 1, '2m': 2, '5m': 5, '10m': 10, '15m': 15, '30m': 30,
@@ -33,10 +45,97 @@ TIMEFRAME_MINUTES = {
 }
 
 
+_OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+_DAY_NS = pd.Timedelta(days=1).value
+
+
+def _reduce_ohlcv(
+    columns: Dict[str, np.ndarray],
+    labels: np.ndarray
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Reduce OHLCV rows sharing a bucket label.
+
+    Args:
+        columns: open, high, low, close, volume arrays without NaN
+        labels: int64 bucket label per row, non-decreasing
+
+    Returns:
+        Tuple of (bucket labels, aggregated column arrays)
+    """
+    starts = np.flatnonzero(np.r_[True, labels[1:] != labels[:-1]])
+    ends = np.r_[starts[1:], len(labels)] - 1
+    return labels[starts], {
+        'open': columns['open'][starts],
+        'high': np.maximum.reduceat(columns['high'], starts),
+        'low': np.minimum.reduceat(columns['low'], starts),
+        'close': columns['close'][ends],
+        'volume': np.add.reduceat(columns['volume'], starts),
+    }
+
+
+def _aggregate_by_labels(df: pd.DataFrame, labels: np.ndarray, tz) -> pd.DataFrame:
+    """
+    Aggregate OHLCV rows by int64 bucket label (nanoseconds).
+
+    Labels must not decrease with time. Uses the reduceat kernel for
+    numeric data without NaN, otherwise a pandas groupby (first/last must
+    skip NaN). Labels become the result's
+    DatetimeIndex, localized to tz. Buckets missing an open, high, low or
+    close are dropped, as after resample().
+    """
+    if not df.index.is_monotonic_increasing:
+        # Time order makes first/last well defined (labels increase with time)
+        order = np.argsort(utc_ns(df.index), kind='stable')
+        df, labels = df.iloc[order], labels[order]
+
+    columns = {col: df[col].to_numpy() for col in _OHLCV_COLUMNS}
+    use_kernel = all(
+        values.dtype.kind in 'iu' or (values.dtype.kind == 'f' and not np.isnan(values).any())
+        for values in columns.values()
+    )
+    if use_kernel:
+        keys, reduced = _reduce_ohlcv(columns, labels)
+        df_agg = pd.DataFrame(reduced, columns=_OHLCV_COLUMNS)
+    else:
+        df_agg = df[_OHLCV_COLUMNS].groupby(labels, sort=True).agg(OHLCV_AGG_RULES).dropna()
+        keys = df_agg.index.to_numpy(dtype='int64')
+        df_agg = df_agg.reset_index(drop=True)
+
+    index = pd.DatetimeIndex(keys.astype('datetime64[ns]'), name=df.index.name)
+    if getattr(df.index, 'unit', 'ns') != 'ns':
+        index = index.as_unit(df.index.unit)
+    df_agg.index = index.tz_localize('UTC').tz_convert(tz) if tz is not None else index
+    return df_agg
+
+
+def _session_positions(minutes: np.ndarray, calendar) -> np.ndarray:
+    """Session of each minute: the first session whose last minute is at or after it (len(sessions) if none)."""
+    last_minutes = utc_ns(calendar.last_minutes)
+    return np.searchsorted(last_minutes, minutes, side='left')
+
+
+def _session_labels(minutes: np.ndarray, session_pos: np.ndarray, freq: pd.Timedelta, calendar) -> np.ndarray:
+    """
+    Bucket label of each minute for session-aware aggregation.
+
+    Daily buckets are sessions (labelled at the session's UTC midnight).
+    Intraday buckets are clock-aligned bins, split at session opens.
+    """
+    if freq == pd.Timedelta(days=1):
+        return utc_ns(calendar.sessions)[session_pos]
+    freq_ns = freq.value
+    # Zipline minutes are bar ends: a session's first minute closes its first bar
+    session_opens = utc_ns(calendar.first_minutes)[session_pos] - pd.Timedelta(minutes=1).value
+    return np.maximum(minutes - minutes % freq_ns, session_opens)
+
+
 def aggregate_ohlcv(
     df: pd.DataFrame,
     target_timeframe: str,
-    method: str = 'standard'
+    method: str = 'standard',
+    calendar=None
 ) -> pd.DataFrame:
     """
     Aggregate OHLCV data to a higher timeframe.
@@ -44,6 +143,12 @@ def aggregate_ohlcv(
     Takes lower-timeframe data (e.g., 1-minute) and aggregates it to
     a higher timeframe (e.g., 5-minute, 15-minute, 1-hour).
 
+    Bucket ids are computed once from the timestamps and OHLCV is reduced
+    with NumPy (first/last indexing, maximum/minimum/add.reduceat), giving
+    the same result as resample().agg().dropna() without its overhead.
+    Frequencies that do not divide a day (weekly), non-UTC timezones and
+    data containing NaN use pandas resample.
+
     Args:
         df: DataFrame with DatetimeIndex and OHLCV columns (open, high, low, close, volume)
         target_timeframe: Target timeframe string. Options:
@@ -54,6 +159,8 @@ def aggregate_ohlcv(
             - '4h', '4H': 4 hours
             - 'D', '1d', 'daily': Daily
         method: Aggregation method. Currently only 'standard' supported.
+        calendar: Optional trading calendar. If given, bars are aggregated
+            per session (see aggregate_ohlcv_by_session())
 
     Returns:
         DataFrame with aggregated OHLCV data at target timeframe
@@ -68,26 +175,34 @@ def aggregate_ohlcv(
     if df.empty:
         return df
 
+    if calendar is not None:
+        return aggregate_ohlcv_by_session(df, target_timeframe, calendar)
+
     # Normalize timeframe string to pandas offset alias
     target_freq = TIMEFRAME_MAP.get(target_timeframe, target_timeframe)
 
-    # Define aggregation rules
-    agg_rules = {
-        'open': 'first',
-        'high': 'max',
-        'low': 'min',
-        'close': 'last',
-        'volume': 'sum'
-    }
-
     # Ensure we have the required columns
     required_cols = ['open', 'high', 'low', 'close', 'volume']
     missing = [c for c in required_cols if c not in df.columns]
     if missing:
         raise ValueError(f"Missing required columns: {missing}")
 
+    try:
+        freq_ns = pd.Timedelta(target_freq).value
+    except ValueError:
+        freq_ns = 0
+    tz = getattr(df.index, 'tz', None)
+    if (
+        isinstance(df.index, pd.DatetimeIndex)
+        and freq_ns > 0 and _DAY_NS % freq_ns == 0
+        and (tz is None or str(tz) == 'UTC')
+    ):
+        # Bins align to midnight, so flooring epoch nanoseconds matches resample()
+        timestamps = utc_ns(df.index)
+        return _aggregate_by_labels(df, timestamps - timestamps % freq_ns, tz)
+
     # Resample and aggregate
-    df_agg = df[required_cols].resample(target_freq).agg(agg_rules)
+    df_agg = df[required_cols].resample(target_freq).agg(OHLCV_AGG_RULES)
 
     # Drop rows with NaN values (incomplete periods)
     df_agg = df_agg.dropna()
@@ -95,6 +210,55 @@ def aggregate_ohlcv(
     return df_agg
 
 
+def aggregate_ohlcv_by_session(
+    df: pd.DataFrame,
+    target_timeframe: str,
+    calendar
+) -> pd.DataFrame:
+    """
+    Aggregate minute OHLCV bars to a higher timeframe without crossing sessions.
+
+    Uses the same rules as aggregate_ohlcv(), with bars assigned to the
+    trading session whose minutes they fall in:
+
+    - Intraday targets use the same clock-aligned bins, but a bin that
+      straddles a session boundary is split. The part in the later session
+      is labelled at that session's open.
+    - 'daily' produces one bar per session, labelled with the session (UTC
+      midnight), even when sessions do not coincide with UTC days.
+
+    Args:
+        df: DataFrame with minute DatetimeIndex and OHLCV columns
+        target_timeframe: Target timeframe ('5m', '15m', '1h', '4h', 'daily', ...)
+        calendar: Trading calendar (exchange_calendars API) defining the sessions
+
+    Returns:
+        DataFrame with aggregated OHLCV data and a UTC DatetimeIndex
+
+    Example:
+        >>> df_1h = aggregate_ohlcv_by_session(df_1m, '1h', get_calendar('FOREX'))
+    """
+    required_cols = ['open', 'high', 'low', 'close', 'volume']
+    missing = [c for c in required_cols if c not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {missing}")
+    if df.empty:
+        return df[required_cols]
+
+    freq = pd.Timedelta(TIMEFRAME_MAP.get(target_timeframe, target_timeframe))
+    if freq > pd.Timedelta(days=1):
+        raise ValueError(f"Session-aware aggregation supports up to daily bars, got {target_timeframe}")
+
+    minutes = utc_ns(df.index)
+    session_pos = _session_positions(minutes, calendar)
+    in_calendar = session_pos < len(calendar.sessions)
+    if not in_calendar.all():
+        df, minutes, session_pos = df[in_calendar], minutes[in_calendar], session_pos[in_calendar]
+
+    labels = _session_labels(minutes, session_pos, freq, calendar)
+    return _aggregate_by_labels(df, labels, 'UTC')
+
+
 def resample_to_timeframe(
     df: pd.DataFrame,
     source_timeframe: str,
@@ -141,6 +305,11 @@ def resample_to_timeframe(
     return aggregate_ohlcv(df, target_timeframe)
 
 
+def _nests_in_day(minutes: int) -> bool:
+    """True if bars of this many minutes tile a UTC day (their boundaries align to midnight)."""
+    return 0 < minutes <= 1440 and 1440 % minutes == 0
+
+
 def create_multi_timeframe_data(
     df: pd.DataFrame,
     source_timeframe: str,
@@ -152,6 +321,15 @@ def create_multi_timeframe_data(
     Useful for multi-timeframe analysis strategies that need to
     reference different timeframes simultaneously.
 
+    Timeframes are built as a cascade: each target is aggregated from the
+    largest already-built timeframe whose bars nest inside it (1m -> 5m ->
+    15m -> 1h -> 4h -> daily), so only the first step reads the full-size
+    source. Each level's timestamp array is the index of its DataFrame and
+    the input of the next level. Weekly bars are resampled from the daily
+    level when it is built. Non-UTC indexes, data containing NaN and other
+    targets whose boundaries do not nest are aggregated from the source
+    frame, as resample_to_timeframe() would.
+
     Args:
         df: DataFrame with DatetimeIndex and OHLCV columns (source data)
         source_timeframe: Timeframe of source data (e.g., '1m')
@@ -160,18 +338,61 @@ def create_multi_timeframe_data(
     Returns:
         Dictionary mapping timeframe to aggregated DataFrame
 
+    Raises:
+        ValueError: If a timeframe is unknown or finer than the source
+
     Example:
         >>> mtf_data = create_multi_timeframe_data(df_1m, '1m', ['5m', '15m', '1h'])
         >>> df_5m = mtf_data['5m']
         >>> df_1h = mtf_data['1h']
     """
     result = {source_timeframe: df.copy()}
+    targets = [tf for tf in dict.fromkeys(target_timeframes) if tf != source_timeframe]
+    source_mins = TIMEFRAME_MINUTES.get(source_timeframe.lower(), 0)
 
-    for tf in target_timeframes:
-        if tf != source_timeframe:
+    tz = getattr(df.index, 'tz', None)
+    # Built levels: minutes -> (timeframe, int64 UTC ns timestamps, column arrays)
+    levels = {}
+    if (
+        not df.empty
+        and isinstance(df.index, pd.DatetimeIndex)
+        and (tz is None or str(tz) == 'UTC')
+        and _nests_in_day(source_mins)
+        and all(c in df.columns for c in _OHLCV_COLUMNS)
+    ):
+        ordered = df if df.index.is_monotonic_increasing else df.sort_index(kind='stable')
+        columns = {c: ordered[c].to_numpy() for c in _OHLCV_COLUMNS}
+        if all(
+            v.dtype.kind in 'iu' or (v.dtype.kind == 'f' and not np.isnan(v).any())
+            for v in columns.values()
+        ):
+            levels[source_mins] = (source_timeframe, utc_ns(ordered.index), columns)
+
+    for tf in sorted(targets, key=lambda t: TIMEFRAME_MINUTES.get(t.lower(), 0)):
+        target_mins = TIMEFRAME_MINUTES.get(tf.lower(), 0)
+        parents = [m for m in levels if m < target_mins and target_mins % m == 0]
+        if parents and not _nests_in_day(target_mins) and 1440 in levels:
+            # Daily bars lie inside one week, so weekly bins can be resampled from them
+            result[tf] = aggregate_ohlcv(result[levels[1440][0]], tf)
+            continue
+        if not parents or not _nests_in_day(target_mins) or target_mins == source_mins:
             result[tf] = resample_to_timeframe(df, source_timeframe, tf)
+            continue
+
+        _, timestamps, columns = levels[max(parents)]
+        freq_ns = target_mins * pd.Timedelta(minutes=1).value
+        keys, reduced = _reduce_ohlcv(columns, timestamps - timestamps % freq_ns)
+        levels[target_mins] = (tf, keys, reduced)
+
+        index = pd.DatetimeIndex(keys.view('datetime64[ns]'), name=df.index.name)
+        if getattr(df.index, 'unit', 'ns') != 'ns':
+            index = index.as_unit(df.index.unit)
+        result[tf] = pd.DataFrame(
+            reduced, columns=_OHLCV_COLUMNS,
+            index=index.tz_localize('UTC') if tz is not None else index
+        )
 
-    return result
+    return {tf: result[tf] for tf in [source_timeframe] + targets}
 
 
 def get_timeframe_multiplier(base_tf: str, target_tf: str) -> int:
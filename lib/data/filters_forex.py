@@ -8,8 +8,10 @@ FOREX market-specific requirements (pre-session bars, Sunday consolidation).
 import logging
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from .normalization import utc_ns
 from .forex import consolidate_sunday_to_friday
 
 logger = logging.getLogger(__name__)
@@ -44,37 +46,20 @@ def filter_forex_presession_bars(
         return df
     
     try:
-        # Get unique dates in the data
-        unique_dates = df.index.normalize().unique()
-        valid_mask = pd.Series(True, index=df.index)
+        index = df.index if df.index.tz is not None else df.index.tz_localize('UTC')
+        index = index.tz_convert('UTC')
 
-        for date_ts in unique_dates:
-            try:
-                # Get session open for this date
-                date_naive = date_ts.tz_convert(None) if date_ts.tz else date_ts
-                if date_naive not in calendar_obj.sessions:
-                    # Not a trading day, mark all bars for this date as invalid
-                    date_bars = df.index.normalize() == date_ts
-                    valid_mask[date_bars] = False
-                    continue
+        # Look up each distinct UTC date's session open once, then broadcast
+        # it to the rows: one pass over the index instead of one per date
+        codes, dates = pd.factorize(index.normalize().tz_localize(None))
+        positions = calendar_obj.sessions.get_indexer(dates)
+        opens = utc_ns(calendar_obj.opens)
+        date_open = np.where(positions >= 0, opens[positions], np.iinfo(np.int64).max)
 
-                session_open = calendar_obj.session_open(date_naive)
-                # Ensure session_open is UTC for comparison
-                if session_open.tz is None:
-                    session_open = session_open.tz_localize('UTC')
-                elif str(session_open.tz) != 'UTC':
-                    session_open = session_open.tz_convert('UTC')
+        # Bars on non-trading dates, or before their date's session open, are pre-session
+        valid_mask = utc_ns(index) >= date_open[codes]
 
-                # Find bars on this date that are before session open
-                date_bars = df.index.normalize() == date_ts
-                pre_session = df.index < session_open
-                invalid = date_bars & pre_session
-                valid_mask[invalid] = False
-            except Exception:
-                # If we can't get session info, keep the bars
-                continue
-
-        excluded = (~valid_mask).sum()
+        excluded = int((~valid_mask).sum())
         if excluded > 0:
             if show_progress:
                 print(f"  {symbol}: Filtered {excluded} pre-session bars (FOREX 00:00-04:59 UTC)")
@@ -6,8 +6,9 @@ including Sunday bar consolidation.
 """
 
 import logging
-from typing import Any, Optional, List
+from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -98,71 +99,44 @@ def consolidate_sunday_to_friday(df: pd.DataFrame, calendar_obj: Optional[Any] =
 
     logger.info(f"Consolidating {sunday_count} Sunday bars into Friday...")
 
-    # Get all Sunday dates
-    sunday_dates = df.index[sunday_mask].tolist()
-
-    consolidated_count = 0
-    dropped_sundays: List[pd.Timestamp] = []
-
-    for sunday_date in sunday_dates:
-        # Calculate the preceding Friday (Sunday - 2 days)
-        friday_date = sunday_date - pd.Timedelta(days=2)
-
-        # Normalize to midnight for index lookup
-        friday_normalized = friday_date.normalize()
-
-        # Check if Friday exists in the data
-        if friday_normalized not in df.index:
-            logger.warning(
-                f"No Friday bar found for Sunday {sunday_date.date()}. "
-                f"Sunday bar will be dropped without consolidation."
-            )
-            dropped_sundays.append(sunday_date)
-            continue
-
-        # Get Sunday and Friday data
-        sunday_row = df.loc[sunday_date]
-        friday_row = df.loc[friday_normalized]
-
-        # Update Friday's OHLCV with Sunday's data
-        # Close: Use Sunday's close (captures weekend movement)
-        df.loc[friday_normalized, 'close'] = sunday_row['close']
-
-        # High: Max of Friday and Sunday highs
-        df.loc[friday_normalized, 'high'] = max(friday_row['high'], sunday_row['high'])
-
-        # Low: Min of Friday and Sunday lows
-        df.loc[friday_normalized, 'low'] = min(friday_row['low'], sunday_row['low'])
-
-        # Volume: Aggregate Sunday volume into Friday
-        df.loc[friday_normalized, 'volume'] = friday_row['volume'] + sunday_row['volume']
-
-        # Mark Sunday for removal
-        dropped_sundays.append(sunday_date)
-        consolidated_count += 1
+    # Each Sunday's preceding Friday, located positionally in one lookup
+    sunday_pos = np.flatnonzero(sunday_mask)
+    friday_pos = df.index.get_indexer(df.index[sunday_pos] - pd.Timedelta(days=2))
+    has_friday = friday_pos >= 0
+
+    for sunday_date in df.index[sunday_pos[~has_friday]]:
+        logger.warning(
+            f"No Friday bar found for Sunday {sunday_date.date()}. "
+            f"Sunday bar will be dropped without consolidation."
+        )
+
+    fri, sun = friday_pos[has_friday], sunday_pos[has_friday]
+    consolidated_count = len(fri)
+
+    # Close: Sunday's close (captures weekend movement)
+    close = df['close'].to_numpy(copy=True)
+    close[fri] = close[sun]
+    df['close'] = close
+
+    # High/low: extremes of Friday and Sunday (Friday's value wins ties and NaN, as max()/min() did)
+    high = df['high'].to_numpy(copy=True)
+    high[fri] = np.where(high[sun] > high[fri], high[sun], high[fri])
+    df['high'] = high
+    low = df['low'].to_numpy(copy=True)
+    low[fri] = np.where(low[sun] < low[fri], low[sun], low[fri])
+    df['low'] = low
+
+    # Volume: Aggregate Sunday volume into Friday
+    volume = df['volume'].to_numpy(copy=True)
+    volume[fri] = volume[fri] + volume[sun]
+    df['volume'] = volume
 
     # Drop all Sunday rows
-    if dropped_sundays:
-        df = df.drop(dropped_sundays)
+    df = df[~sunday_mask]
 
     logger.info(
         f"Sunday consolidation complete. Consolidated {consolidated_count} bars, "
-        f"dropped {len(dropped_sundays)} Sunday rows"
+        f"dropped {sunday_count} Sunday rows"
     )
 
     return df
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
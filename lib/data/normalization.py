@@ -9,6 +9,7 @@ import logging
 from datetime import datetime
 from typing import Union, TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
 if TYPE_CHECKING:
@@ -39,6 +40,19 @@ def normalize_to_utc(dt: Union[pd.Timestamp, datetime, str]) -> pd.Timestamp:
     return ts
 
 
+def utc_ns(index) -> np.ndarray:
+    """
+    Int64 UTC nanoseconds of a DatetimeIndex (naive taken as UTC).
+
+    Use this rather than .asi8 to compare timestamps numerically: asi8 is
+    in the index's own unit, e.g. microseconds for datetime64[us].
+    """
+    index = pd.DatetimeIndex(index)
+    if hasattr(index, 'as_unit'):
+        index = index.as_unit('ns')
+    return (index if index.tz is None else index.tz_convert('UTC')).asi8
+
+
 def fill_data_gaps(
     df: pd.DataFrame,
     calendar: 'ExchangeCalendar',
@@ -0,0 +1,361 @@
+"""
+Rolling history buffers for trading strategies.
+
+Strategies and helpers typically call data.history(asset, field, N, freq)
+on every bar, rebuilding an N-bar window (and a pandas object) each time.
+A HistoryBuffer instead keeps one preallocated numpy ring buffer per
+(asset, field), appends the current bar from data.current() in O(1), and
+serves windows as read-only views without copying.
+
+The buffer is registered once in initialize() with the fields and lengths
+the strategy and its helpers need; every consumer of the same (asset, field)
+shares one buffer, sized for the longest request. It must be updated on
+every bar (call update_history() from handle_data) so it sees the same bars
+data.history() would return.
+
+This module follows the Single Responsibility Principle by focusing solely
+on price history bookkeeping, making it reusable across all strategies.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    # Avoid circular imports - these are Zipline types
+    from zipline.api import Context
+    from zipline.data.data_portal import DataPortal
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# data.history() frequency matching each Zipline data_frequency
+_FREQUENCY_BY_DATA_FREQUENCY = {'daily': '1d', 'minute': '1m'}
+
+
+class RingBuffer:
+    """
+    Fixed-capacity float ring buffer with contiguous window views.
+
+    Every value is written twice, at position i and i + capacity of a
+    2 * capacity array, so the most recent n values are always one
+    contiguous slice. append() is O(1) and window() returns a view.
+
+    Example:
+        >>> buf = RingBuffer(3)
+        >>> for price in [1.0, 2.0, 3.0, 4.0]:
+        ...     buf.append(price)
+        >>> buf.window()
+        array([2., 3., 4.])
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Args:
+            capacity: Maximum number of values kept (must be >= 1)
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1. Got: {capacity}")
+        self.capacity = int(capacity)
+        self._data = np.full(2 * self.capacity, np.nan)
+        self._pos = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def full(self) -> bool:
+        """True once capacity values have been appended."""
+        return self._count == self.capacity
+
+    def append(self, value: float) -> None:
+        """Append one value, overwriting the oldest when full."""
+        self._data[self._pos] = value
+        self._data[self._pos + self.capacity] = value
+        self._pos = (self._pos + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Append several values in order (only the last `capacity` are kept)."""
+        values = np.asarray(values, dtype=float)[-self.capacity:]
+        n = len(values)
+        if n == 0:
+            return
+        positions = (self._pos + np.arange(n)) % self.capacity
+        self._data[positions] = values
+        self._data[positions + self.capacity] = values
+        self._pos = (self._pos + n) % self.capacity
+        self._count = min(self._count + n, self.capacity)
+
+    def window(self, length: Optional[int] = None) -> np.ndarray:
+        """
+        Most recent values, oldest first, as a read-only view.
+
+        Args:
+            length: Number of values (None = all stored values)
+
+        Returns:
+            Read-only array view of min(length, len(self)) values; it is
+            only valid until the next append
+        """
+        if length is None or length > self._count:
+            length = self._count
+        end = self._pos + self.capacity
+        view = self._data[end - length:end]
+        view.flags.writeable = False
+        return view
+
+    def oldest(self) -> float:
+        """Oldest stored value, the one the next append overwrites when full (NaN if empty)."""
+        if self._count == 0:
+            return np.nan
+        return float(self._data[self._pos + self.capacity - self._count])
+
+    def last(self) -> float:
+        """Most recent value (NaN if empty)."""
+        if self._count == 0:
+            return np.nan
+        return float(self._data[self._pos + self.capacity - 1])
+
+    def resized(self, capacity: int) -> 'RingBuffer':
+        """Copy of this buffer with a new capacity, keeping the most recent values."""
+        buffer = RingBuffer(capacity)
+        buffer.extend(self.window())
+        return buffer
+
+
+class HistoryBuffer:
+    """
+    Shared rolling windows of bar data, one ring buffer per (asset, field).
+
+    Buffers are seeded from one data.history() call the first time they are
+    updated (so windows are complete from the first bar) and afterwards
+    grow by one data.current() value per bar.
+
+    Example:
+        >>> def initialize(context):
+        ...     register_history(context, [context.asset], ['price'], 30)
+        >>> def handle_data(context, data):
+        ...     update_history(context, data)
+        >>> prices = history_window(context, data, context.asset, 'price', 30, '1d')
+    """
+
+    def __init__(self, frequency: str = '1d'):
+        """
+        Args:
+            frequency: data.history() frequency the buffered bars correspond
+                to ('1d' when updated every daily bar, '1m' every minute bar)
+        """
+        self.frequency = frequency
+        self.last_dt = None
+        self._buffers: Dict[Tuple[Hashable, str], RingBuffer] = {}
+        self._unseeded: set = set()
+
+    def register(self, assets: Iterable[Hashable], fields: Iterable[str], length: int) -> None:
+        """
+        Request windows of `length` bars for every (asset, field) pair.
+
+        Registering an existing pair with a longer length grows its buffer;
+        the missing older bars are re-seeded from data.history() on the
+        next update.
+        """
+        if length < 1:
+            raise ValueError(f"History length must be >= 1. Got: {length}")
+        for asset in assets:
+            for field in fields:
+                key = (asset, field)
+                buffer = self._buffers.get(key)
+                if buffer is None:
+                    self._buffers[key] = RingBuffer(length)
+                    self._unseeded.add(key)
+                elif buffer.capacity < length:
+                    self._buffers[key] = buffer.resized(length)
+                    self._unseeded.add(key)
+
+    @property
+    def keys(self) -> List[Tuple[Hashable, str]]:
+        """Registered (asset, field) pairs."""
+        return list(self._buffers)
+
+    def capacity(self, asset: Hashable, field: str) -> int:
+        """Longest window registered for (asset, field), 0 if not registered."""
+        buffer = self._buffers.get((asset, field))
+        return buffer.capacity if buffer is not None else 0
+
+    def update(self, data: 'DataPortal') -> None:
+        """
+        Append the current bar to every buffer.
+
+        Idempotent within a bar: calling it again at the same data.current_dt
+        does nothing, so several helpers can safely call it.
+        """
+        current_dt = data.current_dt
+        if self.last_dt is not None and current_dt == self.last_dt:
+            return
+
+        # Seeding reads data.history(), which already includes the current bar
+        seeded = self._seed(data) if self._unseeded else set()
+
+        pending = [key for key in self._buffers if key not in seeded]
+        if pending:
+            assets = list(dict.fromkeys(asset for asset, _ in pending))
+            fields = list(dict.fromkeys(field for _, field in pending))
+            current = data.current(assets, fields)
+            for asset, field in pending:
+                self._buffers[(asset, field)].append(current.at[asset, field])
+
+        self.last_dt = current_dt
+
+    def _seed(self, data: 'DataPortal') -> set:
+        """Fill new or grown buffers from data.history() and return the seeded keys."""
+        seeded = set()
+        for asset, field in self._unseeded:
+            buffer = self._buffers[(asset, field)]
+            try:
+                values = np.asarray(
+                    data.history(asset, field, buffer.capacity, self.frequency), dtype=float
+                )
+            except Exception as e:
+                logger.warning(f"Could not seed history buffer for {asset} {field}: {e}")
+                continue
+            fresh = RingBuffer(buffer.capacity)
+            fresh.extend(values)
+            self._buffers[(asset, field)] = fresh
+            seeded.add((asset, field))
+        self._unseeded -= seeded
+        return seeded
+
+    def is_current(self, data: 'DataPortal') -> bool:
+        """True if the buffer has been updated for the current bar."""
+        return self.last_dt is not None and self.last_dt == data.current_dt
+
+    def has(self, asset: Hashable, field: str, length: int) -> bool:
+        """True if (asset, field) is buffered with at least `length` bars stored."""
+        buffer = self._buffers.get((asset, field))
+        return buffer is not None and len(buffer) >= length
+
+    def window(self, asset: Hashable, field: str, length: int) -> np.ndarray:
+        """
+        Last `length` bars of (asset, field), oldest first, as a read-only view.
+
+        Raises:
+            KeyError: If (asset, field) was not registered
+            ValueError: If length exceeds the registered capacity
+        """
+        buffer = self._buffers.get((asset, field))
+        if buffer is None:
+            raise KeyError(f"No history buffer registered for ({asset}, {field!r})")
+        if length > buffer.capacity:
+            raise ValueError(
+                f"Requested {length} bars of ({asset}, {field!r}) but only "
+                f"{buffer.capacity} are registered"
+            )
+        return buffer.window(length)
+
+
+def register_history(
+    context: 'Context',
+    assets: Iterable[Hashable],
+    fields: Iterable[str],
+    length: int,
+    frequency: Optional[str] = None
+) -> HistoryBuffer:
+    """
+    Register rolling history windows on context.history_buffer.
+
+    Call from initialize(). Creates the shared HistoryBuffer on first use;
+    later calls add fields or grow lengths of the same buffer.
+
+    Args:
+        context: Zipline context object
+        assets: Assets to buffer
+        fields: Bar fields to buffer (e.g. 'price', 'high', 'low')
+        length: Bars needed per window
+        frequency: data.history() frequency the bars correspond to.
+            None uses the algorithm's data frequency ('1d' for daily
+            backtests, '1m' for minute backtests).
+
+    Returns:
+        The context's HistoryBuffer
+    """
+    buffer = get_history_buffer(context)
+    if buffer is None:
+        buffer = HistoryBuffer(frequency or _default_frequency())
+        context.history_buffer = buffer
+    buffer.register(list(assets), list(fields), length)
+    return buffer
+
+
+def get_history_buffer(context: 'Context') -> Optional[HistoryBuffer]:
+    """Return the HistoryBuffer registered on context, or None."""
+    buffer = getattr(context, 'history_buffer', None)
+    return buffer if isinstance(buffer, HistoryBuffer) else None
+
+
+def update_history(context: 'Context', data: 'DataPortal') -> None:
+    """Append the current bar to the context's history buffer (call from handle_data)."""
+    buffer = get_history_buffer(context)
+    if buffer is not None:
+        buffer.update(data)
+
+
+def history_window(
+    context: 'Context',
+    data: 'DataPortal',
+    asset: Hashable,
+    field: str,
+    bar_count: int,
+    frequency: str
+) -> np.ndarray:
+    """
+    Last `bar_count` values of (asset, field), like data.history() as an array.
+
+    Served from the context's HistoryBuffer when it buffers this
+    (asset, field) at this frequency and is up to date for the current bar;
+    otherwise falls back to data.history().
+
+    Args:
+        context: Zipline context object
+        data: Zipline data object
+        asset: Asset to fetch
+        field: Bar field (e.g. 'price')
+        bar_count: Number of bars
+        frequency: data.history() frequency ('1d' or '1m')
+
+    Returns:
+        Float array of up to bar_count values, oldest first
+    """
+    if serves_window(context, data, asset, field, bar_count, frequency):
+        return get_history_buffer(context).window(asset, field, bar_count)
+    return np.asarray(data.history(asset, field, bar_count, frequency), dtype=float)
+
+
+def serves_window(
+    context: 'Context',
+    data: 'DataPortal',
+    asset: Hashable,
+    field: str,
+    bar_count: int,
+    frequency: str
+) -> bool:
+    """True if history_window() would be served from the buffer without calling data.history()."""
+    buffer = get_history_buffer(context)
+    return (
+        buffer is not None
+        and buffer.frequency == frequency
+        and buffer.is_current(data)
+        and buffer.has(asset, field, bar_count)
+    )
+
+
+def _default_frequency() -> str:
+    """History frequency matching the running algorithm's data frequency."""
+    try:
+        from zipline.api import get_environment
+        return _FREQUENCY_BY_DATA_FREQUENCY.get(get_environment('data_frequency'), '1d')
+    except Exception:
+        return '1d'
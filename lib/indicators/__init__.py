@@ -0,0 +1,46 @@
+"""
+Streaming technical indicators for The Researcher's Cockpit.
+
+Per-bar strategy logic usually recomputes indicators from a freshly fetched
+history window on every call, which is O(window) pandas work per bar per
+asset. The indicators here keep running state instead: update() folds in
+one bar in O(1) and returns the current value. Each has a batch compute()
+twin over whole arrays that follows the same conventions, for one-off
+windows and research.
+
+Indicators:
+    - SMA, EMA: moving averages
+    - RSI: Wilder's relative strength index
+    - ATR: Wilder's average true range (true_range() for raw ranges)
+    - BollingerBands: rolling mean +/- k standard deviations
+    - Volatility: rolling standard deviation of returns, optionally annualized
+
+Conventions:
+    - Values are NaN until `warmup` valid bars have been seen (`ready`)
+    - Bars with NaN inputs are skipped; the previous value is kept
+
+Usage:
+    >>> from lib.indicators import SMA, RSI
+    >>> def initialize(context):
+    ...     context.sma = SMA(50)
+    >>> def handle_data(context, data):
+    ...     sma = context.sma.update(data.current(context.asset, 'price'))
+    >>> SMA.compute(prices, period=50)  # batch twin
+"""
+
+from .base import StreamingIndicator, RollingMoments
+from .trend import SMA, EMA
+from .momentum import RSI
+from .volatility import ATR, BollingerBands, Volatility, true_range
+
+__all__ = [
+    'StreamingIndicator',
+    'RollingMoments',
+    'SMA',
+    'EMA',
+    'RSI',
+    'ATR',
+    'BollingerBands',
+    'Volatility',
+    'true_range',
+]
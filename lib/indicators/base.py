@@ -0,0 +1,186 @@
+"""
+Base classes for streaming indicators.
+
+Every indicator has two faces:
+- a streaming object whose update() folds in one bar in O(1) and returns
+  the current value, for per-bar strategy logic
+- a batch compute() classmethod over whole arrays, for one-off windows,
+  research and parity checks
+
+Both follow the same conventions:
+- Values are NaN until the indicator has seen `warmup` valid bars
+- Bars with a NaN input are skipped: state and value are unchanged, so
+  the batch result at a NaN bar repeats the previous value
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Tuple, Union
+
+import numpy as np
+
+from ..history_buffer import RingBuffer
+
+
+class StreamingIndicator(ABC):
+    """
+    Base class for O(1) streaming indicators with a batch compute() twin.
+
+    Subclasses implement:
+    - reset(): clear state (call super().reset())
+    - warmup: valid bars needed before the first value
+    - _update(*inputs): fold in one bar with valid inputs, return the value
+    - _compute_valid(*arrays, **params): batch values for NaN-free arrays
+    """
+
+    # Number of inputs per bar (ATR takes high, low, close)
+    n_inputs = 1
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all bars seen so far."""
+        self.count = 0
+        self.value = np.nan
+
+    @property
+    def ready(self) -> bool:
+        """True once enough valid bars have been seen to produce a value."""
+        return self.count >= self.warmup
+
+    @property
+    @abstractmethod
+    def warmup(self) -> int:
+        """Valid bars needed before the first value."""
+        pass
+
+    def update(self, *inputs: float):
+        """
+        Fold in one bar and return the current value.
+
+        Bars with any NaN input are skipped and return the previous value.
+        """
+        if any(x != x for x in inputs):
+            return self.value
+        self.count += 1
+        self.value = self._update(*inputs)
+        return self.value
+
+    def warm_up(self, *arrays) -> Union[float, Tuple[float, ...]]:
+        """Feed whole arrays of past bars through update() and return the last value."""
+        for bar in zip(*(np.asarray(a, dtype=float) for a in arrays)):
+            self.update(*bar)
+        return self.value
+
+    @abstractmethod
+    def _update(self, *inputs: float):
+        """Fold in one bar with valid inputs and return the value."""
+        pass
+
+    @classmethod
+    def compute(cls, *arrays, **params) -> np.ndarray:
+        """
+        Batch twin of update(): indicator values for every bar of the arrays.
+
+        Args:
+            *arrays: Input arrays of equal length (n_inputs of them)
+            **params: Indicator parameters, as for the constructor
+
+        Returns:
+            Float array with one value per bar (one row per bar for
+            multi-valued indicators)
+        """
+        arrays = [np.asarray(a, dtype=float) for a in arrays]
+        if len(arrays) != cls.n_inputs:
+            raise ValueError(f"{cls.__name__}.compute() takes {cls.n_inputs} array(s), got {len(arrays)}")
+        valid = ~np.any([np.isnan(a) for a in arrays], axis=0)
+        result = np.asarray(cls._compute_valid(*(a[valid] for a in arrays), **params), dtype=float)
+        return _spread_to_bars(result, valid)
+
+    @classmethod
+    @abstractmethod
+    def _compute_valid(cls, *arrays: np.ndarray, **params) -> np.ndarray:
+        """Batch values for NaN-free arrays."""
+        pass
+
+
+def _spread_to_bars(result: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """Place per-valid-bar results at their bars and repeat the last value over skipped bars."""
+    out = np.full((len(valid),) + result.shape[1:], np.nan)
+    # Index of the latest valid bar at or before each bar (-1 before the first)
+    latest = np.cumsum(valid) - 1
+    seen = latest >= 0
+    out[seen] = result[latest[seen]]
+    return out
+
+
+def validate_period(period: int, name: str = 'period', minimum: int = 1) -> int:
+    """Check an indicator period and return it as int."""
+    if int(period) != period or period < minimum:
+        raise ValueError(f"{name} must be an integer >= {minimum}. Got: {period}")
+    return int(period)
+
+
+class RollingMoments:
+    """
+    Mean and variance of the last `period` values in O(1) per value.
+
+    Uses Welford's update while the window fills and a sliding update once
+    full. The sums are recomputed exactly from the window every `period`
+    slides, so rounding error cannot accumulate over long backtests. Like
+    pandas, a window of identical values has a standard deviation of
+    exactly zero.
+    """
+
+    def __init__(self, period: int):
+        self.period = validate_period(period)
+        self._window = RingBuffer(self.period)
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._slides = 0
+        # Length of the run of identical values ending at the newest value
+        self._last = np.nan
+        self._run = 0
+
+    def __len__(self) -> int:
+        return len(self._window)
+
+    def add(self, x: float) -> None:
+        """Add a value, dropping the oldest once the window is full."""
+        self._run = self._run + 1 if x == self._last else 1
+        self._last = x
+        window = self._window
+        if not window.full:
+            window.append(x)
+            delta = x - self._mean
+            self._mean += delta / len(window)
+            self._m2 += delta * (x - self._mean)
+            return
+
+        old = window.oldest()
+        window.append(x)
+        self._slides += 1
+        if self._slides == self.period:
+            self._slides = 0
+            values = window.window()
+            self._mean = float(values.mean())
+            self._m2 = float(((values - self._mean) ** 2).sum())
+            return
+        mean = self._mean + (x - old) / self.period
+        self._m2 = max(0.0, self._m2 + (x - old) * (x - mean + old - self._mean))
+        self._mean = mean
+
+    @property
+    def mean(self) -> float:
+        return self._mean
+
+    def std(self, ddof: int = 0) -> float:
+        """Standard deviation of the current window."""
+        n = len(self._window)
+        if n - ddof <= 0:
+            return np.nan
+        if self._run >= n:
+            return 0.0
+        return float(np.sqrt(self._m2 / (n - ddof)))
@@ -0,0 +1,75 @@
+"""
+Momentum indicators: relative strength index.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from .base import StreamingIndicator, validate_period
+
+
+class RSI(StreamingIndicator):
+    """
+    Wilder's relative strength index of closing prices.
+
+    Average gains and losses are Wilder-smoothed (alpha = 1 / period),
+    seeded with the first price change. The first value is reported after
+    `period` price changes, i.e. `period + 1` prices. RSI is 100 when there
+    are no losses and NaN when prices have not moved at all.
+
+    Matches pandas:
+        delta = close.diff()
+        gain = delta.clip(lower=0).ewm(alpha=1/period, adjust=False, min_periods=period).mean()
+        loss = (-delta.clip(upper=0)).ewm(alpha=1/period, adjust=False, min_periods=period).mean()
+        rsi = 100 - 100 / (1 + gain / loss)
+    """
+
+    def __init__(self, period: int = 14):
+        self.period = validate_period(period)
+        self.alpha = 1.0 / self.period
+        super().__init__()
+
+    def reset(self) -> None:
+        super().reset()
+        self._prev_close = np.nan
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+
+    @property
+    def warmup(self) -> int:
+        return self.period + 1
+
+    def _update(self, close: float) -> float:
+        prev_close, self._prev_close = self._prev_close, close
+        if self.count == 1:
+            return np.nan
+
+        delta = close - prev_close
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        if self.count == 2:
+            self._avg_gain, self._avg_loss = gain, loss
+        else:
+            self._avg_gain += self.alpha * (gain - self._avg_gain)
+            self._avg_loss += self.alpha * (loss - self._avg_loss)
+
+        if self.count <= self.period:
+            return np.nan
+        return _rsi_from_averages(self._avg_gain, self._avg_loss)
+
+    @classmethod
+    def _compute_valid(cls, close: np.ndarray, period: int = 14) -> np.ndarray:
+        period = validate_period(period)
+        delta = pd.Series(close).diff()
+        smoothing = dict(alpha=1.0 / period, adjust=False, min_periods=period)
+        avg_gain = delta.clip(lower=0).ewm(**smoothing).mean().to_numpy()
+        avg_loss = (-delta.clip(upper=0)).ewm(**smoothing).mean().to_numpy()
+        return _rsi_from_averages(avg_gain, avg_loss)
+
+
+def _rsi_from_averages(avg_gain, avg_loss):
+    """RSI from average gain and loss (scalars or arrays)."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 100.0 - 100.0 / (1.0 + np.divide(avg_gain, avg_loss))
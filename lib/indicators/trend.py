@@ -0,0 +1,77 @@
+"""
+Trend indicators: simple and exponential moving averages.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from .base import StreamingIndicator, RollingMoments, validate_period
+
+
+class SMA(StreamingIndicator):
+    """
+    Simple moving average of the last `period` values.
+
+    Matches pandas: series.rolling(period).mean()
+
+    Example:
+        >>> sma = SMA(3)
+        >>> [sma.update(x) for x in [1.0, 2.0, 3.0, 4.0]]
+        [nan, nan, 2.0, 3.0]
+    """
+
+    def __init__(self, period: int):
+        self.period = validate_period(period)
+        super().__init__()
+
+    def reset(self) -> None:
+        super().reset()
+        self._moments = RollingMoments(self.period)
+
+    @property
+    def warmup(self) -> int:
+        return self.period
+
+    def _update(self, x: float) -> float:
+        self._moments.add(x)
+        return self._moments.mean if self.count >= self.period else np.nan
+
+    @classmethod
+    def _compute_valid(cls, values: np.ndarray, period: int) -> np.ndarray:
+        return pd.Series(values).rolling(validate_period(period)).mean().to_numpy()
+
+
+class EMA(StreamingIndicator):
+    """
+    Exponential moving average with alpha = 2 / (span + 1), seeded with the
+    first value and reported once `span` values have been seen.
+
+    Matches pandas: series.ewm(span=span, adjust=False, min_periods=span).mean()
+    """
+
+    def __init__(self, span: int):
+        self.span = validate_period(span, 'span')
+        self.alpha = 2.0 / (self.span + 1)
+        super().__init__()
+
+    def reset(self) -> None:
+        super().reset()
+        self._ema = np.nan
+
+    @property
+    def warmup(self) -> int:
+        return self.span
+
+    def _update(self, x: float) -> float:
+        if self.count == 1:
+            self._ema = x
+        else:
+            self._ema += self.alpha * (x - self._ema)
+        return self._ema if self.count >= self.span else np.nan
+
+    @classmethod
+    def _compute_valid(cls, values: np.ndarray, span: int) -> np.ndarray:
+        span = validate_period(span, 'span')
+        return pd.Series(values).ewm(span=span, adjust=False, min_periods=span).mean().to_numpy()
@@ -0,0 +1,156 @@
+"""
+Volatility indicators: true range / ATR, Bollinger Bands and return volatility.
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .base import StreamingIndicator, RollingMoments, validate_period
+
+
+def true_range(high, low, close) -> np.ndarray:
+    """
+    True range of each bar: max(high - low, |high - prev_close|, |low - prev_close|).
+
+    The first bar has no previous close and uses high - low.
+    """
+    high, low, close = (np.asarray(a, dtype=float) for a in (high, low, close))
+    prev_close = np.concatenate(([np.nan], close[:-1]))
+    return np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+
+
+class ATR(StreamingIndicator):
+    """
+    Wilder's average true range, updated with (high, low, close) bars.
+
+    True ranges are Wilder-smoothed (alpha = 1 / period) from the first bar;
+    the first value is reported after `period` bars.
+
+    Matches pandas:
+        true_range(high, low, close).ewm(alpha=1/period, adjust=False, min_periods=period).mean()
+    """
+
+    n_inputs = 3
+
+    def __init__(self, period: int = 14):
+        self.period = validate_period(period)
+        self.alpha = 1.0 / self.period
+        super().__init__()
+
+    def reset(self) -> None:
+        super().reset()
+        self._prev_close = np.nan
+        self._atr = np.nan
+
+    @property
+    def warmup(self) -> int:
+        return self.period
+
+    def _update(self, high: float, low: float, close: float) -> float:
+        tr = high - low
+        if self.count > 1:
+            prev_close = self._prev_close
+            tr = max(tr, abs(high - prev_close), abs(low - prev_close))
+            self._atr += self.alpha * (tr - self._atr)
+        else:
+            self._atr = tr
+        self._prev_close = close
+        return self._atr if self.count >= self.period else np.nan
+
+    @classmethod
+    def _compute_valid(cls, high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
+        period = validate_period(period)
+        tr = pd.Series(true_range(high, low, close))
+        return tr.ewm(alpha=1.0 / period, adjust=False, min_periods=period).mean().to_numpy()
+
+
+class BollingerBands(StreamingIndicator):
+    """
+    Bollinger Bands: rolling mean +/- num_std rolling standard deviations.
+
+    update() returns a (middle, upper, lower) tuple; compute() returns an
+    array with one (middle, upper, lower) row per bar.
+
+    Matches pandas:
+        middle = series.rolling(period).mean()
+        std = series.rolling(period).std(ddof=ddof)
+        upper, lower = middle + num_std * std, middle - num_std * std
+    """
+
+    def __init__(self, period: int = 20, num_std: float = 2.0, ddof: int = 0):
+        self.period = validate_period(period)
+        self.num_std = float(num_std)
+        self.ddof = int(ddof)
+        super().__init__()
+
+    def reset(self) -> None:
+        super().reset()
+        self._moments = RollingMoments(self.period)
+        self.value = (np.nan, np.nan, np.nan)
+
+    @property
+    def warmup(self) -> int:
+        return self.period
+
+    def _update(self, x: float) -> Tuple[float, float, float]:
+        self._moments.add(x)
+        if self.count < self.period:
+            return (np.nan, np.nan, np.nan)
+        middle = self._moments.mean
+        width = self.num_std * self._moments.std(self.ddof)
+        return (middle, middle + width, middle - width)
+
+    @classmethod
+    def _compute_valid(cls, values: np.ndarray, period: int = 20, num_std: float = 2.0, ddof: int = 0) -> np.ndarray:
+        rolling = pd.Series(values).rolling(validate_period(period))
+        middle = rolling.mean().to_numpy()
+        width = num_std * rolling.std(ddof=ddof).to_numpy()
+        return np.column_stack((middle, middle + width, middle - width))
+
+
+class Volatility(StreamingIndicator):
+    """
+    Standard deviation (ddof=1) of the last `period` simple returns of a
+    price series, optionally annualized by sqrt(annualization).
+
+    Updated with prices; the first value is reported after `period + 1`
+    prices.
+
+    Matches pandas:
+        prices.pct_change().rolling(period).std() * sqrt(annualization)
+    """
+
+    def __init__(self, period: int = 20, annualization: Optional[float] = None):
+        self.period = validate_period(period, minimum=2)
+        self.annualization = annualization
+        self._scale = np.sqrt(annualization) if annualization else 1.0
+        super().__init__()
+
+    def reset(self) -> None:
+        super().reset()
+        self._prev_price = np.nan
+        self._moments = RollingMoments(self.period)
+
+    @property
+    def warmup(self) -> int:
+        return self.period + 1
+
+    def _update(self, price: float) -> float:
+        prev_price, self._prev_price = self._prev_price, price
+        if self.count == 1:
+            return np.nan
+        self._moments.add(price / prev_price - 1.0)
+        if self.count <= self.period:
+            return np.nan
+        return self._moments.std(ddof=1) * self._scale
+
+    @classmethod
+    def _compute_valid(cls, prices: np.ndarray, period: int = 20, annualization: Optional[float] = None) -> np.ndarray:
+        period = validate_period(period, minimum=2)
+        scale = np.sqrt(annualization) if annualization else 1.0
+        returns = pd.Series(prices).pct_change()
+        return returns.rolling(period).std().to_numpy() * scale
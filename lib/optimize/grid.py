@@ -14,6 +14,7 @@ from ..backtest import run_backtest
 from ..config import load_strategy_params
 from ..metrics import calculate_metrics
 from .split import split_data
+from .prescreen import prescreen_param_sets
 from .results import deep_copy_dict, set_nested_param, save_optimization_results
 
 logger = logging.getLogger(__name__)
@@ -28,7 +29,8 @@ def grid_search(
     train_pct: float = 0.7,
     capital_base: Optional[float] = None,
     bundle: Optional[str] = None,
-    asset_class: Optional[str] = None
+    asset_class: Optional[str] = None,
+    prescreen: Optional[float] = None
 ) -> pd.DataFrame:
     """
     Perform grid search optimization over parameter combinations.
@@ -44,6 +46,10 @@ def grid_search(
         capital_base: Starting capital (default: from config)
         bundle: Bundle name (default: auto-detect)
         asset_class: Asset class hint
+        prescreen: Fraction (0-1] of combinations to keep after ranking them
+                   with the vectorized engine on the training period, or a
+                   count if > 1 (default: None, run all combinations).
+                   Requires the strategy to define vectorized_signals().
         
     Returns:
         DataFrame with all parameter combinations and their metrics
@@ -60,6 +66,13 @@ def grid_search(
     param_names = list(param_grid.keys())
     param_values = list(param_grid.values())
     combinations = list(itertools.product(*param_values))
+    param_sets = []
+    for combo in combinations:
+        # Create parameter dict for this combination
+        params = deep_copy_dict(base_params)
+        for param_name, param_value in zip(param_names, combo):
+            set_nested_param(params, param_name, param_value)
+        param_sets.append(params)
     
     results = []
     
@@ -67,11 +80,14 @@ def grid_search(
     print(f"Train period: {train_start} to {train_end}")
     print(f"Test period: {test_start} to {test_end}")
     
-    for i, combo in enumerate(combinations):
-        # Create parameter dict for this combination
-        params = deep_copy_dict(base_params)
-        for param_name, param_value in zip(param_names, combo):
-            set_nested_param(params, param_name, param_value)
+    selected, screen_scores = prescreen_param_sets(
+        strategy_name, param_sets, train_start, train_end, objective, prescreen,
+        capital_base, bundle, asset_class
+    )
+    
+    for n, i in enumerate(selected):
+        combo = combinations[i]
+        params = param_sets[i]
         
         # Run backtest on training data
         try:
@@ -139,16 +155,19 @@ def grid_search(
                 'test_max_dd': test_metrics.get('max_drawdown', 0.0),
             }
             
+            if screen_scores:
+                result['screen_' + objective] = screen_scores[i]
+            
             # Add parameter values
             for param_name, param_value in zip(param_names, combo):
                 result[param_name] = param_value
             
             results.append(result)
             
-            print(f"  [{i+1}/{len(combinations)}] Train {objective}: {train_obj:.4f}, Test {objective}: {test_obj:.4f}")
+            print(f"  [{n+1}/{len(selected)}] Train {objective}: {train_obj:.4f}, Test {objective}: {test_obj:.4f}")
             
         except Exception as e:
-            print(f"  [{i+1}/{len(combinations)}] Error: {e}")
+            print(f"  [{n+1}/{len(selected)}] Error: {e}")
             continue
     
     results_df = pd.DataFrame(results)
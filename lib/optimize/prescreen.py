@@ -0,0 +1,68 @@
+"""
+Vectorized pre-screening for grid and random search.
+
+Ranks parameter sets with lib.backtest.vectorized on the training period
+so only the most promising ones are run through Zipline.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def prescreen_param_sets(
+    strategy_name: str,
+    param_sets: List[Dict[str, Any]],
+    train_start: str,
+    train_end: str,
+    objective: str = 'sharpe',
+    keep: Optional[float] = None,
+    capital_base: Optional[float] = None,
+    bundle: Optional[str] = None,
+    asset_class: Optional[str] = None
+) -> Tuple[List[int], Dict[int, float]]:
+    """
+    Select the parameter sets to run through Zipline.
+
+    Args:
+        strategy_name: Name of strategy being optimized
+        param_sets: Full parameter dicts, one per combination
+        train_start: Training period start (screening runs on it only)
+        train_end: Training period end
+        objective: Objective metric to rank by
+        keep: Fraction (0-1] of parameter sets to keep, or a count if > 1.
+              None disables pre-screening.
+        capital_base: Starting capital (default: from config)
+        bundle: Bundle name (default: auto-detect)
+        asset_class: Asset class hint
+
+    Returns:
+        (indices, scores): indices of the parameter sets to run, and the
+        vectorized objective score by index (empty when not screened)
+    """
+    all_indices = list(range(len(param_sets)))
+    if keep is None or not param_sets:
+        return all_indices, {}
+
+    from ..backtest.vectorized import prescreen
+
+    try:
+        kept, scores = prescreen(
+            strategy_name,
+            param_sets,
+            start_date=train_start,
+            end_date=train_end,
+            objective=objective,
+            keep=keep,
+            capital_base=capital_base,
+            bundle=bundle,
+            asset_class=asset_class,
+        )
+    except Exception as e:
+        # Missing vectorized_signals(), bundle or symbol: screening is an optimization only
+        logger.warning(f"Pre-screening disabled, running all combinations: {e}")
+        return all_indices, {}
+
+    print(f"Pre-screen: kept {len(kept)} of {len(param_sets)} combinations (vectorized {objective})")
+    return kept, scores
@@ -15,6 +15,7 @@ from ..backtest import run_backtest
 from ..config import load_strategy_params, load_settings
 from ..metrics import calculate_metrics
 from .split import split_data
+from .prescreen import prescreen_param_sets
 from .results import deep_copy_dict, set_nested_param, save_optimization_results
 
 logger = logging.getLogger(__name__)
@@ -30,7 +31,8 @@ def random_search(
     train_pct: float = 0.7,
     capital_base: Optional[float] = None,
     bundle: Optional[str] = None,
-    asset_class: Optional[str] = None
+    asset_class: Optional[str] = None,
+    prescreen: Optional[float] = None
 ) -> pd.DataFrame:
     """
     Perform random search optimization over parameter distributions.
@@ -47,6 +49,10 @@ def random_search(
         capital_base: Starting capital (default: from config)
         bundle: Bundle name (default: auto-detect)
         asset_class: Asset class hint
+        prescreen: Fraction (0-1] of iterations to keep after ranking them
+                   with the vectorized engine on the training period, or a
+                   count if > 1 (default: None, run all iterations).
+                   Requires the strategy to define vectorized_signals().
         
     Returns:
         DataFrame with all parameter combinations and their metrics
@@ -71,13 +77,9 @@ def random_search(
     
     # Generate random parameter combinations
     np.random.seed(42)  # For reproducibility
-    results = []
-    
-    print(f"Random search: {n_iter} iterations")
-    print(f"Train period: {train_start} to {train_end}")
-    print(f"Test period: {test_start} to {test_end}")
-    
-    for i in range(n_iter):
+    param_sets = []
+    samples = []
+    for _ in range(n_iter):
         # Sample random parameter values
         params = deep_copy_dict(base_params)
         sampled_params = {}
@@ -96,6 +98,24 @@ def random_search(
             set_nested_param(params, param_name, value)
             sampled_params[param_name] = value
         
+        param_sets.append(params)
+        samples.append(sampled_params)
+    
+    results = []
+    
+    print(f"Random search: {n_iter} iterations")
+    print(f"Train period: {train_start} to {train_end}")
+    print(f"Test period: {test_start} to {test_end}")
+    
+    selected, screen_scores = prescreen_param_sets(
+        strategy_name, param_sets, train_start, train_end, objective, prescreen,
+        capital_base, bundle, asset_class
+    )
+    
+    for n, i in enumerate(selected):
+        params = param_sets[i]
+        sampled_params = samples[i]
+        
         # Run backtest on training data
         try:
             train_perf, _ = run_backtest(
@@ -162,16 +182,19 @@ def random_search(
                 'test_max_dd': test_metrics.get('max_drawdown', 0.0),
             }
             
+            if screen_scores:
+                result['screen_' + objective] = screen_scores[i]
+            
             # Add parameter values
             result.update(sampled_params)
             
             results.append(result)
             
-            if (i + 1) % 10 == 0:
-                print(f"  [{i+1}/{n_iter}] Train {objective}: {train_obj:.4f}, Test {objective}: {test_obj:.4f}")
+            if (n + 1) % 10 == 0:
+                print(f"  [{n+1}/{len(selected)}] Train {objective}: {train_obj:.4f}, Test {objective}: {test_obj:.4f}")
             
         except Exception as e:
-            print(f"  [{i+1}/{n_iter}] Error: {e}")
+            print(f"  [{n+1}/{len(selected)}] Error: {e}")
             continue
     
     results_df = pd.DataFrame(results)
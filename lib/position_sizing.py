@@ -6,6 +6,9 @@ Provides functions to calculate position sizes based on various methods:
 - Volatility-scaled position sizing
 - Kelly Criterion position sizing
 
+Volatility inputs are memoized per session when the strategy enables
+context.session_cache (see lib/session_cache.py).
+
 This module follows the Single Responsibility Principle by focusing solely
 on position sizing calculations, making it reusable across all strategies.
 """
@@ -17,6 +20,10 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 
+from .history_buffer import history_window, serves_window
+from .indicators import Volatility
+from .session_cache import cached_per_session
+
 if TYPE_CHECKING:
     # Avoid circular imports - these are Zipline types
     from zipline.api import Context
@@ -136,26 +143,21 @@ def _compute_volatility_scaled_size(
         return float(max_position)
 
     try:
-        prices = data.history(context.asset, 'price', vol_lookback + 1, '1d')
-        if len(prices) < vol_lookback + 1:
-            logger.debug(
-                f"Insufficient price history ({len(prices)} bars). "
-                f"Need {vol_lookback + 1}. Using max_position."
-            )
-            return float(max_position)
-
-        returns = prices.pct_change().dropna()
-        if len(returns) < vol_lookback:
-            logger.debug(
-                f"Insufficient returns data ({len(returns)}). "
-                f"Need {vol_lookback}. Using max_position."
-            )
-            return float(max_position)
-
         # Annualized volatility (trading days varies by asset class)
         asset_class = params.get('strategy', {}).get('asset_class', 'equities')
         trading_days = {'equities': 252, 'forex': 260, 'crypto': 365}.get(asset_class, 252)
-        current_vol = returns.std() * np.sqrt(trading_days)
+
+        # Memoized for the session when context.session_cache is enabled
+        history_calls = 0 if serves_window(
+            context, data, context.asset, 'price', vol_lookback + 1, '1d'
+        ) else 1
+        current_vol = cached_per_session(
+            context, data, (context.asset, 'volatility_scaled', vol_lookback),
+            lambda: _annualized_volatility(context, data, vol_lookback, trading_days),
+            history_calls=history_calls,
+        )
+        if np.isnan(current_vol):
+            return float(max_position)
 
         if current_vol > 0:
             # Scale position to target volatility
@@ -178,6 +180,38 @@ def _compute_volatility_scaled_size(
         return float(max_position)
 
 
+def _annualized_volatility(
+    context: 'Context',
+    data: 'DataPortal',
+    vol_lookback: int,
+    trading_days: int
+) -> float:
+    """
+    Annualized std of the last vol_lookback daily returns of context.asset.
+
+    Returns NaN (and logs why) when there is not enough price history.
+    """
+    # Served from context.history_buffer when registered, else data.history()
+    prices = history_window(context, data, context.asset, 'price', vol_lookback + 1, '1d')
+    if len(prices) < vol_lookback + 1:
+        logger.debug(
+            f"Insufficient price history ({len(prices)} bars). "
+            f"Need {vol_lookback + 1}. Using max_position."
+        )
+        return np.nan
+
+    # The std of a single return is undefined, as with pandas
+    current_vol = np.nan
+    if vol_lookback >= 2:
+        current_vol = float(Volatility.compute(prices, period=vol_lookback, annualization=trading_days)[-1])
+    if np.isnan(current_vol):
+        logger.debug(
+            f"Insufficient returns data for volatility. "
+            f"Need {vol_lookback} valid returns. Using max_position."
+        )
+    return current_vol
+
+
 def _compute_kelly_size(
     pos_config: dict,
     max_position: float,
@@ -0,0 +1,169 @@
+"""
+Per-session memoization of history-derived risk inputs.
+
+Position sizing and exit logic derive inputs such as volatility or ATR
+from data.history() on every call, although these inputs only need
+refreshing once per session. A SessionCache memoizes such values by
+(asset, method, lookback) and session, and counts the data.history()
+calls it saved over a backtest.
+
+The cache is opt-in: enable it in initialize() with enable_session_cache()
+(the template does so when position_sizing.cache_per_session is true).
+Without it, every call recomputes as before.
+
+This module follows the Single Responsibility Principle by focusing solely
+on caching bookkeeping, making it reusable across all strategies.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .session_levels import current_session
+
+if TYPE_CHECKING:
+    # Avoid circular imports - these are Zipline types
+    from zipline.api import Context
+    from zipline.data.data_portal import DataPortal
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# (asset, method, lookback)
+CacheKey = Tuple[Hashable, str, Any]
+
+
+class SessionCache:
+    """
+    Values memoized per (asset, method, lookback) for the current session.
+
+    An entry computed in an earlier session is recomputed on first use in
+    a new session. invalidate() drops entries explicitly, e.g. after a
+    parameter change within a session.
+
+    Example:
+        >>> cache = SessionCache()
+        >>> vol = cache.get_or_compute((asset, 'volatility_scaled', 20), session,
+        ...                            lambda: compute_vol(), history_calls=1)
+        >>> cache.stats()['history_calls_saved']
+    """
+
+    def __init__(self):
+        self._entries: Dict[CacheKey, Tuple[Any, Any, int]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.history_calls_saved = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(
+        self,
+        key: CacheKey,
+        session: Any,
+        compute: Callable[[], Any],
+        history_calls: int = 1
+    ) -> Any:
+        """
+        Return the value cached for key in this session, computing it on a miss.
+
+        Args:
+            key: (asset, method, lookback)
+            session: Current session label
+            compute: Zero-argument function producing the value
+            history_calls: data.history() calls compute() makes, counted as
+                saved on every hit
+
+        Returns:
+            Cached or freshly computed value
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == session:
+            self.hits += 1
+            self.history_calls_saved += entry[2]
+            return entry[1]
+
+        self.misses += 1
+        value = compute()
+        self._entries[key] = (session, value, history_calls)
+        return value
+
+    def invalidate(self, asset: Optional[Hashable] = None, method: Optional[str] = None) -> int:
+        """
+        Drop cached entries matching asset and/or method (all entries if neither is given).
+
+        Returns:
+            Number of entries dropped
+        """
+        stale = [
+            key for key in self._entries
+            if (asset is None or key[0] == asset) and (method is None or key[1] == method)
+        ]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit, miss and saved data.history() call counts for the backtest so far."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'history_calls_saved': self.history_calls_saved,
+        }
+
+
+def enable_session_cache(context: 'Context') -> SessionCache:
+    """Create context.session_cache (call from initialize()); returns the existing cache if already enabled."""
+    cache = get_session_cache(context)
+    if cache is None:
+        cache = SessionCache()
+        context.session_cache = cache
+    return cache
+
+
+def get_session_cache(context: 'Context') -> Optional[SessionCache]:
+    """Return the SessionCache enabled on context, or None."""
+    cache = getattr(context, 'session_cache', None)
+    return cache if isinstance(cache, SessionCache) else None
+
+
+def cached_per_session(
+    context: 'Context',
+    data: 'DataPortal',
+    key: CacheKey,
+    compute: Callable[[], Any],
+    history_calls: int = 1
+) -> Any:
+    """
+    compute() memoized for the current session when the context's cache is enabled.
+
+    Without an enabled cache, simply returns compute().
+
+    Args:
+        context: Zipline context object
+        data: Zipline data object (for the current session)
+        key: (asset, method, lookback)
+        compute: Zero-argument function producing the value
+        history_calls: data.history() calls compute() makes
+
+    Returns:
+        Cached or freshly computed value
+    """
+    cache = get_session_cache(context)
+    if cache is None:
+        return compute()
+    return cache.get_or_compute(key, current_session(data), compute, history_calls)
+
+
+def log_session_cache_stats(context: 'Context') -> Optional[Dict[str, int]]:
+    """Log and return the context's cache counters (None if no cache is enabled)."""
+    cache = get_session_cache(context)
+    if cache is None:
+        return None
+    stats = cache.stats()
+    logger.info(
+        f"Session cache: {stats['hits']} hits, {stats['misses']} misses, "
+        f"{stats['history_calls_saved']} data.history() calls saved"
+    )
+    return stats
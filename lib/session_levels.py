@@ -0,0 +1,355 @@
+"""
+Once-per-session daily levels for intraday strategies.
+
+Intraday strategies often need the previous session's high/low/close, the
+session open, ATR or volatility over N days. These only change once per
+session, yet are easy to recompute on every call from large minute
+history windows. SessionLevels computes the declared features once at
+session open and serves them from context.session_levels until the next
+session.
+
+Levels are computed either from the bundle's daily bars (one '1d'
+data.history() call per asset and session) or, for the previous-session
+levels, by aggregating only the previous session's minute bars.
+
+This module follows the Single Responsibility Principle by focusing solely
+on session-level feature bookkeeping, making it reusable across all
+strategies.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Dict, Hashable, Iterable, Optional
+
+import numpy as np
+
+from .indicators import Volatility, true_range
+
+if TYPE_CHECKING:
+    # Avoid circular imports - these are Zipline types
+    from zipline.api import Context
+    from zipline.data.data_portal import DataPortal
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Features computed from the previous completed session's bar
+PREVIOUS_SESSION_FEATURES = ('prev_open', 'prev_high', 'prev_low', 'prev_close', 'prev_range')
+
+# All supported features:
+# - prev_*: previous completed session's OHLC and high - low range
+# - session_open: open of the current session
+# - atr: mean true range over the last atr_period completed sessions
+# - volatility: std of the last volatility_lookback daily close-to-close
+#   returns, annualized by sqrt(annualization) when given
+SESSION_FEATURES = PREVIOUS_SESSION_FEATURES + ('session_open', 'atr', 'volatility')
+
+SESSION_LEVEL_SOURCES = ('daily', 'minute')
+
+_OHLC = ['open', 'high', 'low', 'close']
+
+
+class SessionLevels:
+    """
+    Daily features per asset, recomputed once per session.
+
+    update() is idempotent within a session, so it can be both scheduled at
+    session open and called lazily by every reader (see session_level()).
+
+    Example:
+        >>> def initialize(context):
+        ...     register_session_levels(context, [context.asset], ['prev_high', 'prev_low'])
+        >>> def rebalance(context, data):
+        ...     prev_high = session_level(context, data, context.asset, 'prev_high')
+    """
+
+    def __init__(
+        self,
+        assets: Iterable[Hashable],
+        features: Iterable[str],
+        atr_period: int = 14,
+        volatility_lookback: int = 20,
+        annualization: Optional[float] = None,
+        source: str = 'daily'
+    ):
+        """
+        Args:
+            assets: Assets to compute levels for
+            features: Feature names from SESSION_FEATURES
+            atr_period: Completed sessions averaged for 'atr'
+            volatility_lookback: Daily returns used for 'volatility' (>= 2)
+            annualization: Periods per year for 'volatility' (None = not annualized)
+            source: 'daily' to read everything from daily bars, 'minute' to
+                aggregate the previous session's minute bars for the prev_*
+                levels and session_open ('atr' and 'volatility' always use
+                daily bars)
+        """
+        self.assets = list(dict.fromkeys(assets))
+        self.features = list(dict.fromkeys(features))
+        unknown = [f for f in self.features if f not in SESSION_FEATURES]
+        if unknown:
+            raise ValueError(f"Unknown session level features {unknown}. Supported: {list(SESSION_FEATURES)}")
+        if source not in SESSION_LEVEL_SOURCES:
+            raise ValueError(f"source must be one of {list(SESSION_LEVEL_SOURCES)}. Got: {source!r}")
+        if atr_period < 1:
+            raise ValueError(f"atr_period must be >= 1. Got: {atr_period}")
+        if volatility_lookback < 2:
+            raise ValueError(f"volatility_lookback must be >= 2. Got: {volatility_lookback}")
+
+        self.atr_period = int(atr_period)
+        self.volatility_lookback = int(volatility_lookback)
+        self.annualization = annualization
+        self.source = source
+        self.session = None
+        self._values: Dict[Hashable, Dict[str, float]] = {}
+
+    @property
+    def daily_bars_needed(self) -> int:
+        """Daily bars (completed sessions plus the current one) read per asset, 0 if none."""
+        sessions = 0
+        if self.source == 'daily' and any(
+            f in PREVIOUS_SESSION_FEATURES or f == 'session_open' for f in self.features
+        ):
+            sessions = 1
+        if 'atr' in self.features:
+            sessions = max(sessions, self.atr_period + 1)
+        if 'volatility' in self.features:
+            sessions = max(sessions, self.volatility_lookback + 1)
+        return sessions + 1 if sessions else 0
+
+    def is_current(self, data: 'DataPortal') -> bool:
+        """True if levels have been computed for the current session."""
+        return self.session is not None and self.session == current_session(data)
+
+    def update(self, data: 'DataPortal', calendar=None) -> None:
+        """
+        Compute every feature for the current session.
+
+        Does nothing if levels are already current. Features that cannot be
+        computed (missing bars, too little history) are NaN.
+
+        Args:
+            data: Zipline data object
+            calendar: Trading calendar, needed for source='minute' to find
+                the previous session's minutes (falls back to daily bars
+                without one)
+        """
+        session = current_session(data)
+        if self.session is not None and session == self.session:
+            return
+
+        for asset in self.assets:
+            values = dict.fromkeys(self.features, np.nan)
+            try:
+                self._compute_asset(data, asset, calendar, values)
+            except Exception as e:
+                logger.warning(f"Could not compute session levels for {asset}: {e}")
+            self._values[asset] = values
+
+        self.session = session
+
+    def get(self, asset: Hashable, feature: str) -> float:
+        """
+        Value of feature for asset in the last computed session.
+
+        Raises:
+            KeyError: If the feature was not declared
+        """
+        if feature not in self.features:
+            raise KeyError(f"Session level {feature!r} was not registered. Registered: {self.features}")
+        return self._values.get(asset, {}).get(feature, np.nan)
+
+    def values(self, asset: Hashable) -> Dict[str, float]:
+        """All features of asset in the last computed session."""
+        return dict(self._values.get(asset, dict.fromkeys(self.features, np.nan)))
+
+    def _compute_asset(self, data: 'DataPortal', asset: Hashable, calendar, values: Dict[str, float]) -> None:
+        """Fill values for one asset."""
+        n_daily = self.daily_bars_needed
+        minute_levels = self.source == 'minute' and calendar is not None
+
+        if minute_levels:
+            previous, session_open = _aggregate_previous_session(data, asset, calendar)
+            _set_previous_session_levels(values, previous)
+            if 'session_open' in values:
+                values['session_open'] = session_open
+        elif self.source == 'minute':
+            # No calendar to locate the previous session: read daily bars instead
+            n_daily = max(n_daily, 2)
+
+        if n_daily:
+            bars = data.history(asset, _OHLC, n_daily, '1d')
+            # The last daily bar is the current (possibly partial) session
+            completed = bars.iloc[:-1].dropna(subset=['close'])
+            if not minute_levels:
+                if len(completed):
+                    _set_previous_session_levels(values, completed.iloc[-1][_OHLC].to_numpy(dtype=float))
+                if 'session_open' in values:
+                    values['session_open'] = float(bars['open'].iloc[-1])
+            if 'atr' in values:
+                values['atr'] = self._atr(completed)
+            if 'volatility' in values:
+                values['volatility'] = self._volatility(completed)
+
+    def _atr(self, completed) -> float:
+        """Mean true range of the last atr_period completed sessions."""
+        if len(completed) < self.atr_period + 1:
+            return np.nan
+        tail = completed.iloc[-(self.atr_period + 1):]
+        ranges = true_range(tail['high'], tail['low'], tail['close'])[1:]
+        return float(np.mean(ranges))
+
+    def _volatility(self, completed) -> float:
+        """Std of the last volatility_lookback close-to-close returns."""
+        closes = completed['close'].to_numpy(dtype=float)
+        if len(closes) < self.volatility_lookback + 1:
+            return np.nan
+        return float(Volatility.compute(
+            closes, period=self.volatility_lookback, annualization=self.annualization
+        )[-1])
+
+
+def current_session(data: 'DataPortal'):
+    """Session label of the current bar."""
+    session = getattr(data, 'current_session', None)
+    if session is not None:
+        return session
+    return data.current_dt.normalize()
+
+
+def _set_previous_session_levels(values: Dict[str, float], ohlc: np.ndarray) -> None:
+    """Fill the prev_* features that were declared from a previous-session OHLC row."""
+    prev_open, prev_high, prev_low, prev_close = ohlc
+    levels = {
+        'prev_open': prev_open,
+        'prev_high': prev_high,
+        'prev_low': prev_low,
+        'prev_close': prev_close,
+        'prev_range': prev_high - prev_low,
+    }
+    for feature, value in levels.items():
+        if feature in values:
+            values[feature] = float(value)
+
+
+def _aggregate_previous_session(data: 'DataPortal', asset: Hashable, calendar):
+    """
+    Aggregate only the previous session's minute bars.
+
+    Returns:
+        (ohlc, session_open): previous session's (open, high, low, close)
+        array and the current session's open (NaN where no bars traded)
+    """
+    nan_ohlc = np.full(4, np.nan)
+    session = current_session(data)
+    previous = calendar.previous_session(session)
+    previous_minutes = calendar.session_minutes(previous)
+    minutes_today = data.current_session_minutes
+    elapsed = int((minutes_today <= data.current_dt).sum())
+
+    bars = data.history(asset, _OHLC, len(previous_minutes) + elapsed, '1m')
+    index = bars.index
+    in_previous = (index >= previous_minutes[0]) & (index <= previous_minutes[-1])
+    prev_bars = bars[in_previous].dropna(subset=['close'])
+    today = bars[index >= minutes_today[0]].dropna(subset=['open'])
+
+    ohlc = nan_ohlc
+    if len(prev_bars):
+        ohlc = np.array([
+            prev_bars['open'].iloc[0],
+            prev_bars['high'].max(),
+            prev_bars['low'].min(),
+            prev_bars['close'].iloc[-1],
+        ], dtype=float)
+    session_open = float(today['open'].iloc[0]) if len(today) else np.nan
+    return ohlc, session_open
+
+
+def register_session_levels(
+    context: 'Context',
+    assets: Iterable[Hashable],
+    features: Iterable[str],
+    atr_period: int = 14,
+    volatility_lookback: int = 20,
+    annualization: Optional[float] = None,
+    source: str = 'daily',
+    minutes_after_open: int = 1,
+    schedule: bool = True
+) -> SessionLevels:
+    """
+    Declare daily features on context.session_levels, computed once per session.
+
+    Call from initialize(), before scheduling the functions that read the
+    levels: scheduled functions at the same minute run in registration
+    order. Readers that go through session_level() refresh stale levels
+    themselves, so ordering only affects when the work happens.
+
+    Args:
+        context: Zipline context object
+        assets: Assets to compute levels for
+        features: Feature names from SESSION_FEATURES
+        atr_period: Completed sessions averaged for 'atr'
+        volatility_lookback: Daily returns used for 'volatility'
+        annualization: Periods per year for 'volatility' (None = not annualized)
+        source: 'daily' or 'minute' (see SessionLevels)
+        minutes_after_open: When to compute levels each session (>= 1)
+        schedule: Schedule the update with schedule_function (False to
+            update only lazily, e.g. outside a running algorithm)
+
+    Returns:
+        The context's SessionLevels
+    """
+    levels = SessionLevels(
+        assets, features,
+        atr_period=atr_period,
+        volatility_lookback=volatility_lookback,
+        annualization=annualization,
+        source=source,
+    )
+    context.session_levels = levels
+
+    if schedule:
+        from zipline.api import schedule_function, date_rules, time_rules
+        schedule_function(
+            update_session_levels,
+            date_rule=date_rules.every_day(),
+            time_rule=time_rules.market_open(minutes=max(1, minutes_after_open))
+        )
+    return levels
+
+
+def get_session_levels(context: 'Context') -> Optional[SessionLevels]:
+    """Return the SessionLevels registered on context, or None."""
+    levels = getattr(context, 'session_levels', None)
+    return levels if isinstance(levels, SessionLevels) else None
+
+
+def update_session_levels(context: 'Context', data: 'DataPortal') -> None:
+    """Compute the context's session levels for the current session (idempotent)."""
+    levels = get_session_levels(context)
+    if levels is not None:
+        levels.update(data, getattr(context, 'trading_calendar', None))
+
+
+def session_level(context: 'Context', data: 'DataPortal', asset: Hashable, feature: str) -> float:
+    """
+    Current session's value of a registered feature, computing levels if stale.
+
+    Args:
+        context: Zipline context object
+        data: Zipline data object
+        asset: Asset to look up
+        feature: Registered feature name
+
+    Returns:
+        Feature value (NaN if it could not be computed)
+
+    Raises:
+        KeyError: If no session levels or this feature were registered
+    """
+    levels = get_session_levels(context)
+    if levels is None:
+        raise KeyError("No session levels registered on context. Call register_session_levels() in initialize().")
+    update_session_levels(context, data)
+    return levels.get(asset, feature)
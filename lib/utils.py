@@ -4,6 +4,8 @@ Utility functions for The Researcher's Cockpit.
 Provides file operations, directory management, and YAML handling utilities.
 """
 
+import os
+import secrets
 import yaml
 from pathlib import Path
 from datetime import datetime
@@ -17,28 +19,56 @@ def ensure_dir(path: Path) -> Path:
     return path
 
 
-def timestamp_dir(base_path: Path, prefix: str) -> Path:
+def timestamp_dir(base_path: Path, prefix: str, max_attempts: int = 100) -> Path:
     """
-    Create a timestamped directory.
+    Create a uniquely named timestamped directory.
+
+    The name combines a second-resolution timestamp with a short random
+    suffix, and the directory is created exclusively so two runs finishing
+    in the same second (e.g. parallel backtests) never share a directory.
 
     Args:
         base_path: Base directory path
         prefix: Prefix for directory name (e.g., 'backtest', 'optimization')
+        max_attempts: Number of names to try before giving up
 
     Returns:
-        Path to the created directory (e.g., 'results/spy_sma/backtest_20241220_143022')
+        Path to the created directory (e.g., 'results/spy_sma/backtest_20241220_143022_a1b2c3')
+
+    Raises:
+        FileExistsError: If no unique name could be created in max_attempts tries
     """
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    dir_path = base_path / f"{prefix}_{timestamp}"
-    ensure_dir(dir_path)
-    return dir_path
+    ensure_dir(base_path)
+    for _ in range(max_attempts):
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        dir_path = base_path / f"{prefix}_{timestamp}_{secrets.token_hex(3)}"
+        try:
+            dir_path.mkdir(exist_ok=False)
+        except FileExistsError:
+            continue
+        return dir_path
+    raise FileExistsError(
+        f"Could not create a unique '{prefix}' directory in {base_path} "
+        f"after {max_attempts} attempts"
+    )
 
 
 def update_symlink(target: Path, link_path: Path) -> None:
-    """Create or update a symlink pointing to target."""
-    if link_path.exists() or link_path.is_symlink():
-        link_path.unlink()
-    link_path.symlink_to(target)
+    """
+    Create or update a symlink pointing to target.
+
+    The new link is created under a temporary name and moved into place with
+    os.replace, so concurrent readers always see either the old or the new
+    target and concurrent writers never fail on a half-removed link.
+    """
+    tmp_link = link_path.parent / f".{link_path.name}.tmp-{os.getpid()}-{secrets.token_hex(4)}"
+    tmp_link.symlink_to(target)
+    try:
+        os.replace(tmp_link, link_path)
+    except OSError:
+        if tmp_link.is_symlink():
+            tmp_link.unlink()
+        raise
     if not link_path.exists():
         raise OSError(f"Failed to create symlink {link_path} -> {target}")
 
@@ -12,6 +12,7 @@ Architecture:
     - ValidationCheck: Individual check result container
     - ValidationResult: Aggregated validation results with merge support
     - BaseValidator: Abstract base for all validators (DRY pattern)
+    - ValidationFeatures: Derived features computed once per validation
     - DataValidator: OHLCV data validation (orchestrator)
     - Asset-specific validators: EquityValidator, ForexValidator, CryptoValidator
     - BundleValidator: Bundle integrity validation
@@ -68,6 +69,16 @@ from .config import ValidationConfig
 # Column mapping
 from .column_mapping import ColumnMapping, build_column_mapping
 
+# Shared derived features
+from .features import ValidationFeatures
+
+# Validation result cache
+from .cache import (
+    VALIDATION_CACHE_VERSION,
+    get_validation_cache_dir,
+    clear_validation_cache,
+)
+
 # Base validator
 from .base import BaseValidator
 
@@ -147,6 +158,12 @@ __all__ = [
     # Column mapping
     'ColumnMapping',
     'build_column_mapping',
+    # Shared derived features
+    'ValidationFeatures',
+    # Validation result cache
+    'VALIDATION_CACHE_VERSION',
+    'get_validation_cache_dir',
+    'clear_validation_cache',
     # Base validator
     'BaseValidator',
     # Core validators
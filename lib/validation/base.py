@@ -9,8 +9,12 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Optional, List, Callable
 
+import pandas as pd
+
 from .core import ValidationResult
 from .config import ValidationConfig
+from .column_mapping import ColumnMapping, build_column_mapping
+from .features import ValidationFeatures
 
 logger = logging.getLogger('cockpit.validation')
 
@@ -39,6 +43,7 @@ class BaseValidator(ABC):
         """
         self.config = config or ValidationConfig()
         self._check_registry: List[Callable] = []
+        self._features: Optional[ValidationFeatures] = None
         self._register_checks()
 
     @abstractmethod
@@ -64,6 +69,29 @@ class BaseValidator(ABC):
         result.add_metadata('timezone_aware', True)
         return result
 
+    def _get_features(
+        self,
+        df: pd.DataFrame,
+        col_map: Optional[ColumnMapping] = None
+    ) -> ValidationFeatures:
+        """
+        Get the shared feature context for df.
+
+        Returns the context of the validation in progress when it belongs to
+        df, so derived features are computed once per validate() call. Checks
+        called on their own get a fresh context.
+
+        Args:
+            df: DataFrame being checked
+            col_map: Column mapping (built from df if None)
+
+        Returns:
+            ValidationFeatures for df
+        """
+        if self._features is not None and self._features.matches(df):
+            return self._features
+        return ValidationFeatures(df, col_map or build_column_mapping(df))
+
     def _run_check(
         self,
         result: ValidationResult,
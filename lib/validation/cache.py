@@ -0,0 +1,205 @@
+"""
+Persistent cache of DataValidator results.
+
+DataValidator.validate() already hashes the frame it validates. When the
+same data is validated again with the same configuration (re-ingesting an
+unchanged file, re-running scripts/validate_csv_data.py), the result is
+identical, so it is stored as JSON under data/cache/validation/ and returned
+directly on the next call.
+
+Cache keys cover:
+- the data hash (index, column names, dtypes and values)
+- a fingerprint of every ValidationConfig field
+- the asset name (it appears in check messages)
+- the calendar name and session range, when a calendar is passed
+- the UTC date, when clock-dependent checks (stale data, future dates) run
+- VALIDATION_CACHE_VERSION, bumped whenever check logic changes
+
+A key is a scope digest (asset, configuration, calendar) followed by a state
+digest (data hash, UTC date, version). Writing a new key evicts older entries
+of the same scope, so daily runs and data edits don't accumulate files.
+"""
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Any, Optional
+
+import pandas as pd
+
+from ..paths import get_project_root
+from .config import ValidationConfig
+from .core import ValidationResult
+from .validators.reports import load_validation_report
+
+logger = logging.getLogger('cockpit.validation')
+
+# Bump when any check changes its outcome, message or details,
+# so stale results are never served after a code change.
+VALIDATION_CACHE_VERSION = 1
+
+# Cache keys are a 12-hex-digit scope digest followed by a 12-hex-digit state digest
+_DIGEST_LEN = 12
+_KEY_PATTERN = re.compile(r'[0-9a-f]{24}')
+
+# Config fields that control caching itself rather than validation output
+_NON_RESULT_FIELDS = frozenset({'cache_results'})
+
+
+def get_validation_cache_dir() -> Path:
+    """Get the directory holding cached validation results."""
+    return get_project_root() / 'data' / 'cache' / 'validation'
+
+
+def config_fingerprint(config: ValidationConfig) -> str:
+    """
+    Hash every field of a ValidationConfig that can affect results.
+
+    Returns:
+        Short hex digest of the configuration
+    """
+    fields = {
+        name: value for name, value in dataclasses.asdict(config).items()
+        if name not in _NON_RESULT_FIELDS
+    }
+    encoded = json.dumps(fields, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def _calendar_key(calendar: Optional[Any]) -> Optional[str]:
+    """Identify a calendar by name and session range (None without a calendar)."""
+    if calendar is None:
+        return None
+    sessions = calendar.sessions
+    return f"{getattr(calendar, 'name', type(calendar).__name__)}:{sessions[0]}:{sessions[-1]}:{len(sessions)}"
+
+
+def validation_cache_key(
+    data_hash: str,
+    config: ValidationConfig,
+    asset_name: str,
+    calendar: Optional[Any] = None,
+) -> str:
+    """
+    Build the cache key for one validation.
+
+    Args:
+        data_hash: compute_dataframe_hash() of the validated frame
+        config: Effective ValidationConfig (after validate() overrides)
+        asset_name: Asset name used in check messages
+        calendar: Calendar passed to validate(), if any
+
+    Returns:
+        Hex digest identifying the validation result: the scope digest
+        (asset, config, calendar) followed by the state digest (data hash,
+        UTC date, cache version)
+    """
+    clock_dependent = config.check_stale_data or config.check_future_dates
+    scope_fields = {
+        'config': config_fingerprint(config),
+        'asset_type': config.asset_type,
+        'asset_name': asset_name,
+        'calendar': _calendar_key(calendar),
+    }
+    state_fields = {
+        'data_hash': data_hash,
+        'date': str(pd.Timestamp.now(tz='UTC').date()) if clock_dependent else None,
+        'version': VALIDATION_CACHE_VERSION,
+    }
+    return _digest(scope_fields) + _digest(state_fields)
+
+
+def _digest(fields: dict) -> str:
+    """Short hex digest of a JSON-serializable dict."""
+    encoded = json.dumps(fields, sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()[:_DIGEST_LEN]
+
+
+def get_cache_path(key: str) -> Path:
+    """Get the cache file path for a key."""
+    return get_validation_cache_dir() / f"{key}.json"
+
+
+def load_cached_result(key: str) -> Optional[ValidationResult]:
+    """
+    Load a cached validation result.
+
+    Returns:
+        Cached ValidationResult, or None if missing or unreadable
+    """
+    cache_path = get_cache_path(key)
+    if not cache_path.exists():
+        return None
+    try:
+        return load_validation_report(cache_path)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable validation cache file {cache_path}: {e}")
+        return None
+
+
+def save_cached_result(result: ValidationResult, key: str) -> None:
+    """
+    Write a validation result to the cache atomically.
+
+    The file is written under a temporary name and moved into place so
+    concurrent validations never read a partially written entry. Entries
+    it supersedes are then evicted. Write failures are logged and otherwise
+    ignored.
+    """
+    cache_path = get_cache_path(key)
+    tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w') as f:
+            json.dump(result.to_dict(), f, default=str)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.warning(f"Failed to write validation cache file {cache_path}: {e}")
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    _evict_superseded(cache_path)
+
+
+def _evict_superseded(cache_path: Path) -> int:
+    """
+    Delete entries with the same scope as cache_path but an older state.
+
+    The state changes with the data and, for clock-dependent checks, every
+    UTC day, so without eviction the cache would grow without bound.
+
+    Returns:
+        Number of files deleted
+    """
+    removed = 0
+    for path in cache_path.parent.glob(f"{cache_path.stem[:_DIGEST_LEN]}*.json"):
+        if path == cache_path or not _KEY_PATTERN.fullmatch(path.stem):
+            continue
+        try:
+            path.unlink()
+            removed += 1
+        except FileNotFoundError:
+            # A concurrent validation already evicted it
+            pass
+    return removed
+
+
+def clear_validation_cache() -> int:
+    """
+    Delete all cached validation results.
+
+    Returns:
+        Number of files deleted
+    """
+    cache_dir = get_validation_cache_dir()
+    if not cache_dir.exists():
+        return 0
+    removed = 0
+    for path in cache_dir.glob('*.json'):
+        path.unlink()
+        removed += 1
+    return removed
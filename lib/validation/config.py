@@ -51,6 +51,8 @@ class ValidationConfig:
         min_rows_daily: Minimum rows for daily data
         min_rows_intraday: Minimum rows for intraday data
         strict_mode: If True, warnings become errors
+        cache_results: If True, DataValidator reuses results cached under
+            data/cache/validation/ for unchanged data and config
         timeframe: Data timeframe for context-aware validation
     """
     # Gap checking
@@ -93,6 +95,7 @@ class ValidationConfig:
     # Mode
     strict_mode: bool = False
     suggest_fixes: bool = False
+    cache_results: bool = False
 
     # Context
     timeframe: Optional[str] = None
@@ -249,6 +252,7 @@ class ValidationConfig:
             'min_rows_daily': self.min_rows_daily,
             'min_rows_intraday': self.min_rows_intraday,
             'strict_mode': self.strict_mode,
+            'cache_results': self.cache_results,
             'timeframe': self.timeframe,
             'asset_type': self.asset_type,
             'calendar_name': self.calendar_name,
@@ -12,6 +12,7 @@ from typing import Optional, Any, Tuple, Literal
 import numpy as np
 import pandas as pd
 
+from ..data.normalization import utc_ns
 from .core import (
     ValidationResult,
     ValidationSeverity,
@@ -21,12 +22,13 @@ from .core import (
 from .config import ValidationConfig
 from .column_mapping import ColumnMapping, build_column_mapping
 from .base import BaseValidator
+from .cache import validation_cache_key, load_cached_result, save_cached_result
+from .features import ValidationFeatures
 from .utils import (
     normalize_dataframe_index,
     ensure_timezone,
     compute_dataframe_hash,
     safe_divide,
-    calculate_z_scores,
 )
 from .validators import (
     EquityValidator,
@@ -106,6 +108,10 @@ class DataValidator(BaseValidator):
         """
         Validate OHLCV DataFrame with common and asset-specific checks.
 
+        With config.cache_results, a result cached for the same data hash,
+        config, asset and calendar (see cache.py) is returned without
+        re-running the checks; metadata['cache_hit'] tells which happened.
+
         Args:
             df: DataFrame with OHLCV columns (case-insensitive matching)
             calendar: Optional trading calendar for gap detection
@@ -151,29 +157,53 @@ class DataValidator(BaseValidator):
         # Add date range metadata
         result.add_metadata('date_range_start', str(df.index.min()))
         result.add_metadata('date_range_end', str(df.index.max()))
-        result.add_metadata('data_hash', compute_dataframe_hash(df))
+        data_hash = compute_dataframe_hash(df)
+        result.add_metadata('data_hash', data_hash)
+
+        # Unchanged data validated with the same config gives the same result
+        cache_key = None
+        if self.config.cache_results:
+            cache_key = validation_cache_key(data_hash, self.config, asset_name, calendar)
+            cached_result = load_cached_result(cache_key)
+            if cached_result is not None:
+                logger.debug(f"Using cached validation result for {asset_name} ({data_hash[:12]})")
+                # Duration covers this call (the cache lookup), not the original validation
+                cached_result._start_time = result._start_time
+                return cached_result.add_metadata('cache_hit', True)
+            result.add_metadata('cache_hit', False)
 
         # Build column mapping
         col_map = build_column_mapping(df)
 
-        # Run common checks
-        result = self._run_common_checks(df, col_map, asset_name, result)
-
-        # Run gap/continuity checks if calendar provided
-        if self.config.check_gaps and not result.get_check('required_columns') or result.get_check('required_columns').passed:
-            result = self._run_continuity_checks(df, calendar, result, asset_name, calendar_name)
-
-        # Run asset-specific validation
-        if self.config.asset_type:
-            asset_validator = self._get_asset_validator(self.config.asset_type)
-            if asset_validator:
-                asset_result = asset_validator.validate(df, col_map, asset_name)
-                result = result.merge(asset_result)
+        # Derived features (UTC index, returns, z-scores) are computed once and
+        # shared by every check, including the asset-specific validator
+        self._features = ValidationFeatures(df, col_map)
+        try:
+            # Run common checks
+            result = self._run_common_checks(df, col_map, asset_name, result)
+
+            # Run gap/continuity checks if calendar provided
+            if self.config.check_gaps and not result.get_check('required_columns') or result.get_check('required_columns').passed:
+                result = self._run_continuity_checks(df, calendar, result, asset_name, calendar_name)
+
+            # Run asset-specific validation
+            if self.config.asset_type:
+                asset_validator = self._get_asset_validator(self.config.asset_type)
+                if asset_validator:
+                    asset_result = asset_validator.validate(
+                        df, col_map, asset_name, features=self._features
+                    )
+                    result = result.merge(asset_result)
+        finally:
+            self._features = None
 
         # Generate fix suggestions if enabled
         if self.config.suggest_fixes:
             result = add_fix_suggestions_to_result(result, df, asset_name)
 
+        if cache_key is not None:
+            save_cached_result(result, cache_key)
+
         return result
 
     def _run_common_checks(
@@ -306,14 +336,17 @@ class DataValidator(BaseValidator):
                 return result
 
         # High >= Low, High >= Open/Close, Low <= Open/Close
-        high_low_violations = int((df[h] < df[l]).sum())
-        high_violations = int(((df[h] < df[o]) | (df[h] < df[c])).sum())
-        low_violations = int(((df[l] > df[o]) | (df[l] > df[c])).sum())
+        high_low_mask = df[h] < df[l]
+        high_mask = (df[h] < df[o]) | (df[h] < df[c])
+        low_mask = (df[l] > df[o]) | (df[l] > df[c])
+        high_low_violations = int(high_low_mask.sum())
+        high_violations = int(high_mask.sum())
+        low_violations = int(low_mask.sum())
         total_violations = high_low_violations + high_violations + low_violations
 
         if total_violations > 0:
             violation_pct = safe_divide(total_violations, len(df)) * 100
-            violation_mask = (df[h] < df[l]) | (df[h] < df[o]) | (df[h] < df[c]) | (df[l] > df[o]) | (df[l] > df[c])
+            violation_mask = high_low_mask | high_mask | low_mask
             violation_dates = df.index[violation_mask][:3].tolist()
 
             msg = (
@@ -390,7 +423,7 @@ class DataValidator(BaseValidator):
     ) -> ValidationResult:
         """Check for dates in the future."""
         today = pd.Timestamp.now(tz='UTC').normalize()
-        index = ensure_timezone(pd.DatetimeIndex(df.index))
+        index = self._get_features(df, col_map).utc_index
         future_dates = int((index > today).sum())
 
         if future_dates > 0:
@@ -532,7 +565,7 @@ class DataValidator(BaseValidator):
         if len(df) == 0:
             return result
 
-        df_index = ensure_timezone(pd.DatetimeIndex(df.index))
+        df_index = self._get_features(df, col_map).utc_index
         last_date = df_index.max()
         now = pd.Timestamp.now(tz='UTC')
         days_since = (now - last_date).days
@@ -606,12 +639,13 @@ class DataValidator(BaseValidator):
         if not close_col or len(df) < 3:
             return result
 
-        returns = df[close_col].pct_change().dropna()
+        features = self._get_features(df, col_map)
+        returns = features.valid_returns
 
         if len(returns) < 2:
             return result
 
-        z_scores = calculate_z_scores(returns)
+        z_scores = features.return_z_scores
         threshold = self.config.outlier_threshold_sigma
         outliers = int((z_scores > threshold).sum())
 
@@ -721,7 +755,8 @@ class DataValidator(BaseValidator):
     ) -> ValidationResult:
         """Check for missing dates according to trading calendar."""
         try:
-            df_index = ensure_timezone(pd.DatetimeIndex(df.index))
+            features = self._get_features(df)
+            df_index = features.utc_index
             start_date = df_index.min()
             end_date = df_index.max()
 
@@ -744,7 +779,7 @@ class DataValidator(BaseValidator):
 
             # Normalize for comparison
             sessions_norm = ensure_timezone(pd.DatetimeIndex(sessions).normalize())
-            df_dates_norm = df_index.normalize()
+            df_dates_norm = features.utc_dates
             missing = set(sessions_norm) - set(df_dates_norm)
 
             if missing:
@@ -803,13 +838,14 @@ class DataValidator(BaseValidator):
     ) -> ValidationResult:
         """Check intraday data continuity with calendar awareness."""
         try:
-            df_index = ensure_timezone(pd.DatetimeIndex(df.index))
+            df_index = self._get_features(df).utc_index
             start_date = df_index.min()
             end_date = df_index.max()
 
+            # exchange_calendars takes session labels as tz-naive dates
             sessions = calendar.sessions_in_range(
-                start_date.normalize(),
-                end_date.normalize()
+                start_date.normalize().tz_localize(None),
+                end_date.normalize().tz_localize(None)
             )
 
             if len(sessions) == 0:
@@ -820,44 +856,66 @@ class DataValidator(BaseValidator):
             if self._is_continuous_calendar(calendar=calendar, calendar_name=calendar_name):
                 return self._check_intraday_continuity(result, df, asset_name)
 
-            # Check session coverage
-            sessions_with_data = 0
-            sessions_missing = 0
+            # Map every bar to its session in one pass: the first session closing at or after
+            # the bar, kept if the bar is not before that session's open. The [open, close]
+            # window admits both bar-start and bar-end labelled minutes.
+            opens = utc_ns(calendar.opens.loc[sessions])
+            closes = utc_ns(calendar.closes.loc[sessions])
+            bar_ns = utc_ns(df_index)
+            session_pos = np.searchsorted(closes, bar_ns, side='left')
+            in_session = session_pos < len(sessions)
+            in_session[in_session] = bar_ns[in_session] >= opens[session_pos[in_session]]
+            bars_per_session = np.bincount(session_pos[in_session], minlength=len(sessions))
+
+            missing = bars_per_session == 0
+            sessions_missing = int(missing.sum())
+            sessions_with_data = len(sessions) - sessions_missing
+
+            details = {
+                'sessions_missing': sessions_missing,
+                'sessions_with_data': sessions_with_data,
+                'bars_outside_sessions': int(len(bar_ns) - in_session.sum()),
+            }
+            if sessions_missing:
+                details['sample_missing_sessions'] = [
+                    str(d.date()) for d in sessions[missing][:5]
+                ]
 
-            for session in sessions:
-                session_start = session.normalize()
-                session_end = session_start + pd.Timedelta(days=1)
-                session_data = df_index[(df_index >= session_start) & (df_index < session_end)]
-                if len(session_data) > 0:
-                    sessions_with_data += 1
-                else:
-                    sessions_missing += 1
+            # Partial sessions: fewer bars than the session length allows at this timeframe
+            expected_interval = self.config.expected_interval
+            if expected_interval is not None:
+                expected_bars = -((opens - closes) // expected_interval.value)
+                partial = ~missing & (bars_per_session < expected_bars)
+                details['sessions_partial'] = int(partial.sum())
+                if partial.any():
+                    details['sample_partial_sessions'] = [
+                        {
+                            'session': str(sessions[i].date()),
+                            'bars': int(bars_per_session[i]),
+                            'expected_bars': int(expected_bars[i])
+                        }
+                        for i in np.flatnonzero(partial)[:5]
+                    ]
 
             if sessions_missing > self.config.gap_tolerance_days:
                 coverage_pct = safe_divide(sessions_with_data, len(sessions)) * 100
+                details['coverage_pct'] = coverage_pct
                 msg = f"Missing data for {sessions_missing} trading sessions in {asset_name}"
 
                 if self.config.strict_mode:
-                    result.add_check(
-                        'date_continuity', False, msg,
-                        {
-                            'sessions_missing': sessions_missing,
-                            'sessions_with_data': sessions_with_data,
-                            'coverage_pct': coverage_pct
-                        }
-                    )
+                    result.add_check('date_continuity', False, msg, details)
                 else:
                     result.add_warning(msg)
                     result.add_check(
                         'date_continuity', True,
                         "Session gaps within tolerance",
-                        {'sessions_missing': sessions_missing, 'coverage_pct': coverage_pct}
+                        details
                     )
             else:
                 result.add_check(
                     'date_continuity', True,
                     f"Data present for {sessions_with_data} sessions",
-                    {'sessions_with_data': sessions_with_data}
+                    details
                 )
 
         except Exception as e:
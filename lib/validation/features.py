@@ -0,0 +1,114 @@
+"""
+Derived features shared by validation checks.
+
+A single DataValidator.validate() call runs a dozen common checks plus an
+asset-specific validator, and many of them need the same derived series:
+the UTC index, UTC day numbers, close-to-close returns and z-scores.
+ValidationFeatures computes each of these lazily, once per validated frame,
+and is handed to every check of that validation.
+"""
+
+from functools import cached_property
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from ..data.normalization import utc_ns
+from .column_mapping import ColumnMapping
+from .utils import ensure_timezone, calculate_z_scores
+
+_NS_PER_DAY = 86_400_000_000_000
+
+
+class ValidationFeatures:
+    """
+    Lazily computed, cached features of one validated DataFrame.
+
+    Every attribute is computed on first access and reused afterwards, so
+    checks can ask for what they need without coordinating who computes it.
+    Instances are tied to one DataFrame object; use matches() to check
+    whether a context belongs to a given frame.
+
+    Example:
+        >>> features = ValidationFeatures(df, build_column_mapping(df))
+        >>> features.close_returns.dropna()  # computed once
+        >>> features.utc_index.max()         # computed once
+    """
+
+    def __init__(self, df: pd.DataFrame, col_map: ColumnMapping):
+        """
+        Args:
+            df: DataFrame being validated (DatetimeIndex)
+            col_map: Column mapping for OHLCV columns
+        """
+        self.df = df
+        self.col_map = col_map
+        self._values = {}
+
+    def matches(self, df: pd.DataFrame) -> bool:
+        """True if this context was built for exactly this DataFrame object."""
+        return self.df is df
+
+    # -------------------------------------------------------------------------
+    # Index features
+    # -------------------------------------------------------------------------
+
+    @cached_property
+    def utc_index(self) -> pd.DatetimeIndex:
+        """Index as a UTC DatetimeIndex (naive timestamps are taken as UTC)."""
+        return ensure_timezone(pd.DatetimeIndex(self.df.index))
+
+    @cached_property
+    def utc_dates(self) -> pd.DatetimeIndex:
+        """UTC index normalized to midnight."""
+        return self.utc_index.normalize()
+
+    @cached_property
+    def utc_days(self) -> np.ndarray:
+        """UTC day number of each bar (days since 1970-01-01)."""
+        return utc_ns(self.utc_index) // _NS_PER_DAY
+
+    @cached_property
+    def day_of_week(self) -> np.ndarray:
+        """UTC day of week of each bar (Monday=0, Sunday=6)."""
+        # 1970-01-01 was a Thursday
+        return (self.utc_days + 3) % 7
+
+    # -------------------------------------------------------------------------
+    # Column features
+    # -------------------------------------------------------------------------
+
+    def values(self, column: str) -> np.ndarray:
+        """Column as a float64 array with NaN for missing values (cached per column)."""
+        if column not in self._values:
+            self._values[column] = self.df[column].to_numpy(dtype=float, na_value=np.nan)
+        return self._values[column]
+
+    @cached_property
+    def close_returns(self) -> Optional[pd.Series]:
+        """Close-to-close pct_change() (first value NaN), or None without a close column."""
+        if not self.col_map.close:
+            return None
+        return self.df[self.col_map.close].pct_change()
+
+    @cached_property
+    def valid_returns(self) -> Optional[pd.Series]:
+        """Non-null close returns (close_returns.dropna())."""
+        if self.close_returns is None:
+            return None
+        return self.close_returns.dropna()
+
+    @cached_property
+    def return_z_scores(self) -> Optional[pd.Series]:
+        """Absolute z-scores of the non-null close returns."""
+        if self.valid_returns is None:
+            return None
+        return calculate_z_scores(self.valid_returns)
+
+    @cached_property
+    def volume_z_scores(self) -> Optional[pd.Series]:
+        """Absolute z-scores of volume, or None without a volume column."""
+        if not self.col_map.volume:
+            return None
+        return calculate_z_scores(self.df[self.col_map.volume])
@@ -7,6 +7,7 @@ Provides helper functions used across validation modules.
 import hashlib
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 
@@ -56,18 +57,47 @@ def ensure_timezone(
 def compute_dataframe_hash(df: pd.DataFrame) -> str:
     """
     Compute a hash of DataFrame contents for integrity checking.
-    
-    Uses SHA256 for strong collision resistance.
-    
+
+    Hashes the index, column names, dtypes and values with BLAKE2b.
+    Numeric columns and DatetimeIndex values are fed to the hash straight
+    from their numpy buffers in chunks, so no per-row hashing or large
+    intermediate arrays are needed; other dtypes fall back to
+    pd.util.hash_pandas_object.
+
     Args:
         df: DataFrame to hash
-        
+
     Returns:
-        SHA256 hash string (64 characters)
+        BLAKE2b-256 hash string (64 characters)
     """
-    hash_values = pd.util.hash_pandas_object(df, index=True)
-    combined = hashlib.sha256(hash_values.values.tobytes())
-    return combined.hexdigest()
+    digest = hashlib.blake2b(digest_size=32)
+
+    index = df.index
+    digest.update(f"index:{index.dtype}:{len(index)}".encode())
+    if isinstance(index, pd.DatetimeIndex):
+        _update_with_buffer(digest, index.asi8)
+    else:
+        _update_with_buffer(digest, pd.util.hash_pandas_object(index).to_numpy())
+
+    for name in df.columns:
+        column = df[name]
+        digest.update(f"column:{name!r}:{column.dtype}".encode())
+        if column.dtype.kind in 'biufc':
+            _update_with_buffer(digest, column.to_numpy())
+        else:
+            _update_with_buffer(digest, pd.util.hash_pandas_object(column, index=False).to_numpy())
+
+    return digest.hexdigest()
+
+
+_HASH_CHUNK_BYTES = 16 * 1024 * 1024
+
+
+def _update_with_buffer(digest, values: np.ndarray) -> None:
+    """Feed an array's raw bytes to a hashlib object in fixed-size chunks."""
+    buffer = memoryview(np.ascontiguousarray(values)).cast('B')
+    for start in range(0, len(buffer), _HASH_CHUNK_BYTES):
+        digest.update(buffer[start:start + _HASH_CHUNK_BYTES])
 
 
 def parse_timeframe(timeframe: Optional[str]) -> Optional[pd.Timedelta]:
@@ -12,11 +12,14 @@ Validates cryptocurrency data with crypto-specific rules:
 import logging
 from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
 from ..base import BaseValidator
 from ..core import ValidationResult, ValidationSeverity
 from ..column_mapping import ColumnMapping
+from ..features import ValidationFeatures
 from ..utils import safe_divide, calculate_z_scores, ensure_timezone
 
 logger = logging.getLogger('cockpit.validation.crypto')
@@ -50,7 +53,8 @@ class CryptoValidator(BaseValidator):
         self,
         df: pd.DataFrame,
         col_map: ColumnMapping,
-        asset_name: str = "unknown"
+        asset_name: str = "unknown",
+        features: Optional[ValidationFeatures] = None
     ) -> ValidationResult:
         """
         Validate crypto-specific characteristics.
@@ -59,6 +63,8 @@ class CryptoValidator(BaseValidator):
             df: DataFrame with OHLCV data
             col_map: Column mapping for OHLCV columns
             asset_name: Asset name for logging
+            features: Shared feature context from the calling DataValidator
+                (a fresh one is built if None)
 
         Returns:
             ValidationResult with crypto-specific check outcomes
@@ -72,9 +78,13 @@ class CryptoValidator(BaseValidator):
             return result
 
         # Run registered checks
-        for check_func in self._check_registry:
-            if not self._should_skip_check(check_func.__name__):
-                result = self._run_check(result, check_func, df, col_map, asset_name)
+        self._features = features if features is not None else ValidationFeatures(df, col_map)
+        try:
+            for check_func in self._check_registry:
+                if not self._should_skip_check(check_func.__name__):
+                    result = self._run_check(result, check_func, df, col_map, asset_name)
+        finally:
+            self._features = None
 
         return result
 
@@ -100,7 +110,7 @@ class CryptoValidator(BaseValidator):
             return result
 
         # Calculate returns
-        returns = df[close_col].pct_change().dropna()
+        returns = self._get_features(df, col_map).valid_returns
 
         if len(returns) < 2:
             result.add_check(
@@ -170,43 +180,47 @@ class CryptoValidator(BaseValidator):
             )
             return result
 
-        flash_crashes = []
         flash_crash_threshold = 0.20  # 20% drop
 
-        # Iterate through data looking for flash crash patterns
-        for i in range(len(df) - 3):
-            # Check if current bar has a large intrabar drop
-            bar_high = df.iloc[i][high_col]
-            bar_low = df.iloc[i][low_col]
-            bar_close = df.iloc[i][close_col]
-
-            if bar_high == 0:
-                continue
-
-            # Calculate intrabar drop
-            intrabar_drop = (bar_high - bar_low) / bar_high
-
-            if intrabar_drop > flash_crash_threshold:
-                # Check if price recovered in next few bars
-                next_3_bars = df.iloc[i+1:i+4]
-                if len(next_3_bars) > 0:
-                    max_recovery = next_3_bars[high_col].max()
-                    recovery_pct = (max_recovery - bar_low) / (bar_high - bar_low) if (bar_high - bar_low) > 0 else 0
-
-                    # Flash crash if recovery > 50%
-                    if recovery_pct > 0.5:
-                        flash_crashes.append({
-                            'date': str(df.index[i]),
-                            'drop_pct': float(intrabar_drop * 100),
-                            'recovery_pct': float(recovery_pct * 100),
-                            'high': float(bar_high),
-                            'low': float(bar_low),
-                            'close': float(bar_close)
-                        })
-
-        if flash_crashes:
+        features = self._get_features(df, col_map)
+        high = features.values(high_col)
+        low = features.values(low_col)
+        close = features.values(close_col)
+
+        # Every bar with three bars after it is a candidate
+        n_candidates = len(df) - 3
+        bar_high = high[:n_candidates]
+        bar_low = low[:n_candidates]
+        bar_range = bar_high - bar_low
+
+        # Intrabar drop from the high/low arrays
+        with np.errstate(divide='ignore', invalid='ignore'):
+            intrabar_drop = bar_range / bar_high
+            crashed = (bar_high != 0) & (intrabar_drop > flash_crash_threshold)
+
+            # Highest high of the next 3 bars (NaN-skipping, like Series.max)
+            max_recovery = np.fmax.reduce(sliding_window_view(high[1:], 3), axis=1)
+            recovery_pct = np.where(bar_range > 0, (max_recovery - bar_low) / bar_range, 0.0)
+
+            # Flash crash if recovery > 50%
+            crash_pos = np.flatnonzero(crashed & (recovery_pct > 0.5))
+
+        flash_crash_count = len(crash_pos)
+        flash_crashes = [
+            {
+                'date': str(df.index[i]),
+                'drop_pct': float(intrabar_drop[i] * 100),
+                'recovery_pct': float(recovery_pct[i] * 100),
+                'high': float(high[i]),
+                'low': float(low[i]),
+                'close': float(close[i])
+            }
+            for i in crash_pos[:5]  # First 5
+        ]
+
+        if flash_crash_count:
             msg = (
-                f"Found {len(flash_crashes)} potential flash crash(es) in {asset_name}. "
+                f"Found {flash_crash_count} potential flash crash(es) in {asset_name}. "
                 f"These rapid drops with quick recovery may indicate exchange issues, "
                 f"liquidation cascades, or data errors. Review these dates carefully."
             )
@@ -214,8 +228,8 @@ class CryptoValidator(BaseValidator):
             result.add_check(
                 'flash_crashes', False, msg,
                 {
-                    'flash_crash_count': len(flash_crashes),
-                    'flash_crashes': flash_crashes[:5]  # First 5
+                    'flash_crash_count': flash_crash_count,
+                    'flash_crashes': flash_crashes
                 },
                 severity=ValidationSeverity.WARNING
             )
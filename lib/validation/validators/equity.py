@@ -18,7 +18,8 @@ import pandas as pd
 from ..base import BaseValidator
 from ..core import ValidationResult, ValidationSeverity
 from ..column_mapping import ColumnMapping
-from ..utils import safe_divide, calculate_z_scores, ensure_timezone
+from ..features import ValidationFeatures
+from ..utils import safe_divide, ensure_timezone
 
 logger = logging.getLogger('cockpit.validation.equity')
 
@@ -52,7 +53,8 @@ class EquityValidator(BaseValidator):
         self,
         df: pd.DataFrame,
         col_map: ColumnMapping,
-        asset_name: str = "unknown"
+        asset_name: str = "unknown",
+        features: Optional[ValidationFeatures] = None
     ) -> ValidationResult:
         """
         Validate equity-specific characteristics.
@@ -61,6 +63,8 @@ class EquityValidator(BaseValidator):
             df: DataFrame with OHLCV data
             col_map: Column mapping for OHLCV columns
             asset_name: Asset name for logging
+            features: Shared feature context from the calling DataValidator
+                (a fresh one is built if None)
 
         Returns:
             ValidationResult with equity-specific check outcomes
@@ -74,9 +78,13 @@ class EquityValidator(BaseValidator):
             return result
 
         # Run registered checks
-        for check_func in self._check_registry:
-            if not self._should_skip_check(check_func.__name__):
-                result = self._run_check(result, check_func, df, col_map, asset_name)
+        self._features = features if features is not None else ValidationFeatures(df, col_map)
+        try:
+            for check_func in self._check_registry:
+                if not self._should_skip_check(check_func.__name__):
+                    result = self._run_check(result, check_func, df, col_map, asset_name)
+        finally:
+            self._features = None
 
         return result
 
@@ -102,8 +110,7 @@ class EquityValidator(BaseValidator):
             return result
 
         # Calculate z-scores for volume
-        volume_series = df[volume_col]
-        z_scores = calculate_z_scores(volume_series)
+        z_scores = self._get_features(df, col_map).volume_z_scores
         threshold = self.config.volume_spike_threshold_sigma
         spikes = int((z_scores > threshold).sum())
 
@@ -173,9 +180,10 @@ class EquityValidator(BaseValidator):
         ]
 
         # Calculate price changes
-        price_changes = df[close_col].pct_change().dropna()
+        features = self._get_features(df, col_map)
+        changes = features.close_returns.to_numpy(dtype=float, na_value=np.nan)
 
-        if len(price_changes) < 1:
+        if np.isnan(changes).all():
             return result
 
         # Pre-calculate volume z-scores once for efficiency
@@ -183,63 +191,55 @@ class EquityValidator(BaseValidator):
         volume_spike_threshold = self.config.volume_spike_threshold_sigma
         if volume_col and len(df[volume_col]) >= 3:
             try:
-                volume_z_scores = calculate_z_scores(df[volume_col])
+                volume_z_scores = features.volume_z_scores.to_numpy(dtype=float)
             except Exception:
                 # If volume z-score calculation fails, continue without volume check
                 volume_z_scores = None
 
-        potential_splits = []
-
-        for date, pct_change in price_changes.items():
-            # Check for downward price drops (forward splits)
-            if pct_change < 0:
-                abs_change = abs(pct_change)
-                for min_ratio, max_ratio, ratio_name in split_ratios[:5]:  # Forward splits only
-                    if min_ratio <= abs_change <= max_ratio:
-                        # Check if there's a volume spike on the same day
-                        volume_z = None
-                        has_volume_spike = False
-
-                        if volume_z_scores is not None and date in volume_z_scores.index:
-                            volume_z = float(volume_z_scores[date])
-                            has_volume_spike = volume_z > volume_spike_threshold
-
-                        # Flag if price drop matches split pattern (with or without volume spike)
-                        # Volume spike strengthens the signal but isn't required
-                        if has_volume_spike or volume_z_scores is None:
-                            potential_splits.append({
-                                'date': str(date),
-                                'price_change_pct': float(pct_change * 100),
-                                'split_ratio': ratio_name,
-                                'volume_z_score': volume_z,
-                                'has_volume_spike': has_volume_spike
-                            })
-                        break
-
-            # Check for upward price jumps (reverse splits)
-            elif pct_change > 0:
-                for min_ratio, max_ratio, ratio_name in split_ratios[5:]:  # Reverse splits only
-                    if min_ratio <= pct_change <= max_ratio:
-                        volume_z = None
-                        has_volume_spike = False
-
-                        if volume_z_scores is not None and date in volume_z_scores.index:
-                            volume_z = float(volume_z_scores[date])
-                            has_volume_spike = volume_z > volume_spike_threshold
-
-                        if has_volume_spike or volume_z_scores is None:
-                            potential_splits.append({
-                                'date': str(date),
-                                'price_change_pct': float(pct_change * 100),
-                                'split_ratio': ratio_name,
-                                'volume_z_score': volume_z,
-                                'has_volume_spike': has_volume_spike
-                            })
-                        break
-
-        if potential_splits:
+        # Only moves at least as large as the smallest split band can match
+        lower = np.array([r[0] for r in split_ratios])
+        upper = np.array([r[1] for r in split_ratios])
+        is_forward = np.arange(len(split_ratios)) < 5
+        with np.errstate(invalid='ignore'):
+            candidates = np.flatnonzero(np.abs(changes) >= lower.min())
+        cand_changes = changes[candidates][:, None]
+
+        # Classify every candidate against the whole table at once: drops against forward
+        # splits, jumps against reverse splits (bands don't overlap, so at most one matches)
+        magnitude = np.abs(cand_changes)
+        in_band = (
+            (lower <= magnitude) & (magnitude <= upper)
+            & np.where(is_forward, cand_changes < 0, cand_changes > 0)
+        )
+        matched = in_band.any(axis=1)
+        candidates = candidates[matched]
+        ratio_idx = in_band[matched].argmax(axis=1)
+
+        # Flag if price move matches split pattern (with or without volume spike)
+        # Volume spike strengthens the signal but isn't required
+        if volume_z_scores is not None:
+            volume_z = volume_z_scores[candidates]
+            flagged = volume_z > volume_spike_threshold
+        else:
+            volume_z = None
+            flagged = np.ones(len(candidates), dtype=bool)
+
+        flagged_pos = np.flatnonzero(flagged)
+        split_count = len(flagged_pos)
+        potential_splits = [
+            {
+                'date': str(df.index[candidates[i]]),
+                'price_change_pct': float(changes[candidates[i]] * 100),
+                'split_ratio': split_ratios[ratio_idx[i]][2],
+                'volume_z_score': float(volume_z[i]) if volume_z is not None else None,
+                'has_volume_spike': bool(flagged[i]) if volume_z is not None else False
+            }
+            for i in flagged_pos[:10]  # Limit to first 10
+        ]
+
+        if split_count:
             msg = (
-                f"Found {len(potential_splits)} potential unadjusted split(s) in {asset_name}. "
+                f"Found {split_count} potential unadjusted split(s) in {asset_name}. "
                 f"Consider using adjusted close data or verifying split adjustments. "
                 f"Sample dates: {', '.join([s['date'] for s in potential_splits[:3]])}"
             )
@@ -247,8 +247,8 @@ class EquityValidator(BaseValidator):
             result.add_check(
                 'potential_splits', False, msg,
                 {
-                    'potential_split_count': len(potential_splits),
-                    'potential_splits': potential_splits[:10]  # Limit to first 10
+                    'potential_split_count': split_count,
+                    'potential_splits': potential_splits
                 },
                 severity=ValidationSeverity.WARNING
             )
@@ -277,7 +277,7 @@ class EquityValidator(BaseValidator):
             )
             return result
 
-        pct_changes = df[close_col].pct_change().abs() * 100
+        pct_changes = self._get_features(df, col_map).close_returns.abs() * 100
         threshold = self.config.price_jump_threshold_pct
         large_jumps = pct_changes[pct_changes > threshold]
 
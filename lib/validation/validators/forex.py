@@ -12,15 +12,21 @@ Validates FOREX data with FOREX-specific rules:
 import logging
 from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 
 from ..base import BaseValidator
 from ..core import ValidationResult, ValidationSeverity, CONTINUOUS_CALENDARS
 from ..column_mapping import ColumnMapping
-from ..utils import safe_divide, ensure_timezone
+from ..features import ValidationFeatures
+from ..utils import safe_divide
 
 logger = logging.getLogger('cockpit.validation.forex')
 
+def _day_str(day: int) -> str:
+    """Format a UTC day number as YYYY-MM-DD."""
+    return str(np.datetime64(int(day), 'D'))
+
 
 class ForexValidator(BaseValidator):
     """
@@ -50,7 +56,8 @@ class ForexValidator(BaseValidator):
         self,
         df: pd.DataFrame,
         col_map: ColumnMapping,
-        asset_name: str = "unknown"
+        asset_name: str = "unknown",
+        features: Optional[ValidationFeatures] = None
     ) -> ValidationResult:
         """
         Validate FOREX-specific characteristics.
@@ -59,6 +66,8 @@ class ForexValidator(BaseValidator):
             df: DataFrame with OHLCV data
             col_map: Column mapping for OHLCV columns
             asset_name: Asset name for logging
+            features: Shared feature context from the calling DataValidator
+                (a fresh one is built if None)
 
         Returns:
             ValidationResult with FOREX-specific check outcomes
@@ -72,9 +81,13 @@ class ForexValidator(BaseValidator):
             return result
 
         # Run registered checks
-        for check_func in self._check_registry:
-            if not self._should_skip_check(check_func.__name__):
-                result = self._run_check(result, check_func, df, col_map, asset_name)
+        self._features = features if features is not None else ValidationFeatures(df, col_map)
+        try:
+            for check_func in self._check_registry:
+                if not self._should_skip_check(check_func.__name__):
+                    result = self._run_check(result, check_func, df, col_map, asset_name)
+        finally:
+            self._features = None
 
         return result
 
@@ -94,12 +107,13 @@ class ForexValidator(BaseValidator):
             return result
 
         # Check for Sunday bars (dayofweek == 6)
-        df_index = ensure_timezone(pd.DatetimeIndex(df.index))
-        sunday_mask = df_index.dayofweek == 6
+        features = self._get_features(df, col_map)
+        df_index = features.utc_index
+        sunday_mask = features.day_of_week == 6
         sunday_count = int(sunday_mask.sum())
 
         if sunday_count > 0:
-            sunday_dates = df_index[sunday_mask].normalize().tolist()
+            sunday_dates = df_index[sunday_mask][:10].normalize()
             msg = (
                 f"Found {sunday_count} Sunday bar(s) in {asset_name}. "
                 f"Consider consolidating to Friday using "
@@ -109,7 +123,7 @@ class ForexValidator(BaseValidator):
                 'sunday_bars', False, msg,
                 {
                     'sunday_count': sunday_count,
-                    'sunday_dates': [str(d.date()) for d in sunday_dates[:10]]  # First 10
+                    'sunday_dates': [str(d.date()) for d in sunday_dates]  # First 10
                 },
                 severity=ValidationSeverity.WARNING
             )
@@ -132,85 +146,89 @@ class ForexValidator(BaseValidator):
         if len(df) < 2:
             return result
 
-        df_index = ensure_timezone(pd.DatetimeIndex(df.index))
         close_col = col_map.close
 
         if not close_col:
             return result
 
-        # Normalize dates to midnight for day-of-week checks
-        df_index_norm = df_index.normalize()
-
-        # Find all Fridays, Sundays, and Mondays
-        fridays = df_index_norm[df_index_norm.dayofweek == 4]  # Friday = 4
-        sundays = df_index_norm[df_index_norm.dayofweek == 6]  # Sunday = 6
-        mondays = df_index_norm[df_index_norm.dayofweek == 0]  # Monday = 0
+        # UTC day number and day-of-week code per bar
+        features = self._get_features(df, col_map)
+        bar_day = features.utc_days
+        bar_dow = features.day_of_week
 
-        issues = []
         details = {
-            'friday_count': len(fridays),
-            'sunday_count': len(sundays),
-            'monday_count': len(mondays)
+            'friday_count': int(np.count_nonzero(bar_dow == 4)),
+            'sunday_count': int(np.count_nonzero(bar_dow == 6)),
+            'monday_count': int(np.count_nonzero(bar_dow == 0))
         }
 
-        # Check for Friday-Sunday pairs (potential duplication)
-        for sunday_date in sundays:
-            friday_date = sunday_date - pd.Timedelta(days=2)
-            if friday_date in fridays:
-                issues.append(
-                    f"Both Friday {friday_date.date()} and Sunday {sunday_date.date()} "
-                    f"bars exist (potential duplication)"
-                )
-
-        # Check for Sunday-Monday pairs (should have weekend gap)
-        for sunday_date in sundays:
-            monday_date = sunday_date + pd.Timedelta(days=1)
-            if monday_date in mondays:
-                sunday_data = df.loc[df_index_norm == sunday_date, close_col]
-                monday_data = df.loc[df_index_norm == monday_date, col_map.open] if col_map.open else pd.Series(dtype=float)
-
-                if len(sunday_data) > 0 and len(monday_data) > 0:
-                    sunday_close = sunday_data.iloc[0]
-                    monday_open = monday_data.iloc[0]
-
-                    if pd.notna(sunday_close) and pd.notna(monday_open):
-                        gap_pct = abs((monday_open - sunday_close) / sunday_close * 100) if sunday_close != 0 else 0
-                        if gap_pct < 0.01:  # Less than 0.01% gap might indicate missing weekend movement
-                            issues.append(
-                                f"Sunday {sunday_date.date()} to Monday {monday_date.date()} "
-                                f"gap is very small ({gap_pct:.4f}%), may indicate missing weekend data"
-                            )
-
-        # Check for Friday-Monday pairs without Sunday (expected for consolidated data)
-        for friday_date in fridays:
-            monday_date = friday_date + pd.Timedelta(days=3)
-            if monday_date in mondays:
-                # Check if Sunday exists between them
-                sunday_date = friday_date + pd.Timedelta(days=2)
-                if sunday_date not in sundays:
-                    # This is expected if Sunday was consolidated into Friday
-                    # Check if gap is reasonable
-                    friday_data = df.loc[df_index_norm == friday_date, close_col]
-                    monday_data = df.loc[df_index_norm == monday_date, col_map.open] if col_map.open else pd.Series(dtype=float)
-
-                    if len(friday_data) > 0 and len(monday_data) > 0:
-                        friday_close = friday_data.iloc[0]
-                        monday_open = monday_data.iloc[0]
-
-                        if pd.notna(friday_close) and pd.notna(monday_open):
-                            gap_pct = abs((monday_open - friday_close) / friday_close * 100) if friday_close != 0 else 0
-                            if gap_pct > 10:  # Large gap might indicate missing data
-                                issues.append(
-                                    f"Large gap ({gap_pct:.2f}%) from Friday {friday_date.date()} "
-                                    f"to Monday {monday_date.date()} (no Sunday bar found)"
-                                )
-
-        if issues:
+        # One row per calendar day; first_pos is the day's first bar in index order
+        days, first_pos, bar_to_day = np.unique(bar_day, return_index=True, return_inverse=True)
+        dow = (days + 3) % 7
+        fridays = days[dow == 4]
+        sundays = days[dow == 6]
+        mondays = days[dow == 0]
+
+        first_close = features.values(close_col)[first_pos]
+        if col_map.open:
+            first_open = features.values(col_map.open)[first_pos]
+        else:
+            first_open = None
+
+        def _gap_pct(day_offset: int) -> np.ndarray:
+            """Percent gap from each day's first close to the first open day_offset days later."""
+            later = np.clip(np.searchsorted(days, days + day_offset), 0, len(days) - 1)
+            next_open = first_open[later]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                gap = np.abs((next_open - first_close) / first_close * 100)
+            gap = np.where(first_close != 0, gap, 0.0)
+            return np.where(np.isnan(first_close) | np.isnan(next_open), np.nan, gap)
+
+        # Friday-Sunday pairs (potential duplication)
+        fri_sun = (dow == 6) & np.isin(days - 2, fridays)
+
+        # Sunday-Monday pairs (should have weekend gap); small gap may mean missing weekend movement
+        sun_mon = (dow == 6) & np.isin(days + 1, mondays)
+        # Friday-Monday pairs without Sunday (expected for consolidated data); large gap may mean missing data
+        fri_mon = (dow == 4) & np.isin(days + 3, mondays) & ~np.isin(days + 2, sundays)
+        if first_open is not None:
+            sun_mon_gap = _gap_pct(1)
+            fri_mon_gap = _gap_pct(3)
+            sun_mon &= sun_mon_gap < 0.01
+            fri_mon &= fri_mon_gap > 10
+        else:
+            sun_mon[:] = False
+            fri_mon[:] = False
+
+        # Issues are reported once per bar on the offending day, in index order
+        issue_kinds = [
+            (fri_sun, lambda i: (
+                f"Both Friday {_day_str(days[i] - 2)} and Sunday {_day_str(days[i])} "
+                f"bars exist (potential duplication)"
+            )),
+            (sun_mon, lambda i: (
+                f"Sunday {_day_str(days[i])} to Monday {_day_str(days[i] + 1)} "
+                f"gap is very small ({sun_mon_gap[i]:.4f}%), may indicate missing weekend data"
+            )),
+            (fri_mon, lambda i: (
+                f"Large gap ({fri_mon_gap[i]:.2f}%) from Friday {_day_str(days[i])} "
+                f"to Monday {_day_str(days[i] + 3)} (no Sunday bar found)"
+            )),
+        ]
+        issue_count = 0
+        issues = []
+        for day_mask, describe in issue_kinds:
+            bar_positions = np.flatnonzero(day_mask[bar_to_day])
+            issue_count += len(bar_positions)
+            for pos in bar_positions[:5 - len(issues)]:
+                issues.append(describe(bar_to_day[pos]))
+
+        if issue_count:
             msg = (
                 f"Weekend gap integrity issues detected in {asset_name}: "
-                f"{len(issues)} issue(s) found"
+                f"{issue_count} issue(s) found"
             )
-            details['issues'] = issues[:5]  # First 5 issues
+            details['issues'] = issues  # First 5 issues
             result.add_check(
                 'weekend_gap_integrity', False, msg,
                 details,
@@ -8,9 +8,9 @@ Handles saving and loading validation reports:
 
 import json
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 from ..core import ValidationResult, ValidationCheck, ValidationSeverity
 
@@ -89,7 +89,7 @@ def load_validation_report(report_path: Union[str, Path]) -> ValidationResult:
             severity=ValidationSeverity(check_data.get('severity', 'error')),
             message=check_data.get('message', ''),
             details=check_data.get('details', {}),
-            timestamp=datetime.fromisoformat(check_data.get('timestamp', datetime.utcnow().isoformat()).replace('Z', '+00:00'))
+            timestamp=_parse_utc(check_data.get('timestamp')) or datetime.utcnow()
         )
         result.checks.append(check)
 
@@ -100,12 +100,27 @@ def load_validation_report(report_path: Union[str, Path]) -> ValidationResult:
     result.metadata = report_data.get('metadata', {})
 
     # Restore start time if available (for duration calculation)
-    validated_at = report_data.get('validated_at')
-    if validated_at:
-        try:
-            result._start_time = datetime.fromisoformat(validated_at.replace('Z', '+00:00'))
-        except (ValueError, AttributeError):
-            # If we can't parse it, use current time (duration will be inaccurate)
-            pass
+    validated_at = _parse_utc(report_data.get('validated_at'))
+    if validated_at is not None:
+        result._start_time = validated_at
 
     return result
+
+
+def _parse_utc(value) -> Optional[datetime]:
+    """
+    Parse an ISO timestamp as naive UTC, like datetime.utcnow().
+
+    ValidationResult compares timestamps with naive utcnow(), so offsets
+    ('Z', '+00:00') written by to_dict() are converted and dropped.
+    Returns None if the value is missing or cannot be parsed.
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the data ingestion and validation pipeline.
+
+Generates synthetic data and times pipeline stages so performance changes
+can be measured on realistic sizes. Each measurement runs in a fresh
+process so peak RSS is attributable to that stage alone; package import
+cost is paid before the timer starts and reported separately as the
+difference between peak RSS and RSS delta.
+
+Usage Examples:
+    # CSV parse engines on a synthetic 10M-row 1m file
+    python scripts/benchmark_data_pipeline.py csv-parse
+
+    # Smaller file, selected engines only
+    python scripts/benchmark_data_pipeline.py csv-parse --rows 1000000 --engines pandas,pyarrow
+
+    # FOREX pre-session filter, against the old per-date loop
+    python scripts/benchmark_data_pipeline.py forex-presession --rows 500000 --with-baseline
+
+    # FOREX weekend-gap validation on 10 years of 1m bars
+    python scripts/benchmark_data_pipeline.py forex-weekend-gaps --years 10
+
+    # Crypto flash-crash detection on a year of 24/7 1m bars
+    python scripts/benchmark_data_pipeline.py crypto-flash-crashes --with-baseline
+
+    # Full DataValidator.validate on 3M 1m bars per asset type
+    python scripts/benchmark_data_pipeline.py validate --rows 3000000
+"""
+
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import click
+import numpy as np
+import pandas as pd
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of the current process in MB (Linux reports KB)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 if sys.platform != 'darwin' else peak / (1024 * 1024)
+
+
+def _warm_imports() -> None:
+    """Import the pipeline packages so their load cost is excluded from timings."""
+    import lib.bundles  # noqa: F401
+    import lib.data  # noqa: F401
+    import lib.validation  # noqa: F401
+
+
+def _child_entry(func: Callable, args: Tuple, queue) -> None:
+    """Run func(*args) in a child process and report elapsed time and peak RSS."""
+    _warm_imports()
+    baseline = _peak_rss_mb()
+    start = time.perf_counter()
+    try:
+        detail = func(*args)
+        error = None
+    except Exception as e:
+        detail, error = None, str(e)
+    elapsed = time.perf_counter() - start
+    queue.put({
+        'seconds': elapsed,
+        'peak_rss_mb': _peak_rss_mb(),
+        'rss_delta_mb': _peak_rss_mb() - baseline,
+        'detail': detail,
+        'error': error,
+    })
+
+
+def run_isolated(func: Callable, *args: Any) -> Dict[str, Any]:
+    """Run a module-level function in a fresh spawned process and measure it."""
+    ctx = multiprocessing.get_context('spawn')
+    queue = ctx.Queue()
+    proc = ctx.Process(target=_child_entry, args=(func, args, queue))
+    proc.start()
+    result = queue.get()
+    proc.join()
+    return result
+
+
+def synthetic_minute_ohlcv(rows: int, start: str = '2015-01-01', seed: int = 42) -> pd.DataFrame:
+    """Random-walk 1m OHLCV bars with a UTC DatetimeIndex."""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(start, periods=rows, freq='1min', tz='UTC', name='Date')
+    close = 1.1 + np.cumsum(rng.normal(0, 1e-4, rows))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0, 5e-5, rows))
+    return pd.DataFrame({
+        'Open': open_,
+        'High': np.maximum(open_, close) + spread,
+        'Low': np.minimum(open_, close) - spread,
+        'Close': close,
+        'Volume': rng.integers(1, 500, rows).astype(float),
+    }, index=index)
+
+
+def write_synthetic_csv(path: Path, rows: int, chunk_rows: int = 1_000_000) -> Path:
+    """Write a synthetic 1m OHLCV CSV in bounded memory."""
+    start = pd.Timestamp('2015-01-01', tz='UTC')
+    written = 0
+    with open(path, 'w', newline='') as f:
+        while written < rows:
+            n = min(chunk_rows, rows - written)
+            chunk = synthetic_minute_ohlcv(n, start=start + pd.Timedelta(minutes=written), seed=written)
+            chunk.to_csv(f, header=(written == 0), float_format='%.6f')
+            written += n
+    return path
+
+
+def _print_results(results: List[Dict[str, Any]]) -> None:
+    """Print benchmark rows as an aligned table."""
+    click.echo(f"\n{'case':<12} {'seconds':>10} {'peak RSS MB':>12} {'RSS delta MB':>13}  detail")
+    for row in results:
+        if row['error']:
+            click.echo(f"{row['case']:<12} {'failed':>10} {'':>12} {'':>13}  {row['error']}")
+        else:
+            click.echo(
+                f"{row['case']:<12} {row['seconds']:>10.2f} {row['peak_rss_mb']:>12.0f} "
+                f"{row['rss_delta_mb']:>13.0f}  {row['detail'] or ''}"
+            )
+
+
+# =============================================================================
+# Benchmarks
+# =============================================================================
+
+def _parse_csv(csv_file: str, engine: str) -> str:
+    """Parse csv_file with the given engine (runs in a child process)."""
+    from lib.bundles.csv.parser import read_ohlcv_csv
+    df = read_ohlcv_csv(Path(csv_file), engine=engine)
+    return f"{len(df):,} rows, {df.memory_usage(index=True).sum() / 1e6:.0f} MB frame"
+
+
+def _forex_calendar():
+    from zipline.utils.calendar_utils import get_calendar
+    from lib.calendars import register_custom_calendars
+    register_custom_calendars(calendars=['FOREX'])
+    return get_calendar('FOREX')
+
+
+def _presession_per_date(df: pd.DataFrame, calendar_obj) -> pd.DataFrame:
+    """The per-date loop filter_forex_presession_bars() used before vectorization (baseline)."""
+    valid_mask = pd.Series(True, index=df.index)
+    for date_ts in df.index.normalize().unique():
+        date_naive = date_ts.tz_convert(None)
+        date_bars = df.index.normalize() == date_ts
+        if date_naive not in calendar_obj.sessions:
+            valid_mask[date_bars] = False
+            continue
+        valid_mask[date_bars & (df.index < calendar_obj.session_open(date_naive))] = False
+    return df[valid_mask]
+
+
+def _filter_presession(rows: int, implementation: str) -> str:
+    """Filter synthetic 1m FOREX bars (runs in a child process)."""
+    from lib.data.filters_forex import filter_forex_presession_bars
+    calendar_obj = _forex_calendar()
+    df = synthetic_minute_ohlcv(rows, start='2016-01-01')
+    if implementation == 'per-date':
+        result = _presession_per_date(df, calendar_obj)
+    else:
+        result = filter_forex_presession_bars(df, calendar_obj)
+    return f"{len(df):,} rows -> {len(result):,}"
+
+
+def _weekend_gap_per_date(df: pd.DataFrame) -> int:
+    """The per-weekend df.loc loop _check_weekend_gap_integrity() used before vectorization (baseline)."""
+    df_index_norm = df.index.normalize()
+    fridays = df_index_norm[df_index_norm.dayofweek == 4]
+    sundays = df_index_norm[df_index_norm.dayofweek == 6]
+    mondays = df_index_norm[df_index_norm.dayofweek == 0]
+    issues = 0
+    for sunday_date in sundays:
+        if sunday_date - pd.Timedelta(days=2) in fridays:
+            issues += 1
+    for sunday_date in sundays:
+        monday_date = sunday_date + pd.Timedelta(days=1)
+        if monday_date in mondays:
+            sunday_close = df.loc[df_index_norm == sunday_date, 'Close'].iloc[0]
+            monday_open = df.loc[df_index_norm == monday_date, 'Open'].iloc[0]
+            issues += abs((monday_open - sunday_close) / sunday_close * 100) < 0.01
+    for friday_date in fridays:
+        monday_date = friday_date + pd.Timedelta(days=3)
+        if monday_date in mondays and friday_date + pd.Timedelta(days=2) not in sundays:
+            friday_close = df.loc[df_index_norm == friday_date, 'Close'].iloc[0]
+            monday_open = df.loc[df_index_norm == monday_date, 'Open'].iloc[0]
+            issues += abs((monday_open - friday_close) / friday_close * 100) > 10
+    return int(issues)
+
+
+def _validate_weekend_gaps(years: int, implementation: str) -> str:
+    """Run the FOREX weekend-gap check on synthetic 24/5 1m bars (runs in a child process)."""
+    from lib.validation import ValidationConfig
+    from lib.validation.column_mapping import build_column_mapping
+    from lib.validation.validators import ForexValidator
+    df = synthetic_minute_ohlcv(years * 365 * 1440, start='2015-01-01')
+    df = df[df.index.dayofweek != 5]
+    if implementation == 'per-date':
+        return f"{len(df):,} rows, {_weekend_gap_per_date(df):,} issues"
+    validator = ForexValidator(ValidationConfig.for_forex('1m'))
+    check = validator._check_weekend_gap_integrity(
+        validator._create_result(), df, build_column_mapping(df), 'SYNTH'
+    ).get_check('weekend_gap_integrity')
+    return f"{len(df):,} rows, {check.message}"
+
+
+def _flash_crashes_per_bar(df: pd.DataFrame) -> int:
+    """The per-bar iloc loop _check_flash_crashes() used before vectorization (baseline)."""
+    count = 0
+    for i in range(len(df) - 3):
+        bar_high = df.iloc[i]['High']
+        bar_low = df.iloc[i]['Low']
+        _ = df.iloc[i]['Close']
+        if bar_high == 0:
+            continue
+        if (bar_high - bar_low) / bar_high > 0.20:
+            max_recovery = df.iloc[i+1:i+4]['High'].max()
+            recovery_pct = (max_recovery - bar_low) / (bar_high - bar_low) if (bar_high - bar_low) > 0 else 0
+            count += recovery_pct > 0.5
+    return int(count)
+
+
+def _detect_flash_crashes(rows: int, implementation: str) -> str:
+    """Run the crypto flash-crash check on synthetic 1m bars with injected wicks (runs in a child process)."""
+    from lib.validation import ValidationConfig
+    from lib.validation.column_mapping import build_column_mapping
+    from lib.validation.validators import CryptoValidator
+    df = synthetic_minute_ohlcv(rows, start='2023-01-01')
+    wicks = np.random.default_rng(0).random(rows) < 0.001
+    df.loc[wicks, 'Low'] = df.loc[wicks, 'Close'] * 0.7
+    if implementation == 'per-bar':
+        return f"{len(df):,} rows, {_flash_crashes_per_bar(df):,} flash crashes"
+    validator = CryptoValidator(ValidationConfig.for_crypto('1m'))
+    check = validator._check_flash_crashes(
+        validator._create_result(), df, build_column_mapping(df), 'SYNTH'
+    ).get_check('flash_crashes')
+    return f"{len(df):,} rows, {check.details.get('flash_crash_count', 0):,} flash crashes"
+
+
+def _validate_frame(rows: int, asset_type: str) -> str:
+    """Run DataValidator.validate on synthetic 1m bars (runs in a child process)."""
+    import warnings
+    from lib.validation import DataValidator, ValidationConfig
+    df = synthetic_minute_ohlcv(rows)
+    config = getattr(ValidationConfig, f'for_{asset_type}')('1m')
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        start = time.perf_counter()
+        result = DataValidator(config=config).validate(df, asset_name='SYNTH', asset_type=asset_type)
+        elapsed = time.perf_counter() - start
+    return f"{len(df):,} rows, {len(result.checks)} checks, validate() {elapsed:.2f}s"
+
+
+@click.group()
+def cli():
+    """Benchmark data pipeline stages on synthetic data."""
+
+
+@cli.command('csv-parse')
+@click.option('--rows', default=10_000_000, show_default=True, help='Rows in the synthetic 1m file')
+@click.option('--engines', default='pandas,pyarrow,chunked', show_default=True,
+              help='Comma-separated CSV engines to compare')
+@click.option('--csv-file', default=None, type=click.Path(exists=True, dir_okay=False),
+              help='Benchmark an existing CSV instead of generating one')
+def csv_parse(rows, engines, csv_file):
+    """Compare parse time and peak RSS of read_ohlcv_csv engines."""
+    with tempfile.TemporaryDirectory() as tmp:
+        if csv_file is None:
+            csv_file = Path(tmp) / 'SYNTH_1m.csv'
+            click.echo(f"Writing synthetic {rows:,}-row 1m file...")
+            write_synthetic_csv(csv_file, rows)
+        size_mb = Path(csv_file).stat().st_size / 1e6
+        click.echo(f"File: {csv_file} ({size_mb:,.0f} MB)")
+
+        results = []
+        for engine in [e.strip() for e in engines.split(',') if e.strip()]:
+            click.echo(f"  Parsing with engine={engine}...")
+            result = run_isolated(_parse_csv, str(csv_file), engine)
+            result['case'] = engine
+            results.append(result)
+
+    _print_results(results)
+
+
+@cli.command('forex-presession')
+@click.option('--rows', default=5_000_000, show_default=True, help='Rows of synthetic 1m FOREX bars')
+@click.option('--with-baseline', is_flag=True,
+              help='Also time the old per-date loop (O(days x rows); use a few hundred thousand rows)')
+def forex_presession(rows, with_baseline):
+    """Time filter_forex_presession_bars on synthetic 1m FOREX data."""
+    cases = ['vectorized'] + (['per-date'] if with_baseline else [])
+    results = []
+    for case in cases:
+        click.echo(f"  Filtering {rows:,} rows ({case})...")
+        result = run_isolated(_filter_presession, rows, case)
+        result['case'] = case
+        results.append(result)
+    _print_results(results)
+
+
+@cli.command('forex-weekend-gaps')
+@click.option('--years', default=10, show_default=True, help='Years of synthetic 1m FOREX bars')
+@click.option('--with-baseline', is_flag=True,
+              help='Also time the old per-weekend df.loc loop (O(weekends x rows); use one or two years)')
+def forex_weekend_gaps(years, with_baseline):
+    """Time ForexValidator's weekend-gap check on synthetic 1m FOREX data."""
+    cases = ['vectorized'] + (['per-date'] if with_baseline else [])
+    results = []
+    for case in cases:
+        click.echo(f"  Checking {years} year(s) of 1m bars ({case})...")
+        result = run_isolated(_validate_weekend_gaps, years, case)
+        result['case'] = case
+        results.append(result)
+    _print_results(results)
+
+
+@cli.command('crypto-flash-crashes')
+@click.option('--rows', default=525_600, show_default=True, help='Rows of synthetic 24/7 1m bars')
+@click.option('--with-baseline', is_flag=True, help='Also time the old per-bar iloc loop')
+def crypto_flash_crashes(rows, with_baseline):
+    """Time CryptoValidator's flash-crash check on synthetic 1m crypto data."""
+    cases = ['vectorized'] + (['per-bar'] if with_baseline else [])
+    results = []
+    for case in cases:
+        click.echo(f"  Scanning {rows:,} rows ({case})...")
+        result = run_isolated(_detect_flash_crashes, rows, case)
+        result['case'] = case
+        results.append(result)
+    _print_results(results)
+
+
+@cli.command('validate')
+@click.option('--rows', default=3_000_000, show_default=True, help='Rows of synthetic 1m bars')
+@click.option('--asset-types', default='equity,forex,crypto', show_default=True,
+              help='Comma-separated asset types to validate as')
+def validate(rows, asset_types):
+    """Time a full DataValidator.validate call per asset type."""
+    results = []
+    for asset_type in [a.strip() for a in asset_types.split(',') if a.strip()]:
+        click.echo(f"  Validating {rows:,} rows as {asset_type}...")
+        result = run_isolated(_validate_frame, rows, asset_type)
+        result['case'] = asset_type
+        results.append(result)
+    _print_results(results)
+
+
+if __name__ == '__main__':
+    cli()
@@ -17,6 +17,13 @@ Usage Examples:
 
     # 1-minute data (7 days available)
     python scripts/ingest_data.py --source yahoo --assets equities --symbols AAPL --timeframe 1m
+
+    # Nightly refresh: append only new bars to the existing bundle
+    python scripts/ingest_data.py --source csv --assets forex --symbols EURUSD -t 1m --incremental
+
+    # Build 5m and 1h bundles from an ingested 1m bundle (no CSV re-read)
+    python scripts/ingest_data.py --source-bundle csv_forex_1m -t 5m
+    python scripts/ingest_data.py --source-bundle csv_forex_1m -t 1h
 """
 
 import sys
@@ -28,6 +35,8 @@ sys.path.insert(0, str(project_root))
 
 import click
 from lib.bundles import ingest_bundle, VALID_TIMEFRAMES, TIMEFRAME_DATA_LIMITS
+from lib.bundles.csv import CSV_ENGINES
+from lib.bundles.derived import DEFAULT_DERIVED_WORKERS
 from lib.logging import configure_logging, get_logger, LogContext
 
 # Configure logging (console=False since we use click.echo for user output)
@@ -71,6 +80,33 @@ def generate_bundle_name(source: str, assets: str, timeframe: str, custom_name:
     return f"{source}_{assets}_{timeframe}"
 
 
+def ingest_derived(source_bundle, timeframe, bundle_name, symbols, start_date, end_date, force, workers):
+    """Build a bundle by aggregating an ingested minute bundle (--source-bundle)."""
+    symbol_list = [s.strip() for s in symbols.split(',')] if symbols else None
+    with LogContext(phase='data_ingestion', bundle_name=source_bundle, timeframe=timeframe):
+        click.echo(f"Aggregating {source_bundle} to {timeframe}...")
+        try:
+            bundle = ingest_bundle(
+                source='derived',
+                assets=[],
+                bundle_name=bundle_name,
+                symbols=symbol_list,
+                start_date=start_date,
+                end_date=end_date,
+                timeframe=timeframe.lower(),
+                force=force,
+                workers=workers,
+                source_bundle=source_bundle
+            )
+        except Exception as e:
+            logger.error(f"Failed to derive {timeframe} bundle from {source_bundle}: {e}", exc_info=True)
+            click.echo(f"✗ Error deriving {timeframe} bundle from {source_bundle}: {e}", err=True)
+            sys.exit(1)
+    click.echo(f"✓ Successfully ingested bundle: {bundle}")
+    click.echo(f"\nNext steps:")
+    click.echo(f"  1. Run backtest: python scripts/run_backtest.py --strategy <name> --bundle {bundle}")
+
+
 @click.command()
 @click.option('--source', default=None, type=click.Choice(['yahoo', 'binance', 'oanda', 'csv']),
               help='Data source name (e.g., yahoo, binance, oanda, local_csv)')
@@ -90,8 +126,20 @@ def generate_bundle_name(source: str, assets: str, timeframe: str, custom_name:
 @click.option('--ingest-daily', is_flag=True, help='Ingest daily data bundle')
 @click.option('--ingest-intraday', is_flag=True, help='Ingest intraday data bundle (uses --timeframe for granularity)')
 @click.option('--force', is_flag=True, help='Force re-ingestion of the bundle, even if already registered')
+@click.option('--workers', '-j', default=None, type=int,
+              help='Worker processes for CSV parsing/validation (default 1), or aggregation threads '
+                   f'with --source-bundle (default {DEFAULT_DERIVED_WORKERS}); 0 = all CPUs')
+@click.option('--csv-engine', default='pandas', show_default=True, type=click.Choice(CSV_ENGINES),
+              help='CSV parse engine (csv source only). pyarrow is fastest; chunked bounds memory on huge files.')
+@click.option('--rebuild-cache', is_flag=True,
+              help='Ignore cached inputs: reprocess CSVs (data/cache/csv/) or refetch Yahoo responses (data/cache/api/)')
+@click.option('--incremental', is_flag=True,
+              help='Append only data newer than the last ingestion, reusing existing bars (csv and yahoo)')
+@click.option('--source-bundle', default=None,
+              help='Aggregate this ingested minute bundle to --timeframe instead of reading a source '
+                   '(--source/--assets not needed; --symbols defaults to the source bundle\'s)')
 @click.option('--list-timeframes', is_flag=True, help='Show available timeframes and their data limits')
-def main(source, assets, symbols, bundle_name, start_date, end_date, calendar, timeframe, force, list_timeframes, ingest_daily, ingest_intraday):
+def main(source, assets, symbols, bundle_name, start_date, end_date, calendar, timeframe, force, workers, csv_engine, rebuild_cache, incremental, source_bundle, list_timeframes, ingest_daily, ingest_intraday):
     """
     Ingest market data into a Zipline bundle.
 
@@ -117,6 +165,10 @@ def main(source, assets, symbols, bundle_name, start_date, end_date, calendar, t
         click.echo(format_timeframe_help())
         return
 
+    if source_bundle:
+        ingest_derived(source_bundle, timeframe, bundle_name, symbols, start_date, end_date, force, workers)
+        return
+
     # Validate required options for ingestion
     if source is None:
         logger.error("Missing required option: --source")
@@ -189,7 +241,11 @@ def main(source, assets, symbols, bundle_name, start_date, end_date, calendar, t
                     end_date=end_date,
                     calendar_name=calendar,
                     timeframe=current_timeframe,
-                    force=force
+                    force=force,
+                    workers=workers,
+                    csv_engine=csv_engine,
+                    rebuild_cache=rebuild_cache,
+                    incremental=incremental
                 )
                 ingested_bundles.append(bundle)
                 logger.info(f"Successfully ingested bundle: {bundle}")
@@ -26,9 +26,18 @@ Usage Examples:
 
     # Force re-ingest (skip confirmation)
     python scripts/reingest_all.py --force
+
+    # Reprocess CSV sources instead of reusing the processed-CSV cache
+    python scripts/reingest_all.py --rebuild-cache
+
+    # Ingest 4 bundles at a time within a 16 GB memory budget
+    python scripts/reingest_all.py --force --jobs 4 --memory-budget 16
 """
 
+import os
 import sys
+from datetime import datetime
+from functools import partial
 from pathlib import Path
 
 # Add project root to path
@@ -41,8 +50,11 @@ from typing import Optional, List, Dict, Any
 from lib.bundles import (
     load_bundle_registry as _load_bundle_registry,
     ingest_bundle,
+    VALID_SOURCES,
     VALID_TIMEFRAMES,
 )
+from lib.bundles.scheduler import STATUS_SUCCESS, plan_jobs, run_jobs, write_run_summary
+from lib.paths import get_logs_dir
 from lib.logging import configure_logging, get_logger, LogContext
 
 # Configure logging (console=False since we use click.echo for user output)
@@ -134,6 +146,7 @@ def reingest_bundle(
     bundle_name: str,
     meta: Dict[str, Any],
     dry_run: bool = False,
+    rebuild_cache: bool = False,
 ) -> bool:
     """
     Re-ingest a single bundle using its registry metadata.
@@ -142,6 +155,7 @@ def reingest_bundle(
         bundle_name: Name of the bundle
         meta: Bundle metadata from registry
         dry_run: If True, only print what would happen
+        rebuild_cache: If True, reprocess CSV sources instead of using the cache
 
     Returns:
         True if successful, False otherwise
@@ -173,17 +187,7 @@ def reingest_bundle(
 
     try:
         click.echo(f"  Re-ingesting: {bundle_name}...")
-        ingest_bundle(
-            source=parsed['source'],
-            assets=[parsed['assets']],
-            bundle_name=bundle_name,
-            symbols=symbols,
-            start_date=start_date,
-            end_date=end_date,
-            calendar_name=calendar_name,
-            timeframe=timeframe,
-            force=True,  # Force re-registration with new parameters
-        )
+        ingest_from_metadata(bundle_name, meta, rebuild_cache=rebuild_cache)
         click.echo(f"  ✓ {bundle_name} - success")
         return True
 
@@ -192,6 +196,69 @@ def reingest_bundle(
         return False
 
 
+def ingest_from_metadata(
+    bundle_name: str,
+    meta: Dict[str, Any],
+    rebuild_cache: bool = False,
+) -> str:
+    """
+    Ingest a bundle with the parameters recorded in its registry metadata.
+
+    Module-level so the scheduler can run it in worker processes.
+
+    Args:
+        bundle_name: Name of the bundle
+        meta: Bundle metadata from registry
+        rebuild_cache: If True, ignore cached CSV/API inputs
+
+    Returns:
+        Bundle name
+
+    Raises:
+        RuntimeError: If ingestion fails
+    """
+    parsed = parse_bundle_name(bundle_name)
+    end_date = meta.get('end_date')
+    if end_date and not _is_valid_date(end_date):
+        end_date = None
+
+    return ingest_bundle(
+        source=parsed['source'],
+        assets=[parsed['assets']],
+        bundle_name=bundle_name,
+        symbols=meta.get('symbols', []),
+        start_date=meta.get('start_date'),
+        end_date=end_date,
+        calendar_name=meta.get('calendar_name'),
+        timeframe=meta.get('timeframe', 'daily'),
+        force=True,  # Force re-registration with new parameters
+        rebuild_cache=rebuild_cache,
+        source_bundle=meta.get('source_bundle'),
+    )
+
+
+def default_memory_budget_gb() -> Optional[float]:
+    """80% of physical memory in GB, or None if it cannot be determined."""
+    try:
+        total = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+    except (AttributeError, ValueError, OSError):
+        return None
+    return round(total * 0.8 / 1e9, 1)
+
+
+def _echo_event(event: str, job, result) -> None:
+    """Print scheduler progress."""
+    if event == 'start':
+        deps = f" after {', '.join(job.depends_on)}" if job.depends_on else ''
+        click.echo(f"  ▶ {job.name} started (~{job.memory_gb:.1f} GB{deps})")
+    elif event == 'finish' and result.status == STATUS_SUCCESS:
+        click.echo(f"  ✓ {job.name} - success ({result.seconds:.1f}s)")
+    elif event == 'finish':
+        click.echo(f"  ✗ {job.name} - failed after {result.seconds:.1f}s: {result.error}", err=True)
+    else:
+        click.echo(f"  - {job.name} - skipped: {result.error}", err=True)
+
+
 def _is_valid_date(date_str: str) -> bool:
     """Check if string is a valid YYYY-MM-DD date."""
     if not date_str or not isinstance(date_str, str):
@@ -214,7 +281,7 @@ def _is_valid_date(date_str: str) -> bool:
               type=click.Choice(['crypto', 'forex', 'equities']),
               help='Only re-ingest bundles with this asset class')
 @click.option('--source', '-s', default=None,
-              type=click.Choice(['yahoo', 'binance', 'oanda']),
+              type=click.Choice(VALID_SOURCES),
               help='Only re-ingest bundles from this source')
 @click.option('--dry-run', is_flag=True,
               help='Show what would be re-ingested without actually doing it')
@@ -222,7 +289,16 @@ def _is_valid_date(date_str: str) -> bool:
               help='Skip confirmation prompt')
 @click.option('--list', 'list_only', is_flag=True,
               help='List all bundles in registry and exit')
-def main(bundles, timeframe, assets, source, dry_run, force, list_only):
+@click.option('--rebuild-cache', is_flag=True,
+              help='Reprocess CSV sources instead of reusing data/cache/csv/')
+@click.option('--jobs', '-j', default=1, type=click.IntRange(min=1), show_default=True,
+              help='Bundles to ingest in parallel (each in its own process)')
+@click.option('--memory-budget', default=None, type=float,
+              help='GB of estimated ingest memory allowed at once [default: 80% of RAM]')
+@click.option('--summary', 'summary_path', default=None, type=click.Path(dir_okay=False),
+              help='Write the per-bundle status/timing summary here [default: logs/reingest_<time>.json]')
+def main(bundles, timeframe, assets, source, dry_run, force, list_only, rebuild_cache,
+         jobs, memory_budget, summary_path):
     """
     Re-ingest all bundles from the registry.
 
@@ -230,6 +306,11 @@ def main(bundles, timeframe, assets, source, dry_run, force, list_only):
     each bundle with its original parameters. Useful for refreshing data or
     applying fixes to existing bundles.
 
+    With --jobs N, up to N independent bundles are ingested at once, within
+    the memory budget (per-bundle `memory_gb` registry hints or estimates).
+    Bundles derived from another bundle (`source_bundle`) wait for it. A
+    failed bundle does not stop the others.
+
     \b
     Examples:
         # Re-ingest all bundles
@@ -241,13 +322,16 @@ def main(bundles, timeframe, assets, source, dry_run, force, list_only):
         # Re-ingest only hourly bundles
         python scripts/reingest_all.py --timeframe 1h
 
+        # Re-ingest everything, 4 bundles at a time
+        python scripts/reingest_all.py --force --jobs 4
+
         # Preview what would be re-ingested
         python scripts/reingest_all.py --dry-run
     """
     # Use LogContext for structured logging
-    with LogContext(phase='reingest_all', timeframe=timeframe, assets=assets, source=source, dry_run=dry_run):
+    with LogContext(phase='reingest_all', asset_type=assets, timeframe=timeframe):
         logger.info(f"Starting batch re-ingestion (filters: timeframe={timeframe}, assets={assets}, source={source})")
-        
+
         # Load registry
         registry = _load_bundle_registry()
 
@@ -272,10 +356,10 @@ def main(bundles, timeframe, assets, source, dry_run, force, list_only):
                 click.echo()
             return
 
-    # Parse bundle names if provided
-    bundle_list = None
-    if bundles:
-        bundle_list = [b.strip() for b in bundles.split(',')]
+        # Parse bundle names if provided
+        bundle_list = None
+        if bundles:
+            bundle_list = [b.strip() for b in bundles.split(',')]
 
         # Filter bundles
         filtered = filter_bundles(
@@ -291,23 +375,28 @@ def main(bundles, timeframe, assets, source, dry_run, force, list_only):
             click.echo("No bundles match the specified filters.")
             return
 
+        try:
+            planned = plan_jobs(filtered)
+        except ValueError as e:
+            raise click.ClickException(str(e))
+
         logger.info(f"Found {len(filtered)} bundle(s) to re-ingest")
         # Show summary
         click.echo(f"\nBundles to re-ingest: {len(filtered)}")
         click.echo("-" * 40)
-        for name in sorted(filtered.keys()):
-            meta = filtered[name]
-            symbols = meta.get('symbols', [])
-            tf = meta.get('timeframe', 'daily')
-            click.echo(f"  {name} ({tf}, {len(symbols)} symbol(s))")
+        for job in planned:
+            symbols = job.meta.get('symbols', [])
+            tf = job.meta.get('timeframe', 'daily')
+            deps = f", after {', '.join(job.depends_on)}" if job.depends_on else ''
+            click.echo(f"  {job.name} ({tf}, {len(symbols)} symbol(s), ~{job.memory_gb:.1f} GB{deps})")
         click.echo("-" * 40)
 
         # Dry run mode
         if dry_run:
             logger.info("Dry run mode: showing what would be re-ingested")
             click.echo("\n[DRY RUN] Would perform the following:\n")
-            for name, meta in sorted(filtered.items()):
-                reingest_bundle(name, meta, dry_run=True)
+            for job in planned:
+                reingest_bundle(job.name, job.meta, dry_run=True)
                 click.echo()
             return
 
@@ -318,28 +407,49 @@ def main(bundles, timeframe, assets, source, dry_run, force, list_only):
                 abort=True
             )
 
+        if memory_budget is None and jobs > 1:
+            memory_budget = default_memory_budget_gb()
+
         # Re-ingest bundles
-        logger.info(f"Starting re-ingestion of {len(filtered)} bundle(s)")
-        click.echo("\nRe-ingesting bundles...\n")
-        success_count = 0
-        fail_count = 0
-
-        for name, meta in sorted(filtered.items()):
-            logger.info(f"Re-ingesting bundle: {name}")
-            if reingest_bundle(name, meta, dry_run=False):
-                logger.info(f"Successfully re-ingested bundle: {name}")
-                success_count += 1
+        logger.info(f"Starting re-ingestion of {len(filtered)} bundle(s) (jobs={jobs}, memory_budget={memory_budget})")
+        budget_info = f", memory budget {memory_budget:.1f} GB" if memory_budget else ''
+        click.echo(f"\nRe-ingesting bundles ({jobs} job(s){budget_info})...\n")
+        started = datetime.now()
+        results = run_jobs(
+            planned,
+            partial(ingest_from_metadata, rebuild_cache=rebuild_cache),
+            max_jobs=jobs,
+            memory_budget_gb=memory_budget,
+            on_event=_echo_event,
+        )
+        wall_seconds = (datetime.now() - started).total_seconds()
+
+        if summary_path is None:
+            summary_path = get_logs_dir() / f"reingest_{started.strftime('%Y%m%d_%H%M%S')}.json"
+        summary_file = write_run_summary(
+            results, summary_path, jobs=planned,
+            max_jobs=jobs, memory_budget_gb=memory_budget, wall_seconds=round(wall_seconds, 3)
+        )
+
+        success_count = sum(1 for r in results if r.status == STATUS_SUCCESS)
+        fail_count = len(results) - success_count
+        for result in results:
+            if result.status == STATUS_SUCCESS:
+                logger.info(f"Successfully re-ingested bundle: {result.name} ({result.seconds:.1f}s)")
             else:
-                logger.error(f"Failed to re-ingest bundle: {name}")
-                fail_count += 1
+                logger.error(f"Failed to re-ingest bundle: {result.name} ({result.status}: {result.error})")
 
         # Summary
         logger.info(f"Re-ingestion complete: {success_count} successful, {fail_count} failed")
         click.echo("\n" + "=" * 40)
-        click.echo(f"Re-ingestion complete:")
+        click.echo(f"Re-ingestion complete in {wall_seconds:.1f}s:")
+        for result in results:
+            mark = '✓' if result.status == STATUS_SUCCESS else '✗'
+            click.echo(f"  {mark} {result.name:<32} {result.status:<8} {result.seconds:>8.1f}s")
         click.echo(f"  ✓ Successful: {success_count}")
         if fail_count:
-            click.echo(f"  ✗ Failed: {fail_count}")
+            click.echo(f"  ✗ Failed/skipped: {fail_count}")
+        click.echo(f"  Summary: {summary_file}")
         click.echo("=" * 40)
 
         if fail_count:
@@ -78,7 +78,11 @@ def parse_param_range(param_str: str) -> tuple[str, list]:
 @click.option('--bundle', default=None, help='Data bundle name')
 @click.option('--asset-class', default=None, type=click.Choice(['crypto', 'forex', 'equities']),
               help='Asset class hint')
-def main(strategy, method, params, start, end, objective, train_pct, n_iter, capital, bundle, asset_class):
+@click.option('--prescreen', type=float, default=None,
+              help='Pre-screen with the vectorized engine and keep this fraction (0-1] '
+                   'or count (> 1) of combinations for Zipline')
+def main(strategy, method, params, start, end, objective, train_pct, n_iter, capital, bundle, asset_class,
+         prescreen):
     """
     Run parameter optimization for a strategy.
     
@@ -98,6 +102,12 @@ def main(strategy, method, params, start, end, objective, train_pct, n_iter, cap
             --param strategy.fast_period:5,10,15,20 \\
             --param strategy.slow_period:30,50,100 \\
             --n-iter 50
+        
+        # Grid search, Zipline only for the best 20% by vectorized screen
+        python scripts/run_optimization.py \\
+            --strategy spy_sma_cross \\
+            --param strategy.lookback_period:10:100:5 \\
+            --prescreen 0.2
     """
     click.echo(f"Running {method} optimization for strategy: {strategy}")
     
@@ -139,7 +149,8 @@ def main(strategy, method, params, start, end, objective, train_pct, n_iter, cap
                 train_pct=train_pct,
                 capital_base=capital,
                 bundle=bundle,
-                asset_class=asset_class
+                asset_class=asset_class,
+                prescreen=prescreen
                 )
             else:  # random
                 logger.info(f"Running random search optimization ({n_iter} iterations)")
@@ -154,7 +165,8 @@ def main(strategy, method, params, start, end, objective, train_pct, n_iter, cap
                 train_pct=train_pct,
                 capital_base=capital,
                     bundle=bundle,
-                    asset_class=asset_class
+                    asset_class=asset_class,
+                    prescreen=prescreen
                 )
             
             logger.info(f"Optimization complete: {len(results_df)} combinations tested")
@@ -13,17 +13,24 @@ Usage:
     python scripts/validate_csv_data.py --timeframe daily --symbol EURUSD
     python scripts/validate_csv_data.py --all
     python scripts/validate_csv_data.py --all --verbose --strict
+    python scripts/validate_csv_data.py --all --jobs 8 --output results.json
+    python scripts/validate_csv_data.py --timeframe 1m --symbol EURUSD --stream
 """
 
 from __future__ import annotations
 
 import argparse
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from itertools import repeat
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 # Add project root to path for imports
@@ -34,6 +41,8 @@ from lib.bundles import (
     parse_csv_filename as _parse_csv_filename,
     VALID_TIMEFRAMES,
 )
+from lib.bundles.csv.ingestion import resolve_worker_count
+from lib.bundles.csv.parser import DEFAULT_CSV_CHUNKSIZE
 from lib.validation import DataValidator, ValidationConfig
 from lib.paths import get_project_root
 from lib.data.normalization import normalize_to_utc
@@ -458,7 +467,8 @@ def validate_date_range_consistency(
     if not isinstance(df.index, pd.DatetimeIndex):
         return
     
-    if df.empty:
+    # Only the index is needed (streaming passes an index-only frame)
+    if len(df.index) == 0:
         return
     
     # Get actual date range from data
@@ -576,12 +586,24 @@ def validate_gap_detection(
     if len(df) < 2:
         return
     
-    # Determine expected frequency based on timeframe
-    timeframe_lower = timeframe.lower()
+    threshold = _gap_threshold(timeframe)
+    
+    # Calculate time differences between consecutive rows
+    sorted_index = df.index.sort_values()
+    time_diffs = sorted_index[1:] - sorted_index[:-1]
+    
+    # Find gaps exceeding the threshold (NaT differences never compare greater)
+    is_gap = time_diffs > threshold
+    _report_gaps(result, sorted_index[1:][is_gap], time_diffs[is_gap], threshold)
+
+
+def _gap_threshold(timeframe: str) -> pd.Timedelta:
+    """
+    Maximum expected spacing between consecutive bars for a timeframe.
     
-    # Map timeframes to expected gaps (in hours)
-    # These are the maximum expected gaps before we consider it a "gap"
-    # For forex, we expect gaps over weekends, so we use business-aware thresholds
+    For forex, we expect gaps over weekends, so daily uses a
+    business-aware threshold. Unknown timeframes default to 4 hours.
+    """
     gap_thresholds = {
         '1m': pd.Timedelta(minutes=5),      # 5 minutes for 1-minute data
         '5m': pd.Timedelta(minutes=15),     # 15 minutes for 5-minute data
@@ -593,18 +615,29 @@ def validate_gap_detection(
         'd': pd.Timedelta(days=4),
         '1d': pd.Timedelta(days=4),
     }
+    return gap_thresholds.get(timeframe.lower(), pd.Timedelta(hours=4))
+
+
+def _report_gaps(
+    result: ValidationResult,
+    gap_ends: pd.DatetimeIndex,
+    gap_durations: pd.TimedeltaIndex,
+    threshold: pd.Timedelta
+) -> None:
+    """
+    Categorize detected gaps and record them on the result.
     
-    # Get threshold, default to 4 hours if unknown timeframe
-    threshold = gap_thresholds.get(timeframe_lower, pd.Timedelta(hours=4))
-    
-    # Calculate time differences between consecutive rows
-    sorted_index = df.index.sort_values()
-    time_diffs = sorted_index.to_series().diff()
-    
-    # Find gaps exceeding the threshold
-    gaps = time_diffs[time_diffs > threshold]
+    A gap starting on a Friday or Saturday is treated as a weekend gap;
+    any other gap is reported as a non-weekend gap.
     
-    if len(gaps) == 0:
+    Args:
+        result: ValidationResult to add issues to
+        gap_ends: Timestamp of the bar that closes each gap
+        gap_durations: Duration of each gap
+        threshold: Gap threshold used for detection
+    """
+    gap_count = len(gap_ends)
+    if gap_count == 0:
         result.stats['gaps'] = {
             'count': 0,
             'threshold': str(threshold),
@@ -612,59 +645,41 @@ def validate_gap_detection(
         }
         return
     
-    # Analyze gaps
-    gap_count = len(gaps)
-    largest_gap = gaps.max()
-    
-    # Categorize gaps
-    weekend_gaps = 0
-    significant_gaps = []
-    
-    for gap_time, gap_duration in gaps.items():
-        # Check if this gap spans a weekend (Friday to Sunday/Monday)
-        if gap_time is not pd.NaT:
-            gap_start = gap_time - gap_duration
-            # If gap starts on Friday or Saturday, it's likely a weekend gap
-            if hasattr(gap_start, 'dayofweek') and gap_start.dayofweek >= 4:  # Friday=4, Saturday=5
-                weekend_gaps += 1
-            else:
-                # Non-weekend gap - more concerning
-                significant_gaps.append({
-                    'start': str(gap_start),
-                    'end': str(gap_time),
-                    'duration': str(gap_duration),
-                })
-    
-    # Store gap statistics
+    largest_gap = gap_durations.max()
+    
+    # Friday=4, Saturday=5: gaps starting then are likely weekend gaps
+    gap_starts = gap_ends - gap_durations
+    is_weekend = np.asarray(gap_starts.dayofweek >= 4)
+    weekend_gaps = int(is_weekend.sum())
+    significant = np.flatnonzero(~is_weekend)
+    
     result.stats['gaps'] = {
         'count': gap_count,
         'threshold': str(threshold),
         'largest_gap': str(largest_gap),
         'weekend_gaps': weekend_gaps,
-        'non_weekend_gaps': len(significant_gaps),
+        'non_weekend_gaps': len(significant),
     }
     
-    # Report findings
-    if gap_count > 0:
-        if len(significant_gaps) > 0:
-            # Non-weekend gaps are more concerning
-            result.add_warning(
-                "Gaps",
-                f"Found {len(significant_gaps)} non-weekend gap(s) exceeding {threshold}. "
-                f"Largest gap: {largest_gap}"
-            )
-            # Add details for first few significant gaps
-            for i, gap in enumerate(significant_gaps[:3]):
-                result.add_info(
-                    "Gaps",
-                    f"Gap {i+1}: {gap['start']} to {gap['end']} ({gap['duration']})"
-                )
-        else:
-            # Only weekend gaps - less concerning for forex
+    if len(significant) > 0:
+        # Non-weekend gaps are more concerning
+        result.add_warning(
+            "Gaps",
+            f"Found {len(significant)} non-weekend gap(s) exceeding {threshold}. "
+            f"Largest gap: {largest_gap}"
+        )
+        # Add details for first few significant gaps
+        for i, pos in enumerate(significant[:3]):
             result.add_info(
                 "Gaps",
-                f"Found {weekend_gaps} weekend gap(s) (expected for forex data)"
+                f"Gap {i+1}: {gap_starts[pos]} to {gap_ends[pos]} ({gap_durations[pos]})"
             )
+    else:
+        # Only weekend gaps - less concerning for forex
+        result.add_info(
+            "Gaps",
+            f"Found {weekend_gaps} weekend gap(s) (expected for forex data)"
+        )
 
 
 def validate_price_anomalies(
@@ -1068,11 +1083,450 @@ def validate_csv_file(
     return result
 
 
+# =============================================================================
+# STREAMING VALIDATION
+# =============================================================================
+
+# Column order used for streaming checks
+OHLCV_ORDER = ('open', 'high', 'low', 'close', 'volume')
+
+
+@dataclass
+class StreamingState:
+    """
+    Running totals and chunk-boundary state for streaming validation.
+    
+    Everything a check needs from earlier chunks is carried here: the last
+    timestamp (continuity, duplicates, sortedness), the last close (returns
+    across the boundary) and mergeable aggregates for the statistics.
+    """
+    rows: int = 0
+    chunks: int = 0
+    column_count: int = 0
+    found_columns: List[str] = field(default_factory=list)
+    non_numeric: Dict[str, int] = field(default_factory=dict)
+    negative: Dict[str, int] = field(default_factory=dict)
+    nan: Dict[str, int] = field(default_factory=dict)
+    invalid_high_low: int = 0
+    invalid_high: int = 0
+    invalid_low: int = 0
+    nat_count: int = 0
+    duplicate_count: int = 0
+    unsorted: bool = False
+    first_ts: Optional[int] = None
+    last_ts: Optional[int] = None
+    min_ts: Optional[int] = None
+    max_ts: Optional[int] = None
+    gap_ends: List[np.ndarray] = field(default_factory=list)
+    gap_durations: List[np.ndarray] = field(default_factory=list)
+    last_close: float = np.nan
+    close_count: int = 0
+    close_min: float = np.inf
+    close_max: float = -np.inf
+    close_sum: float = 0.0
+    zero_prices: int = 0
+    extreme_count: int = 0
+    max_move: float = 0.0
+    extreme_samples: List[Dict] = field(default_factory=list)
+    volume_count: int = 0
+    volume_mean: float = 0.0
+    volume_m2: float = 0.0
+    volume_min: float = np.inf
+    volume_max: float = -np.inf
+    volume_zero: int = 0
+    volume_uniques: set = field(default_factory=set)
+    
+    def update(self, chunk: pd.DataFrame, timestamps: pd.DatetimeIndex, threshold: pd.Timedelta) -> None:
+        """
+        Fold one normalized chunk into the state.
+        
+        Args:
+            chunk: Chunk with normalized OHLCV columns
+            timestamps: Chunk index parsed to UTC (NaT for unparseable values)
+            threshold: Gap threshold for the file's timeframe
+        """
+        self.rows += len(chunk)
+        self.chunks += 1
+        
+        values = {}
+        for col in OHLCV_ORDER:
+            raw = chunk[col]
+            numeric = pd.to_numeric(raw, errors='coerce')
+            missing = raw.isna().to_numpy()
+            coerced = numeric.isna().to_numpy() & ~missing
+            arr = numeric.to_numpy(dtype=float, na_value=np.nan)
+            self.non_numeric[col] = self.non_numeric.get(col, 0) + int(coerced.sum())
+            self.nan[col] = self.nan.get(col, 0) + int(missing.sum())
+            self.negative[col] = self.negative.get(col, 0) + int((arr < 0).sum())
+            values[col] = arr
+        
+        self._update_ohlc(values)
+        self._update_index(timestamps, threshold)
+        self._update_close(values['close'], timestamps)
+        self._update_volume(values['volume'])
+    
+    def _update_ohlc(self, values: Dict[str, np.ndarray]) -> None:
+        """Count OHLC relationship violations (same rules as validate_ohlc_consistency)."""
+        o, h, l, c = (values[col] for col in OHLCV_ORDER[:4])
+        self.invalid_high_low += int((h < l).sum())
+        self.invalid_high += int(((h < o) | (h < c)).sum())
+        self.invalid_low += int(((l > o) | (l > c)).sum())
+    
+    def _update_index(self, timestamps: pd.DatetimeIndex, threshold: pd.Timedelta) -> None:
+        """Track NaT, duplicates, sortedness and gaps, including across the chunk boundary."""
+        is_nat = np.asarray(timestamps.isna())
+        self.nat_count += int(is_nat.sum())
+        ts = timestamps.asi8[~is_nat]
+        if len(ts) == 0:
+            return
+        
+        self.min_ts = int(ts.min()) if self.min_ts is None else min(self.min_ts, int(ts.min()))
+        self.max_ts = int(ts.max()) if self.max_ts is None else max(self.max_ts, int(ts.max()))
+        if self.first_ts is None:
+            self.first_ts = int(ts[0])
+        
+        # Prepend the previous chunk's last timestamp so boundary pairs are checked
+        if self.last_ts is not None:
+            ts = np.concatenate(([self.last_ts], ts))
+        self.last_ts = int(ts[-1])
+        
+        diffs = np.diff(ts)
+        self.duplicate_count += int((diffs == 0).sum())
+        if (diffs < 0).any():
+            self.unsorted = True
+        is_gap = diffs > threshold.value
+        if is_gap.any():
+            self.gap_ends.append(ts[1:][is_gap])
+            self.gap_durations.append(diffs[is_gap])
+    
+    def _update_close(self, close: np.ndarray, timestamps: pd.DatetimeIndex) -> None:
+        """Track zero prices, extreme moves and price range (same rules as validate_price_anomalies)."""
+        valid = ~np.isnan(close)
+        prices = close[valid]
+        if len(prices) == 0:
+            return
+        
+        self.close_count += len(prices)
+        self.close_min = min(self.close_min, float(prices.min()))
+        self.close_max = max(self.close_max, float(prices.max()))
+        self.close_sum += float(prices.sum())
+        self.zero_prices += int((np.abs(prices) < 1e-10).sum())
+        
+        previous = np.concatenate(([self.last_close], prices[:-1]))
+        self.last_close = float(prices[-1])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            moves = prices / previous - 1
+        extreme = np.abs(moves) > 0.10
+        if not extreme.any():
+            return
+        
+        self.extreme_count += int(extreme.sum())
+        self.max_move = max(self.max_move, float(np.abs(moves[extreme]).max()) * 100)
+        if len(self.extreme_samples) < 10:
+            positions = np.flatnonzero(extreme)[:10 - len(self.extreme_samples)]
+            stamps = timestamps[valid]
+            self.extreme_samples.extend(
+                {'timestamp': str(stamps[pos]), 'pct_change': float(moves[pos]) * 100}
+                for pos in positions
+            )
+    
+    def _update_volume(self, volume: np.ndarray) -> None:
+        """Merge chunk volume statistics (Chan et al. parallel variance update)."""
+        volume = volume[~np.isnan(volume)]
+        n = len(volume)
+        if n == 0:
+            return
+        
+        mean = float(volume.mean())
+        m2 = float(((volume - mean) ** 2).sum())
+        total = self.volume_count + n
+        delta = mean - self.volume_mean
+        self.volume_m2 += m2 + delta ** 2 * self.volume_count * n / total
+        self.volume_mean += delta * n / total
+        self.volume_count = total
+        
+        self.volume_min = min(self.volume_min, float(volume.min()))
+        self.volume_max = max(self.volume_max, float(volume.max()))
+        self.volume_zero += int((volume == 0).sum())
+        # Only "1 unique value" and "fewer than 5" are reported, so stop at 5
+        if len(self.volume_uniques) < 5:
+            self.volume_uniques.update(np.unique(volume)[:5].tolist())
+
+
+def _parse_chunk_index(index: pd.Index) -> pd.DatetimeIndex:
+    """Parse a raw chunk index to UTC, with NaT for unparseable values (naive assumed UTC)."""
+    return pd.DatetimeIndex(pd.to_datetime(index, errors='coerce', utc=True))
+
+
+def _report_streaming_state(
+    state: StreamingState,
+    parsed_info: Dict,
+    threshold: pd.Timedelta,
+    result: ValidationResult,
+    strict: bool
+) -> None:
+    """Turn the accumulated streaming state into issues and stats on the result."""
+    def warn(category: str, message: str) -> None:
+        if strict:
+            result.add_error(category, message)
+        else:
+            result.add_warning(category, message)
+    
+    # Data types (mirrors validate_data_types)
+    for col in OHLCV_ORDER:
+        if state.non_numeric[col]:
+            result.add_error("DataType", f"Column '{col}' contains {state.non_numeric[col]} non-numeric value(s)")
+            continue
+        if state.negative[col]:
+            result.add_error("DataType", f"Column '{col}' contains {state.negative[col]} negative value(s)")
+        nan_count = state.nan[col]
+        if col != 'volume' and nan_count > 0:
+            pct = (nan_count / state.rows) * 100
+            message = f"Column '{col}' has {nan_count} ({pct:.1f}%) NaN values"
+            if pct > 5:
+                result.add_error("DataType", message)
+            else:
+                warn("DataType", message)
+    if state.volume_count and not state.non_numeric['volume']:
+        pct = (state.volume_zero / state.volume_count) * 100
+        if pct > 50:
+            warn("DataType", f"Column 'volume' has {state.volume_zero} ({pct:.1f}%) zero values")
+    
+    # OHLC consistency (mirrors validate_ohlc_consistency)
+    if state.invalid_high_low:
+        result.add_error("OHLC", f"Found {state.invalid_high_low} row(s) where high < low")
+    if state.invalid_high:
+        result.add_error("OHLC", f"Found {state.invalid_high} row(s) where high < open or high < close")
+    if state.invalid_low:
+        result.add_error("OHLC", f"Found {state.invalid_low} row(s) where low > open or low > close")
+    
+    # Index integrity (mirrors validate_index_integrity)
+    if state.duplicate_count:
+        result.add_error("Index", f"Found {state.duplicate_count} duplicate timestamp(s) in index")
+    if state.unsorted:
+        warn("Index", "Index is not sorted in ascending order")
+    if state.nat_count:
+        result.add_error("Index", f"Found {state.nat_count} NaT (Not a Time) value(s) in index")
+    
+    if state.min_ts is None:
+        return
+    
+    span = pd.DatetimeIndex([state.min_ts, state.max_ts]).tz_localize('UTC')
+    validate_date_range_consistency(pd.DataFrame(index=span), parsed_info, result)
+    
+    if state.gap_ends:
+        gap_ends = pd.DatetimeIndex(np.concatenate(state.gap_ends)).tz_localize('UTC')
+        gap_durations = pd.TimedeltaIndex(np.concatenate(state.gap_durations))
+    else:
+        gap_ends = pd.DatetimeIndex([], tz='UTC')
+        gap_durations = pd.TimedeltaIndex([])
+    _report_gaps(result, gap_ends, gap_durations, threshold)
+    
+    # Price anomalies (mirrors validate_price_anomalies, without the IQR pass)
+    if state.zero_prices:
+        result.add_error("PriceAnomaly", f"Found {state.zero_prices} zero or near-zero price(s)")
+    if state.extreme_count:
+        if state.max_move > 50:
+            result.add_error(
+                "PriceAnomaly",
+                f"Found {state.extreme_count} extreme price move(s). "
+                f"Maximum: {state.max_move:.1f}% (likely data error)"
+            )
+        elif state.extreme_count > 10:
+            result.add_warning(
+                "PriceAnomaly",
+                f"Found {state.extreme_count} price moves > 10%. Maximum: {state.max_move:.1f}%"
+            )
+        else:
+            result.add_info(
+                "PriceAnomaly",
+                f"Found {state.extreme_count} price move(s) > 10%. Maximum: {state.max_move:.1f}%"
+            )
+    result.stats['price_anomalies'] = {
+        'extreme_moves': state.extreme_samples,
+        'zero_prices': state.zero_prices,
+        'potential_outliers': [],
+    }
+    
+    # Volume patterns (mirrors validate_volume_patterns, without z-score spikes)
+    if state.volume_count >= 2:
+        unique_volumes = len(state.volume_uniques)
+        if unique_volumes == 1:
+            result.add_warning(
+                "VolumePattern",
+                f"Volume is constant ({state.volume_min}) across all {state.volume_count} rows. "
+                "This may indicate synthetic or placeholder data."
+            )
+        elif unique_volumes < 5 and state.volume_count > 100:
+            result.add_info(
+                "VolumePattern",
+                f"Volume has only {unique_volumes} unique values across {state.volume_count} rows"
+            )
+        zero_pct = (state.volume_zero / state.volume_count) * 100
+        if zero_pct > 50:
+            result.add_warning(
+                "VolumePattern",
+                f"{zero_pct:.1f}% of volume values are zero. "
+                "This may indicate missing data or forex tick data."
+            )
+        elif zero_pct > 10:
+            result.add_info("VolumePattern", f"{zero_pct:.1f}% of volume values are zero")
+        result.stats['volume_patterns'] = {
+            'min': state.volume_min,
+            'max': state.volume_max,
+            'mean': state.volume_mean,
+            'std': float(np.sqrt(state.volume_m2 / (state.volume_count - 1))),
+            'zero_count': state.volume_zero,
+            'constant': unique_volumes == 1,
+        }
+    
+    result.add_info(
+        "Streaming",
+        "Whole-file checks skipped in streaming mode: IQR outliers, volume spikes, DataValidator"
+    )
+    
+    start, end = span
+    result.stats['date_range'] = {
+        'start': str(start),
+        'end': str(end),
+        'span_days': (end - start).days
+    }
+    result.stats['timezone'] = 'UTC'
+    if state.close_count:
+        result.stats['price_range'] = {
+            'min': state.close_min,
+            'max': state.close_max,
+            'mean': state.close_sum / state.close_count
+        }
+
+
+def validate_csv_file_streaming(
+    filepath: Path,
+    chunksize: int = DEFAULT_CSV_CHUNKSIZE,
+    verbose: bool = False,
+    strict: bool = False
+) -> ValidationResult:
+    """
+    Validate a single CSV file in bounded memory, one chunk at a time.
+    
+    Runs the row-level checks of validate_csv_file() (data types, OHLC
+    consistency, timezone, index integrity, date range, gaps, zero prices,
+    extreme moves, volume patterns) on `chunksize` rows at a time. Boundary
+    state is carried between chunks, so duplicates, ordering, gaps and
+    returns spanning two chunks are still detected.
+    
+    Checks that need the whole file at once (IQR outliers, volume z-score
+    spikes, DataValidator) are skipped and noted as info. Duplicates are
+    detected between consecutive rows, which is exact for sorted files;
+    unsorted files are reported as such.
+    
+    Args:
+        filepath: Path to the CSV file
+        chunksize: Rows per chunk
+        verbose: Whether to print detailed output
+        strict: If True, treat warnings as errors
+        
+    Returns:
+        ValidationResult with all findings
+    """
+    result = ValidationResult(filepath=filepath, is_valid=True)
+    
+    filename_valid, filename_error, parsed_info = validate_filename(filepath.name)
+    if not filename_valid:
+        result.add_error("Filename", filename_error)
+        return result
+    
+    result.parsed_info = parsed_info
+    threshold = _gap_threshold(parsed_info.get('timeframe', '1h'))
+    state = StreamingState()
+    
+    try:
+        df_preview = pd.read_csv(filepath, nrows=5)
+        date_col = _identify_date_column(df_preview)
+        reader = pd.read_csv(filepath, index_col=date_col or 0, chunksize=chunksize)
+        
+        for chunk in reader:
+            if state.chunks == 0:
+                state.column_count = len(chunk.columns)
+                columns_valid, columns_error, found_columns = validate_columns(chunk)
+                if not columns_valid:
+                    result.add_error("Columns", columns_error)
+                    return result
+                state.found_columns = found_columns
+                
+                # Timezone status is a property of the file's format, so one chunk decides it
+                try:
+                    probe = pd.DataFrame(index=pd.to_datetime(chunk.index[:5]))
+                    _, _, tz_warnings = validate_timezone(probe)
+                except Exception:
+                    tz_warnings = []
+                for warning in tz_warnings:
+                    if strict:
+                        result.add_error("Timezone", warning)
+                    else:
+                        result.add_warning("Timezone", warning)
+            
+            chunk = _normalize_csv_columns(chunk)
+            state.update(chunk, _parse_chunk_index(chunk.index), threshold)
+            
+            if verbose:
+                print(f"  chunk {state.chunks}: {state.rows:,} rows")
+    
+    except pd.errors.EmptyDataError:
+        result.add_error("File", "CSV file is empty or contains no data")
+        return result
+    except pd.errors.ParserError as e:
+        result.add_error("File", f"CSV parsing error: {str(e)[:100]}")
+        return result
+    except Exception as e:
+        result.add_error("File", f"Failed to read CSV: {str(e)[:100]}")
+        return result
+    
+    if state.rows == 0:
+        result.add_error("File", "CSV file contains no data rows")
+        return result
+    
+    result.stats['row_count'] = state.rows
+    result.stats['column_count'] = state.column_count
+    result.stats['columns'] = state.found_columns
+    result.stats['chunks'] = state.chunks
+    
+    _report_streaming_state(state, parsed_info, threshold, result, strict)
+    return result
+
+
+def _validate_file_task(
+    csv_file: Path,
+    config: ValidationConfig,
+    strict: bool,
+    stream: bool,
+    chunksize: int,
+    validator: Optional[DataValidator] = None
+) -> ValidationResult:
+    """
+    Validate one file and record how long it took.
+    
+    Module-level so it can be submitted to a process pool; workers build
+    their own DataValidator from the (picklable) config.
+    """
+    started = time.perf_counter()
+    if stream:
+        result = validate_csv_file_streaming(csv_file, chunksize=chunksize, strict=strict)
+    else:
+        result = validate_csv_file(csv_file, validator or DataValidator(config=config), strict=strict)
+    result.stats['validation_seconds'] = round(time.perf_counter() - started, 3)
+    return result
+
+
 def validate_timeframe_directory(
     timeframe: str,
     symbol_filter: Optional[str] = None,
     verbose: bool = False,
-    strict: bool = False
+    strict: bool = False,
+    use_cache: bool = True,
+    jobs: int = 1,
+    stream: bool = False,
+    chunksize: int = DEFAULT_CSV_CHUNKSIZE
 ) -> List[ValidationResult]:
     """
     Validate all CSV files in a timeframe directory.
@@ -1082,9 +1536,13 @@ def validate_timeframe_directory(
         symbol_filter: Optional symbol to filter by
         verbose: Whether to print detailed output
         strict: If True, treat warnings as errors
+        use_cache: Reuse DataValidator results cached for unchanged files
+        jobs: Worker processes validating files in parallel (0 = all CPUs)
+        stream: Validate each file in bounded memory, chunk by chunk
+        chunksize: Rows per chunk in streaming mode
         
     Returns:
-        List of ValidationResult objects
+        List of ValidationResult objects, in filename order
     """
     data_path = get_project_root() / 'data' / 'processed' / timeframe
     
@@ -1109,25 +1567,38 @@ def validate_timeframe_directory(
     
     logger.info(f"Found {len(csv_files)} CSV file(s) in {data_path}")
     
-    # Initialize validator once for all files (with timeframe if available)
-    config = ValidationConfig(timeframe=timeframe) if timeframe else None
-    validator = DataValidator(config=config)
-    
-    results = []
-    for csv_file in csv_files:
-        if verbose:
-            print(f"\nValidating: {csv_file.name}")
-        
-        result = validate_csv_file(csv_file, validator, verbose, strict)
-        results.append(result)
+    config = ValidationConfig(timeframe=timeframe, cache_results=use_cache)
+    n_workers = resolve_worker_count(jobs, len(csv_files))
+    
+    with ExitStack() as stack:
+        if n_workers > 1:
+            logger.info(f"Validating with {n_workers} worker processes")
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=n_workers))
+            # map() yields in submission order, so output stays sorted by filename
+            result_iter = executor.map(
+                _validate_file_task, csv_files,
+                repeat(config), repeat(strict), repeat(stream), repeat(chunksize)
+            )
+        else:
+            # Initialize validator once for all files
+            validator = DataValidator(config=config)
+            result_iter = (
+                _validate_file_task(csv_file, config, strict, stream, chunksize, validator)
+                for csv_file in csv_files
+            )
         
-        if verbose:
-            status = "✓ Valid" if result.is_valid else "✗ Invalid"
-            row_count = result.stats.get('row_count', 0)
-            print(f"  {status} ({row_count:,} rows)")
+        results = []
+        for csv_file, result in zip(csv_files, result_iter):
+            results.append(result)
             
-            for issue in result.issues:
-                print(f"    {issue}")
+            if verbose:
+                status = "✓ Valid" if result.is_valid else "✗ Invalid"
+                row_count = result.stats.get('row_count', 0)
+                print(f"\nValidated: {csv_file.name}")
+                print(f"  {status} ({row_count:,} rows)")
+                
+                for issue in result.issues:
+                    print(f"    {issue}")
     
     return results
 
@@ -1177,7 +1648,8 @@ def print_summary(results: List[ValidationResult], timeframe: str) -> None:
 
 def export_results_json(
     results: Dict[str, List[ValidationResult]],
-    output_path: Path
+    output_path: Path,
+    run_info: Optional[Dict] = None
 ) -> None:
     """
     Export validation results to a JSON file for programmatic consumption.
@@ -1185,12 +1657,14 @@ def export_results_json(
     Args:
         results: Dictionary mapping timeframe to list of ValidationResults
         output_path: Path to write the JSON file
+        run_info: Optional run settings (mode, jobs, chunksize, elapsed time)
     """
     import json
     from datetime import datetime
     
     export_data = {
         'generated_at': datetime.utcnow().isoformat() + 'Z',
+        'run': run_info or {},
         'summary': {
             'total_files': 0,
             'valid_files': 0,
@@ -1269,6 +1743,9 @@ Examples:
     python scripts/validate_csv_data.py --all --verbose
     python scripts/validate_csv_data.py --all --strict  # Treat warnings as errors
     python scripts/validate_csv_data.py --all --output results.json
+    python scripts/validate_csv_data.py --all --no-cache  # Re-run DataValidator on every file
+    python scripts/validate_csv_data.py --all --jobs 8    # Validate files in 8 processes
+    python scripts/validate_csv_data.py --timeframe 1m --stream --chunk-size 500000
 
 Exit Codes:
     0 - All files valid
@@ -1313,6 +1790,32 @@ Exit Codes:
         help='Export results to JSON file'
     )
     
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore cached DataValidator results (data/cache/validation/)'
+    )
+    
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Worker processes validating files in parallel (0 = all CPUs, default: 1)'
+    )
+    
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Validate each file chunk by chunk in bounded memory (skips whole-file checks)'
+    )
+    
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=DEFAULT_CSV_CHUNKSIZE,
+        help=f'Rows per chunk with --stream (default: {DEFAULT_CSV_CHUNKSIZE:,})'
+    )
+    
     args = parser.parse_args()
     
     # Validate arguments
@@ -1324,6 +1827,10 @@ Exit Codes:
         parser.error("Cannot specify both --timeframe and --all")
         return EXIT_CONFIGURATION_ERROR
     
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be positive")
+        return EXIT_CONFIGURATION_ERROR
+    
     # Use LogContext for structured logging
     timeframe_context = args.timeframe or 'all'
     with LogContext(phase='csv_validation', timeframe=timeframe_context, symbol=args.symbol, strict=args.strict):
@@ -1349,6 +1856,7 @@ Exit Codes:
             timeframes = [args.timeframe]
         
         # Run validation
+        started = time.perf_counter()
         all_results: Dict[str, List[ValidationResult]] = {}
         total_valid = 0
         total_invalid = 0
@@ -1362,7 +1870,11 @@ Exit Codes:
                 timeframe,
                 symbol_filter=args.symbol,
                 verbose=args.verbose,
-                strict=args.strict
+                strict=args.strict,
+                use_cache=not args.no_cache,
+                jobs=args.jobs,
+                stream=args.stream,
+                chunksize=args.chunk_size
             )
             
             all_results[timeframe] = results
@@ -1397,7 +1909,14 @@ Exit Codes:
         if args.output:
             output_path = Path(args.output)
             logger.info(f"Exporting results to: {output_path}")
-            export_results_json(all_results, output_path)
+            run_info = {
+                'mode': 'stream' if args.stream else 'full',
+                'jobs': args.jobs,
+                'chunksize': args.chunk_size if args.stream else None,
+                'strict': args.strict,
+                'elapsed_seconds': round(time.perf_counter() - started, 3),
+            }
+            export_results_json(all_results, output_path, run_info)
             print(f"\nResults exported to: {output_path}")
         
         # Return appropriate exit code
@@ -69,6 +69,9 @@ from lib.paths import get_project_root
 from lib.config import load_strategy_params, get_warmup_days, validate_strategy_params
 from lib.position_sizing import compute_position_size
 from lib.risk_management import check_exit_conditions, get_exit_type_code
+from lib.history_buffer import register_history, update_history, history_window
+from lib.session_cache import enable_session_cache, get_session_cache
+from lib.indicators import SMA
 from lib.pipeline_utils import setup_pipeline
 
 # =============================================================================
@@ -80,6 +83,10 @@ from lib.pipeline_utils import setup_pipeline
 # - lib.position_sizing: Position sizing algorithms
 # - lib.risk_management: Risk management utilities
 # - lib.pipeline_utils: Pipeline API setup helpers
+# - lib.history_buffer: Rolling price windows fed from handle_data
+# - lib.session_cache: Opt-in per-session memoization of sizing inputs
+# - lib.indicators: Streaming indicators (SMA, EMA, RSI, ATR, ...)
+# - lib.backtest.vectorized: Vectorized pre-screening (see vectorized_signals)
 #
 # For data operations, use:
 # - lib.bundles: Bundle ingestion and management (ingest_bundle, load_bundle)
@@ -237,6 +244,25 @@ def initialize(context):
     
     context.asset = symbol(asset_symbol)
     
+    # Keep rolling daily price windows instead of calling data.history() on
+    # every rebalance. The buffer is fed one bar at a time from handle_data,
+    # so it only mirrors '1d' history in daily backtests.
+    if context.data_frequency == 'daily':
+        strategy_config = params.get('strategy', {})
+        pos_config = params.get('position_sizing', {})
+        history_length = strategy_config.get('lookback_period', 30)
+        if pos_config.get('method') == 'volatility_scaled':
+            history_length = max(history_length, pos_config.get('volatility_lookback', 20) + 1)
+        register_history(context, [context.asset], ['price'], history_length, frequency='1d')
+        # Streaming SMA updated once per bar in handle_data (O(1) per bar)
+        context.price_sma = SMA(strategy_config.get('lookback_period', 30))
+    else:
+        context.price_sma = None
+
+    # Opt-in: memoize history-derived sizing inputs once per session
+    if params.get('position_sizing', {}).get('cache_per_session', False):
+        enable_session_cache(context)
+    
     # Initialize strategy state
     context.in_position = False
     context.entry_price = 0.0
@@ -439,8 +465,8 @@ def compute_signals(context, data):
     #
     # Pattern 2: Direct price/indicator strategy (if use_pipeline: false)
     #   current_price = data.current(context.asset, 'price')
-    #   prices = data.history(context.asset, 'price', lookback_period, '1d')
-    #   sma = prices.mean()
+    #   sma = context.price_sma.value  # lib.indicators.SMA updated in handle_data
+    #   (or: SMA.compute(data.history(context.asset, 'price', lookback_period, '1d'), period=lookback_period)[-1])
     #   # Generate signal based on price vs SMA
     #
     # Pattern 3: Multi-asset strategy
@@ -462,9 +488,13 @@ def compute_signals(context, data):
     threshold_pct = context.params.get('strategy', {}).get('signal_threshold_pct', 0.02)
     
     try:
-        prices = data.history(context.asset, 'price', lookback, '1d')
-        if len(prices) >= lookback:
-            sma = prices.mean()
+        if context.price_sma is not None:
+            sma = context.price_sma.value
+        else:
+            prices = history_window(context, data, context.asset, 'price', lookback, '1d')
+            sma = SMA.compute(prices, period=lookback)[-1] if len(prices) >= lookback else np.nan
+        if not np.isnan(sma):
+            sma = float(sma)
             if current_price > sma * (1 + threshold_pct):
                 signal = 1
             elif current_price < sma * (1 - threshold_pct):
@@ -483,6 +513,36 @@ def compute_signals(context, data):
     return signal, additional_data
 
 
+def vectorized_signals(ohlcv, params):
+    """
+    Compute the signals of compute_signals() for every bar at once.
+
+    Optional: used by lib.backtest.vectorized to screen parameter sets
+    (e.g. grid_search(..., prescreen=0.2)) without running Zipline. Keep
+    it in sync with compute_signals() - the parity harness
+    (lib.backtest.vectorized.compare_with_zipline) measures how far the
+    two drift apart. Delete it if your strategy cannot be vectorized.
+
+    Args:
+        ohlcv: DataFrame of daily bars ('open', 'high', 'low', 'close', 'volume')
+        params: Strategy parameters
+
+    Returns:
+        Array of target positions per bar: 1 long, 0 flat, NaN keep the
+        current position (compute_signals() returned 0)
+    """
+    lookback = params.get('strategy', {}).get('lookback_period', 30)
+    threshold_pct = params.get('strategy', {}).get('signal_threshold_pct', 0.02)
+
+    close = ohlcv['close'].to_numpy(dtype=float)
+    sma = SMA.compute(close, period=lookback)
+
+    target = np.full(len(close), np.nan)
+    target[close > sma * (1 + threshold_pct)] = 1.0
+    target[close < sma * (1 - threshold_pct)] = 0.0
+    return target
+
+
 def rebalance(context, data):
     """
     Main rebalancing function called on schedule.
@@ -581,7 +641,17 @@ def handle_data(context, data):
     Use this for intra-bar logic or recording. For most strategies,
     schedule_function in initialize() is preferred.
     """
-    pass
+    # Append this bar to the rolling history windows registered in initialize()
+    update_history(context, data)
+
+    # Fold this bar into the streaming SMA; seed it from history on the first bar
+    if context.price_sma is not None:
+        if context.price_sma.count == 0:
+            context.price_sma.warm_up(
+                history_window(context, data, context.asset, 'price', context.price_sma.period, '1d')
+            )
+        else:
+            context.price_sma.update(data.current(context.asset, 'price'))
 
 
 def analyze(context, perf):
@@ -686,5 +756,12 @@ def analyze(context, perf):
     print(f"Max Drawdown: {max_dd:.2%}")
     print("-" * 60)
     print(f"Config: risk_free_rate={risk_free_rate:.2%}, trading_days={trading_days}")
+    session_cache = get_session_cache(context)
+    if session_cache is not None:
+        cache_stats = session_cache.stats()
+        print(
+            f"Session cache: {cache_stats['hits']} hits, "
+            f"{cache_stats['history_calls_saved']} data.history() calls saved"
+        )
     print("=" * 60)
 
@@ -24,8 +24,7 @@ from zipline.api import (
     get_open_orders, cancel_order,
 )
 from zipline.finance import commission, slippage
-from datetime import time, datetime, timedelta
-import pytz
+from datetime import time, datetime
 from typing import Tuple, Optional
 import logging
 
@@ -71,6 +70,8 @@ _project_root = _find_project_root()
 if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
+from lib.session_levels import register_session_levels, session_level
+
 try:
     from lib.config import load_strategy_params
     _has_lib_config = True
@@ -119,62 +120,17 @@ def load_params():
         return yaml.safe_load(f)
 
 
-def _get_previous_trading_day(current_time: datetime) -> datetime:
-    """
-    Determine the previous trading day, accounting for weekends.
-    Forex markets are 24/5.
+def _get_previous_day_levels(context, data) -> Tuple[Optional[float], Optional[float]]:
     """
-    previous_day = current_time.date() - timedelta(days=1)
-    # If it's Sunday (0) or Saturday (6), go back to Friday (4)
-    while previous_day.weekday() > 4:  # 5 = Saturday, 6 = Sunday
-        previous_day -= timedelta(days=1)
-    return datetime.combine(previous_day, time(0, 0), tzinfo=pytz.utc)
+    Previous session's high and low, computed once per session.
 
-def _get_safe_historical_data(data, start_date: datetime, end_date: datetime, asset, bar_count: int) -> pd.DataFrame:
-    """
-    Safely retrieve historical data, handling potential data gaps or insufficient data.
+    CRITICAL: Ensures NO look-ahead bias - only completed sessions are used.
     """
-    try:
-        hist_data = data.history(asset, ['open', 'high', 'low', 'close', 'volume'], bar_count, '1m')
-        # Ensure that the data returned is only up to the end_date to prevent look-ahead bias
-        hist_data = hist_data[hist_data.index < end_date]
-        return hist_data
-    except Exception as e:
-        logger.error(f"Error fetching historical data for {asset.symbol}: {e}")
-        return pd.DataFrame() # Return empty DataFrame on error
-
-def _calculate_previous_day_levels(context, data) -> Tuple[Optional[float], Optional[float]]:
-    """
-    CRITICAL: Ensures NO look-ahead bias - only uses data available BEFORE current_time.
-    """
-    current_time = data.current_dt
-    asset = context.asset
-    
-    # We need to look back at least 2 trading days to calculate previous day levels reliably
-    # The `bar_count` below is an estimate, assuming '1m' frequency and a 24-hour trading day
-    # A safer approach is to request enough bars and then filter by date
-    # Let's request enough bars for 2 full days to be safe (24 hours * 60 minutes = 1440 minutes/day)
-    # Adding a buffer, say 3000 minutes.
-    bar_count_estimate = 3000 
-
-    # Fetch data up to current_time, then filter for previous trading day
-    hist_data = _get_safe_historical_data(data, current_time - timedelta(days=2), current_time, asset, bar_count_estimate)
-    
-    if hist_data.empty:
-        return None, None
-        
-    previous_trading_day_end = _get_previous_trading_day(current_time)
-    
-    # Filter data for the actual previous trading day
-    prev_day_data = hist_data[hist_data.index < previous_trading_day_end]
-    
-    if prev_day_data.empty:
+    prev_high = session_level(context, data, context.asset, 'prev_high')
+    prev_low = session_level(context, data, context.asset, 'prev_low')
+    if np.isnan(prev_high) or np.isnan(prev_low):
         return None, None
-
-    prev_day_high = prev_day_data['high'].max()
-    prev_day_low = prev_day_data['low'].min()
-    
-    return prev_day_high, prev_day_low
+    return prev_high, prev_low
 
 def _calculate_required_warmup(params: dict) -> int:
     """
@@ -260,41 +216,6 @@ def _should_trade_current_session(params: dict, current_session: str) -> bool:
 
     return True
 
-def _calculate_atr(data, asset, atr_period: int) -> Optional[float]:
-    """
-    Calculate Average True Range (ATR).
-    """
-    if not data.can_trade(asset):
-        return None
-
-    # Need atr_period + 1 bars for initial TR calculation and then SMA
-    # Fetching 'close', 'high', 'low' for ATR calculation
-    hist_data = data.history(asset, ['high', 'low', 'close'], atr_period + 1, '1d')
-
-    if len(hist_data) < atr_period + 1:
-        return None
-
-    highs = hist_data['high']
-    lows = hist_data['low']
-    closes = hist_data['close']
-
-    # Calculate True Range (TR)
-    tr_values = []
-    for i in range(1, len(hist_data)):
-        tr = max(
-            highs.iloc[i] - lows.iloc[i],
-            abs(highs.iloc[i] - closes.iloc[i-1]),
-            abs(lows.iloc[i] - closes.iloc[i-1])
-        )
-        tr_values.append(tr)
-
-    if not tr_values:
-        return None
-
-    # ATR is the simple moving average of True Ranges
-    atr = pd.Series(tr_values).mean() # Using .mean() for SMA over tr_values
-    return float(atr)
-
 def _detect_range_bound_market(context, data, prev_high: float, prev_low: float) -> bool:
     """
     PHASE 11 CRITICAL ENHANCEMENT: Detect consolidation to avoid whipsaw trades.
@@ -306,11 +227,11 @@ def _detect_range_bound_market(context, data, prev_high: float, prev_low: float)
     if not enable_range_detection:
         return False
 
-    atr_period = strategy_params.get('atr_period', 14)
     range_detection_threshold = strategy_params.get('range_detection_threshold', 1.5)
 
-    atr_value = _calculate_atr(data, context.asset, atr_period)
-    if atr_value is None or atr_value == 0:
+    # Mean true range over the last atr_period completed sessions
+    atr_value = session_level(context, data, context.asset, 'atr')
+    if np.isnan(atr_value) or atr_value == 0:
         return False  # Fail-safe: allow trading if cannot detect ATR
 
     prev_day_range = prev_high - prev_low
@@ -497,38 +418,19 @@ def compute_position_size(context, data) -> float:
         return max_position
 
     elif method == 'volatility_scaled':
-        vol_lookback = pos_config.get('volatility_lookback', 20)
         vol_target = pos_config.get('volatility_target', 0.15)
 
         if not data.can_trade(context.asset):
             return max_position
 
         try:
-            # Fetch minute data for volatility calculation, as it's an intraday strategy
-            # Request enough bars for the lookback period (24 hours * 60 minutes/day)
-            bar_count = vol_lookback * 1440 # Roughly equivalent to days in minutes
-            prices = data.history(context.asset, 'price', bar_count + 1, '1m')
-            
-            if len(prices) < bar_count + 1:
-                logger.warning(f"Insufficient minute data for volatility calculation for {context.asset.symbol}. Returning max position.")
-                return max_position
-
-            returns = prices.pct_change().dropna()
-            if len(returns) < bar_count:
-                logger.warning(f"Insufficient returns data for volatility calculation for {context.asset.symbol}. Returning max position.")
+            # Annualized std of daily close-to-close returns, computed once per
+            # session from daily bars (see register_session_levels in initialize)
+            current_vol = session_level(context, data, context.asset, 'volatility')
+            if np.isnan(current_vol):
+                logger.warning(f"Insufficient daily data for volatility calculation for {context.asset.symbol}. Returning max position.")
                 return max_position
 
-            # Annualized volatility
-            # Use trading_days_per_year from parameters for correct annualization
-            trading_days = params.get('backtest', {}).get('trading_days_per_year', 260)
-            # Calculate daily volatility from minute returns, then annualize
-            # Assuming 1440 minutes in a trading day (24*60)
-            daily_returns = returns.resample('1D').apply(lambda x: (1 + x).prod() - 1).dropna()
-            if len(daily_returns) > 0 and daily_returns.std() > 0:
-                current_vol = daily_returns.std() * np.sqrt(trading_days)
-            else:
-                current_vol = 0.0
-
             if current_vol > 0:
                 size = vol_target / current_vol
                 return float(np.clip(size, min_position, max_position))
@@ -650,6 +552,22 @@ def initialize(context):
         )
     )
     
+    # Daily levels (previous session high/low, ATR, volatility) are computed
+    # once per session instead of from minute history on every call.
+    # Registered before rebalance so the update runs first at the same minute.
+    session_features = ['prev_high', 'prev_low']
+    if params['strategy'].get('enable_range_detection', False):
+        session_features.append('atr')
+    pos_config = params.get('position_sizing', {})
+    if pos_config.get('method', 'fixed') == 'volatility_scaled':
+        session_features.append('volatility')
+    register_session_levels(
+        context, [context.asset], session_features,
+        atr_period=params['strategy'].get('atr_period', 14),
+        volatility_lookback=pos_config.get('volatility_lookback', 20),
+        annualization=params.get('backtest', {}).get('trading_days_per_year', 260),
+    )
+
     # Schedule main trading function
     rebalance_frequency = params['strategy'].get('rebalance_frequency', 'daily')
     minutes_after_open = params['strategy'].get('minutes_after_open', 0) # Default to 0 for intraday
@@ -732,7 +650,7 @@ def compute_signals(context, data) -> Tuple[Optional[int], dict]:
     if pd.isna(current_price):
         return None, {}
 
-    prev_high, prev_low = _calculate_previous_day_levels(context, data)
+    prev_high, prev_low = _get_previous_day_levels(context, data)
 
     if prev_high is None or prev_low is None:
         return None, {}
@@ -0,0 +1,215 @@
+"""
+Tests for lib.history_buffer module.
+
+Tests ring buffer mechanics and that HistoryBuffer windows match what
+data.history() returns bar by bar, using a small in-memory data portal.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+import pytest
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from lib.history_buffer import (
+    RingBuffer,
+    HistoryBuffer,
+    register_history,
+    update_history,
+    history_window,
+    get_history_buffer,
+)
+from lib.position_sizing import compute_position_size
+
+
+class FakeData:
+    """Minimal stand-in for Zipline's BarData over per-asset OHLC frames."""
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.current_dt = None
+        self.history_calls = 0
+        self.current_calls = 0
+
+    def can_trade(self, asset):
+        return True
+
+    def current(self, assets, fields):
+        self.current_calls += 1
+        return pd.DataFrame(
+            {field: [self.frames[a].at[self.current_dt, field] for a in assets] for field in fields},
+            index=assets,
+        )
+
+    def history(self, asset, field, bar_count, frequency):
+        # Zipline pads windows reaching before the first bar with NaN
+        self.history_calls += 1
+        series = self.frames[asset][field].loc[:self.current_dt]
+        values = np.concatenate([np.full(max(0, bar_count - len(series)), np.nan), series.to_numpy()[-bar_count:]])
+        return pd.Series(values)
+
+
+@pytest.fixture
+def daily_frames():
+    rng = np.random.default_rng(7)
+    index = pd.date_range('2024-01-01', periods=120, freq='D')
+    frames = {}
+    for asset in ('AAA', 'BBB'):
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(index))))
+        frames[asset] = pd.DataFrame({'price': close, 'high': close * 1.01}, index=index)
+    return frames
+
+
+class TestRingBuffer:
+    """Test RingBuffer append, wrap-around and views."""
+
+    @pytest.mark.unit
+    def test_window_matches_tail_after_wrapping(self):
+        buffer = RingBuffer(5)
+        values = np.arange(13, dtype=float)
+        for i, value in enumerate(values):
+            buffer.append(value)
+            expected = values[max(0, i - 4):i + 1]
+            np.testing.assert_array_equal(buffer.window(), expected)
+            np.testing.assert_array_equal(buffer.window(2), expected[-2:])
+            assert buffer.last() == value
+        assert buffer.full
+
+    @pytest.mark.unit
+    def test_extend_matches_repeated_append(self):
+        extended, appended = RingBuffer(4), RingBuffer(4)
+        extended.append(-1.0)
+        appended.append(-1.0)
+        extended.extend([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+        for value in [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]:
+            appended.append(value)
+        np.testing.assert_array_equal(extended.window(), appended.window())
+        np.testing.assert_array_equal(extended.resized(6).window(), [3.0, 4.0, 5.0, 6.0])
+
+    @pytest.mark.unit
+    def test_window_is_read_only_view(self):
+        buffer = RingBuffer(3)
+        buffer.extend([1.0, 2.0, 3.0])
+        window = buffer.window()
+        assert np.shares_memory(window, buffer._data)
+        with pytest.raises(ValueError):
+            window[0] = 0.0
+
+    @pytest.mark.unit
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError, match="capacity must be >= 1"):
+            RingBuffer(0)
+
+
+class TestHistoryBuffer:
+    """Test HistoryBuffer parity with data.history()."""
+
+    @pytest.mark.unit
+    def test_windows_match_data_history_every_bar(self, daily_frames):
+        data = FakeData(daily_frames)
+        context = SimpleNamespace()
+        register_history(context, ['AAA', 'BBB'], ['price'], 20, frequency='1d')
+        register_history(context, ['AAA'], ['high'], 10, frequency='1d')
+
+        for dt in daily_frames['AAA'].index:
+            data.current_dt = dt
+            update_history(context, data)
+            for asset, field, length in [('AAA', 'price', 20), ('BBB', 'price', 5), ('AAA', 'high', 10)]:
+                window = history_window(context, data, asset, field, length, '1d')
+                expected = np.asarray(FakeData.history(data, asset, field, length, '1d'))
+                np.testing.assert_array_equal(window, expected)
+
+        # One seeding call per buffer; everything else came from data.current()
+        assert data.history_calls == 3 + 3 * len(daily_frames['AAA'])
+        assert data.current_calls == len(daily_frames['AAA']) - 1
+
+    @pytest.mark.unit
+    def test_update_is_idempotent_within_a_bar(self, daily_frames):
+        data = FakeData(daily_frames)
+        buffer = HistoryBuffer('1d')
+        buffer.register(['AAA'], ['price'], 3)
+        for dt in daily_frames['AAA'].index[:5]:
+            data.current_dt = dt
+            buffer.update(data)
+            buffer.update(data)
+        np.testing.assert_array_equal(
+            buffer.window('AAA', 'price', 3), daily_frames['AAA']['price'].to_numpy()[2:5]
+        )
+
+    @pytest.mark.unit
+    def test_falls_back_to_data_history(self, daily_frames):
+        data = FakeData(daily_frames)
+        context = SimpleNamespace()
+        register_history(context, ['AAA'], ['price'], 5, frequency='1d')
+        data.current_dt = daily_frames['AAA'].index[10]
+
+        # Not updated for this bar yet, wrong frequency, or longer than registered
+        history_window(context, data, 'AAA', 'price', 5, '1d')
+        update_history(context, data)
+        calls = data.history_calls
+        history_window(context, data, 'AAA', 'price', 5, '1m')
+        history_window(context, data, 'AAA', 'price', 6, '1d')
+        history_window(context, data, 'BBB', 'price', 5, '1d')
+        assert data.history_calls == calls + 3
+
+        history_window(context, data, 'AAA', 'price', 5, '1d')
+        assert data.history_calls == calls + 3
+
+    @pytest.mark.unit
+    def test_register_grows_and_reseeds(self, daily_frames):
+        data = FakeData(daily_frames)
+        context = SimpleNamespace()
+        buffer = register_history(context, ['AAA'], ['price'], 3, frequency='1d')
+        for dt in daily_frames['AAA'].index[:30]:
+            data.current_dt = dt
+            update_history(context, data)
+
+        assert register_history(context, ['AAA'], ['price'], 8) is buffer
+        assert buffer.capacity('AAA', 'price') == 8
+        data.current_dt = daily_frames['AAA'].index[30]
+        update_history(context, data)
+        np.testing.assert_array_equal(
+            buffer.window('AAA', 'price', 8), daily_frames['AAA']['price'].to_numpy()[23:31]
+        )
+        with pytest.raises(ValueError, match="only 8 are registered"):
+            buffer.window('AAA', 'price', 9)
+
+    @pytest.mark.unit
+    def test_get_history_buffer_ignores_other_attributes(self):
+        from unittest.mock import Mock
+        assert get_history_buffer(Mock()) is None
+        assert get_history_buffer(SimpleNamespace()) is None
+
+
+class TestPositionSizingUsesHistoryBuffer:
+    """compute_position_size reads volatility windows from the shared buffer."""
+
+    @pytest.mark.unit
+    def test_volatility_sizing_matches_and_skips_history(self, daily_frames):
+        params = {
+            'strategy': {'asset_class': 'equities'},
+            'position_sizing': {
+                'method': 'volatility_scaled',
+                'volatility_lookback': 20,
+                'volatility_target': 0.15,
+                'max_position_pct': 0.95,
+                'min_position_pct': 0.10,
+            },
+        }
+        buffered = SimpleNamespace(asset='AAA', params=params)
+        plain = SimpleNamespace(asset='AAA', params=params)
+        register_history(buffered, ['AAA'], ['price'], 21, frequency='1d')
+        data = FakeData(daily_frames)
+
+        for dt in daily_frames['AAA'].index[:60]:
+            data.current_dt = dt
+            update_history(buffered, data)
+            calls = data.history_calls
+            with_buffer = compute_position_size(buffered, data, params)
+            assert data.history_calls == calls
+            assert with_buffer == compute_position_size(plain, data, params)
@@ -0,0 +1,132 @@
+"""
+Tests for lib.session_cache module.
+
+Tests per-session memoization, explicit invalidation and the saved
+data.history() counters, including through compute_position_size().
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+import pytest
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from lib.session_cache import (
+    SessionCache,
+    enable_session_cache,
+    get_session_cache,
+    cached_per_session,
+)
+from lib.position_sizing import compute_position_size
+
+
+VOL_PARAMS = {
+    'strategy': {'asset_class': 'equities'},
+    'position_sizing': {
+        'method': 'volatility_scaled',
+        'max_position_pct': 0.95,
+        'min_position_pct': 0.10,
+        'volatility_lookback': 20,
+        'volatility_target': 0.15,
+    },
+}
+
+
+def _data(session):
+    data = Mock()
+    data.can_trade.return_value = True
+    data.current_session = pd.Timestamp(session)
+    rng = np.random.default_rng(3)
+    data.history.return_value = pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.01, 21))))
+    return data
+
+
+class TestSessionCache:
+    """Test SessionCache hits, misses and invalidation."""
+
+    @pytest.mark.unit
+    def test_recomputes_once_per_session(self):
+        cache = SessionCache()
+        compute = Mock(side_effect=[1.0, 2.0])
+        key = ('AAA', 'volatility_scaled', 20)
+
+        assert cache.get_or_compute(key, 'day1', compute) == 1.0
+        assert cache.get_or_compute(key, 'day1', compute) == 1.0
+        assert cache.get_or_compute(key, 'day1', compute) == 1.0
+        assert cache.get_or_compute(key, 'day2', compute) == 2.0
+
+        assert compute.call_count == 2
+        assert cache.stats() == {'hits': 2, 'misses': 2, 'history_calls_saved': 2}
+
+    @pytest.mark.unit
+    def test_keys_are_separate_and_history_calls_counted(self):
+        cache = SessionCache()
+        cache.get_or_compute(('AAA', 'volatility_scaled', 20), 'day1', lambda: 1.0, history_calls=0)
+        cache.get_or_compute(('AAA', 'volatility_scaled', 60), 'day1', lambda: 2.0, history_calls=3)
+
+        assert cache.get_or_compute(('AAA', 'volatility_scaled', 20), 'day1', lambda: -1.0) == 1.0
+        assert cache.get_or_compute(('AAA', 'volatility_scaled', 60), 'day1', lambda: -1.0) == 2.0
+        assert cache.history_calls_saved == 3
+
+    @pytest.mark.unit
+    def test_invalidate(self):
+        cache = SessionCache()
+        for asset in ('AAA', 'BBB'):
+            for method in ('volatility_scaled', 'atr'):
+                cache.get_or_compute((asset, method, 14), 'day1', lambda: 1.0)
+
+        assert cache.invalidate(asset='AAA', method='atr') == 1
+        assert cache.invalidate(method='volatility_scaled') == 2
+        assert len(cache) == 1
+        assert cache.invalidate() == 1
+
+        compute = Mock(return_value=5.0)
+        cache.get_or_compute(('BBB', 'atr', 14), 'day1', compute)
+        compute.assert_called_once()
+
+    @pytest.mark.unit
+    def test_disabled_cache_always_computes(self):
+        context = SimpleNamespace()
+        compute = Mock(return_value=1.0)
+        for _ in range(3):
+            cached_per_session(context, _data('2024-01-02'), ('AAA', 'm', 1), compute)
+
+        assert compute.call_count == 3
+        assert get_session_cache(context) is None
+        assert enable_session_cache(context) is enable_session_cache(context)
+
+
+class TestPositionSizingCache:
+    """Test compute_position_size() memoizes volatility per session."""
+
+    @pytest.mark.unit
+    def test_volatility_fetched_once_per_session(self):
+        context = SimpleNamespace(asset='AAA', params=VOL_PARAMS)
+        enable_session_cache(context)
+
+        data = _data('2024-01-02')
+        sizes = [compute_position_size(context, data, VOL_PARAMS) for _ in range(5)]
+        assert data.history.call_count == 1
+        assert len(set(sizes)) == 1
+
+        uncached = compute_position_size(SimpleNamespace(asset='AAA', params=VOL_PARAMS), data, VOL_PARAMS)
+        assert sizes[0] == uncached
+
+        data.current_session = pd.Timestamp('2024-01-03')
+        compute_position_size(context, data, VOL_PARAMS)
+        assert data.history.call_count == 3
+        assert context.session_cache.stats() == {'hits': 4, 'misses': 2, 'history_calls_saved': 4}
+
+    @pytest.mark.unit
+    def test_opt_in_only(self):
+        context = SimpleNamespace(asset='AAA', params=VOL_PARAMS)
+        data = _data('2024-01-02')
+        for _ in range(3):
+            compute_position_size(context, data, VOL_PARAMS)
+        assert data.history.call_count == 3
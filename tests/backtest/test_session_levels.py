@@ -0,0 +1,186 @@
+"""
+Tests for lib.session_levels module.
+
+Tests that once-per-session levels match the same values aggregated
+directly from minute bars, from both the daily and minute sources, and
+that they are computed only once per session.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+import pytest
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from lib.session_levels import (
+    SessionLevels,
+    register_session_levels,
+    session_level,
+    update_session_levels,
+)
+
+# Each fake session trades 08:00-13:59 UTC on weekdays
+SESSION_MINUTES = 360
+
+
+def _aggregate(minutes: pd.DataFrame) -> pd.Series:
+    return pd.Series({
+        'open': minutes['open'].iloc[0],
+        'high': minutes['high'].max(),
+        'low': minutes['low'].min(),
+        'close': minutes['close'].iloc[-1],
+    })
+
+
+class FakeCalendar:
+    """Trading calendar with previous_session() and session_minutes()."""
+
+    def __init__(self, sessions):
+        self.sessions = sessions
+
+    def previous_session(self, session):
+        return self.sessions[self.sessions.get_loc(session) - 1]
+
+    def session_minutes(self, session):
+        start = session + pd.Timedelta(hours=8)
+        return pd.date_range(start, periods=SESSION_MINUTES, freq='min')
+
+
+class FakeMinuteData:
+    """Minimal stand-in for Zipline's BarData in a minute backtest."""
+
+    def __init__(self, minutes, calendar):
+        self.minutes = minutes
+        self.calendar = calendar
+        self.current_dt = None
+        self.history_calls = 0
+
+    @property
+    def current_session(self):
+        return self.current_dt.normalize()
+
+    @property
+    def current_session_minutes(self):
+        return self.calendar.session_minutes(self.current_session)
+
+    def history(self, asset, fields, bar_count, frequency):
+        self.history_calls += 1
+        seen = self.minutes[asset].loc[:self.current_dt]
+        if frequency == '1m':
+            return seen[fields].iloc[-bar_count:]
+        # Daily bars, the last one aggregated from the current session so far
+        daily = seen.groupby(seen.index.normalize()).apply(_aggregate)
+        return daily[fields].iloc[-bar_count:]
+
+
+@pytest.fixture
+def minute_data():
+    rng = np.random.default_rng(11)
+    sessions = pd.bdate_range('2024-01-01', periods=30)
+    calendar = FakeCalendar(sessions)
+    index = sessions.map(calendar.session_minutes).to_list()
+    index = index[0].append(index[1:])
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.0005, len(index))))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    spread = np.abs(rng.normal(0, 0.0003, len(index))) * close
+    frame = pd.DataFrame({
+        'open': open_,
+        'high': np.maximum(open_, close) + spread,
+        'low': np.minimum(open_, close) - spread,
+        'close': close,
+    }, index=index)
+    return FakeMinuteData({'AAA': frame}, calendar), sessions
+
+
+def _expected_daily(data, sessions, upto):
+    """Completed session bars before session `upto`, aggregated from minutes."""
+    frame = data.minutes['AAA']
+    return pd.DataFrame([_aggregate(frame.loc[str(s.date())]) for s in sessions[:upto]])
+
+
+class TestSessionLevels:
+    """Test levels against minute bars aggregated by hand."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize('source', ['daily', 'minute'])
+    def test_previous_session_levels(self, minute_data, source):
+        data, sessions = minute_data
+        data.current_dt = data.calendar.session_minutes(sessions[25])[0]
+        levels = SessionLevels(['AAA'], ['prev_open', 'prev_high', 'prev_low', 'prev_close', 'prev_range', 'session_open'], source=source)
+        levels.update(data, data.calendar)
+
+        previous = _expected_daily(data, sessions, 25).iloc[-1]
+        assert levels.get('AAA', 'prev_open') == pytest.approx(previous['open'])
+        assert levels.get('AAA', 'prev_high') == pytest.approx(previous['high'])
+        assert levels.get('AAA', 'prev_low') == pytest.approx(previous['low'])
+        assert levels.get('AAA', 'prev_close') == pytest.approx(previous['close'])
+        assert levels.get('AAA', 'prev_range') == pytest.approx(previous['high'] - previous['low'])
+        assert levels.get('AAA', 'session_open') == pytest.approx(data.minutes['AAA'].at[data.current_dt, 'open'])
+
+    @pytest.mark.unit
+    def test_atr_and_volatility_use_completed_sessions(self, minute_data):
+        data, sessions = minute_data
+        data.current_dt = data.calendar.session_minutes(sessions[25])[30]
+        levels = SessionLevels(['AAA'], ['atr', 'volatility'], atr_period=5, volatility_lookback=10, annualization=260)
+        levels.update(data)
+
+        daily = _expected_daily(data, sessions, 25)
+        prev_close = daily['close'].shift(1)
+        true_range = pd.concat([
+            daily['high'] - daily['low'],
+            (daily['high'] - prev_close).abs(),
+            (daily['low'] - prev_close).abs(),
+        ], axis=1).max(axis=1)
+        expected_vol = daily['close'].pct_change().iloc[-10:].std() * np.sqrt(260)
+
+        assert levels.get('AAA', 'atr') == pytest.approx(true_range.iloc[-5:].mean())
+        assert levels.get('AAA', 'volatility') == pytest.approx(expected_vol)
+
+    @pytest.mark.unit
+    def test_insufficient_history_is_nan(self, minute_data):
+        data, sessions = minute_data
+        data.current_dt = data.calendar.session_minutes(sessions[3])[0]
+        levels = SessionLevels(['AAA'], ['prev_high', 'atr'], atr_period=14)
+        levels.update(data)
+
+        assert not np.isnan(levels.get('AAA', 'prev_high'))
+        assert np.isnan(levels.get('AAA', 'atr'))
+
+    @pytest.mark.unit
+    def test_computed_once_per_session(self, minute_data):
+        data, sessions = minute_data
+        context = SimpleNamespace(trading_calendar=data.calendar)
+        register_session_levels(context, ['AAA'], ['prev_high', 'volatility'], schedule=False)
+
+        first_session = data.calendar.session_minutes(sessions[25])
+        for minute in first_session[:120]:
+            data.current_dt = minute
+            session_level(context, data, 'AAA', 'prev_high')
+            session_level(context, data, 'AAA', 'volatility')
+        assert data.history_calls == 1
+
+        data.current_dt = data.calendar.session_minutes(sessions[26])[0]
+        update_session_levels(context, data)
+        previous = _expected_daily(data, sessions, 26).iloc[-1]
+        assert data.history_calls == 2
+        assert session_level(context, data, 'AAA', 'prev_high') == pytest.approx(previous['high'])
+
+    @pytest.mark.unit
+    def test_invalid_declarations(self, minute_data):
+        data, _ = minute_data
+        with pytest.raises(ValueError, match="Unknown session level"):
+            SessionLevels(['AAA'], ['prev_mid'])
+        with pytest.raises(ValueError, match="source"):
+            SessionLevels(['AAA'], ['prev_high'], source='hourly')
+
+        context = SimpleNamespace()
+        with pytest.raises(KeyError):
+            session_level(context, data, 'AAA', 'prev_high')
+        register_session_levels(context, ['AAA'], ['prev_high'], schedule=False)
+        with pytest.raises(KeyError, match="not registered"):
+            context.session_levels.get('AAA', 'atr')
@@ -0,0 +1,242 @@
+"""
+Tests for lib.backtest.vectorized package.
+
+Tests next-bar execution, costs, position sizing, rebalance scheduling
+and the tracking error statistics on synthetic bars.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+import pytest
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from lib.backtest.vectorized import (
+    CostModel,
+    run_vectorized,
+    position_sizes,
+    rebalance_bars,
+    screen_signals,
+    tracking_error,
+)
+from lib.position_sizing import compute_position_size
+
+
+def _bars(close, volume=1e6):
+    close = np.asarray(close, dtype=float)
+    index = pd.bdate_range('2024-01-01', periods=len(close))
+    return pd.DataFrame({
+        'open': close - 0.5,
+        'high': close + 1.0,
+        'low': close - 1.0,
+        'close': close,
+        'volume': np.full(len(close), float(volume)),
+    }, index=index)
+
+
+class TestRunVectorized:
+    """Test execution timing and costs of run_vectorized()."""
+
+    @pytest.mark.unit
+    def test_fills_on_next_bar_close(self):
+        bars = _bars([100, 100, 110, 121, 121])
+        signals = [np.nan, 1, np.nan, np.nan, 0]
+
+        result = run_vectorized(bars, signals, sizes=1.0, capital_base=10000.0)
+
+        # Signal at bar 1, bought at bar 2's close of 110; target 10000 / 100 shares
+        assert len(result.trades) == 1
+        trade = result.trades.iloc[0]
+        assert trade['fill_bar'] == bars.index[2]
+        assert trade['price'] == 110.0
+        assert trade['shares'] == pytest.approx(100.0)
+        assert result.positions.iloc[1] == 0.0
+        assert result.positions.iloc[2] == pytest.approx(100.0)
+        # Exit signal on the last bar has no bar to fill on
+        assert result.positions.iloc[-1] == pytest.approx(100.0)
+        assert result.equity.iloc[3] == pytest.approx(10000.0 + 100 * 11)
+
+    @pytest.mark.unit
+    def test_open_fills(self):
+        bars = _bars([100, 100, 110, 121])
+        result = run_vectorized(bars, [1, np.nan, np.nan, np.nan], fill_price='open')
+        assert result.trades.iloc[0]['price'] == 99.5
+
+        with pytest.raises(ValueError):
+            run_vectorized(bars, [1, 0, 0, 0], fill_price='vwap')
+
+    @pytest.mark.unit
+    def test_commission_and_slippage(self):
+        bars = _bars([100.0] * 4, volume=1000.0)
+        costs = CostModel(per_share=0.005, min_cost=1.0, volume_limit=0.025, price_impact=0.1)
+
+        result = run_vectorized(bars, [1, np.nan, 0, np.nan], capital_base=10000.0, costs=costs)
+
+        buy, sell = result.trades.iloc[0], result.trades.iloc[1]
+        # 100 shares against 1000 volume is capped at the 2.5% volume limit
+        impact = 0.1 * 0.025 ** 2
+        assert buy['price'] == pytest.approx(100.0 * (1 + impact))
+        assert sell['price'] == pytest.approx(100.0 * (1 - impact))
+        # 100 shares * 0.005 is below the minimum commission
+        assert buy['commission'] == 1.0
+        assert result.total_commission == 2.0
+        assert result.equity.iloc[-1] < 10000.0
+
+    @pytest.mark.unit
+    def test_nan_holds_and_start_masks_history(self):
+        bars = _bars(np.linspace(100, 120, 10))
+        signals = np.array([1, np.nan, np.nan, np.nan, 1, np.nan, np.nan, 0, np.nan, np.nan])
+
+        result = run_vectorized(bars, signals, start=bars.index[3])
+
+        # Signal at bar 0 is before start; only bars 4 and 7 trade
+        assert list(result.trades['signal_bar']) == [bars.index[4], bars.index[7]]
+        assert result.equity.index[0] == bars.index[3]
+        assert result.returns.iloc[0] == 0.0
+
+    @pytest.mark.unit
+    def test_signal_length_checked(self):
+        with pytest.raises(ValueError):
+            run_vectorized(_bars([100, 101]), [1])
+
+
+class TestScreening:
+    """Test sizing, rebalance schedule and warmup of the screen."""
+
+    @pytest.mark.unit
+    def test_fixed_size_matches_compute_position_size(self):
+        params = {'position_sizing': {'method': 'fixed', 'max_position_pct': 0.8}}
+        expected = compute_position_size(SimpleNamespace(params=params), None, params)
+        assert np.all(position_sizes(_bars([100] * 5), params) == expected)
+
+    @pytest.mark.unit
+    def test_volatility_scaled_sizes_clipped(self):
+        rng = np.random.default_rng(7)
+        bars = _bars(100 * np.exp(np.cumsum(rng.normal(0, 0.03, 60))))
+        params = {'position_sizing': {
+            'method': 'volatility_scaled', 'max_position_pct': 0.9,
+            'min_position_pct': 0.2, 'volatility_lookback': 20, 'volatility_target': 0.15,
+        }}
+
+        sizes = position_sizes(bars, params)
+
+        # Not enough history yet: max position, as compute_position_size()
+        assert np.all(sizes[:20] == 0.9)
+        assert np.all((sizes >= 0.2) & (sizes <= 0.9))
+        assert sizes[20:].min() < 0.9
+
+    @pytest.mark.unit
+    def test_rebalance_bars(self):
+        index = pd.bdate_range('2024-01-29', '2024-02-09')
+        weekly = rebalance_bars(index, 'weekly')
+        monthly = rebalance_bars(index, 'monthly')
+
+        assert list(index[weekly].strftime('%Y-%m-%d')) == ['2024-01-29', '2024-02-05']
+        assert list(index[monthly].strftime('%Y-%m-%d')) == ['2024-01-29', '2024-02-01']
+        assert rebalance_bars(index, 'daily').all()
+
+    @pytest.mark.unit
+    def test_warmup_skips_first_rebalances(self):
+        bars = _bars(np.linspace(100, 110, 12))
+        params = {
+            'strategy': {'rebalance_frequency': 'daily'},
+            'backtest': {'warmup_days': 3},
+            'position_sizing': {'method': 'fixed', 'max_position_pct': 1.0},
+        }
+
+        result = screen_signals(bars, params, lambda ohlcv, p: np.ones(len(ohlcv)),
+                                start_date=str(bars.index[2].date()), capital_base=10000.0)
+
+        # Rebalances at bars 2-4 are warmup; first entry at bar 5 fills at bar 6
+        assert result.trades.iloc[0]['signal_bar'] == bars.index[5]
+        assert result.trades.iloc[0]['fill_bar'] == bars.index[6]
+
+
+class TestTrackingError:
+    """Test tracking_error() statistics."""
+
+    @pytest.mark.unit
+    def test_identical_returns(self):
+        returns = pd.Series([0.01, -0.02, 0.005, 0.0], index=pd.bdate_range('2024-01-01', periods=4))
+        stats = tracking_error(returns, returns.tz_localize('UTC'))
+
+        assert stats['n_days'] == 4
+        assert stats['tracking_error'] == 0.0
+        assert stats['total_return_diff'] == 0.0
+        assert stats['correlation'] == pytest.approx(1.0)
+
+    @pytest.mark.unit
+    def test_aligns_on_common_sessions(self):
+        index = pd.bdate_range('2024-01-01', periods=5)
+        a = pd.Series([0.01, 0.02, 0.0, -0.01, 0.01], index=index)
+        b = pd.Series([0.02, 0.0, 0.0], index=index[1:4])
+
+        stats = tracking_error(a, b)
+
+        assert stats['n_days'] == 3
+        assert stats['max_abs_daily_diff'] == pytest.approx(0.01)
+        assert tracking_error(a, pd.Series(dtype=float))['n_days'] == 0
+
+
+class TestPrescreen:
+    """Test prescreen() selection and its fallbacks."""
+
+    @staticmethod
+    def _patch(monkeypatch, load_bars):
+        from lib.backtest.vectorized import screen
+
+        monkeypatch.setattr(screen, 'load_signal_function', lambda name, asset_class=None: (
+            lambda ohlcv, params: np.where(np.arange(len(ohlcv)) % params['strategy']['period'] == 0, 1.0, 0.0)
+        ))
+        monkeypatch.setattr(screen, '_prepare_backtest_config', lambda *args: SimpleNamespace(
+            bundle='test_bundle', start_date='2024-01-01', end_date='2024-12-31', capital_base=10000.0
+        ))
+        monkeypatch.setattr(screen, 'load_bundle_ohlcv', load_bars)
+        return screen
+
+    @pytest.mark.unit
+    def test_bars_loaded_once_and_best_kept(self, monkeypatch):
+        rng = np.random.default_rng(11)
+        bars = _bars(100 * np.exp(np.cumsum(rng.normal(0.001, 0.01, 120))))
+        calls = []
+        screen = self._patch(monkeypatch, lambda *args: calls.append(args) or bars)
+        param_sets = [{'strategy': {'asset_symbol': 'AAA', 'period': p}} for p in (2, 3, 5, 7, 11)]
+
+        kept, scores = screen.prescreen('s', param_sets, '2024-01-01', '2024-12-31', keep=0.4)
+
+        assert len(calls) == 1
+        assert len(kept) == 2
+        best = sorted(scores, key=scores.get, reverse=True)[:2]
+        assert kept == sorted(best)
+
+    @pytest.mark.unit
+    def test_missing_bundle_runs_every_combination(self, monkeypatch):
+        from lib.optimize.prescreen import prescreen_param_sets
+
+        def missing(*args):
+            raise FileNotFoundError("Bundle 'no_such_bundle' not found")
+
+        self._patch(monkeypatch, missing)
+        param_sets = [{'strategy': {'asset_symbol': 'AAA', 'period': p}} for p in range(2, 7)]
+
+        kept, scores = prescreen_param_sets('s', param_sets, '2024-01-01', '2024-12-31', keep=0.4)
+
+        assert kept == [0, 1, 2, 3, 4]
+        assert scores == {}
+
+    @pytest.mark.unit
+    def test_no_finite_scores_keeps_all(self, monkeypatch):
+        screen = self._patch(monkeypatch, lambda *args: _bars([100.0] * 30))
+        monkeypatch.setattr(screen, 'screen_signals', Mock(side_effect=RuntimeError('boom')))
+        param_sets = [{'strategy': {'asset_symbol': 'AAA', 'period': p}} for p in range(2, 7)]
+
+        kept, scores = screen.prescreen('s', param_sets, '2024-01-01', '2024-12-31', keep=0.4)
+
+        assert kept == [0, 1, 2, 3, 4]
+        assert all(score == -np.inf for score in scores.values())
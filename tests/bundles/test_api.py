@@ -47,6 +47,12 @@ from lib.bundles import (
 )
 
 
+@pytest.fixture
+def isolated_registry(tmp_path, monkeypatch):
+    """Point the bundle registry (~/.zipline) at the test's temp directory."""
+    monkeypatch.setenv('HOME', str(tmp_path))
+
+
 class TestTimeframeConfiguration:
     """Test timeframe configuration and validation."""
     
@@ -98,6 +104,7 @@ class TestTimeframeConfiguration:
         assert warning is None or isinstance(warning, str)
 
 
+@pytest.mark.usefixtures('isolated_registry')
 class TestBundleRegistry:
     """Test bundle registry operations."""
     
@@ -223,6 +230,7 @@ class TestBundleAPI:
         assert 'bundle_name' in params
 
 
+@pytest.mark.usefixtures('isolated_registry')
 class TestBundleIntegration:
     """Integration tests for bundle operations."""
     
@@ -0,0 +1,263 @@
+"""
+Test CSV bundle ingestion helpers.
+
+Tests for per-symbol CSV loading, validation and filtering used by
+register_csv_bundle.
+"""
+
+# Standard library imports
+import sys
+from pathlib import Path
+
+# Third-party imports
+import pytest
+import pandas as pd
+import numpy as np
+
+# Local imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from lib.bundles.csv import CSV_ENGINES, CsvCacheStats, load_symbol_csvs, read_ohlcv_csv
+from lib.bundles.csv import cache as csv_cache
+from lib.bundles.csv.ingestion import resolve_worker_count
+
+
+def _write_daily_csv(directory: Path, symbol: str, seed: int, days: int = 60) -> Path:
+    """Write a synthetic daily OHLCV CSV in the data/processed naming format."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range('2023-01-02', periods=days, freq='D', tz='UTC')
+    close = 100 + np.cumsum(rng.normal(0, 1, days))
+    open_ = close + rng.normal(0, 0.5, days)
+    df = pd.DataFrame({
+        'Open': open_,
+        'High': np.maximum(open_, close) + 1.0,
+        'Low': np.minimum(open_, close) - 1.0,
+        'Close': close,
+        'Volume': rng.integers(1_000, 10_000, days).astype(float),
+    }, index=pd.Index(dates, name='Date'))
+    path = directory / f"{symbol}_daily_20230102_20230302.csv"
+    df.to_csv(path)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def isolated_csv_cache(tmp_path, monkeypatch):
+    """Redirect the processed-CSV cache into the test's temp directory."""
+    cache_dir = tmp_path / 'csv_cache'
+    monkeypatch.setattr(csv_cache, 'get_csv_cache_dir', lambda: cache_dir)
+    return cache_dir
+
+
+@pytest.fixture
+def csv_dir(tmp_path):
+    """Directory with synthetic daily CSVs for three crypto symbols."""
+    data_dir = tmp_path / 'processed'
+    data_dir.mkdir()
+    for seed, symbol in enumerate(['BTCUSD', 'ETHUSD', 'SOLUSD']):
+        _write_daily_csv(data_dir, symbol, seed)
+    return data_dir
+
+
+class TestLoadSymbolCsvs:
+    """Tests for load_symbol_csvs."""
+
+    @pytest.mark.unit
+    def test_resolve_worker_count(self):
+        """Worker count is clamped to the number of tasks."""
+        assert resolve_worker_count(None, 10) == 1
+        assert resolve_worker_count(4, 2) == 2
+        assert resolve_worker_count(4, 0) == 1
+        assert resolve_worker_count(0, 100) >= 1
+
+    @pytest.mark.unit
+    def test_missing_symbols_are_skipped(self, csv_dir):
+        """Symbols without a CSV keep their sid slot but produce no data."""
+        loaded = load_symbol_csvs(
+            symbols=['BTCUSD', 'MISSING', 'SOLUSD'],
+            data_path=csv_dir,
+            timeframe='daily',
+            asset_class='crypto',
+            user_start_date=None,
+            user_end_date=None,
+        )
+        assert [sid for sid, _ in loaded] == [0, 2]
+
+    @pytest.mark.unit
+    def test_parallel_matches_sequential(self, csv_dir):
+        """Process-pool loading returns identical frames in sid order."""
+        kwargs = dict(
+            symbols=['BTCUSD', 'ETHUSD', 'SOLUSD'],
+            data_path=csv_dir,
+            timeframe='daily',
+            asset_class='crypto',
+            user_start_date=None,
+            user_end_date=None,
+            use_cache=False,
+        )
+        sequential = load_symbol_csvs(workers=1, **kwargs)
+        parallel = load_symbol_csvs(workers=3, **kwargs)
+
+        assert [sid for sid, _ in parallel] == [0, 1, 2]
+        assert [sid for sid, _ in sequential] == [sid for sid, _ in parallel]
+        for (_, seq_df), (_, par_df) in zip(sequential, parallel):
+            pd.testing.assert_frame_equal(seq_df, par_df)
+
+
+class TestReadOhlcvCsv:
+    """Tests for read_ohlcv_csv parse engines."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize('engine', ['pyarrow', 'chunked'])
+    def test_engine_matches_pandas(self, csv_dir, engine):
+        """Fast engines return the same frame as the pandas engine."""
+        csv_file = next(csv_dir.glob('BTCUSD_*.csv'))
+        expected = read_ohlcv_csv(csv_file, engine='pandas')
+        result = read_ohlcv_csv(csv_file, engine=engine, chunksize=7)
+
+        pd.testing.assert_frame_equal(result, expected)
+        assert list(result.columns) == ['open', 'high', 'low', 'close', 'volume']
+        assert (result.dtypes == 'float64').all()
+        assert str(result.index.tz) == 'UTC'
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize('engine', CSV_ENGINES)
+    def test_naive_timestamps_treated_as_utc(self, tmp_path, engine):
+        """Timestamps without an offset are interpreted as UTC by every engine."""
+        csv_file = tmp_path / 'EURUSD_1m.csv'
+        csv_file.write_text(
+            "timestamp,OPEN,HIGH,LOW,CLOSE,VOLUME\n"
+            "2024-01-02 00:00:00,1.1,1.2,1.0,1.15,10\n"
+            "2024-01-02 00:01:00,1.15,1.25,1.1,1.2,12\n"
+        )
+        df = read_ohlcv_csv(csv_file, engine=engine)
+
+        assert df.index[0] == pd.Timestamp('2024-01-02 00:00:00', tz='UTC')
+        assert df['volume'].tolist() == [10.0, 12.0]
+
+    @pytest.mark.unit
+    def test_unknown_engine_raises(self, csv_dir):
+        """Unknown engine names are rejected."""
+        csv_file = next(csv_dir.glob('BTCUSD_*.csv'))
+        with pytest.raises(ValueError, match='Unknown CSV engine'):
+            read_ohlcv_csv(csv_file, engine='polars')
+
+
+class TestProcessedCsvCache:
+    """Tests for the processed-CSV cache used by load_and_process_csv."""
+
+    @staticmethod
+    def _load(csv_dir, **kwargs):
+        return load_symbol_csvs(
+            symbols=['BTCUSD', 'ETHUSD'],
+            data_path=csv_dir,
+            timeframe='daily',
+            asset_class='crypto',
+            user_start_date=None,
+            user_end_date=None,
+            **kwargs
+        )
+
+    @pytest.mark.unit
+    def test_second_ingest_hits_cache(self, csv_dir, isolated_csv_cache):
+        """Unchanged files are served from the cache with identical output."""
+        first_stats, second_stats = CsvCacheStats(), CsvCacheStats()
+        first = self._load(csv_dir, cache_stats=first_stats)
+        second = self._load(csv_dir, cache_stats=second_stats)
+
+        assert (first_stats.misses, first_stats.writes) == (2, 2)
+        assert (second_stats.hits, second_stats.misses) == (2, 0)
+        assert len(list(isolated_csv_cache.glob('*.parquet'))) == 2
+        for (_, a), (_, b) in zip(first, second):
+            pd.testing.assert_frame_equal(a, b, check_freq=False)
+
+    @pytest.mark.unit
+    def test_modified_file_invalidates_entry(self, csv_dir):
+        """Changing a source file forces it to be reprocessed."""
+        self._load(csv_dir)
+        _write_daily_csv(csv_dir, 'BTCUSD', seed=99, days=61)
+
+        stats = CsvCacheStats()
+        self._load(csv_dir, cache_stats=stats)
+        assert (stats.hits, stats.misses) == (1, 1)
+
+    @pytest.mark.unit
+    def test_modified_file_evicts_old_entry(self, csv_dir, isolated_csv_cache):
+        """Writing a new key deletes the entry it supersedes."""
+        self._load(csv_dir)
+        _write_daily_csv(csv_dir, 'BTCUSD', seed=99, days=61)
+        self._load(csv_dir)
+
+        assert len(list(isolated_csv_cache.glob('BTCUSD_daily_*.parquet'))) == 1
+        assert len(list(isolated_csv_cache.glob('*.parquet'))) == 2
+
+    @pytest.mark.unit
+    def test_eviction_keeps_other_symbols_and_scopes(self, isolated_csv_cache):
+        """Symbols sharing a prefix, other timeframes and other scopes are not evicted."""
+        df = pd.DataFrame({'close': [1.0]})
+        kept = [
+            csv_cache.get_cache_path('EUR_USD', 'daily', 'c' * 12 + '1' * 12),
+            csv_cache.get_cache_path('EUR', '1h', 'c' * 12 + '1' * 12),
+            csv_cache.get_cache_path('EUR', 'daily', 'e' * 12 + '1' * 12),
+        ]
+        for path in kept:
+            csv_cache.save_cached_csv(df, path)
+        csv_cache.save_cached_csv(df, csv_cache.get_cache_path('EUR', 'daily', 'c' * 12 + '1' * 12))
+        newest = csv_cache.get_cache_path('EUR', 'daily', 'c' * 12 + '2' * 12)
+        csv_cache.save_cached_csv(df, newest)
+
+        assert sorted(isolated_csv_cache.glob('*.parquet')) == sorted(kept + [newest])
+
+    @pytest.mark.unit
+    def test_bundles_with_other_bounds_share_cache(self, csv_dir, isolated_csv_cache):
+        """Ingests of one file with different date bounds keep separate entries."""
+        def load(start, stats):
+            return load_symbol_csvs(
+                symbols=['BTCUSD'], data_path=csv_dir, timeframe='daily', asset_class='crypto',
+                user_start_date=start, user_end_date=None, cache_stats=stats,
+            )
+
+        load(None, CsvCacheStats())
+        load(pd.Timestamp('2023-02-01', tz='UTC'), CsvCacheStats())
+        stats = CsvCacheStats()
+        load(None, stats)
+        load(pd.Timestamp('2023-02-01', tz='UTC'), stats)
+
+        assert (stats.hits, stats.misses) == (2, 0)
+        assert len(list(isolated_csv_cache.glob('*.parquet'))) == 2
+
+    @pytest.mark.unit
+    def test_clear_symbol_keeps_prefixed_symbols(self, isolated_csv_cache):
+        """clear_csv_cache('EUR') leaves EUR_USD entries alone."""
+        df = pd.DataFrame({'close': [1.0]})
+        eur_usd = csv_cache.get_cache_path('EUR_USD', 'daily', 'a' * 24)
+        for path in (eur_usd, csv_cache.get_cache_path('EUR', 'daily', 'b' * 24)):
+            csv_cache.save_cached_csv(df, path)
+
+        assert csv_cache.clear_csv_cache('EUR') == 1
+        assert list(isolated_csv_cache.glob('*.parquet')) == [eur_usd]
+
+    @pytest.mark.unit
+    def test_version_bump_invalidates_entry(self, csv_dir, monkeypatch):
+        """Entries written under an older CSV_CACHE_VERSION are not served."""
+        self._load(csv_dir)
+        monkeypatch.setattr(csv_cache, 'CSV_CACHE_VERSION', csv_cache.CSV_CACHE_VERSION + 1)
+
+        stats = CsvCacheStats()
+        self._load(csv_dir, cache_stats=stats)
+        assert (stats.hits, stats.misses) == (0, 2)
+
+    @pytest.mark.unit
+    def test_rebuild_cache_ignores_entries(self, csv_dir):
+        """rebuild_cache reprocesses and rewrites every file."""
+        self._load(csv_dir)
+
+        stats = CsvCacheStats()
+        self._load(csv_dir, rebuild_cache=True, cache_stats=stats)
+        assert (stats.hits, stats.misses, stats.writes) == (0, 2, 2)
+
+    @pytest.mark.unit
+    def test_cache_disabled(self, csv_dir, isolated_csv_cache):
+        """use_cache=False neither reads nor writes cache files."""
+        self._load(csv_dir, use_cache=False)
+        assert not isolated_csv_cache.exists()
@@ -0,0 +1,165 @@
+"""
+Test bundles derived from an existing minute bundle.
+
+Ingests a 1m CSV bundle, derives 5m and daily bundles from it with
+ingest_bundle(source_bundle=...) and checks them against the source data
+aggregated directly.
+"""
+
+# Standard library imports
+import sys
+from pathlib import Path
+
+# Third-party imports
+import pytest
+import pandas as pd
+import numpy as np
+
+# Local imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from lib.bundles import (
+    derived_bundle_name, ingest_bundle, load_bundle, load_bundle_registry, unregister_bundle
+)
+from lib.bundles import registry as bundle_registry
+from lib.bundles.csv import cache as csv_cache
+from lib.bundles.csv import registration as csv_registration
+from lib.data.aggregation import aggregate_ohlcv, aggregate_ohlcv_by_session
+
+SOURCE = 'test_derived_1m'
+FIELDS = ['open', 'high', 'low', 'close', 'volume']
+
+
+@pytest.fixture
+def source_bundle(tmp_path, monkeypatch):
+    """Ingest a two-symbol 1m XNYS CSV bundle into tmp_path; yields the source minute bars."""
+    from zipline.utils.calendar_utils import get_calendar
+    monkeypatch.setenv('ZIPLINE_ROOT', str(tmp_path / 'zipline'))
+    monkeypatch.setattr(bundle_registry, 'get_bundle_registry_path', lambda: tmp_path / 'registry.json')
+    monkeypatch.setattr(csv_registration, 'get_project_root', lambda: tmp_path)
+    monkeypatch.setattr(csv_cache, 'get_csv_cache_dir', lambda: tmp_path / 'csv_cache')
+
+    calendar = get_calendar('XNYS')
+    minutes = calendar.minutes_in_range(
+        calendar.session_first_minute('2023-01-03'), calendar.session_last_minute('2023-01-06')
+    )
+    data_dir = tmp_path / 'data' / 'processed' / '1m'
+    data_dir.mkdir(parents=True)
+    frames = {}
+    for seed, symbol in enumerate(['AAPL', 'MSFT']):
+        rng = np.random.default_rng(seed)
+        close = np.round(100 + np.cumsum(rng.normal(0, 0.1, len(minutes))), 2)
+        df = pd.DataFrame({
+            'open': close, 'high': close + 0.5, 'low': close - 0.5, 'close': close,
+            'volume': rng.integers(100, 1_000, len(minutes)).astype(float),
+        }, index=minutes)
+        # MSFT misses its first session, so its derived asset starts later
+        if symbol == 'MSFT':
+            df = df[df.index >= calendar.session_first_minute('2023-01-04')]
+        frames[symbol] = df
+        df.rename(columns=str.title).rename_axis('Date').to_csv(
+            data_dir / f"{symbol}_1m_20230103_20230106.csv"
+        )
+
+    ingest_bundle(
+        source='csv', assets=['equity'], bundle_name=SOURCE, symbols=['AAPL', 'MSFT'],
+        calendar_name='XNYS', timeframe='1m', start_date='2023-01-01', force=True
+    )
+    yield frames
+    for name in (SOURCE, 'test_derived_5m', 'test_derived_daily'):
+        unregister_bundle(name)
+
+
+def _load(bundle: str, reader_attr: str, start, end, sids) -> np.ndarray:
+    from zipline.data.bundles import load
+    reader = getattr(load(bundle), reader_attr)
+    return np.stack(reader.load_raw_arrays(FIELDS, start, end, sids), axis=-1)
+
+
+class TestDerivedBundles:
+    """Tests for ingest_bundle(source_bundle=...)."""
+
+    @pytest.mark.unit
+    def test_default_name(self):
+        assert derived_bundle_name('csv_crypto_1m', '5m') == 'csv_crypto_5m'
+        assert derived_bundle_name('csv_crypto_1m', '1d') == 'csv_crypto_daily'
+
+    @pytest.mark.unit
+    def test_5m_matches_direct_aggregation(self, source_bundle):
+        """5m bars and the daily bars of a derived minute bundle match aggregating the source."""
+        from zipline.utils.calendar_utils import get_calendar
+        calendar = get_calendar('XNYS')
+
+        name = ingest_bundle(source='csv', assets=[], source_bundle=SOURCE, timeframe='5m', workers=2)
+        assert name == 'test_derived_5m'
+
+        for sid, symbol in enumerate(['AAPL', 'MSFT']):
+            expected = aggregate_ohlcv(source_bundle[symbol], '5m')
+            start = calendar.session_first_minute(expected.index[0].normalize().tz_localize(None))
+            loaded = _load(name, 'equity_minute_bar_reader', start, expected.index[-1], [sid])[:, 0]
+            minutes = calendar.minutes_in_range(start, expected.index[-1])
+            loaded = pd.DataFrame(loaded, index=minutes, columns=FIELDS).dropna()
+            # Bars are stored at their label, like CSV 5m bundles; the 14:30 label lands on the open (14:31)
+            assert loaded.index[0] == start
+            assert loaded.index[1] == start + pd.Timedelta(minutes=4)
+            np.testing.assert_allclose(loaded.to_numpy(), expected[FIELDS].to_numpy(), rtol=1e-6)
+
+        daily = aggregate_ohlcv_by_session(source_bundle['AAPL'], 'daily', calendar)
+        loaded = _load(name, 'equity_daily_bar_reader', daily.index[0].tz_localize(None),
+                       daily.index[-1].tz_localize(None), [0])[:, 0]
+        np.testing.assert_allclose(loaded, daily[FIELDS].to_numpy(), rtol=1e-6)
+
+        entry = load_bundle_registry()[name]
+        assert entry['source_bundle'] == SOURCE
+        assert entry['symbols'] == ['AAPL', 'MSFT']
+        assert entry['coverage']['MSFT'] == {'start': '2023-01-04', 'end': '2023-01-06'}
+
+        # A fresh process re-registers the bundle as derived, keeping its source
+        from zipline.data.bundles import unregister
+        unregister(name)
+        load_bundle(name)
+        assert load_bundle_registry()[name]['source_bundle'] == SOURCE
+
+    @pytest.mark.unit
+    def test_daily_subset(self, source_bundle, monkeypatch):
+        """A daily bundle can be derived for a subset of the source symbols."""
+        from zipline.data.bundles import load
+        from lib.bundles import derived
+
+        pipeline_workers = []
+        run_pipeline = derived.run_pipeline
+
+        def spy(items, stages, *args, **kwargs):
+            pipeline_workers.append(stages[0].workers)
+            return run_pipeline(items, stages, *args, **kwargs)
+
+        monkeypatch.setattr(derived, 'run_pipeline', spy)
+        name = ingest_bundle(
+            source='csv', assets=[], source_bundle=SOURCE, symbols=['MSFT'],
+            timeframe='daily', bundle_name='test_derived_daily'
+        )
+        # No workers given: derived ingests aggregate on the default thread count
+        assert pipeline_workers == [derived.DEFAULT_DERIVED_WORKERS]
+        bundle = load(name)
+        assert bundle.asset_finder.lookup_symbol('MSFT', None).sid == 0
+
+        df = source_bundle['MSFT']
+        loaded = _load(name, 'equity_daily_bar_reader', pd.Timestamp('2023-01-04'), pd.Timestamp('2023-01-06'), [0])
+        first_session = df[df.index < pd.Timestamp('2023-01-05 14:31', tz='UTC')]
+        np.testing.assert_allclose(
+            loaded[0, 0],
+            [first_session['open'].iloc[0], first_session['high'].max(), first_session['low'].min(),
+             first_session['close'].iloc[-1], first_session['volume'].sum()],
+            rtol=1e-6
+        )
+
+    @pytest.mark.unit
+    def test_rejects_invalid_derivations(self, source_bundle):
+        with pytest.raises(RuntimeError, match='whole multiple'):
+            ingest_bundle(source='csv', assets=[], source_bundle=SOURCE, timeframe='1m',
+                          bundle_name='test_derived_bad')
+        with pytest.raises(RuntimeError, match='not in source bundle'):
+            ingest_bundle(source='csv', assets=[], source_bundle=SOURCE, symbols=['TSLA'], timeframe='5m')
+        with pytest.raises(RuntimeError, match='not in the bundle registry'):
+            ingest_bundle(source='csv', assets=[], source_bundle='missing_1m', timeframe='5m')
@@ -0,0 +1,144 @@
+"""
+Test incremental (append-only) bundle ingestion.
+
+Ingests a CSV bundle from a truncated file, extends the file, re-ingests with
+incremental=True and checks the new version against the full data.
+"""
+
+# Standard library imports
+import sys
+import time
+from pathlib import Path
+
+# Third-party imports
+import pytest
+import pandas as pd
+import numpy as np
+
+# Local imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from lib.bundles import ingest_bundle, load_bundle_registry, load_previous_ingestion, unregister_bundle
+from lib.bundles import registry as bundle_registry
+from lib.bundles.csv import cache as csv_cache
+from lib.bundles.csv import registration as csv_registration
+
+BUNDLE = 'test_incremental_csv'
+
+
+@pytest.fixture
+def isolated_bundles(tmp_path, monkeypatch):
+    """Redirect Zipline data, the bundle registry, CSV inputs and the CSV cache into tmp_path."""
+    monkeypatch.setenv('ZIPLINE_ROOT', str(tmp_path / 'zipline'))
+    monkeypatch.setattr(bundle_registry, 'get_bundle_registry_path', lambda: tmp_path / 'registry.json')
+    monkeypatch.setattr(csv_registration, 'get_project_root', lambda: tmp_path)
+    monkeypatch.setattr(csv_cache, 'get_csv_cache_dir', lambda: tmp_path / 'csv_cache')
+    yield tmp_path
+    unregister_bundle(BUNDLE)
+
+
+def _bars(index: pd.DatetimeIndex, seed: int = 0) -> pd.DataFrame:
+    """Synthetic OHLCV bars on the given index."""
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.1, len(index)))
+    return pd.DataFrame({
+        'Open': close,
+        'High': close + 0.5,
+        'Low': close - 0.5,
+        'Close': close,
+        'Volume': rng.integers(100, 1_000, len(index)).astype(float),
+    }, index=pd.Index(index, name='Date'))
+
+
+def _write_csv(root: Path, timeframe: str, df: pd.DataFrame) -> None:
+    """(Re)write the single AAPL CSV for timeframe, bumping its mtime."""
+    data_dir = root / 'data' / 'processed' / timeframe
+    data_dir.mkdir(parents=True, exist_ok=True)
+    for old in data_dir.glob('*.csv'):
+        old.unlink()
+    df.to_csv(data_dir / f"AAPL_{timeframe}_20230103_20230331.csv")
+    # Zipline names ingestions by timestamp; keep successive ingests distinct
+    time.sleep(0.01)
+
+
+def _ingest(timeframe: str, **kwargs) -> None:
+    ingest_bundle(
+        source='csv', assets=['equity'], bundle_name=BUNDLE, symbols=['AAPL'],
+        calendar_name='XNYS', timeframe=timeframe, start_date='2023-01-01', force=True, **kwargs
+    )
+
+
+def _load_daily(sessions: pd.DatetimeIndex) -> np.ndarray:
+    """Load daily OHLCV for sid 0 over sessions from the latest ingestion."""
+    from zipline.data.bundles import load
+    reader = load(BUNDLE).equity_daily_bar_reader
+    arrays = reader.load_raw_arrays(
+        ['open', 'high', 'low', 'close', 'volume'],
+        sessions[0].tz_localize(None), sessions[-1].tz_localize(None), [0]
+    )
+    return np.column_stack([a[:, 0] for a in arrays])
+
+
+class TestIncrementalIngestion:
+    """Tests for ingest_bundle(incremental=True) on CSV bundles."""
+
+    @pytest.mark.unit
+    def test_daily_append_matches_full_data(self, isolated_bundles):
+        """Appending new sessions yields the same bars as the full file and records coverage."""
+        from zipline.utils.calendar_utils import get_calendar
+        sessions = get_calendar('XNYS').sessions_in_range('2023-01-03', '2023-03-31').tz_localize('UTC')
+        full = _bars(sessions)
+
+        _write_csv(isolated_bundles, 'daily', full.iloc[:40])
+        _ingest('daily')
+        _write_csv(isolated_bundles, 'daily', full)
+        _ingest('daily', incremental=True)
+
+        loaded = _load_daily(sessions)
+        np.testing.assert_allclose(loaded[:, 3], full['Close'].round(3).to_numpy())
+        np.testing.assert_allclose(loaded[:, 4], full['Volume'].to_numpy())
+
+        entry = load_bundle_registry()[BUNDLE]
+        assert entry['coverage']['AAPL'] == {'start': '2023-01-03', 'end': '2023-03-31'}
+        assert entry['last_ingest']['incremental'] is True
+
+    @pytest.mark.unit
+    def test_minute_append_continues_partial_session(self, isolated_bundles):
+        """Minute ctables are extended in place of a rewrite, including a partially ingested session."""
+        from zipline.data.bundles import load
+        from zipline.utils.calendar_utils import get_calendar
+        calendar = get_calendar('XNYS')
+        minutes = calendar.minutes_in_range(
+            calendar.session_first_minute('2023-01-03'), calendar.session_last_minute('2023-01-06')
+        )
+        full = _bars(minutes)
+
+        # Cut mid-session so the last ingested session is partial
+        _write_csv(isolated_bundles, '1m', full.iloc[:500])
+        _ingest('1m')
+        previous = load_previous_ingestion(BUNDLE, ['AAPL'], 'minute')
+        assert previous.resume_from(0) == minutes[500]
+
+        _write_csv(isolated_bundles, '1m', full)
+        _ingest('1m', incremental=True)
+
+        minute_reader = load(BUNDLE).equity_minute_bar_reader
+        close = minute_reader.load_raw_arrays(['close'], minutes[0], minutes[-1], [0])[0][:, 0]
+        np.testing.assert_allclose(close, full['Close'].round(3).to_numpy())
+
+        expected_daily = full.rename(columns=str.lower).groupby(full.index.normalize()).agg({
+            'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum',
+        })
+        np.testing.assert_allclose(_load_daily(expected_daily.index), expected_daily.round(3).to_numpy())
+
+    @pytest.mark.unit
+    def test_changed_symbol_order_falls_back_to_full_ingest(self, isolated_bundles):
+        """A previous ingestion with different sids is not reused."""
+        from zipline.utils.calendar_utils import get_calendar
+        sessions = get_calendar('XNYS').sessions_in_range('2023-01-03', '2023-01-31').tz_localize('UTC')
+        _write_csv(isolated_bundles, 'daily', _bars(sessions))
+        _ingest('daily')
+
+        assert load_previous_ingestion(BUNDLE, ['AAPL'], 'daily') is not None
+        assert load_previous_ingestion(BUNDLE, ['MSFT', 'AAPL'], 'daily') is None
@@ -0,0 +1,104 @@
+"""
+Test the streaming stage pipeline used by bundle ingestion.
+"""
+
+# Standard library imports
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Third-party imports
+import pytest
+
+# Local imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from lib.bundles.pipeline import Stage, run_pipeline
+
+
+class TestRunPipeline:
+    """Tests for run_pipeline()."""
+
+    @pytest.mark.unit
+    def test_preserves_input_order(self):
+        """Results come out in input order even when workers finish out of order."""
+        def slow_square(x):
+            time.sleep(random.random() * 0.01)
+            return x * x
+
+        stages = [Stage(slow_square, workers=4), Stage(lambda x: x + 1, workers=2)]
+        assert list(run_pipeline(range(40), stages, max_in_flight=8)) == [x * x + 1 for x in range(40)]
+
+    @pytest.mark.unit
+    def test_no_stages(self):
+        assert list(run_pipeline(iter('abc'), [])) == ['a', 'b', 'c']
+
+    @pytest.mark.unit
+    def test_errors_become_results(self):
+        """A failing item is yielded as its exception and skips later stages."""
+        calls = []
+
+        def check(x):
+            if x == 2:
+                raise ValueError('bad item')
+            return x
+
+        def record(x):
+            calls.append(x)
+            return x
+
+        results = list(run_pipeline(range(4), [Stage(check, workers=2), Stage(record)]))
+        assert results[:2] == [0, 1] and results[3] == 3
+        assert isinstance(results[2], ValueError)
+        assert sorted(calls) == [0, 1, 3]
+
+    @pytest.mark.unit
+    def test_backpressure_bounds_items_in_flight(self):
+        """The source is not read further ahead than max_in_flight items."""
+        admitted = []
+        lock = threading.Lock()
+        peak = [0]
+
+        def source():
+            for i in range(30):
+                with lock:
+                    admitted.append(i)
+                yield i
+
+        results = run_pipeline(source(), [Stage(lambda x: x, workers=4)], max_in_flight=3)
+        for consumed, _ in enumerate(results, start=1):
+            time.sleep(0.002)  # slow consumer, like a bar writer
+            with lock:
+                peak[0] = max(peak[0], len(admitted) - consumed)
+        # Read ahead never exceeds the bound, plus one item pulled from the source waiting for a slot
+        assert peak[0] <= 4
+
+    @pytest.mark.unit
+    def test_source_error_is_raised(self):
+        def source():
+            yield 1
+            raise KeyError('source broke')
+
+        results = run_pipeline(source(), [Stage(lambda x: x)])
+        assert next(results) == 1
+        with pytest.raises(KeyError):
+            next(results)
+
+    @pytest.mark.unit
+    def test_early_close_stops_source(self):
+        """Closing the consumer stops reading the source."""
+        read = []
+
+        def source():
+            for i in range(1000):
+                read.append(i)
+                yield i
+
+        results = run_pipeline(source(), [Stage(lambda x: x)], max_in_flight=2)
+        assert next(results) == 0
+        results.close()
+        time.sleep(0.3)
+        assert len(read) < 10
@@ -20,7 +20,9 @@ sys.path.insert(0, str(project_root))
 from lib.bundles import (
     load_bundle_registry,
     save_bundle_registry,
+    locked_bundle_registry,
     register_bundle_metadata,
+    update_bundle_coverage,
     list_bundles,
     get_bundle_symbols,
     load_bundle,
@@ -199,3 +201,81 @@ class TestBundleIntegrity:
                 # Bundle doesn't exist or failed to load - skip this bundle
                 continue
 
+
+
+def _register_many(worker: int, count: int) -> None:
+    """Register `count` bundles from one worker process."""
+    for i in range(count):
+        register_bundle_metadata(f"w{worker}_b{i}", ['AAA'], 'XNYS', '2024-01-02', '2024-01-31')
+        update_bundle_coverage(f"w{worker}_b{i}", {'AAA': ('2024-01-02', '2024-01-31')})
+
+
+class TestConcurrentRegistryUpdates:
+    """Tests for registry updates from several processes at once."""
+
+    @pytest.mark.unit
+    def test_concurrent_writers_keep_every_entry(self, tmp_path, monkeypatch):
+        """Workers registering different bundles do not drop each other's entries."""
+        import multiprocessing
+
+        monkeypatch.setenv('HOME', str(tmp_path))
+        context = multiprocessing.get_context('fork')
+        workers = [context.Process(target=_register_many, args=(w, 15)) for w in range(4)]
+        for process in workers:
+            process.start()
+        for process in workers:
+            process.join(timeout=60)
+            assert process.exitcode == 0
+
+        registry = load_bundle_registry()
+        assert len(registry) == 60
+        assert all(entry['coverage'] == {'AAA': {'start': '2024-01-02', 'end': '2024-01-31'}}
+                   for entry in registry.values())
+        assert not list((tmp_path / '.zipline').glob('*.tmp'))
+
+    @pytest.mark.unit
+    def test_unreadable_registry_is_kept_aside(self, tmp_path, monkeypatch):
+        """An update never overwrites a registry it could not parse."""
+        monkeypatch.setenv('HOME', str(tmp_path))
+        registry_path = tmp_path / '.zipline' / 'bundle_registry.json'
+        registry_path.parent.mkdir()
+        registry_path.write_text('{"half": ')
+
+        register_bundle_metadata('fresh', ['AAA'], 'XNYS')
+
+        assert list(load_bundle_registry()) == ['fresh']
+        backups = list(registry_path.parent.glob('bundle_registry.json.corrupt-*'))
+        assert len(backups) == 1 and backups[0].read_text() == '{"half": '
+
+    @pytest.mark.unit
+    def test_reregistering_keeps_hints_and_coverage(self, tmp_path, monkeypatch):
+        """Re-ingesting a bundle keeps memory_gb and coverage."""
+        monkeypatch.setenv('HOME', str(tmp_path))
+        register_bundle_metadata('derived_1h', ['AAA'], 'XNYS', timeframe='1h', source_bundle='src_1m')
+        update_bundle_coverage('derived_1h', {'AAA': ('2024-01-02', '2024-01-31')})
+        with locked_bundle_registry() as registry:
+            registry['derived_1h']['memory_gb'] = 6.5
+
+        register_bundle_metadata('derived_1h', ['AAA', 'BBB'], 'XNYS', timeframe='1h', source_bundle='src_1m')
+
+        entry = load_bundle_registry()['derived_1h']
+        assert entry['symbols'] == ['AAA', 'BBB']
+        assert entry['memory_gb'] == 6.5
+        assert entry['source_bundle'] == 'src_1m'
+        assert entry['coverage'] == {'AAA': {'start': '2024-01-02', 'end': '2024-01-31'}}
+
+        register_bundle_metadata('derived_1h', ['AAA'], 'XNYS', timeframe='1h', memory_gb=2.0)
+        assert load_bundle_registry()['derived_1h']['memory_gb'] == 2.0
+
+    @pytest.mark.unit
+    def test_reregistering_without_source_clears_it(self, tmp_path, monkeypatch):
+        """A derived bundle re-registered from CSV/Yahoo is no longer derived."""
+        monkeypatch.setenv('HOME', str(tmp_path))
+        register_bundle_metadata('aaa_1h', ['AAA'], 'XNYS', timeframe='1h', source_bundle='src_1m')
+        update_bundle_coverage('aaa_1h', {'AAA': ('2024-01-02', '2024-01-31')})
+
+        register_bundle_metadata('aaa_1h', ['AAA'], 'XNYS', timeframe='1h')
+
+        entry = load_bundle_registry()['aaa_1h']
+        assert 'source_bundle' not in entry
+        assert entry['coverage'] == {'AAA': {'start': '2024-01-02', 'end': '2024-01-31'}}
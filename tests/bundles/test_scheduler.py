@@ -0,0 +1,178 @@
+"""
+Test the dependency-aware bundle ingestion scheduler.
+"""
+
+# Standard library imports
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Third-party imports
+import pytest
+
+# Local imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from lib.bundles.scheduler import (
+    STATUS_FAILED,
+    STATUS_SKIPPED,
+    STATUS_SUCCESS,
+    estimate_memory_gb,
+    plan_jobs,
+    run_jobs,
+    write_run_summary,
+)
+
+
+def _meta(timeframe='daily', source_bundle=None, memory_gb=None, symbols=('SPY',)):
+    meta = {
+        'symbols': list(symbols), 'timeframe': timeframe, 'calendar_name': 'XNYS',
+        'start_date': '2020-01-01', 'end_date': '2021-01-01',
+    }
+    if source_bundle:
+        meta['source_bundle'] = source_bundle
+    if memory_gb is not None:
+        meta['memory_gb'] = memory_gb
+    return meta
+
+
+def failing_job(name, meta):
+    """Module-level job so it can run in worker processes."""
+    if meta.get('fail'):
+        raise RuntimeError(f"{name} broke")
+    time.sleep(0.01)
+
+
+class Recorder:
+    """Job function that records concurrency and start order."""
+
+    def __init__(self, duration=0.05, fail=()):
+        self.duration = duration
+        self.fail = set(fail)
+        self.started = []
+        self.running = set()
+        self.peak = 0
+        self.peak_memory = 0.0
+        self._lock = threading.Lock()
+        self.memory = {}
+
+    def __call__(self, name, meta):
+        with self._lock:
+            self.started.append(name)
+            self.running.add(name)
+            self.peak = max(self.peak, len(self.running))
+            self.peak_memory = max(self.peak_memory, sum(self.memory.get(n, 0) for n in self.running))
+        time.sleep(self.duration)
+        with self._lock:
+            self.running.discard(name)
+        if name in self.fail:
+            raise RuntimeError(f"{name} failed")
+
+
+class TestPlanJobs:
+    """Tests for plan_jobs()."""
+
+    @pytest.mark.unit
+    def test_sources_before_derived(self):
+        jobs = plan_jobs({
+            'csv_crypto_5m': _meta('5m', source_bundle='csv_crypto_1m'),
+            'csv_crypto_1m': _meta('1m'),
+            'csv_crypto_daily': _meta('daily', source_bundle='csv_crypto_5m'),
+            'yahoo_equities_daily': _meta(),
+        })
+        names = [job.name for job in jobs]
+        assert names.index('csv_crypto_1m') < names.index('csv_crypto_5m') < names.index('csv_crypto_daily')
+        assert jobs[names.index('csv_crypto_5m')].depends_on == ['csv_crypto_1m']
+
+    @pytest.mark.unit
+    def test_source_outside_selection_is_not_a_dependency(self):
+        jobs = plan_jobs({'csv_crypto_5m': _meta('5m', source_bundle='csv_crypto_1m')})
+        assert jobs[0].depends_on == []
+
+    @pytest.mark.unit
+    def test_cycle_raises(self):
+        with pytest.raises(ValueError, match='cycle'):
+            plan_jobs({'a_x_1m': _meta(source_bundle='b_x_1m'), 'b_x_1m': _meta(source_bundle='a_x_1m')})
+
+    @pytest.mark.unit
+    def test_memory_estimate(self):
+        """Explicit hints win; minute bundles and more symbols estimate higher."""
+        assert estimate_memory_gb(_meta(memory_gb=3)) == 3.0
+        daily = estimate_memory_gb(_meta('daily'))
+        minute = estimate_memory_gb(_meta('1m'))
+        wide = estimate_memory_gb(_meta('1m', symbols=['A', 'B', 'C', 'D']))
+        assert daily < minute < wide
+
+
+class TestRunJobs:
+    """Tests for run_jobs()."""
+
+    @pytest.mark.unit
+    def test_parallel_with_job_limit(self):
+        recorder = Recorder()
+        jobs = plan_jobs({f"yahoo_equities_{i}": _meta() for i in range(6)})
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = run_jobs(jobs, recorder, max_jobs=3, executor=executor)
+        assert recorder.peak == 3
+        assert all(r.status == STATUS_SUCCESS and r.seconds > 0 for r in results)
+
+    @pytest.mark.unit
+    def test_memory_budget(self):
+        """Running hints never exceed the budget, except a single oversize job."""
+        bundles = {'big_x_1m': _meta(memory_gb=10)}
+        bundles.update({f"small_x_{i}": _meta(memory_gb=2) for i in range(4)})
+        recorder = Recorder()
+        recorder.memory = {name: meta['memory_gb'] for name, meta in bundles.items()}
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = run_jobs(plan_jobs(bundles), recorder, max_jobs=4, memory_budget_gb=5, executor=executor)
+        assert all(r.status == STATUS_SUCCESS for r in results)
+        assert recorder.peak_memory <= 10
+        assert recorder.peak == 2
+
+    @pytest.mark.unit
+    def test_failure_skips_dependents_only(self):
+        bundles = {
+            'csv_crypto_1m': _meta('1m'),
+            'csv_crypto_5m': _meta('5m', source_bundle='csv_crypto_1m'),
+            'yahoo_equities_daily': _meta(),
+        }
+        recorder = Recorder(duration=0.01, fail={'csv_crypto_1m'})
+        events = []
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = run_jobs(
+                plan_jobs(bundles), recorder, max_jobs=2, executor=executor,
+                on_event=lambda event, job, result: events.append((event, job.name))
+            )
+        status = {r.name: r.status for r in results}
+        assert status == {
+            'csv_crypto_1m': STATUS_FAILED,
+            'csv_crypto_5m': STATUS_SKIPPED,
+            'yahoo_equities_daily': STATUS_SUCCESS,
+        }
+        assert 'csv_crypto_5m' not in recorder.started
+        assert ('skip', 'csv_crypto_5m') in events
+
+    @pytest.mark.unit
+    def test_sequential_inline(self):
+        recorder = Recorder(duration=0)
+        jobs = plan_jobs({'b_x_daily': _meta(source_bundle='a_x_daily'), 'a_x_daily': _meta()})
+        run_jobs(jobs, recorder, max_jobs=1)
+        assert recorder.started == ['a_x_daily', 'b_x_daily']
+
+    @pytest.mark.unit
+    def test_worker_processes(self, tmp_path):
+        """Default executor runs each bundle in its own process and writes a summary."""
+        bundles = {'ok_x_daily': _meta(), 'bad_x_daily': dict(_meta(), fail=True)}
+        jobs = plan_jobs(bundles)
+        results = run_jobs(jobs, failing_job, max_jobs=2)
+        status = {r.name: r.status for r in results}
+        assert status == {'ok_x_daily': STATUS_SUCCESS, 'bad_x_daily': STATUS_FAILED}
+
+        summary = json.loads(write_run_summary(results, tmp_path / 'summary.json', jobs=jobs, max_jobs=2).read_text())
+        assert summary['counts'] == {'success': 1, 'failed': 1, 'skipped': 0}
+        bad = next(b for b in summary['bundles'] if b['name'] == 'bad_x_daily')
+        assert 'bad_x_daily broke' in bad['error'] and 'memory_gb' in bad
@@ -0,0 +1,251 @@
+"""
+Test the concurrent, rate-limited Yahoo fetcher and its response cache.
+
+All tests run offline: requests go to a fixture directory, an in-memory
+transport, or a local fake chart API server.
+"""
+
+# Standard library imports
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Third-party imports
+import pytest
+import pandas as pd
+import numpy as np
+
+# Local imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from lib.bundles import cache as api_cache
+from lib.bundles.yahoo import (
+    ChartApiTransport,
+    FixtureTransport,
+    TokenBucket,
+    TransientFetchError,
+    YahooTransport,
+    fetch_symbols,
+    fetch_yahoo_data,
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Redirect the API response cache into tmp_path."""
+    monkeypatch.setattr(api_cache, 'get_api_cache_dir', lambda source: tmp_path / 'api' / source)
+    return tmp_path / 'api'
+
+
+@pytest.fixture
+def fast_limiter():
+    """A limiter that never throttles, so tests don't wait."""
+    return TokenBucket(rate=1e6, capacity=1e6)
+
+
+def _bars(start: str, periods: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, periods))
+    index = pd.date_range(start, periods=periods, freq='D', tz='UTC', name='Date')
+    return pd.DataFrame({
+        'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close,
+        'Volume': rng.integers(1_000, 10_000, periods).astype(float),
+    }, index=index)
+
+
+class CountingTransport(YahooTransport):
+    """Serves fixed frames, failing the first `failures` calls per symbol."""
+
+    def __init__(self, frames, failures=0):
+        self.frames = frames
+        self.failures = failures
+        self.calls = {}
+        self._lock = threading.Lock()
+
+    def history(self, symbol, start_date, end_date, interval):
+        with self._lock:
+            self.calls[symbol] = self.calls.get(symbol, 0) + 1
+            attempt = self.calls[symbol]
+        if attempt <= self.failures:
+            raise TransientFetchError(f"{symbol}: HTTP 429")
+        return self.frames.get(symbol, pd.DataFrame())
+
+
+class TestTokenBucket:
+    """Tests for the token-bucket rate limiter."""
+
+    @pytest.mark.unit
+    def test_burst_then_throttle(self):
+        """Up to capacity requests pass at once; the rest are paced at rate."""
+        bucket = TokenBucket(rate=50, capacity=2)
+        start = time.monotonic()
+        for _ in range(6):
+            bucket.acquire()
+        elapsed = time.monotonic() - start
+        # 2 free tokens, then 4 more at 50/s = 0.08s
+        assert 0.06 <= elapsed < 1.0
+
+    @pytest.mark.unit
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestFetchYahooData:
+    """Tests for fetch_yahoo_data() retries and caching."""
+
+    @pytest.mark.unit
+    def test_retries_transient_errors(self, cache_dir, fast_limiter):
+        """Transient errors are retried until the request succeeds."""
+        transport = CountingTransport({'SPY': _bars('2024-01-01', 5)}, failures=2)
+        df = fetch_yahoo_data(
+            'SPY', '2024-01-01', '2024-01-06', '1d', transport=transport,
+            rate_limiter=fast_limiter, use_cache=False, retries=3, backoff_seconds=0.001
+        )
+        assert len(df) == 5
+        assert transport.calls['SPY'] == 3
+
+    @pytest.mark.unit
+    def test_gives_up_after_retries(self, cache_dir, fast_limiter):
+        transport = CountingTransport({'SPY': _bars('2024-01-01', 5)}, failures=10)
+        with pytest.raises(ValueError, match='Failed to fetch data for SPY'):
+            fetch_yahoo_data(
+                'SPY', '2024-01-01', '2024-01-06', '1d', transport=transport,
+                rate_limiter=fast_limiter, use_cache=False, retries=2, backoff_seconds=0.001
+            )
+        assert transport.calls['SPY'] == 3
+
+    @pytest.mark.unit
+    def test_cache_hit_expiry_and_refresh(self, cache_dir, fast_limiter, monkeypatch):
+        """Responses are reused within the TTL and refetched after it or on refresh."""
+        monkeypatch.setattr(api_cache, 'get_cache_settings', lambda: {'enabled': True, 'ttl_hours': 1.0})
+        transport = CountingTransport({'SPY': _bars('2024-01-01', 5)})
+        kwargs = dict(transport=transport, rate_limiter=fast_limiter, use_cache=True)
+
+        first = fetch_yahoo_data('SPY', '2024-01-01', '2024-01-06', '1d', **kwargs)
+        second = fetch_yahoo_data('SPY', '2024-01-01', '2024-01-06', '1d', **kwargs)
+        assert transport.calls['SPY'] == 1
+        pd.testing.assert_frame_equal(first, second, check_freq=False)
+
+        # A different range is a different cache entry
+        fetch_yahoo_data('SPY', '2024-01-02', '2024-01-06', '1d', **kwargs)
+        assert transport.calls['SPY'] == 2
+
+        fetch_yahoo_data('SPY', '2024-01-01', '2024-01-06', '1d', refresh_cache=True, **kwargs)
+        assert transport.calls['SPY'] == 3
+
+        # Age every entry past the TTL
+        for path in cache_dir.rglob('*.parquet'):
+            old = time.time() - 2 * 3600
+            os.utime(path, (old, old))
+        fetch_yahoo_data('SPY', '2024-01-01', '2024-01-06', '1d', **kwargs)
+        assert transport.calls['SPY'] == 4
+
+        assert api_cache.clear_cache('yahoo', symbol='SPY') == 2
+        assert not list(cache_dir.rglob('*.parquet'))
+
+
+class TestFetchSymbols:
+    """Tests for concurrent multi-symbol fetching."""
+
+    @pytest.mark.unit
+    def test_fixture_transport_concurrent(self, tmp_path, cache_dir, fast_limiter):
+        """Fetching from a fixture directory slices [start, end) and reports failures per symbol."""
+        fixtures = tmp_path / 'fixtures'
+        fixtures.mkdir()
+        frames = {symbol: _bars('2024-01-01', 30, seed=i) for i, symbol in enumerate(['SPY', 'QQQ', 'IWM'])}
+        for symbol, df in frames.items():
+            df.to_csv(fixtures / f"{symbol}_1d.csv")
+
+        results = fetch_symbols(
+            [(symbol, '2024-01-05', '2024-01-15') for symbol in [*frames, 'MISSING']],
+            '1d', max_workers=4, transport=FixtureTransport(fixtures),
+            rate_limiter=fast_limiter, use_cache=False
+        )
+
+        for symbol, df in frames.items():
+            expected = df.loc['2024-01-05':'2024-01-14']
+            np.testing.assert_allclose(results[symbol]['Close'].to_numpy(), expected['Close'].to_numpy())
+        assert isinstance(results['MISSING'], ValueError)
+
+    @pytest.mark.unit
+    def test_shared_rate_limit(self, cache_dir):
+        """Concurrent workers draw from one bucket, so total rate stays bounded."""
+        transport = CountingTransport({f"S{i}": _bars('2024-01-01', 3) for i in range(6)})
+        start = time.monotonic()
+        fetch_symbols(
+            [(f"S{i}", None, None) for i in range(6)], '1d', max_workers=6,
+            transport=transport, rate_limiter=TokenBucket(rate=40, capacity=1), use_cache=False
+        )
+        # 1 immediate + 5 at 40/s >= 0.125s, even with 6 workers
+        assert time.monotonic() - start >= 0.1
+
+
+class _FakeChartHandler(BaseHTTPRequestHandler):
+    """Minimal Yahoo v8 chart endpoint: first request per symbol gets a 429."""
+
+    seen = set()
+
+    def do_GET(self):
+        symbol = self.path.split('/v8/finance/chart/')[1].split('?')[0]
+        if symbol == 'NOPE':
+            self.send_response(404)
+            self.end_headers()
+            return
+        if symbol not in self.seen:
+            self.seen.add(symbol)
+            self.send_response(429)
+            self.end_headers()
+            return
+        timestamps = [1704205800, 1704292200, 1704378600]
+        payload = {'chart': {'error': None, 'result': [{
+            'meta': {'exchangeTimezoneName': 'America/New_York'},
+            'timestamp': timestamps,
+            'indicators': {'quote': [{
+                'open': [1.0, 2.0, 3.0], 'high': [1.5, 2.5, 3.5], 'low': [0.5, 1.5, None],
+                'close': [1.2, 2.2, 3.2], 'volume': [100, 200, 300],
+            }]},
+        }]}}
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestChartApiTransport:
+    """Tests for the HTTP chart API transport against a local fake server."""
+
+    @pytest.fixture
+    def server_url(self):
+        _FakeChartHandler.seen = set()
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _FakeChartHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+        server.shutdown()
+        server.server_close()
+
+    @pytest.mark.unit
+    def test_fetch_through_fake_server(self, server_url, cache_dir, fast_limiter):
+        """429s are retried and the JSON payload becomes a yfinance-shaped frame."""
+        results = fetch_symbols(
+            [('SPY', '2024-01-01', '2024-01-05'), ('NOPE', '2024-01-01', '2024-01-05')], '1d',
+            max_workers=2, transport=ChartApiTransport(server_url, timeout=5),
+            rate_limiter=fast_limiter, use_cache=False, retries=2, backoff_seconds=0.001
+        )
+        spy = results['SPY']
+        assert list(spy.columns) == ['Open', 'High', 'Low', 'Close', 'Volume']
+        assert str(spy.index.tz) == 'America/New_York'
+        assert spy.index[0] == pd.Timestamp('2024-01-02 09:30', tz='America/New_York')
+        np.testing.assert_allclose(spy['Close'].to_numpy(), [1.2, 2.2, 3.2])
+        assert isinstance(results['NOPE'], ValueError)
@@ -0,0 +1,184 @@
+"""
+Tests for OHLCV aggregation.
+
+Tests for:
+- aggregate_ohlcv()
+- aggregate_ohlcv_by_session()
+- create_multi_timeframe_data()
+"""
+
+# Standard library imports
+import sys
+from pathlib import Path
+
+# Third-party imports
+import pytest
+import numpy as np
+import pandas as pd
+
+# Local imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from lib.calendars import register_custom_calendars
+from lib.data.aggregation import (
+    OHLCV_AGG_RULES,
+    TIMEFRAME_MAP,
+    aggregate_ohlcv,
+    aggregate_ohlcv_by_session,
+    create_multi_timeframe_data,
+    resample_to_timeframe,
+)
+
+
+def _resample_reference(df: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+    """resample().agg().dropna(), the behaviour aggregate_ohlcv() must keep."""
+    freq = TIMEFRAME_MAP.get(timeframe, timeframe)
+    return df[list(OHLCV_AGG_RULES)].resample(freq).agg(OHLCV_AGG_RULES).dropna()
+
+
+def _minute_bars(start: str, periods: int, seed: int = 0, drop: float = 0.3) -> pd.DataFrame:
+    """Random-walk 1m bars with a fraction of minutes missing."""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(start, periods=periods, freq='1min', tz='UTC')
+    index = index[rng.random(periods) > drop]
+    close = 100 + np.cumsum(rng.normal(0, 0.1, len(index)))
+    return pd.DataFrame({
+        'open': close + rng.normal(0, 0.05, len(index)),
+        'high': close + 0.5,
+        'low': close - 0.5,
+        'close': close,
+        'volume': rng.integers(1, 1_000, len(index)),
+    }, index=index)
+
+
+@pytest.fixture(scope='module')
+def calendars():
+    from zipline.utils.calendar_utils import get_calendar
+    register_custom_calendars(calendars=['CRYPTO', 'FOREX'])
+    return {name: get_calendar(name) for name in ('XNYS', 'CRYPTO', 'FOREX')}
+
+
+class TestAggregateOhlcv:
+    """Tests for aggregate_ohlcv()."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize('timeframe', ['5m', '15m', '1h', '4h', 'daily', 'weekly'])
+    def test_matches_resample(self, timeframe):
+        df = _minute_bars('2024-01-01', 20_000)
+        result = aggregate_ohlcv(df, timeframe)
+        pd.testing.assert_frame_equal(result, _resample_reference(df, timeframe), check_freq=False)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize('variant', ['naive', 'new_york', 'unsorted', 'nan', 'float_volume'])
+    def test_matches_resample_edge_cases(self, variant):
+        df = _minute_bars('2024-03-08', 5_000)
+        if variant == 'naive':
+            df = df.tz_localize(None)
+        elif variant == 'new_york':
+            df = df.tz_convert('America/New_York')
+        elif variant == 'unsorted':
+            df = df.sample(frac=1.0, random_state=0)
+        elif variant == 'nan':
+            df.iloc[::7, 0] = np.nan
+            df.iloc[::11, 4] = np.nan
+        else:
+            df['volume'] = df['volume'].astype(float)
+        result = aggregate_ohlcv(df, '15m')
+        pd.testing.assert_frame_equal(result, _resample_reference(df, '15m'), check_freq=False)
+
+    @pytest.mark.unit
+    def test_calendar_delegates_to_session_aggregation(self, calendars):
+        df = _minute_bars('2024-03-04', 3_000, drop=0)
+        pd.testing.assert_frame_equal(
+            aggregate_ohlcv(df, '1h', calendar=calendars['FOREX']),
+            aggregate_ohlcv_by_session(df, '1h', calendars['FOREX'])
+        )
+
+
+class TestAggregateOhlcvBySession:
+    """Tests for aggregate_ohlcv_by_session()."""
+
+    @pytest.mark.unit
+    def test_xnys_bins_start_at_the_open(self, calendars):
+        calendar = calendars['XNYS']
+        minutes = calendar.minutes_in_range(
+            calendar.session_first_minute('2024-03-04'), calendar.session_last_minute('2024-03-05')
+        )
+        df = _minute_bars('2024-01-01', 1, drop=0).reindex(minutes, method='nearest')
+        df['volume'] = 1
+        hourly = aggregate_ohlcv_by_session(df, '1h', calendar)
+        assert hourly.index[0] == pd.Timestamp('2024-03-04 14:30', tz='UTC')
+        assert hourly.index[1] == pd.Timestamp('2024-03-04 15:00', tz='UTC')
+        # 14:31-14:59 in the first bar, every later minute in clock-aligned bars
+        assert hourly['volume'].iloc[0] == 29
+        assert hourly['volume'].sum() == len(df)
+
+        daily = aggregate_ohlcv_by_session(df, 'daily', calendar)
+        assert list(daily.index) == list(pd.DatetimeIndex(['2024-03-04', '2024-03-05'], tz='UTC'))
+
+    @pytest.mark.unit
+    def test_forex_daily_follows_new_york_sessions(self, calendars):
+        """FOREX sessions start at 00:00 New York, not UTC midnight."""
+        calendar = calendars['FOREX']
+        df = _minute_bars('2024-03-05', 2 * 1440, drop=0)
+        daily = aggregate_ohlcv_by_session(df, 'daily', calendar)
+        first_session = df[df.index < calendar.session_open(pd.Timestamp('2024-03-05'))]
+        assert daily.index[0] == pd.Timestamp('2024-03-04', tz='UTC')
+        assert daily['volume'].iloc[0] == first_session['volume'].sum()
+        assert daily['open'].iloc[0] == first_session['open'].iloc[0]
+        assert daily['close'].iloc[0] == first_session['close'].iloc[-1]
+
+    @pytest.mark.unit
+    def test_crypto_matches_clock_aggregation(self, calendars):
+        """24/7 UTC-midnight sessions give the same bars as plain aggregation."""
+        df = _minute_bars('2024-03-04', 3 * 1440)
+        for timeframe in ('15m', '4h', 'daily'):
+            pd.testing.assert_frame_equal(
+                aggregate_ohlcv_by_session(df, timeframe, calendars['CRYPTO']),
+                aggregate_ohlcv(df, timeframe),
+                check_freq=False
+            )
+
+    @pytest.mark.unit
+    def test_rejects_longer_than_daily(self, calendars):
+        with pytest.raises(ValueError, match='up to daily'):
+            aggregate_ohlcv_by_session(_minute_bars('2024-03-04', 100), 'weekly', calendars['CRYPTO'])
+
+
+class TestCreateMultiTimeframeData:
+    """Tests for create_multi_timeframe_data()."""
+
+    TIMEFRAMES = ['daily', '5m', '1h', 'weekly', '15m', '4h']
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize('variant', ['int_volume', 'float_volume', 'nan', 'new_york'])
+    def test_cascade_matches_independent_resampling(self, variant):
+        df = _minute_bars('2024-01-01', 30 * 1440)
+        if variant == 'float_volume':
+            df['volume'] = df['volume'] * 0.1
+        elif variant == 'nan':
+            df.iloc[::13, 1] = np.nan
+        elif variant == 'new_york':
+            df = df.tz_convert('America/New_York')
+        result = create_multi_timeframe_data(df, '1m', self.TIMEFRAMES)
+        assert list(result) == ['1m'] + self.TIMEFRAMES
+        pd.testing.assert_frame_equal(result['1m'], df)
+        for tf in self.TIMEFRAMES:
+            pd.testing.assert_frame_equal(result[tf], resample_to_timeframe(df, '1m', tf), check_freq=False)
+
+    @pytest.mark.unit
+    def test_partially_nesting_timeframes(self):
+        """15m does not nest in 10m, so it comes from the source; 30m then cascades from 15m."""
+        df = _minute_bars('2024-01-01', 5 * 1440)
+        result = create_multi_timeframe_data(df, '5m', ['10m', '15m', '30m'])
+        for tf in ('10m', '15m', '30m'):
+            pd.testing.assert_frame_equal(result[tf], aggregate_ohlcv(df, tf), check_freq=False)
+
+    @pytest.mark.unit
+    def test_invalid_timeframes_raise(self):
+        df = _minute_bars('2024-01-01', 1440)
+        with pytest.raises(ValueError, match='downsample'):
+            create_multi_timeframe_data(df, '5m', ['1m'])
+        with pytest.raises(ValueError, match='Unknown timeframe'):
+            create_multi_timeframe_data(df, '1m', ['7m'])
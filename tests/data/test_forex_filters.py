@@ -0,0 +1,166 @@
+"""
+Tests for FOREX data filters.
+
+Tests for:
+- filter_forex_presession_bars()
+- consolidate_sunday_to_friday()
+"""
+
+# Standard library imports
+import sys
+from pathlib import Path
+
+# Third-party imports
+import pytest
+import numpy as np
+import pandas as pd
+
+# Local imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from lib.calendars import register_custom_calendars
+from lib.data.filters_forex import filter_forex_presession_bars
+from lib.data.forex import consolidate_sunday_to_friday
+
+
+@pytest.fixture(scope='module')
+def forex_calendar():
+    from zipline.utils.calendar_utils import get_calendar
+    register_custom_calendars(calendars=['FOREX'])
+    return get_calendar('FOREX')
+
+
+def _minute_bars(start: str, end: str, freq: str = '1min') -> pd.DataFrame:
+    index = pd.date_range(start, end, freq=freq, tz='UTC', inclusive='left')
+    close = 1.1 + np.arange(len(index)) * 1e-6
+    return pd.DataFrame({
+        'open': close, 'high': close, 'low': close, 'close': close, 'volume': 1.0,
+    }, index=index)
+
+
+def _presession_reference(df: pd.DataFrame, calendar_obj) -> pd.DataFrame:
+    """Per-date loop the vectorized filter replaced, kept as the parity oracle."""
+    valid_mask = pd.Series(True, index=df.index)
+    for date_ts in df.index.normalize().unique():
+        date_naive = date_ts.tz_convert(None)
+        date_bars = df.index.normalize() == date_ts
+        if date_naive not in calendar_obj.sessions:
+            valid_mask[date_bars] = False
+            continue
+        valid_mask[date_bars & (df.index < calendar_obj.session_open(date_naive))] = False
+    return df[valid_mask]
+
+
+class TestFilterForexPresessionBars:
+    """Tests for filter_forex_presession_bars()."""
+
+    @pytest.mark.unit
+    def test_matches_per_date_reference(self, forex_calendar):
+        """Same rows as the per-date loop, across weekends and a DST change."""
+        df = _minute_bars('2024-03-01', '2024-03-20', freq='7min')
+        result = filter_forex_presession_bars(df, forex_calendar)
+        expected = _presession_reference(df, forex_calendar)
+        pd.testing.assert_frame_equal(result, expected)
+        assert len(result) < len(df)
+
+    @pytest.mark.unit
+    def test_drops_bars_before_open_and_on_non_sessions(self, forex_calendar):
+        df = _minute_bars('2024-03-08', '2024-03-12', freq='1h')
+        result = filter_forex_presession_bars(df, forex_calendar)
+        # Saturday 2024-03-09 is not a session
+        assert not (result.index.normalize() == pd.Timestamp('2024-03-09', tz='UTC')).any()
+        for day, bars in result.groupby(result.index.normalize()):
+            assert bars.index[0] >= forex_calendar.session_open(day.tz_localize(None))
+
+    @pytest.mark.unit
+    def test_naive_index_is_treated_as_utc(self, forex_calendar):
+        df = _minute_bars('2024-03-04', '2024-03-06', freq='30min')
+        naive = df.tz_localize(None)
+        result = filter_forex_presession_bars(naive, forex_calendar)
+        assert result.index.equals(filter_forex_presession_bars(df, forex_calendar).index.tz_localize(None))
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize('unit', ['s', 'ms', 'us'])
+    def test_non_ns_index_matches_reference(self, forex_calendar, unit):
+        """Indexes stored in other units keep the same rows as at ns."""
+        df = _minute_bars('2024-03-01', '2024-03-20', freq='7min')
+        coarse = df.copy()
+        coarse.index = coarse.index.as_unit(unit)
+
+        result = filter_forex_presession_bars(coarse, forex_calendar)
+
+        expected = _presession_reference(df, forex_calendar)
+        assert len(result) == len(expected) > 0
+        assert result.index.as_unit('ns').equals(expected.index)
+
+    @pytest.mark.unit
+    def test_empty(self, forex_calendar):
+        df = _minute_bars('2024-03-04', '2024-03-04')
+        assert filter_forex_presession_bars(df, forex_calendar).empty
+
+
+def _sunday_reference(df: pd.DataFrame) -> pd.DataFrame:
+    """Row-by-row .loc consolidation the vectorized version replaced, kept as the parity oracle."""
+    df = df.copy()
+    if df.index.tz is not None:
+        df.index = df.index.tz_convert('UTC').tz_localize(None)
+    df.index = df.index.normalize()
+    dropped = []
+    for sunday in df.index[df.index.dayofweek == 6]:
+        friday = sunday - pd.Timedelta(days=2)
+        if friday in df.index:
+            sun, fri = df.loc[sunday], df.loc[friday]
+            df.loc[friday, 'close'] = sun['close']
+            df.loc[friday, 'high'] = max(fri['high'], sun['high'])
+            df.loc[friday, 'low'] = min(fri['low'], sun['low'])
+            df.loc[friday, 'volume'] = fri['volume'] + sun['volume']
+        dropped.append(sunday)
+    return df.drop(dropped)
+
+
+def _daily_bars(days: pd.DatetimeIndex, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.005, len(days)))
+    return pd.DataFrame({
+        'open': close + rng.normal(0, 0.002, len(days)),
+        'high': close + np.abs(rng.normal(0, 0.01, len(days))),
+        'low': close - np.abs(rng.normal(0, 0.01, len(days))),
+        'close': close,
+        'volume': rng.integers(0, 10_000, len(days)),
+    }, index=days)
+
+
+class TestConsolidateSundayToFriday:
+    """Tests for consolidate_sunday_to_friday()."""
+
+    @pytest.mark.unit
+    def test_matches_row_by_row_reference(self):
+        """Identical to the .loc loop, including Sundays whose Friday is missing."""
+        days = pd.date_range('2015-01-01', '2020-12-31', freq='D', tz='UTC')
+        days = days[days.dayofweek != 5]
+        df = _daily_bars(days)
+        # Remove a few Fridays so their Sundays are dropped unconsolidated
+        df = df.drop(df.index[(df.index.dayofweek == 4)][::7])
+        result = consolidate_sunday_to_friday(df)
+        pd.testing.assert_frame_equal(result, _sunday_reference(df))
+        assert not (result.index.dayofweek == 6).any()
+
+    @pytest.mark.unit
+    def test_combines_weekend(self):
+        index = pd.DatetimeIndex(['2024-03-07', '2024-03-08', '2024-03-10', '2024-03-11'])
+        df = pd.DataFrame({
+            'open': [1.0, 2.0, 3.0, 4.0], 'high': [1.5, 2.5, 3.5, 4.5], 'low': [0.5, 1.5, 1.0, 3.5],
+            'close': [1.2, 2.2, 3.2, 4.2], 'volume': [10, 20, 30, 40],
+        }, index=index)
+        result = consolidate_sunday_to_friday(df)
+        friday = result.loc['2024-03-08']
+        assert list(result.index) == list(index[[0, 1, 3]])
+        assert (friday['open'], friday['high'], friday['low'], friday['close'], friday['volume']) == \
+            (2.0, 3.5, 1.0, 3.2, 50)
+
+    @pytest.mark.unit
+    def test_no_sundays_unchanged(self):
+        days = pd.bdate_range('2024-01-01', '2024-02-01')
+        df = _daily_bars(days)
+        pd.testing.assert_frame_equal(consolidate_sunday_to_friday(df), df)
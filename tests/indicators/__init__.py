@@ -0,0 +1,8 @@
+"""
+Tests for lib/indicators/ package.
+
+This directory contains tests for:
+- Streaming indicator updates
+- Batch compute() twins
+- Parity with the reference pandas formulas
+"""
@@ -0,0 +1,177 @@
+"""
+Tests for lib.indicators package.
+
+Every indicator is checked three ways on the same data: the streaming
+update() sequence, the batch compute() twin and the reference pandas
+formula from its docstring must agree bar for bar.
+"""
+
+import sys
+from pathlib import Path
+import pytest
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from lib.indicators import SMA, EMA, RSI, ATR, BollingerBands, Volatility, RollingMoments, true_range
+
+
+@pytest.fixture
+def ohlc():
+    """Random-walk OHLC bars with flat stretches (zero changes)."""
+    rng = np.random.default_rng(42)
+    n = 2000
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    close[500:520] = close[499]
+    spread = np.abs(rng.normal(0, 0.005, n)) * close
+    high = np.maximum(close, np.roll(close, 1)) + spread
+    low = np.minimum(close, np.roll(close, 1)) - spread
+    return pd.DataFrame({'high': high, 'low': low, 'close': close})
+
+
+def _stream(indicator, *arrays):
+    """Feed arrays bar by bar and collect every returned value."""
+    return np.array([indicator.update(*bar) for bar in zip(*arrays)], dtype=float)
+
+
+def _reference(name, df, **params):
+    """Reference pandas formulas for each indicator."""
+    close = df['close']
+    if name == 'sma':
+        return close.rolling(params['period']).mean()
+    if name == 'ema':
+        return close.ewm(span=params['span'], adjust=False, min_periods=params['span']).mean()
+    if name == 'rsi':
+        period = params['period']
+        delta = close.diff()
+        gain = delta.clip(lower=0).ewm(alpha=1 / period, adjust=False, min_periods=period).mean()
+        loss = (-delta.clip(upper=0)).ewm(alpha=1 / period, adjust=False, min_periods=period).mean()
+        return 100 - 100 / (1 + gain / loss)
+    if name == 'atr':
+        period = params['period']
+        prev_close = close.shift(1)
+        tr = pd.concat(
+            [df['high'] - df['low'], (df['high'] - prev_close).abs(), (df['low'] - prev_close).abs()], axis=1
+        ).max(axis=1)
+        return tr.ewm(alpha=1 / period, adjust=False, min_periods=period).mean()
+    if name == 'volatility':
+        return close.pct_change().rolling(params['period']).std() * np.sqrt(params.get('annualization') or 1)
+    raise ValueError(name)
+
+
+SINGLE_OUTPUT_CASES = [
+    (SMA, 'sma', {'period': 20}),
+    (SMA, 'sma', {'period': 1}),
+    (EMA, 'ema', {'span': 12}),
+    (RSI, 'rsi', {'period': 14}),
+    (ATR, 'atr', {'period': 14}),
+    (Volatility, 'volatility', {'period': 20}),
+    (Volatility, 'volatility', {'period': 20, 'annualization': 252}),
+]
+
+
+class TestParityWithPandas:
+    """Streaming, batch and pandas reference agree."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize('cls,name,params', SINGLE_OUTPUT_CASES)
+    def test_single_output_indicators(self, ohlc, cls, name, params):
+        inputs = [ohlc['high'], ohlc['low'], ohlc['close']] if cls.n_inputs == 3 else [ohlc['close']]
+        expected = _reference(name, ohlc, **params).to_numpy()
+
+        streamed = _stream(cls(**params), *inputs)
+        batch = cls.compute(*inputs, **params)
+
+        np.testing.assert_allclose(streamed, expected, rtol=1e-9, atol=1e-12, equal_nan=True)
+        np.testing.assert_allclose(batch, expected, rtol=1e-9, atol=1e-12, equal_nan=True)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize('ddof', [0, 1])
+    def test_bollinger_bands(self, ohlc, ddof):
+        close = ohlc['close']
+        middle = close.rolling(20).mean()
+        std = close.rolling(20).std(ddof=ddof)
+        expected = np.column_stack((middle, middle + 2.5 * std, middle - 2.5 * std))
+
+        indicator = BollingerBands(20, 2.5, ddof)
+        streamed = np.array([indicator.update(x) for x in close])
+        batch = BollingerBands.compute(close, period=20, num_std=2.5, ddof=ddof)
+
+        np.testing.assert_allclose(streamed, expected, rtol=1e-9, atol=1e-12, equal_nan=True)
+        np.testing.assert_allclose(batch, expected, rtol=1e-9, atol=1e-12, equal_nan=True)
+
+    @pytest.mark.unit
+    def test_true_range(self, ohlc):
+        expected = _reference('atr', ohlc, period=1).to_numpy()
+        np.testing.assert_allclose(true_range(ohlc['high'], ohlc['low'], ohlc['close']), expected)
+
+
+class TestConventions:
+    """Warmup, NaN skipping and state handling."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize('indicator,warmup', [
+        (SMA(5), 5), (EMA(5), 5), (RSI(5), 6), (ATR(5), 5), (BollingerBands(5), 5), (Volatility(5), 6),
+    ])
+    def test_ready_after_warmup(self, ohlc, indicator, warmup):
+        bars = ohlc.to_numpy() if indicator.n_inputs == 3 else ohlc[['close']].to_numpy()
+        for i, bar in enumerate(bars[:warmup + 1], start=1):
+            value = np.atleast_1d(indicator.update(*bar))
+            assert indicator.ready == (i >= warmup)
+            assert np.isnan(value).all() != indicator.ready
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize('cls,params', [
+        (SMA, {'period': 10}), (EMA, {'span': 10}), (RSI, {'period': 10}),
+        (Volatility, {'period': 10}), (BollingerBands, {'period': 10}),
+    ])
+    def test_nan_bars_are_skipped(self, ohlc, cls, params):
+        close = ohlc['close'].to_numpy().copy()
+        close[[0, 3, 50, 51, 52, 700]] = np.nan
+        valid = ~np.isnan(close)
+
+        indicator = cls(**params)
+        streamed = np.array([indicator.update(x) for x in close])
+        batch = cls.compute(close, **params)
+        on_valid = cls.compute(close[valid], **params)
+
+        np.testing.assert_allclose(streamed, batch, rtol=1e-9, equal_nan=True)
+        np.testing.assert_allclose(batch[valid], on_valid, rtol=1e-9, equal_nan=True)
+        # A skipped bar repeats the previous value
+        np.testing.assert_array_equal(batch[51], batch[49])
+
+    @pytest.mark.unit
+    def test_reset_and_warm_up(self, ohlc):
+        close = ohlc['close'].to_numpy()
+        rsi = RSI(14)
+        rsi.warm_up(close[:100])
+        first = rsi.value
+        rsi.reset()
+        assert rsi.count == 0 and np.isnan(rsi.value)
+        assert rsi.warm_up(close[:100]) == first == RSI.compute(close[:100], period=14)[-1]
+
+    @pytest.mark.unit
+    def test_compute_checks_inputs(self, ohlc):
+        with pytest.raises(ValueError, match="takes 3 array"):
+            ATR.compute(ohlc['close'], period=14)
+        with pytest.raises(ValueError, match="period must be an integer >= 1"):
+            SMA(0)
+        with pytest.raises(ValueError, match="period must be an integer >= 2"):
+            Volatility(1)
+
+
+class TestRollingMoments:
+    """Sliding mean and variance stay exact over long streams."""
+
+    @pytest.mark.unit
+    def test_no_drift_over_long_stream(self):
+        rng = np.random.default_rng(1)
+        values = 1e6 + rng.normal(0, 1, 50_000)
+        moments = RollingMoments(30)
+        for x in values:
+            moments.add(x)
+        np.testing.assert_allclose(moments.mean, values[-30:].mean(), rtol=1e-12)
+        np.testing.assert_allclose(moments.std(ddof=1), values[-30:].std(ddof=1), rtol=1e-6)
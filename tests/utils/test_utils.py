@@ -6,6 +6,7 @@ Tests for utility functions.
 
 # Standard library imports
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Third-party imports
@@ -17,7 +18,7 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from lib.data.normalization import normalize_to_utc
-from lib.utils import get_project_root
+from lib.utils import get_project_root, timestamp_dir, update_symlink
 
 
 class TestUtilityFunctions:
@@ -38,3 +39,29 @@ class TestUtilityFunctions:
         assert root is not None
         assert root.exists()
 
+
+
+class TestRunDirectories:
+    """Test run directory creation and latest symlink updates."""
+
+    @pytest.mark.unit
+    def test_timestamp_dir_unique_under_concurrency(self, tmp_path):
+        """Parallel runs in the same second get distinct directories."""
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            dirs = list(pool.map(lambda _: timestamp_dir(tmp_path, 'backtest'), range(32)))
+
+        assert len(set(dirs)) == 32
+        assert all(d.is_dir() and d.name.startswith('backtest_') for d in dirs)
+
+    @pytest.mark.unit
+    def test_update_symlink_replaces_existing_link(self, tmp_path):
+        """Updating a symlink repoints it and leaves no temporary links."""
+        first = timestamp_dir(tmp_path, 'backtest')
+        second = timestamp_dir(tmp_path, 'backtest')
+        link = tmp_path / 'latest'
+
+        update_symlink(first, link)
+        update_symlink(second, link)
+
+        assert link.resolve() == second.resolve()
+        assert [p.name for p in tmp_path.iterdir() if p.is_symlink()] == ['latest']
@@ -0,0 +1,328 @@
+"""
+Test asset-specific validators.
+
+Parity tests for the vectorized asset checks, using the per-row loops they
+replaced as oracles.
+"""
+
+# Standard library imports
+import sys
+from pathlib import Path
+
+# Third-party imports
+import pytest
+import numpy as np
+import pandas as pd
+
+# Local imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from lib.validation import ValidationConfig
+from lib.validation.column_mapping import build_column_mapping
+from lib.validation.utils import calculate_z_scores, ensure_timezone
+from lib.validation.validators import CryptoValidator, EquityValidator, ForexValidator
+
+
+def _hourly_bars(start: str, end: str, seed: int = 7) -> pd.DataFrame:
+    index = pd.date_range(start, end, freq='1h', tz='UTC', inclusive='left')
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 1e-3, len(index)))
+    return pd.DataFrame({
+        'open': close, 'high': close + 1e-3, 'low': close - 1e-3, 'close': close, 'volume': 1.0,
+    }, index=index)
+
+
+def _weekend_gap_reference(df: pd.DataFrame, col_map) -> dict:
+    """Per-date loop the vectorized weekend-gap check replaced, kept as the parity oracle."""
+    df_index_norm = ensure_timezone(pd.DatetimeIndex(df.index)).normalize()
+    close_col = col_map.close
+    fridays = df_index_norm[df_index_norm.dayofweek == 4]
+    sundays = df_index_norm[df_index_norm.dayofweek == 6]
+    mondays = df_index_norm[df_index_norm.dayofweek == 0]
+    issues = []
+    details = {'friday_count': len(fridays), 'sunday_count': len(sundays), 'monday_count': len(mondays)}
+    for sunday_date in sundays:
+        friday_date = sunday_date - pd.Timedelta(days=2)
+        if friday_date in fridays:
+            issues.append(
+                f"Both Friday {friday_date.date()} and Sunday {sunday_date.date()} "
+                f"bars exist (potential duplication)"
+            )
+    for sunday_date in sundays:
+        monday_date = sunday_date + pd.Timedelta(days=1)
+        if monday_date in mondays and col_map.open:
+            sunday_close = df.loc[df_index_norm == sunday_date, close_col].iloc[0]
+            monday_open = df.loc[df_index_norm == monday_date, col_map.open].iloc[0]
+            if pd.notna(sunday_close) and pd.notna(monday_open):
+                gap_pct = abs((monday_open - sunday_close) / sunday_close * 100) if sunday_close != 0 else 0
+                if gap_pct < 0.01:
+                    issues.append(
+                        f"Sunday {sunday_date.date()} to Monday {monday_date.date()} "
+                        f"gap is very small ({gap_pct:.4f}%), may indicate missing weekend data"
+                    )
+    for friday_date in fridays:
+        monday_date = friday_date + pd.Timedelta(days=3)
+        sunday_date = friday_date + pd.Timedelta(days=2)
+        if monday_date in mondays and sunday_date not in sundays and col_map.open:
+            friday_close = df.loc[df_index_norm == friday_date, close_col].iloc[0]
+            monday_open = df.loc[df_index_norm == monday_date, col_map.open].iloc[0]
+            if pd.notna(friday_close) and pd.notna(monday_open):
+                gap_pct = abs((monday_open - friday_close) / friday_close * 100) if friday_close != 0 else 0
+                if gap_pct > 10:
+                    issues.append(
+                        f"Large gap ({gap_pct:.2f}%) from Friday {friday_date.date()} "
+                        f"to Monday {monday_date.date()} (no Sunday bar found)"
+                    )
+    return {'issue_count': len(issues), 'details': {**details, **({'issues': issues[:5]} if issues else {})}}
+
+
+def _run_weekend_gap(df: pd.DataFrame):
+    validator = ForexValidator(ValidationConfig.for_forex('1h'))
+    result = validator.validate(df, build_column_mapping(df), 'EURUSD')
+    return result.get_check('weekend_gap_integrity')
+
+
+_SPLIT_RATIOS = [
+    (0.25, 0.28, "5:4"), (0.33, 0.36, "3:2"), (0.50, 0.55, "2:1"), (0.667, 0.70, "3:1"),
+    (0.75, 0.78, "4:1"), (1.00, 1.10, "1:2 reverse"), (2.00, 2.20, "1:3 reverse"),
+]
+
+
+def _potential_splits_reference(df: pd.DataFrame, threshold: float, use_volume: bool = True) -> list:
+    """Per-candidate loop the vectorized split detection replaced, kept as the parity oracle."""
+    price_changes = df['close'].pct_change().dropna()
+    volume_z_scores = calculate_z_scores(df['volume']) if use_volume else None
+    potential_splits = []
+    for date, pct_change in price_changes.items():
+        if pct_change < 0:
+            bands, magnitude = _SPLIT_RATIOS[:5], abs(pct_change)
+        elif pct_change > 0:
+            bands, magnitude = _SPLIT_RATIOS[5:], pct_change
+        else:
+            continue
+        for min_ratio, max_ratio, ratio_name in bands:
+            if min_ratio <= magnitude <= max_ratio:
+                volume_z, has_volume_spike = None, False
+                if volume_z_scores is not None:
+                    volume_z = float(volume_z_scores[date])
+                    has_volume_spike = volume_z > threshold
+                if has_volume_spike or volume_z_scores is None:
+                    potential_splits.append({
+                        'date': str(date),
+                        'price_change_pct': float(pct_change * 100),
+                        'split_ratio': ratio_name,
+                        'volume_z_score': volume_z,
+                        'has_volume_spike': has_volume_spike
+                    })
+                break
+    return potential_splits
+
+
+def _noisy_small_cap(rows: int = 2000, seed: int = 11) -> pd.DataFrame:
+    """Daily bars with frequent split-sized moves and volume spikes."""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range('2015-01-01', periods=rows, freq='B', tz='UTC')
+    factors = rng.choice([1.0, 0.5, 0.26, 0.34, 0.31, 2.05, 3.1, 0.22, 1.0, 1.0], rows)
+    close = 10 * np.cumprod(factors * (1 + rng.normal(0, 0.01, rows)))
+    volume = rng.lognormal(10, 1, rows)
+    volume[rng.random(rows) < 0.2] *= 50
+    return pd.DataFrame({
+        'open': close, 'high': close * 1.01, 'low': close * 0.99, 'close': close, 'volume': volume,
+    }, index=index)
+
+
+class TestEquityPotentialSplits:
+    """Test EquityValidator._check_potential_splits."""
+
+    @staticmethod
+    def _run(df: pd.DataFrame):
+        validator = EquityValidator(ValidationConfig.for_equity('1d'))
+        return validator._check_potential_splits(
+            validator._create_result(), df, build_column_mapping(df), 'SMALLCAP'
+        ).get_check('potential_splits')
+
+    @pytest.mark.unit
+    def test_matches_reference_with_volume(self):
+        """Candidates classify to the same ratios and volume flags as the loop."""
+        df = _noisy_small_cap()
+        threshold = ValidationConfig.for_equity('1d').volume_spike_threshold_sigma
+        expected = _potential_splits_reference(df, threshold)
+
+        check = self._run(df)
+
+        assert expected
+        assert check.details['potential_split_count'] == len(expected)
+        assert check.details['potential_splits'] == expected[:10]
+        assert check.message.startswith(f"Found {len(expected)} potential unadjusted split(s)")
+
+    @pytest.mark.unit
+    def test_matches_reference_without_volume(self):
+        """Without a volume column every band match is reported."""
+        df = _noisy_small_cap().drop(columns='volume')
+        expected = _potential_splits_reference(df, 0.0, use_volume=False)
+
+        check = self._run(df)
+
+        assert check.details['potential_split_count'] == len(expected)
+        assert check.details['potential_splits'] == expected[:10]
+
+    @pytest.mark.unit
+    def test_band_edges_and_nans(self):
+        """Exact band boundaries are inclusive and NaN closes are skipped."""
+        close = [100.0, 75.0, np.nan, 75.0, 37.5, 110.0, 100.0, 200.0, 620.0]
+        df = pd.DataFrame(
+            {'open': close, 'high': close, 'low': close, 'close': close},
+            index=pd.date_range('2024-01-01', periods=len(close), freq='D', tz='UTC'),
+        )
+        expected = _potential_splits_reference(df, 0.0, use_volume=False)
+
+        check = self._run(df)
+
+        assert [s['split_ratio'] for s in check.details['potential_splits']] == [
+            s['split_ratio'] for s in expected
+        ]
+        assert check.details['potential_splits'] == expected
+
+    @pytest.mark.unit
+    def test_no_splits(self):
+        """Smooth prices pass."""
+        df = _hourly_bars('2024-01-01', '2024-02-01')
+
+        assert self._run(df).passed
+
+
+class TestForexWeekendGapIntegrity:
+    """Test ForexValidator._check_weekend_gap_integrity."""
+
+    @pytest.mark.unit
+    def test_matches_reference_with_sunday_bars(self):
+        """Friday/Sunday duplication and flat Sunday->Monday gaps match the loop."""
+        df = _hourly_bars('2024-01-01', '2024-03-01')
+        sundays = df.index.dayofweek == 6
+        df.loc[sundays, ['open', 'close']] = 1.2
+        mondays = df.index.dayofweek == 0
+        df.loc[mondays, 'open'] = 1.2
+
+        check = _run_weekend_gap(df)
+        expected = _weekend_gap_reference(df, build_column_mapping(df))
+
+        assert not check.passed
+        assert check.details == expected['details']
+        assert f"{expected['issue_count']} issue(s) found" in check.message
+
+    @pytest.mark.unit
+    def test_matches_reference_with_large_friday_monday_gaps(self):
+        """Consolidated data (no Sundays) flags >10% Friday->Monday gaps like the loop."""
+        df = _hourly_bars('2024-01-01', '2024-04-01')
+        df = df[df.index.dayofweek != 6]
+        mondays = df.index.dayofweek == 0
+        df.loc[mondays, 'open'] = df.loc[mondays, 'open'] * 1.5
+        df.iloc[5, df.columns.get_loc('close')] = np.nan
+
+        check = _run_weekend_gap(df)
+        expected = _weekend_gap_reference(df, build_column_mapping(df))
+
+        assert check.details == expected['details']
+        assert f"{expected['issue_count']} issue(s) found" in check.message
+
+    @pytest.mark.unit
+    def test_unsorted_naive_index(self):
+        """First bars are taken in index order and naive indexes are treated as UTC."""
+        df = _hourly_bars('2024-01-01', '2024-02-01')
+        df.loc[df.index.dayofweek == 6, ['open', 'close']] = 0.0
+        df = df.sample(frac=1.0, random_state=3)
+        df.index = df.index.tz_localize(None)
+
+        check = _run_weekend_gap(df)
+        expected = _weekend_gap_reference(df, build_column_mapping(df))
+
+        assert check.details == expected['details']
+
+    @pytest.mark.unit
+    def test_clean_weekends_pass(self):
+        """Normal weekend gaps on 24/5 data pass."""
+        df = _hourly_bars('2024-01-01', '2024-02-01')
+        df = df[~df.index.dayofweek.isin([5, 6])]
+
+        check = _run_weekend_gap(df)
+
+        assert check.passed
+        assert check.details == _weekend_gap_reference(df, build_column_mapping(df))['details']
+
+
+def _flash_crash_reference(df: pd.DataFrame) -> list:
+    """Per-bar iloc loop the vectorized flash-crash check replaced, kept as the parity oracle."""
+    flash_crashes = []
+    for i in range(len(df) - 3):
+        bar_high = df.iloc[i]['high']
+        bar_low = df.iloc[i]['low']
+        bar_close = df.iloc[i]['close']
+        if bar_high == 0:
+            continue
+        intrabar_drop = (bar_high - bar_low) / bar_high
+        if intrabar_drop > 0.20:
+            max_recovery = df.iloc[i+1:i+4]['high'].max()
+            recovery_pct = (max_recovery - bar_low) / (bar_high - bar_low) if (bar_high - bar_low) > 0 else 0
+            if recovery_pct > 0.5:
+                flash_crashes.append({
+                    'date': str(df.index[i]),
+                    'drop_pct': float(intrabar_drop * 100),
+                    'recovery_pct': float(recovery_pct * 100),
+                    'high': float(bar_high),
+                    'low': float(bar_low),
+                    'close': float(bar_close)
+                })
+    return flash_crashes
+
+
+class TestCryptoFlashCrashes:
+    """Test CryptoValidator._check_flash_crashes."""
+
+    @staticmethod
+    def _run(df: pd.DataFrame):
+        validator = CryptoValidator(ValidationConfig.for_crypto('1m'))
+        return validator._check_flash_crashes(
+            validator._create_result(), df, build_column_mapping(df), 'BTCUSD'
+        ).get_check('flash_crashes')
+
+    @staticmethod
+    def _bars_with_crashes(rows: int = 3000, seed: int = 5) -> pd.DataFrame:
+        rng = np.random.default_rng(seed)
+        index = pd.date_range('2024-01-01', periods=rows, freq='1min', tz='UTC')
+        close = 40000 + np.cumsum(rng.normal(0, 20, rows))
+        high = close + 10
+        low = close - 10
+        wicks = rng.random(rows) < 0.05
+        low[wicks] = close[wicks] * rng.uniform(0.5, 0.85, wicks.sum())
+        high[rng.random(rows) < 0.02] = np.nan
+        return pd.DataFrame({
+            'open': close, 'high': high, 'low': low, 'close': close, 'volume': 1.0,
+        }, index=index)
+
+    @pytest.mark.unit
+    def test_matches_reference(self):
+        """Same flash-crash records as the per-bar loop, including NaN highs."""
+        df = self._bars_with_crashes()
+        expected = _flash_crash_reference(df)
+
+        check = self._run(df)
+
+        assert expected
+        assert check.details['flash_crash_count'] == len(expected)
+        assert check.details['flash_crashes'] == expected[:5]
+
+    @pytest.mark.unit
+    def test_last_three_bars_and_zero_high_are_not_candidates(self):
+        """Bars without three successors and zero-high bars are skipped."""
+        df = pd.DataFrame({
+            'open': [0.0, 100, 100, 100, 100, 100, 100],
+            'high': [0.0, 100, 100, 100, 100, 100, 100],
+            'low': [-5.0, 100, 100, 100, 50, 50, 50],
+            'close': [0.0, 100, 100, 100, 100, 100, 100],
+        }, index=pd.date_range('2024-01-01', periods=7, freq='1min', tz='UTC'))
+
+        check = self._run(df)
+
+        assert check.passed
+        assert _flash_crash_reference(df) == []
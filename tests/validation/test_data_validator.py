@@ -323,3 +323,243 @@ class TestValidationResultProperties:
         assert isinstance(result.error_checks, list), "error_checks should be a list"
         assert isinstance(result.warning_checks, list), "warning_checks should be a list"
 
+
+
+def _xnys_minute_bars(start: str, end: str, label: str = 'start'):
+    """1m bars covering each XNYS session, labelled at bar start or bar end."""
+    from zipline.utils.calendar_utils import get_calendar
+    calendar = get_calendar('XNYS')
+    sessions = calendar.sessions_in_range(start, end)
+    inclusive = 'left' if label == 'start' else 'right'
+    index = pd.DatetimeIndex(np.concatenate([
+        pd.date_range(calendar.session_open(s), calendar.session_close(s), freq='1min',
+                      inclusive=inclusive).asi8
+        for s in sessions
+    ])).tz_localize('UTC')
+    close = np.full(len(index), 100.0)
+    df = pd.DataFrame({
+        'open': close, 'high': close, 'low': close, 'close': close, 'volume': 1000.0,
+    }, index=index)
+    return df, calendar
+
+
+class TestIntradayCalendarContinuity:
+    """Test DataValidator._check_intraday_calendar_continuity."""
+
+    @staticmethod
+    def _run(df, calendar, **config_kwargs):
+        validator = DataValidator(config=ValidationConfig(timeframe='1m', **config_kwargs))
+        result = validator._check_intraday_calendar_continuity(
+            ValidationResult(), df, calendar, 'TEST', 'XNYS'
+        )
+        return result.get_check('date_continuity')
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize('label', ['start', 'end'])
+    def test_complete_sessions(self, label):
+        """Full sessions report no missing or partial sessions for either bar labelling."""
+        df, calendar = _xnys_minute_bars('2024-03-01', '2024-03-29', label=label)
+
+        check = self._run(df, calendar)
+
+        assert check.passed
+        assert check.details['sessions_missing'] == 0
+        assert check.details['sessions_partial'] == 0
+        assert check.details['bars_outside_sessions'] == 0
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize('unit', ['s', 'ms', 'us'])
+    def test_non_ns_index(self, unit):
+        """Bars map to their sessions whatever the index's datetime64 unit."""
+        df, calendar = _xnys_minute_bars('2024-03-01', '2024-03-29')
+        df.index = df.index.as_unit(unit)
+
+        check = self._run(df, calendar)
+
+        assert check.passed
+        assert check.details['sessions_missing'] == 0
+        assert check.details['sessions_partial'] == 0
+        assert check.details['bars_outside_sessions'] == 0
+
+    @pytest.mark.unit
+    def test_missing_and_partial_sessions(self):
+        """Dropped sessions count as missing and truncated ones (incl. early closes) only when short."""
+        df, calendar = _xnys_minute_bars('2023-11-01', '2023-11-30')
+        days = df.index.normalize()
+        dropped = days.isin(pd.to_datetime(['2023-11-06', '2023-11-07'], utc=True))
+        truncated = (days == pd.Timestamp('2023-11-08', tz='UTC')) & (df.index.hour >= 18)
+        df = df[~(dropped | truncated)]
+        df = pd.concat([df, df.iloc[:1].set_axis([pd.Timestamp('2023-11-09 03:00', tz='UTC')])])
+
+        check = self._run(df, calendar, gap_tolerance_days=1, strict_mode=True)
+
+        assert not check.passed
+        assert check.details['sessions_missing'] == 2
+        assert check.details['sample_missing_sessions'] == ['2023-11-06', '2023-11-07']
+        assert check.details['sessions_partial'] == 1
+        assert check.details['sample_partial_sessions'][0]['session'] == '2023-11-08'
+        assert check.details['sample_partial_sessions'][0]['expected_bars'] == 390
+        assert check.details['bars_outside_sessions'] == 1
+
+
+class TestSharedFeatures:
+    """Test that derived features are computed once per DataValidator.validate call."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize('asset_type', ['equity', 'forex', 'crypto'])
+    def test_features_computed_once(self, asset_type):
+        """UTC index and close returns are derived once and shared with the asset validator."""
+        from lib.validation import features as features_module
+
+        index = pd.date_range('2024-01-01', periods=5000, freq='1min', tz='UTC')
+        close = 100 + np.cumsum(np.random.default_rng(1).normal(0, 0.1, len(index)))
+        df = pd.DataFrame({
+            'open': close, 'high': close + 0.1, 'low': close - 0.1, 'close': close, 'volume': 100.0,
+        }, index=index)
+        config = getattr(ValidationConfig, f'for_{asset_type}')('1m')
+        validator = DataValidator(config=config)
+
+        with patch.object(features_module, 'ensure_timezone', wraps=features_module.ensure_timezone) as tz_spy, \
+                patch.object(pd.Series, 'pct_change', autospec=True, side_effect=pd.Series.pct_change) as pct_spy:
+            result = validator.validate(df, asset_name='TEST', asset_type=asset_type)
+
+        assert tz_spy.call_count == 1
+        assert pct_spy.call_count == 1
+        assert result.get_check('price_outliers') is not None
+        assert validator._features is None
+
+    @pytest.mark.unit
+    def test_day_of_week_matches_pandas(self):
+        """Day-of-week codes derived from UTC day numbers match DatetimeIndex.dayofweek."""
+        from lib.validation import ValidationFeatures, build_column_mapping
+
+        index = pd.date_range('1969-12-25', periods=400, freq='7h', tz='America/New_York')
+        df = pd.DataFrame({'close': 1.0}, index=index)
+        features = ValidationFeatures(df, build_column_mapping(df))
+
+        utc = index.tz_convert('UTC')
+        np.testing.assert_array_equal(features.day_of_week, utc.dayofweek)
+        assert features.utc_dates.equals(utc.normalize())
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize('unit', ['s', 'ms', 'us'])
+    def test_day_features_independent_of_index_unit(self, unit):
+        """UTC day numbers and weekdays do not depend on the index's datetime64 unit."""
+        from lib.validation import ValidationFeatures, build_column_mapping
+
+        index = pd.date_range('2024-03-01', periods=300, freq='5h', tz='UTC')
+        df = pd.DataFrame({'close': 1.0}, index=index.as_unit(unit))
+        features = ValidationFeatures(df, build_column_mapping(df))
+
+        np.testing.assert_array_equal(features.day_of_week, index.dayofweek)
+        np.testing.assert_array_equal(
+            features.utc_days, (index.normalize() - pd.Timestamp('1970-01-01', tz='UTC')).days
+        )
+
+
+@pytest.fixture
+def isolated_validation_cache(tmp_path, monkeypatch):
+    """Redirect the validation result cache into the test's temp directory."""
+    from lib.validation import cache as validation_cache
+    cache_dir = tmp_path / 'validation_cache'
+    monkeypatch.setattr(validation_cache, 'get_validation_cache_dir', lambda: cache_dir)
+    return cache_dir
+
+
+class TestValidationResultCache:
+    """Test the persistent validation result cache."""
+
+    @pytest.mark.unit
+    def test_second_validation_hits_cache(self, valid_ohlcv_data, isolated_validation_cache):
+        """Unchanged data and config return the stored result without running checks."""
+        config = ValidationConfig(timeframe='1d', cache_results=True)
+        first = DataValidator(config=config).validate(valid_ohlcv_data, asset_name='TEST')
+
+        with patch.object(DataValidator, '_run_common_checks') as run_checks:
+            second = DataValidator(config=config).validate(valid_ohlcv_data, asset_name='TEST')
+
+        run_checks.assert_not_called()
+        assert first.metadata['cache_hit'] is False
+        assert second.metadata['cache_hit'] is True
+        assert second.passed == first.passed
+        assert [(c.name, c.passed, c.message) for c in second.checks] == \
+            [(c.name, c.passed, c.message) for c in first.checks]
+        assert len(list(isolated_validation_cache.glob('*.json'))) == 1
+
+    @pytest.mark.unit
+    def test_cache_hit_result_is_usable(self, valid_ohlcv_data, isolated_validation_cache, tmp_path):
+        """A cached result reports, serializes and saves like a fresh one."""
+        from lib.validation import save_validation_report, load_validation_report
+
+        config = ValidationConfig(timeframe='1d', cache_results=True)
+        DataValidator(config=config).validate(valid_ohlcv_data, asset_name='TEST')
+        cached = DataValidator(config=config).validate(valid_ohlcv_data, asset_name='TEST')
+
+        assert cached.metadata['cache_hit'] is True
+        assert cached.summary().startswith('Validation PASSED')
+        assert 0 <= cached.to_dict()['summary']['duration_ms'] < 60_000
+        save_validation_report(cached, tmp_path / 'report.json')
+        reloaded = load_validation_report(tmp_path / 'report.json')
+        assert reloaded._start_time.tzinfo is None
+        assert all(check.timestamp.tzinfo is None for check in reloaded.checks)
+
+    @pytest.mark.unit
+    def test_changed_data_or_config_misses(self, valid_ohlcv_data, isolated_validation_cache):
+        """Different values, config or asset type are validated afresh."""
+        DataValidator(ValidationConfig(timeframe='1d', cache_results=True)).validate(
+            valid_ohlcv_data, asset_name='TEST'
+        )
+        changed = valid_ohlcv_data.copy()
+        changed.iloc[3, changed.columns.get_loc('close')] += 0.01
+
+        results = [
+            DataValidator(ValidationConfig(timeframe='1d', cache_results=True)).validate(
+                changed, asset_name='TEST'),
+            DataValidator(ValidationConfig(timeframe='1d', cache_results=True, outlier_threshold_sigma=2.0)).validate(
+                valid_ohlcv_data, asset_name='TEST'),
+            DataValidator(ValidationConfig(timeframe='1d', cache_results=True)).validate(
+                valid_ohlcv_data, asset_name='TEST', asset_type='equity'),
+        ]
+
+        assert all(r.metadata['cache_hit'] is False for r in results)
+        # The changed data supersedes the original entry for the same asset and config
+        assert len(list(isolated_validation_cache.glob('*.json'))) == 3
+
+    @pytest.mark.unit
+    def test_superseded_entries_evicted(self, valid_ohlcv_data, isolated_validation_cache):
+        """A new result for the same asset and config replaces the old entry only."""
+        config = ValidationConfig(timeframe='1d', cache_results=True)
+        DataValidator(config=config).validate(valid_ohlcv_data, asset_name='TEST')
+        DataValidator(config=config).validate(valid_ohlcv_data, asset_name='OTHER')
+        changed = valid_ohlcv_data.copy()
+        changed.iloc[3, changed.columns.get_loc('close')] += 0.01
+
+        DataValidator(config=config).validate(changed, asset_name='TEST')
+
+        assert len(list(isolated_validation_cache.glob('*.json'))) == 2
+        assert DataValidator(config=config).validate(changed, asset_name='TEST').metadata['cache_hit'] is True
+        assert DataValidator(config=config).validate(valid_ohlcv_data, asset_name='OTHER').metadata['cache_hit'] is True
+
+    @pytest.mark.unit
+    def test_cache_disabled_by_default(self, valid_ohlcv_data, isolated_validation_cache):
+        """Without cache_results nothing is read or written."""
+        result = DataValidator(ValidationConfig(timeframe='1d')).validate(valid_ohlcv_data, asset_name='TEST')
+
+        assert 'cache_hit' not in result.metadata
+        assert not isolated_validation_cache.exists()
+
+    @pytest.mark.unit
+    def test_data_hash_covers_index_columns_and_values(self, valid_ohlcv_data):
+        """The data hash is stable and changes with index, column names or values."""
+        from lib.validation import compute_dataframe_hash
+
+        base = compute_dataframe_hash(valid_ohlcv_data)
+        shifted = valid_ohlcv_data.copy()
+        shifted.index = shifted.index + pd.Timedelta(minutes=1)
+        renamed = valid_ohlcv_data.rename(columns={'volume': 'Volume'})
+        with_text = valid_ohlcv_data.assign(note='x')
+
+        assert compute_dataframe_hash(valid_ohlcv_data.copy()) == base
+        assert len(base) == 64
+        assert len({base, compute_dataframe_hash(shifted), compute_dataframe_hash(renamed),
+                    compute_dataframe_hash(with_text)}) == 4
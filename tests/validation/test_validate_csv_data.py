@@ -0,0 +1,142 @@
+"""
+Tests for scripts/validate_csv_data.py streaming and parallel modes.
+
+Tests that streaming validation reports the same row-level issues as the
+full read for chunk sizes splitting duplicates, gaps and returns across
+chunk boundaries, and that parallel validation keeps filename order.
+"""
+
+# Standard library imports
+import importlib.util
+import sys
+from pathlib import Path
+
+# Third-party imports
+import numpy as np
+import pandas as pd
+import pytest
+
+# Local imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def _load_script():
+    spec = importlib.util.spec_from_file_location(
+        'validate_csv_data', project_root / 'scripts' / 'validate_csv_data.py'
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['validate_csv_data'] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+vcd = _load_script()
+
+# Issues only the full read can produce (whole-file checks) or only streaming notes
+WHOLE_FILE_CATEGORIES = {'DataValidator', 'Streaming'}
+WHOLE_FILE_MESSAGES = ('IQR bounds', 'volume spike', 'UTC normalization issue')
+
+
+def _hourly_bars(n: int = 60) -> pd.DataFrame:
+    index = pd.date_range('2024-01-02 00:00', periods=n, freq='1h', tz='UTC', name='timestamp')
+    close = 100 + np.arange(n) * 0.1
+    return pd.DataFrame({
+        'open': close, 'high': close + 1, 'low': close - 1, 'close': close,
+        'volume': np.arange(n) + 10.0,
+    }, index=index)
+
+
+def _bad_bars() -> pd.DataFrame:
+    """Rows 19/20 duplicate a timestamp, 20/21 span a 10-hour gap, 40/41 jump 30%."""
+    df = _hourly_bars()
+    df = pd.concat([df.iloc[:20], df.iloc[19:20], df.iloc[30:]])
+    df.iloc[41:, :4] *= 1.3
+    return df
+
+
+def _issues(result):
+    return sorted(
+        (issue.severity.value, issue.category, issue.message)
+        for issue in result.issues
+        if issue.category not in WHOLE_FILE_CATEGORIES
+        and not any(text in issue.message for text in WHOLE_FILE_MESSAGES)
+    )
+
+
+class TestStreamingParity:
+    """Streaming and full-read validation agree on row-level issues."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize('filename', [
+        'AAA_1h_20240102-000000_20240104-110000_ready.csv',
+        'AAA_1h_ready.csv',
+    ])
+    # 20 and 21 put the duplicate and the gap on a chunk boundary, 41 the extreme move
+    @pytest.mark.parametrize('chunksize', [1, 7, 20, 21, 41, 1000])
+    def test_same_issues_as_full_read(self, tmp_path, filename, chunksize):
+        path = tmp_path / filename
+        _bad_bars().to_csv(path)
+
+        full = vcd.validate_csv_file(path)
+        streamed = vcd.validate_csv_file_streaming(path, chunksize=chunksize)
+
+        assert _issues(streamed) == _issues(full)
+        categories = {issue.category for issue in streamed.issues}
+        assert {'Index', 'Gaps', 'PriceAnomaly'} <= categories
+        assert streamed.stats['row_count'] == full.stats['row_count']
+        assert streamed.stats['gaps'] == full.stats['gaps']
+
+    @pytest.mark.unit
+    def test_missing_filename_dates_warned(self, tmp_path):
+        path = tmp_path / 'AAA_1h_ready.csv'
+        _hourly_bars().to_csv(path)
+
+        streamed = vcd.validate_csv_file_streaming(path, chunksize=7)
+
+        assert ('DateRange', 'Could not extract date range from filename for comparison') in \
+            {(issue.category, issue.message) for issue in streamed.warnings}
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize('chunksize', [3, 20])
+    def test_unsorted_across_boundary(self, tmp_path, chunksize):
+        df = _hourly_bars(40)
+        df = pd.concat([df.iloc[20:], df.iloc[:20]])
+        path = tmp_path / 'AAA_1h_20240102-000000_20240103-150000_ready.csv'
+        df.to_csv(path)
+
+        streamed = vcd.validate_csv_file_streaming(path, chunksize=chunksize)
+
+        assert ('Index', 'Index is not sorted in ascending order') in \
+            {(issue.category, issue.message) for issue in streamed.warnings}
+
+    @pytest.mark.unit
+    def test_volume_stats_match(self, tmp_path):
+        path = tmp_path / 'AAA_1h_20240102-000000_20240104-110000_ready.csv'
+        _hourly_bars().to_csv(path)
+
+        full = vcd.validate_csv_file(path)
+        streamed = vcd.validate_csv_file_streaming(path, chunksize=7)
+
+        for key in ('min', 'max', 'mean', 'std', 'zero_count'):
+            assert streamed.stats['volume_patterns'][key] == pytest.approx(full.stats['volume_patterns'][key])
+
+
+class TestParallelValidation:
+    """Parallel validation keeps results in filename order."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize('stream', [False, True])
+    def test_jobs_keep_filename_order(self, tmp_path, monkeypatch, stream):
+        data_dir = tmp_path / 'data' / 'processed' / '1h'
+        data_dir.mkdir(parents=True)
+        # Largest file first so it tends to finish last
+        sizes = {'AAA': 5000, 'BBB': 20, 'CCC': 200, 'DDD': 60}
+        for symbol, n in sizes.items():
+            _hourly_bars(n).to_csv(data_dir / f"{symbol}_1h_ready.csv")
+        monkeypatch.setattr(vcd, 'get_project_root', lambda: tmp_path)
+
+        results = vcd.validate_timeframe_directory('1h', jobs=2, stream=stream, use_cache=False)
+
+        assert [r.filepath.name for r in results] == sorted(f"{s}_1h_ready.csv" for s in sizes)
+        assert [r.stats['row_count'] for r in results] == list(sizes.values())